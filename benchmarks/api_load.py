@@ -0,0 +1,203 @@
+"""
+시뮬레이션 API 부하 테스트
+동시 클라이언트(keep-alive 연결)가 임의의 What-if 시나리오로 /simulate를 호출하고
+지연 시간 p50/p90/p99와 초당 처리량(requests/sec), 서버의 평균 배치 크기를 보고한다.
+
+--url을 주지 않으면 빈 포트로 API 서버를 하위 프로세스로 띄운 뒤 측정한다.
+
+    python benchmarks/api_load.py --parts 100000 --concurrency 64 --requests 20000
+    python benchmarks/api_load.py --parts 100000 --batch-window-ms 0      # 묶음 처리 없이 비교
+    python benchmarks/api_load.py --url http://127.0.0.1:8765 --context sample
+"""
+import argparse
+import asyncio
+import json
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+
+
+class Connection:
+    """keep-alive HTTP/1.1 연결 하나로 JSON 요청을 순서대로 보낸다"""
+
+    def __init__(self, host: str, port: int):
+        self.host, self.port = host, port
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def request(self, method: str, path: str, payload=None) -> Tuple[int, object]:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        body = json.dumps(payload).encode() if payload is not None else b''
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
+        )
+        await self.writer.drain()
+
+        head = await self.reader.readuntil(b'\r\n\r\n')
+        status_line, *header_lines = head.decode('latin-1').rstrip('\r\n').split('\r\n')
+        headers = {k.strip().lower(): v.strip() for k, _, v in (line.partition(':') for line in header_lines)}
+        data = await self.reader.readexactly(int(headers.get('content-length', 0)))
+        if headers.get('connection', '').lower() == 'close':
+            await self.close()
+        return int(status_line.split(' ')[1]), json.loads(data) if data else None
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = self.reader = None
+
+
+def random_scenario(rng: random.Random, context: Optional[str]) -> Dict:
+    scenario = {
+        'price_increase_pct': round(rng.uniform(-10, 40), 1),
+        'delay_days': rng.randint(0, 30),
+    }
+    if rng.random() < 0.3:
+        scenario['currency_shocks'] = {'USD': round(rng.uniform(-5, 15), 1)}
+    if context:
+        scenario['context'] = context
+    return scenario
+
+
+async def run_load(host: str, port: int, context: Optional[str], total: int, concurrency: int, seed: int) -> Dict:
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(total))
+
+    async def worker(worker_id: int):
+        nonlocal errors
+        rng = random.Random(seed + worker_id)
+        conn = Connection(host, port)
+        try:
+            for _ in remaining:
+                started = time.perf_counter()
+                status, _ = await conn.request('POST', '/simulate', random_scenario(rng, context))
+                latencies.append(time.perf_counter() - started)
+                if status != 200:
+                    errors += 1
+        finally:
+            await conn.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    conn = Connection(host, port)
+    _, stats = await conn.request('GET', '/stats')
+    await conn.close()
+
+    ms = sorted(x * 1000 for x in latencies)
+    quantile = lambda q: ms[min(len(ms) - 1, int(q * len(ms)))]
+    return {
+        'requests': len(ms),
+        'errors': errors,
+        'concurrency': concurrency,
+        'elapsed_s': elapsed,
+        'rps': len(ms) / elapsed if elapsed else 0.0,
+        'mean_ms': statistics.fmean(ms),
+        'p50_ms': quantile(0.50),
+        'p90_ms': quantile(0.90),
+        'p99_ms': quantile(0.99),
+        'max_ms': ms[-1],
+        'server': stats,
+    }
+
+
+def write_context_csvs(n_parts: int, directory: str) -> str:
+    """합성 데이터 CSV를 저장하고 --csv 인자 값을 반환"""
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+    from infrastructure.synthetic import generate_synthetic
+
+    paths = generate_synthetic(n_parts).write_csvs(directory)
+    return 'synthetic=' + ','.join(str(paths[name]) for name in ('parts', 'suppliers', 'production'))
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+async def wait_until_ready(host: str, port: int, timeout: float = 60.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            conn = Connection(host, port)
+            status, _ = await conn.request('GET', '/health')
+            await conn.close()
+            if status == 200:
+                return
+        except OSError:
+            pass
+        if time.monotonic() > deadline:
+            raise RuntimeError("API 서버가 시간 안에 시작되지 않았습니다.")
+        await asyncio.sleep(0.1)
+
+
+def format_report(r: Dict) -> str:
+    lines = [
+        f"요청 {r['requests']}건 (오류 {r['errors']}), 동시성 {r['concurrency']}, {r['elapsed_s']:.2f}s",
+        f"처리량 {r['rps']:,.0f} req/s",
+        f"지연 mean {r['mean_ms']:.2f} / p50 {r['p50_ms']:.2f} / p90 {r['p90_ms']:.2f} / "
+        f"p99 {r['p99_ms']:.2f} / max {r['max_ms']:.2f} ms",
+    ]
+    for name, s in r['server'].items():
+        lines.append(
+            f"[{name}] 배치 {s['batches']}회, 평균 크기 {s['mean_batch_size']:.1f}, "
+            f"최대 {s['max_batch_size']}, 계산 누적 {s['busy_ms']:.0f} ms"
+        )
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', help='이미 실행 중인 서버 주소 (없으면 하위 프로세스로 서버 실행)')
+    parser.add_argument('--context', help='조회할 컨텍스트 이름')
+    parser.add_argument('--parts', type=int, default=0, help='합성 데이터 부품 수 (0이면 샘플 데이터)')
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--batch-window-ms', type=float, default=2.0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help='결과를 JSON 파일로 저장')
+    args = parser.parse_args()
+
+    server = None
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.url:
+            parsed = urlsplit(args.url)
+            host, port = parsed.hostname or '127.0.0.1', parsed.port or 80
+        else:
+            host, port = '127.0.0.1', free_port()
+            context_args = ['--csv', write_context_csvs(args.parts, tmp)] if args.parts else ['--sample']
+            server = subprocess.Popen(
+                [sys.executable, str(SRC_PATH / 'presentation' / 'api.py'), '--port', str(port),
+                 '--batch-window-ms', str(args.batch_window_ms), *context_args],
+                stdout=subprocess.DEVNULL
+            )
+
+        try:
+            asyncio.run(wait_until_ready(host, port))
+            result = asyncio.run(run_load(host, port, args.context, args.requests, args.concurrency, args.seed))
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+
+    print(format_report(result))
+    if args.json:
+        Path(args.json).write_text(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
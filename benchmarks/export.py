@@ -0,0 +1,89 @@
+"""
+대용량 내보내기 벤치마크
+부품별 노출표와 가격 × 지연 시나리오 스윕을 청크 스트리밍(write_chunks)으로 쓸 때와
+전체 DataFrame -> CSV 문자열 -> gzip 바이트를 메모리에서 만들 때(기존 download_button 방식)의
+처리량(rows/sec)과 단계별 peak 메모리(tracemalloc, RSS)를 비교한다.
+
+    python benchmarks/export.py --parts 1000000 --sweep-step 0.01 --sweep-delay 365
+"""
+import argparse
+import gzip
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from common.memprof import MB, MemoryProfiler
+from common.tracing import span
+from domain.forecast_service import ForecastService
+from infrastructure.export import available_formats, export_path, part_exposure_chunks, write_chunks
+from infrastructure.synthetic import generate_synthetic
+
+
+def in_memory_export(chunks) -> int:
+    """비교 기준: 전체 표를 메모리에 모은 뒤 한 번에 CSV 문자열 + gzip 바이트로 변환"""
+    with span('bench.in_memory'):
+        frame = pd.concat([pd.DataFrame(dict(c)) for c in chunks], ignore_index=True)
+        return len(gzip.compress(frame.to_csv(index=False).encode('utf-8'), 1))
+
+
+def run(name: str, make_chunks, directory: Path) -> list:
+    rows = []
+    for fmt in available_formats():
+        result = write_chunks(make_chunks(), export_path(directory, name, fmt), fmt)
+        with MemoryProfiler(stages=('export.write_chunks',)) as profiler:
+            write_chunks(make_chunks(), export_path(directory, name, fmt), fmt)
+        memory = profiler.report()[0]
+        rows.append({
+            'dataset': name, 'method': f'stream-{fmt}', 'rows': result.rows, 'bytes': result.bytes,
+            'seconds': result.seconds, 'rows_per_sec': result.rows / result.seconds,
+            'peak_mb': memory['peak_mb'], 'rss_peak_mb': memory['rss_peak_mb'],
+        })
+
+    started = time.perf_counter()
+    size = in_memory_export(make_chunks())
+    seconds = time.perf_counter() - started
+    with MemoryProfiler(stages=('bench.in_memory',)) as profiler:
+        in_memory_export(make_chunks())
+    memory = profiler.report()[0]
+    rows.append({
+        'dataset': name, 'method': 'in-memory-csv', 'rows': rows[0]['rows'], 'bytes': size,
+        'seconds': seconds, 'rows_per_sec': rows[0]['rows'] / seconds,
+        'peak_mb': memory['peak_mb'], 'rss_peak_mb': memory['rss_peak_mb'],
+    })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--parts', type=int, default=1_000_000)
+    parser.add_argument('--sweep-step', type=float, default=0.01, help='스윕 가격 축 간격 (%%p)')
+    parser.add_argument('--sweep-delay', type=int, default=365, help='스윕 최대 지연 일수')
+    parser.add_argument('--json', help='결과를 JSON 파일로 저장')
+    args = parser.parse_args()
+
+    context = generate_synthetic(args.parts).to_context()
+    forecast = ForecastService()
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        results += run('exposure', lambda: part_exposure_chunks(context, 10.0, 14), Path(directory))
+        results += run('sweep', lambda: forecast.iter_grid_rows(context, 30.0, args.sweep_delay, args.sweep_step, 1), Path(directory))
+
+    print(f"{'dataset':<10} {'method':<16} {'rows':>11} {'file MB':>8} {'sec':>6} {'rows/sec':>11} {'peak MB':>8} {'RSS peak MB':>12}")
+    for r in results:
+        print(
+            f"{r['dataset']:<10} {r['method']:<16} {r['rows']:>11,} {r['bytes'] / MB:>8.1f} {r['seconds']:>6.2f} "
+            f"{r['rows_per_sec']:>11,.0f} {r['peak_mb']:>8.1f} {r['rss_peak_mb']:>12.1f}"
+        )
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
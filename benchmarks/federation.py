@@ -0,0 +1,99 @@
+"""
+다중 공장 연합(Federation) 벤치마크
+공장 수 × 시나리오 수를 워커 프로세스 수별로 평가해 처리량(공장·시나리오/sec)과
+부모/워커 프로세스 RSS, 공급사 노출 집계 시간을 보고한다.
+공장 데이터는 워커 안에서 합성 데이터로 만들므로 부모 프로세스는 공장 데이터를 들고 있지 않다.
+
+    python benchmarks/federation.py --plants 200 --parts 5000 --scenarios 1000 --workers 1 2 4 8
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from application.federation import Federation
+from common.memprof import MB, current_rss
+
+
+class SyntheticPlant:
+    """워커 프로세스에서 load()할 때 합성 컨텍스트를 만드는 공장 소스"""
+
+    def __init__(self, n_parts: int, seed: int):
+        self.n_parts, self.seed = n_parts, seed
+
+    def load(self):
+        from infrastructure.synthetic import generate_synthetic
+        return generate_synthetic(self.n_parts, self.seed).to_context()
+
+
+def scenarios(n: int):
+    return [
+        {'price_increase_pct': (i % 61) - 30, 'delay_days': i % 31, 'currency_shocks': {'USD': (i % 11) - 5}}
+        for i in range(n)
+    ]
+
+
+def bench(plants, batch, workers: int) -> dict:
+    rss_before = current_rss() or 0
+    started = time.perf_counter()
+    group = Federation(plants, workers=workers)
+    load_s = time.perf_counter() - started
+    try:
+        group.evaluate(batch[:1])  # 워커 준비 (첫 호출 오버헤드 제외)
+        started = time.perf_counter()
+        result = group.evaluate(batch)
+        eval_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        exposure = group.supplier_exposure(10.0)
+        exposure_s = time.perf_counter() - started
+        worker_rss = [r or 0 for r in group.worker_rss()] if workers > 1 else []
+        parent_rss = (current_rss() or 0) - rss_before
+    finally:
+        group.close()
+    cells = len(plants) * len(batch)
+    return {
+        'workers': workers, 'plants': len(plants), 'scenarios': len(batch),
+        'load_s': load_s, 'evaluate_s': eval_s, 'cells_per_sec': cells / eval_s,
+        'exposure_s': exposure_s, 'suppliers': len(exposure),
+        'parent_rss_delta_mb': parent_rss / MB, 'worker_rss_mb': [r / MB for r in worker_rss],
+        'group_profit_delta_first': result.totals()[0]['profit_delta'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--plants', type=int, default=200)
+    parser.add_argument('--parts', type=int, default=5_000, help='공장당 부품 수')
+    parser.add_argument('--scenarios', type=int, default=1_000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--json', help='결과를 JSON 파일로 저장')
+    args = parser.parse_args()
+
+    plants = {f'plant-{i:03d}': SyntheticPlant(args.parts, seed=i) for i in range(args.plants)}
+    batch = scenarios(args.scenarios)
+    print(f"공장 {args.plants}개 × 부품 {args.parts:,}개, 시나리오 {args.scenarios:,}개 (CPU {os.cpu_count()}개)")
+    print(f"{'workers':>7} {'load s':>7} {'eval s':>7} {'cells/s':>12} {'exposure s':>10} {'suppliers':>9} {'parent ΔRSS MB':>14} {'worker RSS MB':>14}")
+
+    results = []
+    for workers in args.workers:
+        r = bench(plants, batch, workers)
+        results.append(r)
+        worker = f"{max(r['worker_rss_mb']):.0f} × {len(r['worker_rss_mb'])}" if r['worker_rss_mb'] else '-'
+        print(
+            f"{workers:>7} {r['load_s']:>7.2f} {r['evaluate_s']:>7.2f} {r['cells_per_sec']:>12,.0f} "
+            f"{r['exposure_s']:>10.3f} {r['suppliers']:>9,} {r['parent_rss_delta_mb']:>14.1f} {worker:>14}"
+        )
+
+    first = {round(r['group_profit_delta_first'], 2) for r in results}
+    print("워커 수별 결과 일치" if len(first) == 1 else f"결과 불일치: {first}")
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
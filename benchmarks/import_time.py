@@ -0,0 +1,117 @@
+"""
+모듈 임포트 시간 벤치마크 (콜드 스타트)
+새 인터프리터에서 `python -X importtime`으로 대상 모듈을 임포트해
+누적 임포트 시간과 가장 오래 걸린 하위 모듈, 무거운 패키지(pandas, plotly 등)의 로드 여부를 보고한다.
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py domain.forecast_service application.services --repeat 5 --top 10
+    python benchmarks/import_time.py --check    # 도메인/애플리케이션 레이어가 무거운 패키지를 불러오면 실패
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+
+DEFAULT_MODULES = (
+    'domain.strategies',
+    'domain.forecast_service',
+    'domain.insights_service',
+    'application.services',
+    'infrastructure.repositories',
+    'presentation.frames',
+)
+
+HEAVY_PACKAGES = ('pandas', 'plotly', 'streamlit', 'scipy', 'matplotlib', 'numba')
+
+# 콜드 스타트 경로에서 무거운 패키지를 불러오면 안 되는 레이어
+PANDAS_FREE_PREFIXES = ('domain.', 'application.', 'common.', 'presentation.frames')
+
+
+def measure(module: str) -> Dict:
+    """새 프로세스에서 module을 임포트하고 -X importtime 출력을 파싱"""
+    env = dict(os.environ, PYTHONPATH=str(SRC_PATH))
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, env=env, check=False
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{module} 임포트 실패:\n{proc.stderr[-2000:]}")
+
+    entries = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        entries.append({
+            'name': name.strip(),
+            'self_us': int(self_us),
+            'cumulative_us': int(cumulative_us),
+        })
+
+    total = next((e['cumulative_us'] for e in reversed(entries) if e['name'] == module), 0)
+    loaded = {e['name'] for e in entries}
+    return {
+        'module': module,
+        'total_us': total,
+        'entries': entries,
+        'heavy': [p for p in HEAVY_PACKAGES if p in loaded],
+    }
+
+
+def benchmark(module: str, repeat: int, top: int) -> Dict:
+    runs = [measure(module) for _ in range(repeat)]
+    fastest = min(runs, key=lambda r: r['total_us'])
+    slowest_children = sorted(fastest['entries'], key=lambda e: -e['self_us'])[:top]
+    return {
+        'module': module,
+        'median_ms': statistics.median(r['total_us'] for r in runs) / 1000,
+        'min_ms': fastest['total_us'] / 1000,
+        'heavy': fastest['heavy'],
+        'top_self': [{'name': e['name'], 'self_ms': e['self_us'] / 1000} for e in slowest_children],
+    }
+
+
+def format_results(results: List[Dict]) -> str:
+    header = f"{'module':<32} {'median ms':>10} {'min ms':>10}  heavy packages"
+    lines = [header, '-' * len(header)]
+    for r in results:
+        lines.append(f"{r['module']:<32} {r['median_ms']:>10.1f} {r['min_ms']:>10.1f}  {', '.join(r['heavy']) or '-'}")
+    for r in results:
+        lines.append('')
+        lines.append(f"[{r['module']}] self 시간 상위 모듈")
+        for e in r['top_self']:
+            lines.append(f"  {e['self_ms']:>8.1f} ms  {e['name']}")
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('modules', nargs='*', default=list(DEFAULT_MODULES))
+    parser.add_argument('--repeat', type=int, default=3, help='모듈별 반복 측정 횟수 (중앙값 보고)')
+    parser.add_argument('--top', type=int, default=5, help='self 시간 상위 하위 모듈 개수')
+    parser.add_argument('--json', help='결과를 JSON 파일로 저장')
+    parser.add_argument('--check', action='store_true', help='pandas-free 레이어가 무거운 패키지를 불러오면 종료 코드 1')
+    args = parser.parse_args()
+
+    results = [benchmark(module, args.repeat, args.top) for module in args.modules]
+    print(format_results(results))
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, ensure_ascii=False, indent=2))
+
+    if args.check:
+        violations = [r for r in results if r['module'].startswith(PANDAS_FREE_PREFIXES) and r['heavy']]
+        for r in violations:
+            print(f"\n❌ {r['module']}이(가) 무거운 패키지를 임포트합니다: {', '.join(r['heavy'])}", file=sys.stderr)
+        if violations:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+커널 백엔드(NumPy / numba) 비교 벤치마크
+컨텍스트 크기별로 이산 사건 공급 시뮬레이션(SupplyEventSimulator)과 몬테카를로 경로 생성(RiskSampler.sample)을
+두 백엔드로 실행해 최단 시간, 속도 비, 결과 일치 여부를 보고한다.
+numba 첫 호출(컴파일 또는 캐시 로드) 시간은 따로 표시하며, numba가 없으면 NumPy만 측정한다.
+
+    python benchmarks/kernels.py --parts 10000 100000 1000000 --days 180
+    python benchmarks/kernels.py --parts 100000 --paths 8192 --fill-rate 0.7 --json kernels.json
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from domain import kernels
+from domain.event_sim import SupplyEventSimulator
+from domain.monte_carlo import RiskSampler
+from infrastructure.synthetic import generate_synthetic
+
+
+def best_of(func, repeat: int):
+    timings, value = [], None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        value = func()
+        timings.append(time.perf_counter() - started)
+    return min(timings), value
+
+
+def bench_event_sim(context, backends, days: int, fill_rate: float, repeat: int) -> dict:
+    out = {}
+    traces = {}
+    for backend in backends:
+        simulator = SupplyEventSimulator(horizon_days=days, fill_rate=fill_rate, backend=backend)
+        started = time.perf_counter()
+        simulator.run(context)  # 컬럼 스냅샷 준비 + numba 첫 호출
+        first = time.perf_counter() - started
+        best, traces[backend] = best_of(lambda: simulator.run(context), repeat)
+        out[backend] = {'first_s': first, 'best_s': best, 'events_per_sec': traces[backend].events / best}
+    if len(traces) == 2:
+        a, b = traces['numpy'], traces['numba']
+        out['match'] = bool(
+            np.allclose(a.inventory, b.inventory) and np.allclose(a.line_output, b.line_output)
+            and (a.orders, a.shipments, a.queue_events) == (b.orders, b.shipments, b.queue_events)
+        )
+    return out
+
+
+def bench_monte_carlo(context, backends, paths: int, repeat: int) -> dict:
+    out = {}
+    samples = {}
+    for backend in backends:
+        sampler = RiskSampler.from_context(context, price_mean_pct=5.0, backend=backend)
+        started = time.perf_counter()
+        sampler.sample(paths, np.random.default_rng(0))
+        first = time.perf_counter() - started
+        best, samples[backend] = best_of(lambda: sampler.sample(paths, np.random.default_rng(0)), repeat)
+        out[backend] = {'first_s': first, 'best_s': best, 'paths_per_sec': paths / best}
+    if len(samples) == 2:
+        out['match'] = bool(np.array_equal(samples['numpy']['production_loss'], samples['numba']['production_loss']))
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--parts', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--days', type=int, default=180)
+    parser.add_argument('--fill-rate', type=float, default=1.0, help='분할 선적 시 1차 입고 비율')
+    parser.add_argument('--paths', type=int, default=4096, help='몬테카를로 배치 경로 수')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', help='결과를 JSON 파일로 저장')
+    args = parser.parse_args()
+
+    backends = ['numpy'] + (['numba'] if kernels.NUMBA_AVAILABLE else [])
+    if not kernels.NUMBA_AVAILABLE:
+        print("numba가 설치되어 있지 않아 NumPy 백엔드만 측정합니다 (pip install numba).")
+    print(f"{'parts':>10} {'작업':<12} {'numpy s':>9} {'numba s':>9} {'첫 호출 s':>10} {'배속':>6} {'일치':>4}")
+
+    results = []
+    for n_parts in args.parts:
+        context = generate_synthetic(n_parts, 0, n_lines=10).to_context()
+        row = {
+            'parts': n_parts,
+            'event_sim': bench_event_sim(context, backends, args.days, args.fill_rate, args.repeat),
+            'monte_carlo': bench_monte_carlo(context, backends, args.paths, args.repeat),
+        }
+        results.append(row)
+        for task, label in (('event_sim', f'사건 {args.days}일'), ('monte_carlo', f'경로 {args.paths:,}')):
+            r = row[task]
+            numba = r.get('numba')
+            print(
+                f"{n_parts:>10,} {label:<12} {r['numpy']['best_s']:>9.3f} "
+                + (f"{numba['best_s']:>9.3f} {numba['first_s']:>10.3f} {r['numpy']['best_s'] / numba['best_s']:>5.1f}x {'예' if r['match'] else '아니오':>4}" if numba else f"{'-':>9} {'-':>10} {'-':>6} {'-':>4}")
+            )
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
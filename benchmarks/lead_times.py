@@ -0,0 +1,107 @@
+"""
+납품 이력 리드타임 추정 벤치마크
+합성 컨텍스트의 공급사 리드타임 / 지연 확률(risk_score)로 납품 로그 CSV를 만든 뒤
+SimulationRepository.fit_lead_times가 청크 스트리밍으로 추정하는 시간, 처리량(행/초)과
+참값 대비 추정 오차(지연 확률, 정상 납품 리드타임)를 보고한다.
+--memory를 주면 tracemalloc으로 한 번 더 실행해 최대 할당량을 잰다 (tracemalloc은 실행을 크게 늦추므로 시간 측정과 분리).
+
+    python benchmarks/lead_times.py --rows 1000000 5000000
+    python benchmarks/lead_times.py --rows 2000000 --suppliers 2000 --chunksize 250000 --memory --json lead_times.json
+"""
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from domain.safety_stock import DEFAULT_DELAY_SCENARIOS
+from infrastructure.repositories import SimulationRepository
+from infrastructure.synthetic import generate_synthetic
+
+
+def write_log(path: Path, context, n_rows: int, seed: int, chunk: int = 1_000_000):
+    """공급사별 risk_score 확률로 DEFAULT_DELAY_SCENARIOS만큼 늦게 입고되는 납품 로그 (헤더는 한글 별칭)"""
+    rng = np.random.default_rng(seed)
+    ids = np.array([s.id for s in context.suppliers])
+    lead = np.array([s.base_lead_time_days for s in context.suppliers])
+    risk = np.array([s.risk_score for s in context.suppliers], dtype=float)
+    days = np.array([d for d, _ in DEFAULT_DELAY_SCENARIOS])
+    probs = np.array([p for _, p in DEFAULT_DELAY_SCENARIOS])
+    start = np.datetime64('2022-01-01')
+    for offset in range(0, n_rows, chunk):
+        n = min(chunk, n_rows - offset)
+        supplier = rng.integers(0, len(ids), n)
+        order = start + rng.integers(0, 730, n).astype('timedelta64[D]')
+        promised = order + lead[supplier].astype('timedelta64[D]')
+        delay = np.where(rng.random(n) < risk[supplier], rng.choice(days, n, p=probs), 0)
+        pd.DataFrame({
+            '공급사코드': ids[supplier],
+            '발주일': order,
+            '납기일': promised,
+            '입고일': promised + delay.astype('timedelta64[D]'),
+        }).to_csv(path, mode='w' if offset == 0 else 'a', header=offset == 0, index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000_000, 5_000_000])
+    parser.add_argument('--suppliers', type=int, default=500)
+    parser.add_argument('--chunksize', type=int, default=500_000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--memory', action='store_true', help='tracemalloc으로 최대 할당량 측정')
+    parser.add_argument('--json', help='결과를 JSON 파일로 저장')
+    args = parser.parse_args()
+
+    context = generate_synthetic(1_000, args.seed, n_suppliers=args.suppliers).to_context()
+    risk = np.array([s.risk_score for s in context.suppliers], dtype=float)
+    lead = np.array([s.base_lead_time_days for s in context.suppliers], dtype=float)
+    repo = SimulationRepository()
+
+    print(f"{'rows':>11} {'파일 MB':>8} {'추정 s':>8} {'행/s':>12} {'메모리 MB':>9} {'지연확률 오차':>12} {'리드타임 오차':>12}")
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_rows in args.rows:
+            path = Path(tmp) / f"deliveries_{n_rows}.csv"
+            write_log(path, context, n_rows, args.seed)
+
+            started = time.perf_counter()
+            fit = repo.fit_lead_times(path, context, chunksize=args.chunksize)
+            elapsed = time.perf_counter() - started
+            peak = None
+            if args.memory:
+                tracemalloc.start()
+                repo.fit_lead_times(path, context, chunksize=args.chunksize)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+
+            row = {
+                'rows': n_rows,
+                'file_mb': path.stat().st_size / 1e6,
+                'fit_s': elapsed,
+                'rows_per_sec': n_rows / elapsed,
+                'peak_mb': peak / 1e6 if peak is not None else None,
+                'risk_mae': float(np.abs(fit.delay_probability - risk).mean()),
+                'lead_time_mae': float(np.abs(fit.nominal_lead_time - lead).mean()),
+                'delay_scenarios': fit.delay_scenarios,
+            }
+            results.append(row)
+            print(
+                f"{n_rows:>11,} {row['file_mb']:>8.0f} {elapsed:>8.2f} {row['rows_per_sec']:>12,.0f} "
+                + (f"{row['peak_mb']:>9.0f} " if peak is not None else f"{'-':>9} ")
+                + f"{row['risk_mae']:>12.4f} {row['lead_time_mae']:>12.3f}"
+            )
+    print("추정 지연 분포:", ", ".join(f"{d:g}일 {p:.1%}" for d, p in results[-1]['delay_scenarios']))
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+단계별 메모리 프로파일 벤치마크
+데이터 크기를 늘려가며 업로드 → 컨텍스트 변환 → 예측 → 차트 생성 파이프라인의
+단계별 peak / 잔존 메모리를 측정해 스케일링 한계(cliff)를 찾는다.
+
+    python benchmarks/memory_profile.py --sizes 1000 10000 100000
+"""
+import argparse
+import io
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from common.memprof import MB, MemoryProfiler
+from common.tracing import span
+from domain.forecast_service import ForecastService
+from domain.tables import part_table
+from presentation.frames import forecast_frames
+from infrastructure.repositories import SimulationRepository
+from infrastructure.synthetic import generate_synthetic
+
+
+def synthetic_csvs(n_parts: int, seed: int = 0):
+    """업로드 파일을 흉내 낸 CSV 버퍼 (부품, 공급사, 생산라인)"""
+    frames = generate_synthetic(n_parts, seed).to_frames()
+    return tuple(io.StringIO(frames[name].to_csv(index=False)) for name in ('parts', 'suppliers', 'production'))
+
+
+def build_charts(forecasts):
+    """대시보드와 같은 Plotly 차트 생성 (plotly가 없으면 건너뜀)"""
+    try:
+        import plotly.express as px
+    except ImportError:
+        return
+    with span('render.forecast_charts'):
+        frames = forecast_frames(forecasts)
+        px.line(frames['price_scenarios'], x='price_increase_pct', y='profit_delta').to_json()
+        px.line(frames['delay_scenarios'], x='delay_days', y='production_loss').to_json()
+
+
+def profile(n_parts: int):
+    parts_csv, suppliers_csv, production_csv = synthetic_csvs(n_parts)
+    with MemoryProfiler() as profiler:
+        context = SimulationRepository().load_context_from_uploads(parts_csv, suppliers_csv, production_csv)
+        forecasts = ForecastService().forecast_scenarios(context)
+        build_charts(forecasts)
+    return profiler, part_table(context.parts)
+
+
+def format_column_report(table) -> str:
+    """부품 컬럼별 저장 dtype과 Part 객체 대비 절감량"""
+    header = f"{'column':<20} {'dtype':<18} {'object MB':>10} {'stored MB':>10} {'saved %':>8}"
+    lines = [header, '-' * len(header)]
+    for c in table.memory_report():
+        lines.append(
+            f"{c.column:<20} {c.stored_dtype:<18} {c.object_bytes / MB:>10.2f} "
+            f"{c.stored_bytes / MB:>10.2f} {c.saved_ratio * 100:>7.1f}%"
+        )
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+    parser.add_argument('--json', help='결과를 JSON 파일로 저장')
+    args = parser.parse_args()
+
+    results = {}
+    for n_parts in args.sizes:
+        profiler, table = profile(n_parts)
+        print(f"\n=== parts: {n_parts:,} ===")
+        print(profiler.format_report())
+        if table is not None:
+            print()
+            print(format_column_report(table))
+        results[n_parts] = profiler.report()
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding='utf-8')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+적응형 몬테카를로 벤치마크
+경로 수를 늘려도 peak 메모리(tracemalloc)가 일정한지와 초당 경로 수, 수렴까지 필요한 경로 수를 보고한다.
+
+    python benchmarks/monte_carlo.py --parts 10000 --paths 100000 1000000 4000000
+    python benchmarks/monte_carlo.py --parts 10000 --rel-tol 0.01 --workers 4
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from domain.monte_carlo import AdaptiveMonteCarlo, RiskSampler
+from event_sim import synthetic_context
+
+
+def measure(sampler: RiskSampler, **options):
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = AdaptiveMonteCarlo(**options).run(sampler)
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--parts', type=int, default=10_000)
+    parser.add_argument('--paths', type=int, nargs='*', default=[100_000, 1_000_000, 4_000_000],
+                        help='고정 경로 수 (허용 오차 0으로 max_paths까지 실행)')
+    parser.add_argument('--rel-tol', type=float, default=0.01, help='적응형 실행의 허용 오차')
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    sampler = RiskSampler.from_context(synthetic_context(args.parts), price_mean_pct=5.0)
+    print(f"공급사 {len(sampler.spend):,}개, 라인 {len(sampler.line_capacity)}개")
+
+    print(f"\n{'paths':>12} {'seconds':>9} {'paths/s':>12} {'peak MB':>9}")
+    for paths in args.paths:
+        result, elapsed, peak = measure(sampler, rel_tol=0.0, max_paths=paths, workers=args.workers, seed=args.seed)
+        print(f"{result.paths:>12,} {elapsed:>9.2f} {result.paths / elapsed:>12,.0f} {peak / 2 ** 20:>9.1f}")
+
+    result, elapsed, peak = measure(sampler, rel_tol=args.rel_tol, workers=args.workers, seed=args.seed)
+    status = '수렴' if result.converged else '최대 경로 수 도달'
+    print(f"\n허용 오차 {args.rel_tol:g}: 경로 {result.paths:,}개, {elapsed:.2f}s, peak {peak / 2 ** 20:.1f} MB ({status})")
+    for record in result.to_records():
+        print(f"  {record['kpi']:<16} P{record['quantile'] * 100:<5g} {record['value']:>16,.1f}"
+              f"  [{record['lower']:,.1f}, {record['upper']:,.1f}]")
+
+
+if __name__ == '__main__':
+    main()
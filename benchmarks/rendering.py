@@ -0,0 +1,135 @@
+"""
+차트/표 렌더링 페이로드 벤치마크
+브라우저로 보내는 데이터 크기와 직렬화 시간을 원본 / 축소(LTTB, coarse-to-fine, 페이지) 경로로 비교한다.
+- 선 그래프: px.line(...).to_json() 바이트 수와 시간 (streamlit.plotly_chart가 보내는 JSON)
+- 히트맵: go.Heatmap 단계별 JSON 크기, 첫 단계까지 걸린 시간
+- 표: Arrow IPC 바이트 수 (streamlit.dataframe 전송 형식)
+
+    python benchmarks/rendering.py --points 100000 1000000 --grid 601 301 --rows 1000000
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from presentation.rendering import DEFAULT_MAX_POINTS, DEFAULT_PAGE_SIZE, decimate_frame, heatmap_levels, page_frame
+
+
+def timed(func, *args, **kwargs):
+    started = time.perf_counter()
+    value = func(*args, **kwargs)
+    return value, time.perf_counter() - started
+
+
+def line_payload(df: pd.DataFrame) -> int:
+    import plotly.express as px
+    return len(px.line(df, x='day', y='value', markers=True).to_json())
+
+
+def heatmap_payload(x, y, z) -> int:
+    import plotly.graph_objects as go
+    return len(go.Figure(go.Heatmap(x=x, y=y, z=z)).to_json())
+
+
+def arrow_bytes(df: pd.DataFrame) -> int:
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().size
+
+
+def bench_lines(n_points: int, rng) -> dict:
+    df = pd.DataFrame({'day': np.arange(n_points), 'value': np.cumsum(rng.normal(size=n_points))})
+    full_bytes, full_s = timed(line_payload, df)
+    decimated, decimate_s = timed(decimate_frame, df, 'day', ['value'], DEFAULT_MAX_POINTS)
+    small_bytes, small_s = timed(line_payload, decimated)
+    return {
+        'points': n_points, 'kept': len(decimated),
+        'full_bytes': full_bytes, 'full_s': full_s,
+        'decimated_bytes': small_bytes, 'decimate_s': decimate_s, 'decimated_s': small_s,
+        # 모양 보존: 줄인 점을 선형 보간했을 때의 최대 오차 (값 범위 대비), 같은 점 수의 등간격 추출과 비교
+        'lttb_error': shape_error(df, decimated),
+        'stride_error': shape_error(df, df.iloc[::max(1, n_points // len(decimated))]),
+    }
+
+
+def shape_error(df: pd.DataFrame, kept: pd.DataFrame) -> float:
+    y = df['value'].to_numpy()
+    approx = np.interp(df['day'].to_numpy(), kept['day'].to_numpy(), kept['value'].to_numpy())
+    return float(np.abs(approx - y).max() / (y.max() - y.min()))
+
+
+def bench_heatmap(nx: int, ny: int, rng) -> dict:
+    x, y = np.linspace(-30, 30, nx), np.arange(ny)
+    z = np.add.outer(y * -1000.0, x * 5000.0) + rng.normal(scale=1000, size=(ny, nx))
+    full_bytes, full_s = timed(heatmap_payload, x, y, z)
+
+    levels = []
+    started = time.perf_counter()
+    first_s = None
+    for lx, ly, lz in heatmap_levels(x, y, z, first_cells=32, max_cells=300):
+        levels.append({'shape': [len(ly), len(lx)], 'bytes': heatmap_payload(lx, ly, lz)})
+        first_s = first_s if first_s is not None else time.perf_counter() - started
+    return {
+        'grid': [ny, nx], 'full_bytes': full_bytes, 'full_s': full_s,
+        'levels': levels, 'first_level_s': first_s, 'progressive_s': time.perf_counter() - started,
+    }
+
+
+def bench_table(n_rows: int, rng) -> dict:
+    df = pd.DataFrame({
+        'part_id': [f'P{i}' for i in range(n_rows)],
+        'profit_delta': rng.normal(size=n_rows),
+        'production_loss': rng.integers(0, 1000, n_rows),
+    })
+    full_bytes, full_s = timed(arrow_bytes, df)
+    (page, _), page_s = timed(page_frame, df, 1, DEFAULT_PAGE_SIZE)
+    return {'rows': n_rows, 'full_bytes': full_bytes, 'full_s': full_s, 'page_bytes': arrow_bytes(page), 'page_s': page_s}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--points', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--grid', type=int, nargs=2, default=[601, 301], metavar=('NX', 'NY'))
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--json', help='결과를 JSON 파일로 저장')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    result = {'lines': [], 'heatmap': None, 'table': None}
+    for n in args.points:
+        r = bench_lines(n, rng)
+        result['lines'].append(r)
+        print(
+            f"선 {n:>9,}점: 원본 {r['full_bytes'] / 1e6:7.2f} MB {r['full_s']:.2f}s -> "
+            f"LTTB {r['kept']:,}점 {r['decimated_bytes'] / 1e6:.3f} MB {r['decimate_s'] + r['decimated_s']:.3f}s"
+            f" (보간 오차 {r['lttb_error']:.1%}, 등간격 추출 {r['stride_error']:.1%})"
+        )
+
+    r = result['heatmap'] = bench_heatmap(*args.grid, rng)
+    print(f"히트맵 {r['grid'][0]} × {r['grid'][1]}: 원본 {r['full_bytes'] / 1e6:.2f} MB {r['full_s']:.2f}s")
+    for level in r['levels']:
+        print(f"  단계 {level['shape'][0]} × {level['shape'][1]}: {level['bytes'] / 1e6:.3f} MB")
+    print(f"  첫 단계 {r['first_level_s']:.3f}s, 전체 단계 {r['progressive_s']:.3f}s")
+
+    r = result['table'] = bench_table(args.rows, rng)
+    print(
+        f"표 {r['rows']:,}행: 전체 {r['full_bytes'] / 1e6:.2f} MB {r['full_s']:.2f}s -> "
+        f"페이지 {DEFAULT_PAGE_SIZE}행 {r['page_bytes'] / 1e3:.1f} KB {r['page_s'] * 1e3:.2f}ms"
+    )
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+재발주 정책 스윕 벤치마크
+부품 수별로 (s, S) / (R, S) 후보 정책(기본 안전 일수 10 × 주기 일수 10 = 100개) 전체를 평가해 부품별 최적 정책을 고르는
+시간과 초당 평가 셀(부품 × 후보) 수, 기준 정책 대비 일평균 비용을 보고한다.
+--simulate를 주면 기준 정책과 최적 (s, S) 정책으로 이산 사건 시뮬레이션을 돌려 결품량 / 평균 재고를 비교한다
+(--delay: 고위험 공급사(risk_score > 0.4)의 입고 지연 일수, 결품량은 초기 재고 소진 구간 --warmup 일 이후만 센다).
+
+    python benchmarks/replenishment.py --parts 10000 100000
+    python benchmarks/replenishment.py --parts 100000 --target 0.98 --simulate --json replenishment.json
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from domain.event_sim import SupplyEventSimulator
+from domain.replenishment import POLICY_KINDS, ReorderPolicySweep
+from infrastructure.synthetic import generate_synthetic
+
+
+def best_of(func, repeat: int):
+    timings, value = [], None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        value = func()
+        timings.append(time.perf_counter() - started)
+    return min(timings), value
+
+
+def simulate(context, plan, days: int, delay_days: int, warmup: int) -> dict:
+    risky = [s.id for s in context.suppliers if s.risk_score > 0.4]
+    out = {}
+    for label, policy in (('baseline', None), ('optimized', plan)):
+        trace = SupplyEventSimulator(horizon_days=days, delay_days=delay_days, delayed_suppliers=risky, policy=policy).run(context)
+        out[label] = {
+            'shortage': float(trace.shortage[warmup:].sum()),
+            'mean_inventory': float(trace.inventory[warmup:].mean()),
+            'orders': trace.orders,
+        }
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--parts', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--kinds', nargs='+', choices=POLICY_KINDS, default=list(POLICY_KINDS))
+    parser.add_argument('--target', type=float, default=None, help='목표 fill rate (없으면 비용 최소)')
+    parser.add_argument('--demand-cv', type=float, default=0.3)
+    parser.add_argument('--simulate', action='store_true', help='(s, S) 최적 정책을 이산 사건 시뮬레이션으로 검증')
+    parser.add_argument('--days', type=int, default=180)
+    parser.add_argument('--delay', type=int, default=10, help='시뮬레이션에서 고위험 공급사 입고 지연 일수')
+    parser.add_argument('--warmup', type=int, default=60, help='결품 / 재고 집계에서 제외할 초기 일수')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', help='결과를 JSON 파일로 저장')
+    args = parser.parse_args()
+
+    print(f"{'parts':>10} {'정책':<4} {'후보':>5} {'시간 s':>8} {'셀/s':>12} {'기준 비용/일':>14} {'최적 비용/일':>14} {'목표 달성':>8}")
+    results = []
+    for n_parts in args.parts:
+        context = generate_synthetic(n_parts, 0, n_lines=10).to_context()
+        for kind in args.kinds:
+            sweep = ReorderPolicySweep(kind=kind, target_fill_rate=args.target, demand_cv=args.demand_cv)
+            elapsed, plan = best_of(lambda: sweep.optimize(context), args.repeat)
+            row = {
+                'parts': n_parts,
+                'kind': kind,
+                'candidates': sweep.candidates,
+                'best_s': elapsed,
+                'cells_per_sec': n_parts * sweep.candidates / elapsed,
+                'baseline_daily_cost': plan.total_baseline_cost,
+                'daily_cost': plan.total_daily_cost,
+                'meets_target': float(plan.meets_target.mean()),
+            }
+            print(
+                f"{n_parts:>10,} {kind:<4} {sweep.candidates:>5} {elapsed:>8.3f} {row['cells_per_sec']:>12,.0f} "
+                f"{plan.total_baseline_cost:>14,.0f} {plan.total_daily_cost:>14,.0f} {row['meets_target']:>8.1%}"
+            )
+            if args.simulate and kind == 'sS':
+                row['simulation'] = simulate(context, plan, args.days, args.delay, args.warmup)
+                for label, sim in row['simulation'].items():
+                    print(f"{'':>10} └ {label:<9} 결품 {sim['shortage']:>14,.0f}  평균 재고 {sim['mean_inventory']:>14,.0f}  발주 {sim['orders']:>9,}")
+            results.append(row)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,397 @@
+"""
+대시보드 동시 세션 부하 테스트 (서비스 계층)
+세션마다 실제 사용 흐름(CSV 업로드 → 슬라이더 조작 → 섹션 토글/예측 보기 전환)을 상호작용 기록(trace)으로 만들고,
+N개 세션을 동시에 재생하며 대시보드 재실행(rerun) 한 번이 호출하는 저장소/서비스 묶음의 지연 시간을 잰다.
+
+- rerun 한 번: (업로드 단계면 CSV 파싱 + 서비스 생성) → run_simulation → 켜진 섹션의 서비스 호출
+  (인사이트, 드릴다운, 안전재고, 예측 보기, 저장 결과 조회). 차트/표 렌더링은 포함하지 않는다.
+- 결과 저장소와 백그라운드 계산(BackgroundTasks)은 대시보드처럼 모든 세션이 공유한다.
+  대시보드에서는 무거운 계산 중에 자리표시자를 보여 주지만, 여기서는 결과가 나올 때까지를 rerun 지연으로 잰다.
+- --mode threads: 한 프로세스 안의 세션 스레드 (대시보드 인스턴스 하나, GIL 공유)
+  --mode processes: 세션마다 프로세스 하나 (저장소/백그라운드 캐시는 프로세스별)
+- 세션 i의 기록은 세션 수와 무관하게 같으므로 세션 수별 결과를 그대로 비교할 수 있다.
+- 리포트(JSON)에는 커밋/환경 정보가 들어가며 --compare로 이전 버전 리포트와 비교한다.
+
+    python benchmarks/session_load.py --parts 20000 --sessions 1 2 4 8 16 --json before.json
+    python benchmarks/session_load.py --parts 20000 --sessions 1 2 4 8 16 --compare before.json
+    python benchmarks/session_load.py --mode processes --think-ms 0 --spans
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from application.services import SimulationService
+from common.memprof import MB, current_rss
+from common.tracing import get_tracer
+from domain.columnar import context_fingerprint
+from domain.forecast_service import ForecastService
+from domain.insights_service import InsightsService
+from infrastructure.repositories import SimulationRepository
+from infrastructure.result_store import SqliteScenarioResultStore
+from infrastructure.synthetic import generate_synthetic
+from presentation.background import BackgroundTasks
+
+SECTIONS = ('insights', 'drill_down', 'safety_stock', 'saved_results')
+FORECAST_VIEWS = ('hide', 'price', 'delay', 'trend', 'grid', 'distribution')
+DRILL_DIMENSIONS = ('supplier', 'line', 'category')
+
+# 다음 상호작용 종류별 비율 (업로드 직후 첫 rerun 제외)
+STEP_WEIGHTS = {'slider': 0.55, 'section': 0.2, 'view': 0.2, 'upload': 0.05}
+
+
+@dataclass(frozen=True)
+class Step:
+    """rerun 한 번을 일으키는 상호작용과 그 시점의 위젯 상태"""
+    kind: str                          # upload / slider / section / view
+    price_increase: float = 0.0
+    delay_days: int = 0
+    fx_shock: float = 0.0
+    sections: Tuple[str, ...] = ('insights',)
+    forecast_view: str = 'hide'
+    drill_by: str = 'supplier'
+
+
+def make_trace(seed: int, steps: int) -> List[Step]:
+    """세션 하나의 상호작용 기록 (슬라이더는 놓을 때 rerun되므로 조작 한 번이 rerun 한 번)"""
+    rng = random.Random(seed)
+    state = Step('upload')
+    trace = [state]
+    kinds, weights = zip(*STEP_WEIGHTS.items())
+    while len(trace) < steps:
+        kind = rng.choices(kinds, weights)[0]
+        if kind == 'slider':
+            # 같은 슬라이더를 몇 번 연달아 조금씩 움직이는 조작
+            slider = rng.choice(('price', 'delay', 'fx'))
+            for _ in range(rng.randint(1, 4)):
+                if slider == 'price':
+                    state = replace(state, kind=kind, price_increase=float(min(50, max(-50, state.price_increase + rng.randint(-10, 10)))))
+                elif slider == 'delay':
+                    state = replace(state, kind=kind, delay_days=min(30, max(0, state.delay_days + rng.randint(-5, 5))))
+                else:
+                    state = replace(state, kind=kind, fx_shock=float(min(30, max(-30, state.fx_shock + rng.randint(-5, 5)))))
+                trace.append(state)
+            continue
+        if kind == 'section':
+            toggled = rng.choice(SECTIONS)
+            sections = tuple(s for s in SECTIONS if (s in state.sections) != (s == toggled))
+            drill_by = rng.choice(DRILL_DIMENSIONS) if toggled == 'drill_down' else state.drill_by
+            state = replace(state, kind=kind, sections=sections, drill_by=drill_by)
+        elif kind == 'view':
+            state = replace(state, kind=kind, forecast_view=rng.choice([v for v in FORECAST_VIEWS if v != state.forecast_view]))
+        else:
+            state = replace(state, kind=kind)
+        trace.append(state)
+    return trace[:steps]
+
+
+class SharedState:
+    """대시보드의 st.cache_resource에 해당하는 세션 공용 객체 (결과 저장소, 백그라운드 계산)"""
+
+    def __init__(self, csv_paths: Dict[str, str]):
+        self.csv_paths = csv_paths
+        self.result_store = SqliteScenarioResultStore(':memory:')
+        self.background = BackgroundTasks()
+
+    def compute(self, key, func, *args):
+        return self.background.submit(key, func, *args).result()
+
+
+class Session:
+    """세션 하나의 st.session_state (업로드로 만든 서비스)"""
+
+    def __init__(self, session_id: int, shared: SharedState):
+        self.session_id = session_id
+        self.shared = shared
+        self.service: Optional[SimulationService] = None
+
+    def rerun(self, step: Step):
+        """대시보드 스크립트 한 번 실행에 해당하는 저장소/서비스 호출"""
+        shared = self.shared
+        if step.kind == 'upload' or self.service is None:
+            context = SimulationRepository().load_context_from_uploads(
+                parts_csv=shared.csv_paths['parts'],
+                suppliers_csv=shared.csv_paths['suppliers'],
+                production_csv=shared.csv_paths['production']
+            )
+            self.service = SimulationService(context, result_store=shared.result_store, scope=f'session-{self.session_id}')
+        service = self.service
+        context = service.context
+        context_key = context_fingerprint(context)
+
+        currencies = sorted({s.currency for s in context.suppliers if s.currency})
+        currency_shocks = {currencies[0]: step.fx_shock} if currencies else {}
+        result = service.run_simulation(step.price_increase, step.delay_days, currency_shocks, {})
+
+        if 'insights' in step.sections:
+            InsightsService().generate_insights(context, result, step.price_increase, step.delay_days)
+        if 'drill_down' in step.sections:
+            for dim in DRILL_DIMENSIONS:
+                if dim != step.drill_by:
+                    service.cube.query(by=(dim,)).to_records()
+            service.drill_down(step.price_increase, step.delay_days, [step.drill_by])
+        if 'safety_stock' in step.sections:
+            budget = float(round(service.cube.total()['monthly_spend'] * 0.1, -2))
+            shared.compute(('safety_stock', context_key, budget), service.optimize_safety_stock, budget)
+
+        forecast = ForecastService(result_store=shared.result_store, scope=service.scope)
+        if step.forecast_view in ('price', 'delay'):
+            shared.compute(('forecast', context_key), forecast.forecast_scenarios, context)
+        elif step.forecast_view == 'trend' and (step.price_increase > 0 or step.delay_days > 0):
+            shared.compute(
+                ('trend', context_key, step.price_increase, step.delay_days),
+                forecast.get_risk_trend, context, step.price_increase, step.delay_days
+            )
+        elif step.forecast_view == 'grid':
+            shared.compute(('forecast_grid', context_key, 1.0), forecast.forecast_grid, context, 30.0, 30, 1.0, 1)
+        elif step.forecast_view == 'distribution':
+            shared.compute(('distribution', context_key, step.price_increase), forecast.forecast_distribution, context, step.price_increase)
+
+        if 'saved_results' in step.sections:
+            shared.result_store.query(scope=service.scope, kind='simulation', min_delay=0, limit=200)
+
+
+def play(session: Session, trace: Sequence[Step], think_s: float, seed: int) -> Dict:
+    """기록을 재생하고 rerun별 (종류, 지연 ms)와 오류를 반환 (rerun 사이에 think_s 전후의 대기)"""
+    rng = random.Random(seed)
+    latencies: List[Tuple[str, float]] = []
+    errors: List[str] = []
+    for step in trace:
+        started = time.perf_counter()
+        try:
+            session.rerun(step)
+        except Exception as e:
+            errors.append(f"{step.kind}: {type(e).__name__}: {e}")
+        latencies.append((step.kind, (time.perf_counter() - started) * 1000))
+        if think_s:
+            time.sleep(think_s * rng.uniform(0.5, 1.5))
+    return {'latencies': latencies, 'errors': errors}
+
+
+class RssSampler:
+    """백그라운드 스레드로 RSS 최댓값 기록"""
+
+    def __init__(self, interval: float = 0.02):
+        self.interval = interval
+        self.peak = current_rss() or 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='session-load-rss', daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, current_rss() or 0)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, current_rss() or 0)
+        return False
+
+
+def cpu_seconds(who: int = resource.RUSAGE_SELF) -> float:
+    usage = resource.getrusage(who)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _process_session(session_id: int, csv_paths: Dict[str, str], steps: int, think_s: float, seed: int, spans: bool) -> Dict:
+    """--mode processes의 세션 하나 (프로세스별 공용 객체, 자기 RSS 최댓값과 스팬 요약 포함)"""
+    tracer = get_tracer()
+    tracer.enabled = spans
+    tracer.clear()
+    with RssSampler() as rss:
+        out = play(Session(session_id, SharedState(csv_paths)), make_trace(seed + session_id, steps), think_s, seed + session_id)
+    out['peak_rss'] = rss.peak
+    out['spans'] = tracer.summary() if spans else []
+    return out
+
+
+def quantiles(ms: Sequence[float]) -> Dict[str, float]:
+    ms = sorted(ms)
+    if not ms:
+        return {'p50_ms': 0.0, 'p95_ms': 0.0, 'p99_ms': 0.0, 'max_ms': 0.0}
+    pick = lambda q: ms[min(len(ms) - 1, int(q * len(ms)))]
+    return {'p50_ms': pick(0.50), 'p95_ms': pick(0.95), 'p99_ms': pick(0.99), 'max_ms': ms[-1]}
+
+
+def merge_spans(summaries: Sequence[Sequence[Dict]], top: int = 10) -> List[Dict]:
+    merged: Dict[str, Dict] = {}
+    for summary in summaries:
+        for s in summary:
+            m = merged.setdefault(s['name'], {'name': s['name'], 'calls': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+            m['calls'] += s['calls']
+            m['total_ms'] += s['total_ms']
+            m['max_ms'] = max(m['max_ms'], s['max_ms'])
+    return sorted(merged.values(), key=lambda s: -s['total_ms'])[:top]
+
+
+def run_level(n_sessions: int, mode: str, csv_paths: Dict[str, str], steps: int, think_s: float, seed: int, spans: bool) -> Dict:
+    """세션 n_sessions개를 동시에 재생한 결과 한 줄"""
+    tracer = get_tracer()
+    rss_before = current_rss() or 0
+    cpu_before = cpu_seconds(resource.RUSAGE_SELF) + cpu_seconds(resource.RUSAGE_CHILDREN)
+    started = time.perf_counter()
+
+    if mode == 'threads':
+        tracer.enabled = spans
+        tracer.clear()
+        shared = SharedState(csv_paths)
+        outputs: List[Optional[Dict]] = [None] * n_sessions
+
+        def worker(i: int):
+            outputs[i] = play(Session(i, shared), make_trace(seed + i, steps), think_s, seed + i)
+
+        with RssSampler() as rss:
+            threads = [threading.Thread(target=worker, args=(i,), name=f'session-{i}') for i in range(n_sessions)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        peak_rss = rss.peak
+        span_summaries = [tracer.summary()] if spans else []
+        tracer.enabled = False
+    else:
+        with ProcessPoolExecutor(max_workers=n_sessions) as pool:
+            futures = [pool.submit(_process_session, i, csv_paths, steps, think_s, seed, spans) for i in range(n_sessions)]
+            outputs = [f.result() for f in futures]
+        # 세션 프로세스의 RSS 최댓값 합 (동시에 최대였다고 가정한 상한) + 부모
+        peak_rss = sum(o['peak_rss'] for o in outputs) + rss_before
+        span_summaries = [o['spans'] for o in outputs]
+
+    elapsed = time.perf_counter() - started
+    cpu = cpu_seconds(resource.RUSAGE_SELF) + cpu_seconds(resource.RUSAGE_CHILDREN) - cpu_before
+    latencies = [x for o in outputs for x in o['latencies']]
+    errors = [e for o in outputs for e in o['errors']]
+    by_kind = {}
+    for kind in ('upload', 'slider', 'section', 'view'):
+        ms = [t for k, t in latencies if k == kind]
+        if ms:
+            by_kind[kind] = {'reruns': len(ms), **quantiles(ms)}
+    return {
+        'sessions': n_sessions,
+        'mode': mode,
+        'reruns': len(latencies),
+        'errors': len(errors),
+        'error_samples': errors[:5],
+        'elapsed_s': elapsed,
+        'reruns_per_sec': len(latencies) / elapsed if elapsed else 0.0,
+        **quantiles([t for _, t in latencies]),
+        'by_kind': by_kind,
+        'cpu_s': cpu,
+        'cpu_util': cpu / elapsed / (os.cpu_count() or 1) if elapsed else 0.0,
+        'peak_rss_mb': peak_rss / MB,
+        'rss_per_session_mb': max(0, peak_rss - rss_before) / MB / n_sessions,
+        'top_spans': merge_spans(span_summaries),
+    }
+
+
+def git_revision() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=Path(__file__).resolve().parent,
+            capture_output=True, text=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return (out.stdout.strip() or None) if out.returncode == 0 else None
+
+
+def format_row(r: Dict) -> str:
+    return (
+        f"{r['sessions']:>8} {r['reruns']:>7} {r['errors']:>6} {r['reruns_per_sec']:>9.1f} "
+        f"{r['p50_ms']:>9.1f} {r['p95_ms']:>9.1f} {r['p99_ms']:>9.1f} {r['max_ms']:>9.1f} "
+        f"{r['cpu_util'] * 100:>6.0f}% {r['peak_rss_mb']:>9.0f} {r['rss_per_session_mb']:>9.1f}"
+    )
+
+
+def format_comparison(baseline: Dict, results: Sequence[Dict]) -> str:
+    """세션 수가 같은 줄끼리 이전 리포트와 비교 (비율 = 현재 / 이전)"""
+    old = {r['sessions']: r for r in baseline['results'] if r['mode'] == results[0]['mode']}
+    meta = baseline.get('meta', {})
+    lines = [f"비교 기준: {meta.get('git') or '?'} ({meta.get('created_at', '?')})"]
+    lines.append(f"{'sessions':>8} {'p95 ms':>18} {'ratio':>6} {'reruns/s':>16} {'ratio':>6} {'RSS MB':>14}")
+    for r in results:
+        b = old.get(r['sessions'])
+        if b is None:
+            continue
+        ratio = lambda new, prev: new / prev if prev else float('nan')
+        lines.append(
+            f"{r['sessions']:>8} {b['p95_ms']:>8.1f} → {r['p95_ms']:>7.1f} {ratio(r['p95_ms'], b['p95_ms']):>6.2f} "
+            f"{b['reruns_per_sec']:>7.1f} → {r['reruns_per_sec']:>6.1f} {ratio(r['reruns_per_sec'], b['reruns_per_sec']):>6.2f} "
+            f"{b['peak_rss_mb']:>6.0f} → {r['peak_rss_mb']:>5.0f}"
+        )
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--parts', type=int, default=20_000, help='업로드할 합성 데이터 부품 수')
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1, 2, 4, 8, 16])
+    parser.add_argument('--steps', type=int, default=30, help='세션당 rerun 수')
+    parser.add_argument('--think-ms', type=float, default=300.0, help='rerun 사이 평균 대기 (0이면 쉬지 않고 재생)')
+    parser.add_argument('--mode', choices=('threads', 'processes'), default='threads')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--spans', action='store_true', help='스팬 계측을 켜고 소요 시간 상위 구간을 리포트에 포함')
+    parser.add_argument('--json', help='리포트를 JSON 파일로 저장')
+    parser.add_argument('--compare', help='이전 리포트(JSON)와 비교')
+    args = parser.parse_args()
+
+    meta = {
+        'git': git_revision(),
+        'created_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'parts': args.parts,
+        'steps': args.steps,
+        'think_ms': args.think_ms,
+        'mode': args.mode,
+        'seed': args.seed,
+    }
+    print(f"부품 {args.parts:,}개 CSV, 세션당 rerun {args.steps}회, 대기 {args.think_ms:.0f} ms, {args.mode} (CPU {os.cpu_count()}개, 커밋 {meta['git']})")
+    print(f"{'sessions':>8} {'reruns':>7} {'errors':>6} {'reruns/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9} {'CPU':>7} {'RSS MB':>9} {'MB/sess':>9}")
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_paths = {name: str(path) for name, path in generate_synthetic(args.parts).write_csvs(tmp).items()}
+        for n in args.sessions:
+            r = run_level(n, args.mode, csv_paths, args.steps, args.think_ms / 1000, args.seed, args.spans)
+            results.append(r)
+            print(format_row(r))
+
+    last = results[-1]
+    print(f"\n세션 {last['sessions']}개 상호작용별 p95 (ms): " + ", ".join(f"{k} {v['p95_ms']:.1f} ({v['reruns']}회)" for k, v in last['by_kind'].items()))
+    for r in results:
+        for sample in r['error_samples']:
+            print(f"[오류] 세션 {r['sessions']}개: {sample}")
+    if last['top_spans']:
+        print(f"\n세션 {last['sessions']}개 소요 시간 상위 구간")
+        for s in last['top_spans']:
+            print(f"  {s['name']:<40} {s['calls']:>6}회 {s['total_ms']:>10.1f} ms (최대 {s['max_ms']:.1f})")
+
+    report = {'meta': meta, 'results': results}
+    if args.compare:
+        print()
+        print(format_comparison(json.loads(Path(args.compare).read_text()), results))
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,258 @@
+"""
+다중 공장 연합 (Federation)
+SimulationService는 컨텍스트 하나만 다루므로, 그룹 전체(공장 수백 개)를 보려면 공장별 컨텍스트를
+여러 워커 프로세스에 나눠 두고 같은 시나리오를 동시에 평가한 뒤 KPI를 합산한다.
+
+- 공장은 워커 수만큼의 샤드로 나누고, 샤드마다 전용 프로세스(ProcessPoolExecutor(max_workers=1))를 둔다.
+  컨텍스트는 워커에 보낸 첫 작업에서 한 번만 로드해 그 프로세스에 상주하므로, 시나리오 요청마다 보내는 것은
+  시나리오 목록뿐이다. 부모 프로세스는 공장 데이터를 들고 있지 않는다.
+  (로드를 풀 initializer가 아닌 작업으로 하므로, 실패하면 BrokenProcessPool 대신 공장 이름이 담긴 오류가 올라온다)
+- 공장 소스: load()로 SimulationContext를 돌려주는 객체(PlantSpec 등) 또는 SimulationContext
+- 공급사 노출: 여러 공장에 같은 Supplier_ID로 등장하는 공급사는 하나로 합쳐(중복 제거)
+  그룹 전체 구매액, 거래 공장 수, 부품 수를 집계한다.
+- workers=1이면 프로세스 없이 현재 프로세스에서 평가한다.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from application.services import SimulationService
+from common.memprof import current_rss
+from common.tracing import span, traced
+from domain.columnar import get_columns
+from domain.models import SimulationContext
+
+
+@dataclass(frozen=True)
+class PlantSpec:
+    """공장 하나의 CSV 파일 묶음 (워커 프로세스에서 로드)"""
+    parts_csv: str
+    suppliers_csv: str
+    production_csv: str
+
+    def load(self) -> SimulationContext:
+        from infrastructure.repositories import SimulationRepository
+
+        return SimulationRepository().load_context_from_uploads(self.parts_csv, self.suppliers_csv, self.production_csv)
+
+
+def plants_from_directory(root) -> Dict[str, PlantSpec]:
+    """root 아래 하위 폴더 하나를 공장 하나로 본다 (파일 이름 규칙은 application.ingest.FILE_PATTERNS)"""
+    from application.ingest import FolderIngestService
+
+    plants = {}
+    for directory in sorted(p for p in Path(root).iterdir() if p.is_dir()):
+        files = FolderIngestService(directory, settle_s=0.0).find_files()
+        if len(files) == 3:
+            plants[directory.name] = PlantSpec(str(files['parts']), str(files['suppliers']), str(files['production']))
+    return plants
+
+
+class PlantShard:
+    """한 프로세스가 맡는 공장 묶음 (로드된 서비스 보관)"""
+
+    def __init__(self, plants: Sequence[Tuple[str, Any]]):
+        self.services: Dict[str, SimulationService] = {}
+        for name, source in plants:
+            try:
+                context = source.load() if hasattr(source, 'load') else source
+            except Exception as exc:
+                raise ValueError(f"공장 '{name}' 로드 실패: {exc}") from exc
+            self.services[name] = SimulationService(context, scope=name)
+
+    def sizes(self) -> Dict[str, int]:
+        return {name: len(service.context.parts) for name, service in self.services.items()}
+
+    def rss(self) -> Optional[int]:
+        return current_rss()
+
+    def evaluate(self, scenarios: Sequence[Mapping[str, Any]]) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """공장별 (영업이익 변화, 생산 손실) 시나리오 배열"""
+        out = {}
+        for name, service in self.services.items():
+            results = service.run_simulation_batch(scenarios)
+            out[name] = (
+                np.array([r.profit_delta for r in results], dtype=np.float64),
+                np.array([r.production_loss for r in results], dtype=np.float64),
+            )
+        return out
+
+    def supplier_spend(self) -> Dict[str, Tuple[List[str], List[str], np.ndarray, np.ndarray, np.ndarray]]:
+        """공장별 (공급사 ID, 이름, 리스크, 월간 구매액, 부품 수)"""
+        out = {}
+        for name, service in self.services.items():
+            cols = get_columns(service.context)
+            known = cols.supplier_index >= 0
+            spend = np.bincount(cols.supplier_index[known], weights=(cols.unit_price * cols.monthly_usage)[known], minlength=len(cols.supplier_ids))
+            counts = np.bincount(cols.supplier_index[known], minlength=len(cols.supplier_ids))
+            names = [s.name for s in service.context.suppliers]
+            out[name] = (cols.supplier_ids, names, cols.supplier_risk, spend, counts)
+        return out
+
+
+# --- 워커 프로세스 쪽 (프로세스당 샤드 하나) ---
+
+_SHARD: Optional[PlantShard] = None
+
+
+def _load_shard(plants: Sequence[Tuple[str, Any]]) -> Dict[str, int]:
+    global _SHARD
+    _SHARD = PlantShard(plants)
+    return _SHARD.sizes()
+
+
+def _call(method: str, *args: Any):
+    return getattr(_SHARD, method)(*args)
+
+
+@dataclass
+class FederationResult:
+    """공장 × 시나리오 KPI (행: plants 순서, 열: 시나리오 순서)"""
+    plants: List[str]
+    profit_delta: np.ndarray
+    production_loss: np.ndarray
+
+    def totals(self) -> List[Dict]:
+        """시나리오별 그룹 합계와 영업이익 영향이 가장 큰 공장"""
+        profit, loss = self.profit_delta.sum(axis=0), self.production_loss.sum(axis=0)
+        worst = self.profit_delta.argmin(axis=0) if len(self.plants) else np.zeros(len(profit), dtype=np.int64)
+        return [
+            {
+                'scenario': i,
+                'profit_delta': float(profit[i]),
+                'production_loss': int(round(loss[i])),
+                'worst_plant': self.plants[worst[i]] if len(self.plants) else None,
+            }
+            for i in range(len(profit))
+        ]
+
+    def plant_records(self, scenario: int = 0) -> List[Dict]:
+        """시나리오 하나의 공장별 KPI"""
+        return [
+            {'plant': plant, 'profit_delta': float(self.profit_delta[i, scenario]), 'production_loss': int(round(self.production_loss[i, scenario]))}
+            for i, plant in enumerate(self.plants)
+        ]
+
+
+class Federation:
+    """
+    공장별 컨텍스트 연합
+    사용 예:
+        with Federation(plants_from_directory('plants/'), workers=8) as group:
+            result = group.evaluate([{'price_increase_pct': 10, 'delay_days': 7}])
+            print(result.totals(), group.supplier_exposure(10)[:10])
+    """
+
+    def __init__(self, plants: Mapping[str, Any], workers: int = 1):
+        if not plants:
+            raise ValueError("연합에 포함할 공장이 없습니다.")
+        items = list(plants.items())
+        self.workers = max(1, min(workers, len(items)))
+        shards = [items[i::self.workers] for i in range(self.workers)]
+
+        self._local: Optional[PlantShard] = None
+        self._executors: List[ProcessPoolExecutor] = []
+        self.sizes: Dict[str, int] = {}
+        try:
+            with span('federation.load', plants=len(items), workers=self.workers):
+                if self.workers == 1:
+                    self._local = PlantShard(items)
+                    self.sizes.update(self._local.sizes())
+                else:
+                    # 로드 오류가 첫 평가가 아니라 생성 시점에 드러나도록 모든 샤드의 로드를 기다린다
+                    self._executors = [ProcessPoolExecutor(max_workers=1) for _ in shards]
+                    futures = [executor.submit(_load_shard, shard) for executor, shard in zip(self._executors, shards)]
+                    for future in futures:
+                        self.sizes.update(future.result())
+        except BaseException:
+            self.close()
+            raise
+        self.plants = [name for name, _ in items]
+
+    def _gather(self, method: str, *args: Any) -> List[Any]:
+        if self._local is not None:
+            return [getattr(self._local, method)(*args)]
+        futures = [executor.submit(_call, method, *args) for executor in self._executors]
+        return [f.result() for f in futures]
+
+    @traced('federation.evaluate')
+    def evaluate(self, scenarios: Sequence[Mapping[str, Any]]) -> FederationResult:
+        """
+        시나리오 목록을 모든 공장에 동시에 평가 (시나리오 형식은 SimulationService.run_simulation_batch)
+        개별 조정(overlay)은 공장마다 부품/공급사 ID가 달라 지원하지 않는다.
+        """
+        if any(s.get('overlay') for s in scenarios):
+            raise ValueError("연합 평가에서는 개별 조정(overlay)을 지원하지 않습니다.")
+        merged: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for part in self._gather('evaluate', list(scenarios)):
+            merged.update(part)
+        n = len(scenarios)
+        profit = np.array([merged[p][0] for p in self.plants]).reshape(len(self.plants), n)
+        loss = np.array([merged[p][1] for p in self.plants]).reshape(len(self.plants), n)
+        return FederationResult(plants=list(self.plants), profit_delta=profit, production_loss=loss)
+
+    @traced('federation.supplier_exposure')
+    def supplier_exposure(self, price_increase_pct: float = 0.0) -> List[Dict]:
+        """
+        공급사별 그룹 노출 (Supplier_ID 기준 중복 제거, 구매액 내림차순)
+        - plants: 거래 공장 수, part_count: 전체 부품 수, spend_share: 그룹 구매액 대비 비중
+        - risk_score: 공장 데이터 중 최댓값 (공장마다 평가가 다를 수 있음)
+        - profit_delta: 해당 공급사 단가가 price_increase_pct% 오를 때 그룹 영업이익 변화
+        """
+        ids: List[str] = []
+        names: Dict[str, str] = {}
+        risk, spend, counts = [], [], []
+        for part in self._gather('supplier_spend'):
+            for plant_ids, plant_names, plant_risk, plant_spend, plant_counts in part.values():
+                ids.extend(plant_ids)
+                for sid, name in zip(plant_ids, plant_names):
+                    names.setdefault(sid, name)
+                risk.append(plant_risk)
+                spend.append(plant_spend)
+                counts.append(plant_counts)
+        if not ids:
+            return []
+
+        unique, inverse = np.unique(np.array(ids, dtype=object), return_inverse=True)
+        spend_all, counts_all, risk_all = np.concatenate(spend), np.concatenate(counts), np.concatenate(risk)
+        trading = counts_all > 0
+        total_spend = np.bincount(inverse, weights=spend_all, minlength=len(unique))
+        part_count = np.bincount(inverse, weights=counts_all, minlength=len(unique))
+        plants = np.bincount(inverse[trading], minlength=len(unique))
+        max_risk = np.full(len(unique), -np.inf)
+        np.maximum.at(max_risk, inverse, risk_all)
+        group_spend = float(total_spend.sum())
+
+        order = np.argsort(-total_spend, kind='stable')
+        return [
+            {
+                'supplier_id': unique[i],
+                'supplier_name': names[unique[i]],
+                'plants': int(plants[i]),
+                'part_count': int(part_count[i]),
+                'monthly_spend': float(total_spend[i]),
+                'spend_share': float(total_spend[i] / group_spend) if group_spend else 0.0,
+                'risk_score': float(max_risk[i]),
+                'profit_delta': float(-total_spend[i] * price_increase_pct / 100),
+            }
+            for i in order
+        ]
+
+    def worker_rss(self) -> List[Optional[int]]:
+        """워커(샤드) 프로세스별 RSS (bytes)"""
+        return self._gather('rss')
+
+    def close(self):
+        for executor in self._executors:
+            executor.shutdown(cancel_futures=True)
+        self._executors = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
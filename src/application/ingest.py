@@ -0,0 +1,208 @@
+"""
+감시 폴더 수집 서비스 (백그라운드 갱신 + 컨텍스트 원자적 교체)
+ERP가 공유 폴더에 부품/공급사/생산라인 CSV를 주기적으로 떨어뜨리면, 백그라운드 스레드가
+새 파일을 SimulationRepository로 읽어 컨텍스트와 사전 집계(컬럼 스냅샷, 롤업 큐브, 오버레이 집계)를
+요청 경로 밖에서 모두 만든 뒤 ContextHolder의 참조 하나를 바꿔 끼운다.
+
+- 읽는 쪽은 holder.current()로 (버전, 서비스) 스냅샷을 한 번 받아 그 실행 동안 계속 쓴다.
+  교체는 완성된 스냅샷 참조의 대입이므로 반쯤 로드된 상태는 보이지 않는다.
+- 파일은 테이블별로 이름 패턴(parts*.csv, 부품*.csv 등)에 맞는 가장 최근 파일을 쓴다.
+  마지막 수정 후 settle_s초가 지나지 않은 파일은 아직 쓰는 중일 수 있으므로 다음 폴링까지 기다린다.
+- 세 테이블이 모두 있어야 로드한다 (없는 테이블을 샘플 데이터로 채우지 않음).
+- 로드/검증에 실패하면 기존 컨텍스트를 그대로 두고 오류만 상태에 기록한다.
+  같은 파일 묶음은 다시 시도하지 않으며, 파일이 바뀌면 다시 로드한다.
+"""
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
+from application.services import SimulationService
+from common.tracing import span, traced
+from domain.columnar import context_fingerprint, get_columns
+from domain.interfaces import IScenarioResultStore
+from domain.overlays import get_overlay_base
+
+logger = logging.getLogger(__name__)
+
+# 테이블 -> 파일 이름 패턴 (대소문자 무시)
+FILE_PATTERNS: Dict[str, Tuple[str, ...]] = {
+    'parts': ('parts*.csv', '부품*.csv'),
+    'suppliers': ('suppliers*.csv', '공급사*.csv'),
+    'production': ('production*.csv', '생산라인*.csv'),
+}
+
+# 파일 묶음 서명: 테이블별 (파일 이름, 크기, 수정 시각 ns)
+Signature = Tuple[Tuple[str, str, int, int], ...]
+
+
+@dataclass(frozen=True)
+class ContextSnapshot:
+    """한 번에 교체되는 컨텍스트 버전 (서비스와 그 출처)"""
+    version: int
+    service: SimulationService
+    signature: Signature
+    loaded_at: float
+    load_seconds: float
+
+
+class ContextHolder:
+    """현재 컨텍스트 스냅샷 보관소 (모든 세션 공유, 교체는 참조 대입 한 번)"""
+
+    def __init__(self):
+        self._snapshot: Optional[ContextSnapshot] = None
+        self._lock = threading.Lock()
+
+    def current(self) -> Optional[ContextSnapshot]:
+        return self._snapshot
+
+    def swap(self, service: SimulationService, signature: Signature = (), load_seconds: float = 0.0) -> ContextSnapshot:
+        with self._lock:
+            version = self._snapshot.version + 1 if self._snapshot is not None else 1
+            snapshot = ContextSnapshot(version, service, signature, time.time(), load_seconds)
+            self._snapshot = snapshot
+        return snapshot
+
+
+def warm_up(service: SimulationService):
+    """요청 경로에서 처음 접근할 때 만들어지는 사전 집계를 미리 계산"""
+    context = service.context
+    get_columns(context)
+    service.cube
+    get_overlay_base(context)
+    context_fingerprint(context)
+
+
+class FolderIngestService:
+    """
+    감시 폴더 수집기
+    - poll_once(): 한 번 확인하고 바뀐 파일이 있으면 로드/교체 (테스트나 수동 갱신용, 동기 실행)
+    - start() / stop(): poll_interval_s마다 poll_once를 도는 데몬 스레드
+    """
+
+    def __init__(
+        self,
+        directory,
+        holder: Optional[ContextHolder] = None,
+        result_store: Optional[IScenarioResultStore] = None,
+        scope: Optional[str] = None,
+        poll_interval_s: float = 30.0,
+        settle_s: float = 2.0,
+        patterns: Optional[Dict[str, Sequence[str]]] = None
+    ):
+        self.directory = Path(directory)
+        self.holder = holder or ContextHolder()
+        self.result_store = result_store
+        self.scope = scope or f'watch-{self.directory.name}'
+        self.poll_interval_s = poll_interval_s
+        self.settle_s = settle_s
+        self.patterns = patterns or FILE_PATTERNS
+        self.last_error: Optional[str] = None
+        self.last_checked: Optional[float] = None
+        self._failed: Optional[Signature] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._poll_lock = threading.Lock()
+
+    # --- 파일 탐색 ---
+
+    def find_files(self) -> Dict[str, Path]:
+        """테이블별 가장 최근 파일 (안정화되지 않은 파일은 제외)"""
+        if not self.directory.is_dir():
+            return {}
+        now = time.time()
+        found: Dict[str, Path] = {}
+        for path in self.directory.iterdir():
+            if not path.is_file():
+                continue
+            name = path.name.lower()
+            for table, patterns in self.patterns.items():
+                if not any(fnmatch(name, p.lower()) for p in patterns):
+                    continue
+                mtime = path.stat().st_mtime
+                if now - mtime < self.settle_s:
+                    break
+                if table not in found or mtime > found[table].stat().st_mtime:
+                    found[table] = path
+                break
+        return found
+
+    @staticmethod
+    def signature(files: Dict[str, Path]) -> Signature:
+        return tuple(
+            (table, path.name, path.stat().st_size, path.stat().st_mtime_ns)
+            for table, path in sorted(files.items())
+        )
+
+    # --- 로드 / 교체 ---
+
+    @traced('ingest.poll')
+    def poll_once(self) -> Optional[ContextSnapshot]:
+        """바뀐 파일 묶음이 있으면 로드해 교체하고 새 스냅샷을 반환 (변화 없거나 실패하면 None)"""
+        with self._poll_lock:
+            self.last_checked = time.time()
+            files = self.find_files()
+            if set(files) != set(self.patterns):
+                return None
+            signature = self.signature(files)
+            current = self.holder.current()
+            if (current is not None and current.signature == signature) or signature == self._failed:
+                return None
+
+            started = time.perf_counter()
+            try:
+                service = self._load(files)
+            except Exception as e:
+                self._failed = signature
+                self.last_error = str(e)
+                logger.error("watch-folder ingest failed (%s): %s", self.directory, e)
+                return None
+
+            self._failed, self.last_error = None, None
+            snapshot = self.holder.swap(service, signature, time.perf_counter() - started)
+            logger.info("watch-folder context v%d loaded in %.2fs", snapshot.version, snapshot.load_seconds)
+            return snapshot
+
+    def _load(self, files: Dict[str, Path]) -> SimulationService:
+        # CSV 파싱에 pandas가 필요하므로 로드할 때 임포트
+        from infrastructure.repositories import SimulationRepository
+
+        context = SimulationRepository().load_context_from_uploads(
+            parts_csv=str(files['parts']),
+            suppliers_csv=str(files['suppliers']),
+            production_csv=str(files['production'])
+        )
+        service = SimulationService(context, result_store=self.result_store, scope=self.scope)
+        with span('ingest.warm_up', parts=len(context.parts)):
+            warm_up(service)
+        return service
+
+    # --- 백그라운드 스레드 ---
+
+    def start(self) -> 'FolderIngestService':
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='watch-folder-ingest', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.poll_once()
+            except Exception:  # 폴링 스레드는 어떤 오류에도 멈추지 않는다
+                logger.exception("watch-folder polling error")
+            self._stop.wait(self.poll_interval_s)
@@ -1,30 +1,195 @@
-from typing import List, Optional
+from dataclasses import asdict
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+import numpy as np
+from common.tracing import traced
 from domain.models import SimulationContext, SimulationResult, Part, Supplier, ProductionLine
-from domain.interfaces import ISimulationStrategy
-from domain.strategies import PriceHikeStrategy, DelayImpactStrategy
+from domain.interfaces import ISimulationStrategy, IColumnarStrategy, IOverlayStrategy, IScenarioResultStore
+from domain.columnar import context_fingerprint, get_columns
+from domain.fusion import FusedEvaluator
+from domain.strategies import PriceHikeStrategy, DelayImpactStrategy, CurrencyShockStrategy, TariffStrategy
+from domain.safety_stock import SafetyStockOptimizer, SafetyStockPlan
+from domain.event_sim import SupplyEventSimulator, SupplyTrace
+from domain.replenishment import ReorderPolicySweep, ReorderPolicyPlan
+from domain.rollup import RollupCube
+from domain.overlays import WhatIfOverlay, evaluate_overlay
 
 class SimulationService:
     """
     SimulationService (Facade Pattern)
     - UI 레이어는 구체적인 전략 클래스를 알 필요 없이 이 서비스를 통해 시뮬레이션을 요청한다.
     - 여러 전략을 복합적으로 적용하는 로직을 담당한다.
+    - result_store가 주어지면 run_simulation 결과를 저장하고, 같은 데이터/파라미터는 저장된 결과로 응답한다.
     """
-    def __init__(self, context: SimulationContext):
+    def __init__(
+        self,
+        context: SimulationContext,
+        result_store: Optional[IScenarioResultStore] = None,
+        scope: str = ""
+    ):
         self.context = context
+        self.result_store = result_store
+        self.scope = scope
+        self._cube: Optional[RollupCube] = None
+        self._cube_columns = None  # 큐브를 맞춘 컬럼 스냅샷 (get_overlay_base와 같은 방식으로 변경 감지)
+        self._cube_parts: Optional[List[Part]] = None
+
+    @property
+    def cube(self) -> RollupCube:
+        """
+        공급사/라인/분류 드릴다운용 집계 큐브 (컬럼 스냅샷이 바뀌면 갱신)
+        리스트 기반 컨텍스트에서 부품 수와 생산라인이 그대로면 교체된 부품만 apply_changes로 반영하고,
+        그 밖의 변경(PartSequence 행 교체, 추가/삭제, 라인 변경 등)은 큐브를 다시 만든다.
+        """
+        columns = get_columns(self.context)
+        if self._cube is not None and self._cube_columns is columns:
+            return self._cube
+
+        parts = self.context.parts
+        changed = self._changed_parts(parts)
+        if changed is None:
+            self._cube = RollupCube(self.context)
+        else:
+            previous = self._cube_parts
+            self._cube.apply_changes(removed=[previous[i] for i in changed], added=[parts[i] for i in changed])
+        self._cube_columns = columns
+        self._cube_parts = list(parts) if isinstance(parts, list) else None
+        return self._cube
+
+    def _changed_parts(self, parts) -> Optional[List[int]]:
+        """증분 갱신할 부품 위치 (다시 만들어야 하면 None). Part는 불변이므로 객체 동일성으로 비교한다."""
+        previous = self._cube_parts
+        if self._cube is None or previous is None or not isinstance(parts, list) or len(parts) != len(previous):
+            return None
+        capacity = {line.id: float(line.capacity_per_day) for line in self.context.production_lines}
+        if capacity != self._cube.line_capacity:
+            return None
+        changed = [i for i, (old, new) in enumerate(zip(previous, parts)) if old is not new]
+        # 부품별 갱신은 Python 루프이므로 많이 바뀌었으면 벡터화된 재생성이 더 빠르다
+        return changed if len(changed) * 4 <= len(parts) else None
+
+    @traced('service.drill_down')
+    def drill_down(self, price_increase_pct: float, delay_days: int, by: List[str], **filters: str) -> List[Dict]:
+        """
+        집계 큐브에서 그룹별 구매액/커버리지와 현재 시나리오의 영향을 함께 조회한다.
+        지연 영향은 라인 기준 집계에서만 계산 가능하므로 그 외에는 가격 영향만 포함한다.
+        """
+        strategies: List[ISimulationStrategy] = [PriceHikeStrategy(price_increase_pct)]
+        if delay_days > 0 and set(by) | set(filters) <= {'line'}:
+            strategies.append(DelayImpactStrategy(delay_days))
+
+        impacts = self.cube.evaluate(strategies, by, **filters)
+        records = self.cube.query(by, **filters).to_records()
+        for record, impact in zip(records, impacts):
+            record['profit_delta'] = impact['profit_delta']
+            record['production_loss'] = impact['production_loss']
+        return records
     
-    def run_simulation(self, price_increase_pct: float, delay_days: int) -> SimulationResult:
+    @traced('service.run_simulation')
+    def run_simulation(
+        self,
+        price_increase_pct: float,
+        delay_days: int,
+        currency_shocks: Optional[Dict[str, float]] = None,
+        tariffs: Optional[Dict[str, float]] = None,
+        overlay: Optional[WhatIfOverlay] = None
+    ) -> SimulationResult:
         """
         사용자 입력(가격, 지연)을 받아 적절한 전략을 수립하고 실행 결과를 합산 반환한다.
+        currency_shocks / tariffs: 통화별 환율 변동(%) / 국가별 관세율(%) (선택)
+        overlay: 부품/공급사 개별 조정 (예: S2 단가 +40%, S3 지연 12일) (선택)
         """
+        overlay = _as_overlay(overlay)
+        params = {
+            'price_increase_pct': float(price_increase_pct),
+            'delay_days': int(delay_days),
+            'currency_shocks': {k: float(v) for k, v in sorted((currency_shocks or {}).items()) if v},
+            'tariffs': {k: float(v) for k, v in sorted((tariffs or {}).items()) if v},
+        }
+        if overlay:
+            params['overlay'] = overlay.to_params()
+        cached = self._lookup('simulation', params)
+        if cached is not None:
+            return SimulationResult(**cached)
+
         strategies: List[ISimulationStrategy] = []
         
         # 전략 선택 로직 (Factory 역할 겸임)
-        if price_increase_pct != 0:
+        if price_increase_pct != 0 or overlay.part_price_pct or overlay.supplier_price_pct:
             strategies.append(PriceHikeStrategy(price_increase_pct))
             
-        if delay_days > 0:
+        if delay_days > 0 or overlay.supplier_delay_days:
             strategies.append(DelayImpactStrategy(delay_days))
             
+        if currency_shocks and any(currency_shocks.values()):
+            strategies.append(CurrencyShockStrategy(currency_shocks))
+            
+        if tariffs and any(tariffs.values()):
+            strategies.append(TariffStrategy(tariffs))
+            
+        result = self.run_strategies(strategies, overlay)
+        self._store('simulation', params, asdict(result))
+        return result
+
+    @traced('service.run_simulation_batch')
+    def run_simulation_batch(self, scenarios: Sequence[Mapping[str, Any]]) -> List[SimulationResult]:
+        """
+        여러 시나리오를 한 번에 평가한다 (API 서버의 요청 묶음 처리용).
+        scenarios: run_simulation 인자 이름을 키로 갖는 dict 목록
+            (price_increase_pct, delay_days, currency_shocks, tariffs, overlay)
+
+        기본 전략의 영향은 모두 집계값에 선형이므로 부품 배열은 한 번만 훑고
+        시나리오 축으로만 벡터 연산한다 (환율/관세는 SupplierAttributeShockStrategy.sweep).
+        결과는 run_simulation과 같으며, 결과 저장소는 거치지 않는다.
+        """
+        if not scenarios:
+            return []
+
+        snapshot = get_columns(self.context)
+        price_pct = np.array([float(s.get('price_increase_pct', 0.0)) for s in scenarios])
+        delay_days = np.array([int(s.get('delay_days', 0)) for s in scenarios])
+
+        total_spend = float(np.sum(snapshot.unit_price * snapshot.monthly_usage))
+        profit_delta = PriceHikeStrategy(price_pct).aggregate_terms({'monthly_spend': total_spend})['profit_delta']
+        lost_days = np.maximum(delay_days - DelayImpactStrategy.SAFETY_BUFFER_DAYS, 0)
+        production_loss = float(np.sum(snapshot.line_capacity)) * lost_days
+
+        # 개별 조정이 있는 시나리오만 가격/지연 항을 오버레이 보정으로 다시 계산 (조정 개수에 비례)
+        for i, scenario in enumerate(scenarios):
+            if not scenario.get('overlay'):
+                continue
+            overlay = _as_overlay(scenario['overlay'])
+            if overlay:
+                adjusted = evaluate_overlay(
+                    self.context, [PriceHikeStrategy(price_pct[i]), DelayImpactStrategy(int(delay_days[i]))], overlay
+                )
+                profit_delta[i] = adjusted.profit_delta
+                production_loss[i] = adjusted.production_loss
+
+        for key, strategy in (('currency_shocks', CurrencyShockStrategy), ('tariffs', TariffStrategy)):
+            shocks = [s.get(key) or {} for s in scenarios]
+            names = sorted({name for shock in shocks for name, value in shock.items() if value})
+            if names:
+                matrix = np.array([[float(shock.get(name, 0.0)) for name in names] for shock in shocks])
+                profit_delta = profit_delta + strategy.sweep(self.context, names, matrix)
+
+        return [
+            SimulationResult(
+                operating_profit=0,
+                production_output=0,
+                profit_delta=float(delta),
+                production_loss=int(round(loss))
+            )
+            for delta, loss in zip(profit_delta, production_loss)
+        ]
+
+    @traced('service.run_strategies')
+    def run_strategies(self, strategies: List[ISimulationStrategy], overlay: Optional[WhatIfOverlay] = None) -> SimulationResult:
+        """
+        전략 목록을 실행하고 결과를 합산한다.
+        - 개별 조정(overlay)이 있으면 오버레이 지원 전략(IOverlayStrategy)은 원본 집계값 + 조정 보정으로 평가한다.
+        - 컬럼형 전략(IColumnarStrategy)은 FusedEvaluator로 묶어 부품 배열을 한 번만 훑는다.
+        - 그 외의 단순 플러그인 전략은 기존처럼 각자 calculate를 호출한다.
+        """
         # 결과 합산 (Composite Pattern과 유사한 접근)
         final_result = SimulationResult(
             operating_profit=0, # 추후 Base Calculation 로직 필요, 지금은 Delta 중심
@@ -36,10 +201,61 @@ class SimulationService:
         # Base Data Calculation (Baseline)
         # 실제 구현에서는 Repository에서 기본 Profit/Production을 가져와야 함.
         # 여기서는 Delta 누적만 수행.
+        results = []
+        if overlay:
+            overlaid = [s for s in strategies if isinstance(s, IOverlayStrategy)]
+            results.append(evaluate_overlay(self.context, overlaid, overlay))
+            strategies = [s for s in strategies if not isinstance(s, IOverlayStrategy)]
+
+        columnar = [s for s in strategies if isinstance(s, IColumnarStrategy)]
+        results += [s.calculate(self.context) for s in strategies if not isinstance(s, IColumnarStrategy)]
+        if columnar:
+            results.append(FusedEvaluator(columnar).evaluate(self.context))
         
-        for strategy in strategies:
-            result = strategy.calculate(self.context)
+        for result in results:
             final_result.profit_delta += result.profit_delta
             final_result.production_loss += result.production_loss
             
         return final_result
+
+    @traced('service.optimize_safety_stock')
+    def optimize_safety_stock(self, budget: float) -> SafetyStockPlan:
+        """
+        조달 예산 내에서 공급 지연 시 기대 생산 손실(결품량)이 최소가 되도록
+        부품별 추가 안전재고를 배분한다.
+        """
+        return SafetyStockOptimizer().optimize(self.context, budget)
+
+    @traced('service.optimize_reorder_policy')
+    def optimize_reorder_policy(self, kind: str = 'sS', target_fill_rate: Optional[float] = None, **options: Any) -> ReorderPolicyPlan:
+        """
+        부품별 (s, S) / (R, S) 재발주 정책 후보를 스윕해 비용 최소(목표 fill rate가 있으면 그 조건에서) 정책을 고른다.
+        options: ReorderPolicySweep 인자 (safety_days, cycle_days, order_cost, holding_rate, demand_cv 등)
+        """
+        return ReorderPolicySweep(kind=kind, target_fill_rate=target_fill_rate, **options).optimize(self.context)
+
+    @traced('service.run_supply_simulation')
+    def run_supply_simulation(self, delay_days: int = 0, horizon_days: int = 180, **options: Any) -> SupplyTrace:
+        """
+        입고/소비/재발주 이산 사건 시뮬레이션으로 일별 재고와 라인 생산량 궤적을 계산한다.
+        options: SupplyEventSimulator 인자 (delayed_suppliers, fill_rate, order_cover_days 등)
+        """
+        return SupplyEventSimulator(horizon_days=horizon_days, delay_days=delay_days, **options).run(self.context)
+
+    # --- 결과 저장소 ---
+
+    def _lookup(self, kind: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if self.result_store is None:
+            return None
+        return self.result_store.lookup(context_fingerprint(self.context), kind, params)
+
+    def _store(self, kind: str, params: Dict[str, Any], result: Dict[str, Any]):
+        if self.result_store is not None:
+            self.result_store.append(context_fingerprint(self.context), kind, params, result, scope=self.scope)
+
+
+def _as_overlay(overlay: Any) -> WhatIfOverlay:
+    """WhatIfOverlay 또는 to_params() 형식 dict를 오버레이로 정규화 (None이면 빈 오버레이)"""
+    if isinstance(overlay, WhatIfOverlay):
+        return overlay
+    return WhatIfOverlay.from_params(overlay.to_params() if hasattr(overlay, 'to_params') else overlay)
@@ -0,0 +1,95 @@
+"""
+asyncio 요청 묶음 처리기 (micro-batching)
+- 짧은 시간 창(window) 동안 들어온 요청을 모아 배치 함수 한 번으로 처리한다.
+- 배치 함수는 동기 함수이며 실행기(스레드 풀)에서 호출되므로 이벤트 루프는 계속 요청을 받는다.
+- 창이 0이면 묶지 않고 요청마다 바로 처리한다 (부하 테스트 비교용).
+"""
+import asyncio
+import time
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    사용 예:
+        batcher = MicroBatcher(service.run_simulation_batch, window_ms=2.0)
+        result = await batcher.submit({'price_increase_pct': 10, 'delay_days': 7})
+
+    handler는 입력 목록을 받아 같은 길이·같은 순서의 결과 목록을 반환해야 한다.
+    handler가 예외를 던지면 그 배치의 모든 요청이 같은 예외로 실패한다.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[T]], Sequence[R]],
+        window_ms: float = 2.0,
+        max_batch: int = 512,
+        executor: Optional[Executor] = None
+    ):
+        if max_batch < 1:
+            raise ValueError("max_batch는 1 이상이어야 합니다.")
+        self.handler = handler
+        self.window = max(window_ms, 0.0) / 1000
+        self.max_batch = max_batch if window_ms > 0 else 1
+        self.executor = executor
+        self._pending: List[Tuple[T, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._batches = 0
+        self._items = 0
+        self._largest = 0
+        self._busy_seconds = 0.0
+
+    async def submit(self, item: T) -> R:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            asyncio.get_running_loop().create_task(self._run(batch))
+
+    async def _run(self, batch: List[Tuple[T, asyncio.Future]]):
+        items = [item for item, _ in batch]
+        started = time.perf_counter()
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(self.executor, self.handler, items)
+            if len(results) != len(items):
+                raise RuntimeError(f"배치 결과 수가 입력과 다릅니다: {len(results)} != {len(items)}")
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self._busy_seconds += time.perf_counter() - started
+            self._batches += 1
+            self._items += len(items)
+            self._largest = max(self._largest, len(items))
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        """처리한 배치 수 / 요청 수 / 평균·최대 배치 크기 / 배치 함수 누적 실행 시간"""
+        return {
+            'batches': self._batches,
+            'items': self._items,
+            'mean_batch_size': self._items / self._batches if self._batches else 0.0,
+            'max_batch_size': self._largest,
+            'busy_ms': self._busy_seconds * 1000,
+        }
@@ -0,0 +1,209 @@
+"""
+파이프라인 단계별 메모리 프로파일러 (opt-in)
+- tracemalloc으로 Python 할당량(단계 시작 대비 peak / 잔존량)을 측정하고,
+  백그라운드 스레드로 RSS를 샘플링해 NumPy/Pandas 등 네이티브 할당까지 포함한 최대치를 기록한다.
+- common.tracing의 스팬 리스너로 동작하므로 이미 계측된 구간
+  (load_context_from_uploads, _build_context, forecast_scenarios, 차트 렌더링)을
+  별도 코드 수정 없이 단계로 사용한다.
+- 단계 중첩은 스레드별로 따로 추적하므로 대시보드처럼 프로세스당 하나를 여러 세션이 함께 써도 스택이 섞이지 않는다
+  (tracemalloc peak는 프로세스 전체 값이므로 동시에 실행된 단계의 할당이 함께 잡힐 수 있다).
+"""
+import os
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from typing import Dict, List, Optional, Sequence
+
+from common.tracing import Tracer, get_tracer
+
+DEFAULT_STAGES = (
+    'repository.load_context_from_uploads',
+    'repository.load_context',
+    'repository.build_context',
+    'forecast.forecast_scenarios',
+    'render.*',
+)
+
+MB = 1024 * 1024
+
+
+def current_rss() -> Optional[int]:
+    """현재 프로세스 RSS(bytes). psutil이 없으면 /proc을 사용하고, 둘 다 없으면 None"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+@dataclass
+class StageMemory:
+    """단계 하나의 누적 메모리 통계"""
+    name: str
+    calls: int = 0
+    peak_bytes: int = 0         # tracemalloc 기준, 단계 시작 대비 최대 증가량
+    retained_bytes: int = 0     # tracemalloc 기준, 단계 종료 후 남은 증가량 (마지막 호출)
+    rss_peak_bytes: int = 0     # 단계 실행 중 관측된 최대 RSS
+    rss_delta_bytes: int = 0    # 단계 종료 RSS - 시작 RSS (마지막 호출)
+
+
+@dataclass
+class _Frame:
+    name: str
+    start_traced: int
+    start_rss: int
+    peak_traced: int = 0
+    peak_rss: int = 0
+    children_peak: int = 0
+
+
+class MemoryProfiler:
+    """
+    단계별 peak / 잔존 메모리 리포트 생성기
+
+    사용 예:
+        profiler = MemoryProfiler()
+        with profiler:
+            repo.load_context_from_uploads(...)
+        print(profiler.format_report())
+    """
+
+    def __init__(
+        self,
+        stages: Sequence[str] = DEFAULT_STAGES,
+        sample_interval: float = 0.005,
+        tracer: Optional[Tracer] = None
+    ):
+        self.stages = tuple(stages)
+        self.sample_interval = sample_interval
+        self.tracer = tracer or get_tracer()
+        self.results: Dict[str, StageMemory] = {}
+        self._stacks: Dict[int, List[_Frame]] = {}  # 스레드별 진행 중인 단계
+        self._lock = threading.Lock()
+        self._sampler: Optional[threading.Thread] = None
+        self._running = False
+        self._started_tracemalloc = False
+        self._previous_enabled = False
+
+    # --- 시작 / 종료 ---
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        if not self._running:
+            self._previous_enabled = self.tracer.enabled
+        self.tracer.enabled = True
+        self.tracer.add_listener(self)
+
+        self._running = True
+        if self._sampler is None and current_rss() is not None:
+            self._sampler = threading.Thread(target=self._sample_rss, name='memprof-rss', daemon=True)
+            self._sampler.start()
+
+    def stop(self):
+        self._running = False
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+        self.tracer.remove_listener(self)
+        self.tracer.enabled = self._previous_enabled
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    # --- 스팬 리스너 ---
+
+    def on_span_start(self, name: str):
+        if not self._is_stage(name):
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        with self._lock:
+            stack = self._stacks.setdefault(threading.get_ident(), [])
+            # 중첩 단계: 바깥 단계의 peak를 보존한 뒤 peak 카운터를 초기화
+            if stack:
+                stack[-1].peak_traced = max(stack[-1].peak_traced, peak)
+            rss = current_rss() or 0
+            stack.append(_Frame(name=name, start_traced=current, start_rss=rss, peak_rss=rss))
+        tracemalloc.reset_peak()
+
+    def on_span_end(self, name: str, attrs: Dict):
+        if not self._is_stage(name):
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        rss = current_rss() or 0
+        with self._lock:
+            stack = self._stacks.get(threading.get_ident())
+            if not stack or stack[-1].name != name:
+                return
+            frame = stack.pop()
+            if not stack:
+                del self._stacks[threading.get_ident()]
+            frame_peak = max(frame.peak_traced, frame.children_peak, peak)
+            frame.peak_rss = max(frame.peak_rss, rss)
+            if stack:
+                parent = stack[-1]
+                parent.children_peak = max(parent.children_peak, frame_peak)
+                parent.peak_rss = max(parent.peak_rss, frame.peak_rss)
+
+            stats = self.results.setdefault(name, StageMemory(name=name))
+            stats.calls += 1
+            stats.peak_bytes = max(stats.peak_bytes, frame_peak - frame.start_traced)
+            stats.retained_bytes = current - frame.start_traced
+            stats.rss_peak_bytes = max(stats.rss_peak_bytes, frame.peak_rss)
+            stats.rss_delta_bytes = rss - frame.start_rss
+
+    def _is_stage(self, name: str) -> bool:
+        return any(fnmatch(name, pattern) for pattern in self.stages)
+
+    def _sample_rss(self):
+        while self._running:
+            rss = current_rss()
+            if rss is not None:
+                with self._lock:
+                    for stack in self._stacks.values():
+                        for frame in stack:
+                            frame.peak_rss = max(frame.peak_rss, rss)
+            time.sleep(self.sample_interval)
+
+    # --- 리포트 ---
+
+    def report(self) -> List[Dict]:
+        """단계별 메모리 통계 (MB 단위, peak 내림차순)"""
+        rows = [
+            {
+                'stage': s.name,
+                'calls': s.calls,
+                'peak_mb': s.peak_bytes / MB,
+                'retained_mb': s.retained_bytes / MB,
+                'rss_peak_mb': s.rss_peak_bytes / MB,
+                'rss_delta_mb': s.rss_delta_bytes / MB,
+            }
+            for s in self.results.values()
+        ]
+        return sorted(rows, key=lambda r: -r['peak_mb'])
+
+    def format_report(self) -> str:
+        header = f"{'stage':<40} {'calls':>5} {'peak MB':>10} {'retained MB':>12} {'RSS peak MB':>12} {'RSS Δ MB':>10}"
+        lines = [header, '-' * len(header)]
+        for r in self.report():
+            lines.append(
+                f"{r['stage']:<40} {r['calls']:>5} {r['peak_mb']:>10.2f} {r['retained_mb']:>12.2f} "
+                f"{r['rss_peak_mb']:>12.2f} {r['rss_delta_mb']:>10.2f}"
+            )
+        return '\n'.join(lines)
@@ -0,0 +1,239 @@
+"""
+경량 스팬(span) 계측 모듈
+- 저장소/서비스/전략 레이어의 핫 패스 구간 시간을 측정한다.
+- 비활성화 상태에서는 span()이 공용 no-op 컨텍스트 매니저를 반환하므로
+  호출 비용이 함수 호출 한 번 수준이다.
+- 수집된 스팬은 Chrome Trace(JSON, chrome://tracing / Perfetto)로 내보낼 수 있다.
+- 계측은 두 가지로 켠다: enabled(프로세스 전역, 링 버퍼에 기록)와 begin_collect / collect
+  (현재 실행 흐름만, contextvar로 지정한 목록에 기록). 대시보드처럼 세션마다 스레드가 다른 경우
+  세션별 수집은 다른 세션의 계측 여부나 기록에 영향을 주지 않는다.
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class SpanRecord:
+    """완료된 스팬 하나의 기록"""
+    name: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+    depth: int
+    attrs: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration_ns / 1e6
+
+
+class _NullSpan:
+    """비활성화 상태의 no-op 스팬"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **attrs):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('tracer', 'name', 'attrs', 'start_ns', 'depth')
+
+    def __init__(self, tracer: 'Tracer', name: str, attrs: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+
+    def __enter__(self):
+        local = self.tracer._local
+        self.depth = getattr(local, 'depth', 0)
+        local.depth = self.depth + 1
+        for listener in self.tracer._listeners:
+            listener.on_span_start(self.name)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end_ns = time.perf_counter_ns()
+        self.tracer._local.depth = self.depth
+        for listener in self.tracer._listeners:
+            listener.on_span_end(self.name, self.attrs)
+        if exc_type is not None:
+            self.attrs['error'] = exc_type.__name__
+        self.tracer._record(SpanRecord(
+            name=self.name,
+            start_ns=self.start_ns,
+            duration_ns=end_ns - self.start_ns,
+            thread_id=threading.get_ident(),
+            depth=self.depth,
+            attrs=self.attrs,
+        ))
+        return False
+
+    def set(self, **attrs):
+        """스팬 실행 중 속성(행 수 등) 추가"""
+        self.attrs.update(attrs)
+
+
+class Tracer:
+    """스팬 수집기 (스레드 안전, 최근 max_records개만 보관하는 링 버퍼)"""
+
+    def __init__(self, enabled: bool = False, max_records: int = 100_000):
+        self.enabled = enabled
+        self._records = deque(maxlen=max_records)
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._listeners: List[Any] = []
+        # 현재 실행 흐름(스레드 / asyncio 작업)의 수집 목록 (None이면 수집하지 않음)
+        self._collector: ContextVar[Optional[List[SpanRecord]]] = ContextVar(f'tracer_collector_{id(self)}', default=None)
+
+    @property
+    def active(self) -> bool:
+        """전역으로 켜져 있거나 현재 실행 흐름에서 수집 중인지"""
+        return self.enabled or self._collector.get() is not None
+
+    def add_listener(self, listener):
+        """
+        스팬 시작/종료 시 호출될 리스너 등록 (메모리 프로파일러 등)
+        listener는 on_span_start(name), on_span_end(name, attrs)를 구현한다. 같은 리스너는 한 번만 등록된다.
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def span(self, name: str, **attrs):
+        if not self.active:
+            return _NULL_SPAN
+        return _Span(self, name, attrs)
+
+    def _record(self, record: SpanRecord):
+        collected = self._collector.get()
+        if collected is not None:
+            collected.append(record)
+        if self.enabled:
+            with self._lock:
+                self._records.append(record)
+                self._seq += 1
+
+    @property
+    def records(self) -> List[SpanRecord]:
+        with self._lock:
+            return list(self._records)
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+
+    def mark(self) -> int:
+        """현재까지 기록된 스팬 수 (records_since의 기준점)"""
+        with self._lock:
+            return self._seq
+
+    def records_since(self, mark: int) -> List[SpanRecord]:
+        """mark 이후 기록된 스팬 (링 버퍼에서 밀려난 기록은 제외)"""
+        with self._lock:
+            count = min(self._seq - mark, len(self._records))
+            return list(self._records)[len(self._records) - count:] if count > 0 else []
+
+    def begin_collect(self, enabled: bool = True) -> Optional[List[SpanRecord]]:
+        """
+        현재 실행 흐름에서만 계측을 켜고 이후 스팬을 모을 새 목록을 돌려준다 (enabled=False면 끄고 None).
+        다른 스레드 / 세션에는 영향이 없다. 블록으로 감쌀 수 없는 곳(Streamlit rerun 한 번 등)에서
+        실행 시작마다 호출해 이전 실행의 목록을 덮어쓴다.
+        """
+        collected: Optional[List[SpanRecord]] = [] if enabled else None
+        self._collector.set(collected)
+        return collected
+
+    @contextmanager
+    def collect(self):
+        """블록 안에서만(현재 실행 흐름 한정) 계측을 켜고, 블록 동안 수집된 스팬 목록을 돌려준다."""
+        collected: List[SpanRecord] = []
+        token = self._collector.set(collected)
+        try:
+            yield collected
+        finally:
+            self._collector.reset(token)
+
+    def summary(self, records: Optional[List[SpanRecord]] = None) -> List[Dict[str, Any]]:
+        """스팬 이름별 호출 수 / 총 소요 시간 / 최대 소요 시간 (총 시간 내림차순)"""
+        stats: Dict[str, Dict[str, Any]] = {}
+        for r in self.records if records is None else records:
+            s = stats.setdefault(r.name, {'name': r.name, 'calls': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'depth': r.depth})
+            s['calls'] += 1
+            s['total_ms'] += r.duration_ms
+            s['max_ms'] = max(s['max_ms'], r.duration_ms)
+            s['depth'] = min(s['depth'], r.depth)
+        return sorted(stats.values(), key=lambda s: -s['total_ms'])
+
+    def to_chrome_trace(self, records: Optional[List[SpanRecord]] = None) -> Dict[str, Any]:
+        """Chrome Trace Event Format (Complete 이벤트, 단위 µs)"""
+        pid = os.getpid()
+        events = [
+            {
+                'name': r.name,
+                'cat': r.name.split('.', 1)[0],
+                'ph': 'X',
+                'ts': r.start_ns / 1000,
+                'dur': r.duration_ns / 1000,
+                'pid': pid,
+                'tid': r.thread_id,
+                'args': {k: v if isinstance(v, (int, float, str, bool)) else str(v) for k, v in r.attrs.items()},
+            }
+            for r in (self.records if records is None else records)
+        ]
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export_chrome_trace(self, path: str, records: Optional[List[SpanRecord]] = None):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(records), f)
+
+
+# 프로세스 전역 트레이서 (환경 변수 SCM_TRACE=1 이면 시작부터 활성화)
+_tracer = Tracer(enabled=os.environ.get('SCM_TRACE', '') not in ('', '0'))
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+def span(name: str, **attrs):
+    """전역 트레이서로 스팬 생성: with span('service.run_simulation'): ..."""
+    if not _tracer.active:
+        return _NULL_SPAN
+    return _Span(_tracer, name, attrs)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """함수 전체를 스팬으로 감싸는 데코레이터"""
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _tracer.active:
+                return func(*args, **kwargs)
+            with _Span(_tracer, span_name, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
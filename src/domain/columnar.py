@@ -0,0 +1,173 @@
+import hashlib
+from dataclasses import dataclass
+from typing import Dict, List
+
+import numpy as np
+
+from common.tracing import traced
+from domain.lead_times import fitted_delay_scenarios, get_lead_time_fit
+from domain.models import SimulationContext
+from domain.tables import part_labels, part_numeric, part_strings
+
+
+@dataclass
+class ContextColumns:
+    """
+    SimulationContext의 컬럼형(Columnar) 스냅샷
+    - Part/Supplier/ProductionLine 리스트를 numpy 배열로 한 번만 변환해 두고
+      벡터화 계산(최적화, 시나리오 스윕 등)에서 재사용한다.
+    - supplier_index는 부품별 공급사 위치(공급사 목록에 없으면 -1)이다.
+    """
+    unit_price: np.ndarray
+    current_inventory: np.ndarray
+    daily_usage_rate: np.ndarray
+    supplier_index: np.ndarray
+    supplier_ids: List[str]
+    supplier_risk: np.ndarray
+    supplier_lead_time: np.ndarray
+    supplier_currency_index: np.ndarray
+    currencies: List[str]
+    supplier_country_index: np.ndarray
+    countries: List[str]
+    line_capacity: np.ndarray
+    line_efficiency: np.ndarray
+
+    @property
+    def n_parts(self) -> int:
+        return len(self.unit_price)
+
+    @property
+    def monthly_usage(self) -> np.ndarray:
+        return self.daily_usage_rate * 30
+
+    @property
+    def part_supplier_risk(self) -> np.ndarray:
+        """부품별 공급사 리스크 (공급사 정보가 없으면 0)"""
+        risk = np.zeros(self.n_parts)
+        known = self.supplier_index >= 0
+        risk[known] = self.supplier_risk[self.supplier_index[known]]
+        return risk
+
+    def gather_supplier_codes(self, supplier_codes: np.ndarray) -> np.ndarray:
+        """공급사 단위 코드 배열을 부품 단위로 모은다 (공급사 정보가 없으면 -1)"""
+        codes = np.full(self.n_parts, -1, dtype=np.int64)
+        known = self.supplier_index >= 0
+        codes[known] = supplier_codes[self.supplier_index[known]]
+        return codes
+
+
+def _encode(values: List[str]):
+    """문자열 목록을 (코드 배열, 고유값 목록)으로 변환 (빈 값은 -1)"""
+    categories: Dict[str, int] = {}
+    codes = np.array(
+        [categories.setdefault(v, len(categories)) if v else -1 for v in values],
+        dtype=np.int64
+    )
+    return codes, list(categories)
+
+
+@traced('domain.build_columns')
+def build_columns(context: SimulationContext) -> ContextColumns:
+    """컨텍스트의 도메인 객체 리스트를 numpy 컬럼으로 변환"""
+    supplier_ids = [s.id for s in context.suppliers]
+    position: Dict[str, int] = {sid: i for i, sid in enumerate(supplier_ids)}
+    parts = context.parts
+    currency_codes, currencies = _encode([s.currency for s in context.suppliers])
+    country_codes, countries = _encode([s.country for s in context.suppliers])
+
+    # PartSequence면 테이블 컬럼을 그대로 읽고, Part 리스트면 한 번 순회해 변환
+    part_supplier_codes, part_supplier_values = part_labels(parts, 'supplier_id')
+    supplier_lookup = np.array([position.get(v, -1) for v in part_supplier_values], dtype=np.int64)
+
+    # 납품 이력 추정 결과가 붙어 있으면 지연 확률 / 리드타임을 추정값으로 대체 (domain.lead_times)
+    supplier_risk = np.array([float(s.risk_score) for s in context.suppliers], dtype=np.float64)
+    supplier_lead_time = np.array([s.base_lead_time_days for s in context.suppliers], dtype=np.float64)
+    fit = get_lead_time_fit(context)
+    if fit is not None:
+        supplier_risk, supplier_lead_time = fit.overlay(supplier_ids, supplier_risk, supplier_lead_time)
+
+    return ContextColumns(
+        unit_price=part_numeric(parts, 'unit_price'),
+        current_inventory=part_numeric(parts, 'current_inventory'),
+        daily_usage_rate=part_numeric(parts, 'daily_usage_rate'),
+        supplier_index=supplier_lookup[part_supplier_codes] if len(parts) else np.zeros(0, dtype=np.int64),
+        supplier_ids=supplier_ids,
+        supplier_risk=supplier_risk,
+        supplier_lead_time=supplier_lead_time,
+        supplier_currency_index=currency_codes,
+        currencies=currencies,
+        supplier_country_index=country_codes,
+        countries=countries,
+        line_capacity=np.array([l.capacity_per_day for l in context.production_lines], dtype=np.float64),
+        line_efficiency=np.array([l.efficiency_rate for l in context.production_lines], dtype=np.float64),
+    )
+
+
+def _snapshot(items):
+    """리스트는 얕은 사본(원소 교체 / 추가 / 삭제 감지용), 그 밖의 시퀀스(PartSequence 등)는 (객체, 변경 버전)"""
+    return list(items) if isinstance(items, list) else (items, getattr(items, 'version', None))
+
+
+def _unchanged(snapshot, items) -> bool:
+    """리스트는 원소 동일성으로 비교 (식별자가 같으면 값 비교를 건너뛰므로 수백만 건도 싸다), 그 밖의 시퀀스는 객체와 변경 버전"""
+    if isinstance(items, list):
+        return isinstance(snapshot, list) and snapshot == items
+    return isinstance(snapshot, tuple) and snapshot[0] is items and snapshot[1] == getattr(items, 'version', None)
+
+
+def get_columns(context: SimulationContext) -> ContextColumns:
+    """
+    컨텍스트별 컬럼 스냅샷을 캐시하여 반환한다.
+    목록이 교체되거나 원소가 바뀌거나(context.parts[i] = new, append 등) 리드타임 추정 결과가 바뀌면 다시 만든다.
+    Part는 불변이고, 공급사 / 생산라인 객체의 속성을 제자리에서 바꾼 경우는 감지하지 않으므로 invalidate_columns를 호출한다.
+    """
+    fit = get_lead_time_fit(context)
+    lists = (context.parts, context.suppliers, context.production_lines)
+    cached = context.__dict__.get('_columns_cache')
+    # 리드타임 추정 결과는 객체 동일성으로 비교 (LeadTimeFit eq=False)
+    if cached is not None and cached[1] is fit and all(map(_unchanged, cached[0], lists)):
+        return cached[2]
+
+    columns = build_columns(context)
+    context.__dict__['_columns_cache'] = (tuple(map(_snapshot, lists)), fit, columns)
+    return columns
+
+
+def invalidate_columns(context: SimulationContext):
+    """공급사 / 생산라인 객체의 속성을 제자리에서 바꾼 뒤 호출 (지문 / 오버레이 캐시는 컬럼 스냅샷에 묶여 함께 무효화)"""
+    context.__dict__.pop('_columns_cache', None)
+
+
+def context_fingerprint(context: SimulationContext) -> str:
+    """
+    컨텍스트 내용의 해시 (결과 캐시 키용)
+    같은 데이터를 다시 로드해도 같은 값이 나오도록 객체 식별자가 아닌 내용으로 계산한다.
+    """
+    columns = get_columns(context)
+    cached = context.__dict__.get('_fingerprint_cache')
+    if cached is not None and cached[0] is columns:
+        return cached[1]
+
+    digest = hashlib.blake2b(digest_size=16)
+    for array in (
+        columns.unit_price, columns.current_inventory, columns.daily_usage_rate,
+        columns.supplier_index, columns.supplier_risk, columns.supplier_lead_time,
+        columns.supplier_currency_index, columns.supplier_country_index,
+        columns.line_capacity, columns.line_efficiency,
+    ):
+        digest.update(np.ascontiguousarray(array).tobytes())
+    for values in (
+        part_strings(context.parts, 'id'), part_strings(context.parts, 'category'), part_strings(context.parts, 'line_id'),
+        columns.supplier_ids, columns.currencies, columns.countries,
+        [l.id for l in context.production_lines],
+    ):
+        digest.update('\x1f'.join(map(str, values)).encode('utf-8'))
+        digest.update(b'\x1e')
+    # 추정 지연 일수 분포는 컬럼에 드러나지 않지만 안전재고 / 재발주 / 분포 결과를 바꾼다
+    # (납품 건수가 부족해 컬럼은 그대로여도 키가 달라야 함)
+    digest.update(repr(fitted_delay_scenarios(context)).encode('utf-8'))
+
+    fingerprint = digest.hexdigest()
+    context.__dict__['_fingerprint_cache'] = (columns, fingerprint)
+    return fingerprint
+
@@ -0,0 +1,329 @@
+"""
+이산 사건(discrete-event) 공급 시뮬레이션 엔진
+DelayImpactStrategy / get_risk_trend의 닫힌 식 대신 입고 · 소비 · 재발주 사건을 날짜순으로 처리해
+부품 재고와 라인 생산량의 일별 궤적을 만든다.
+
+- 사건은 (날짜, 처리 순서, 일련번호) 순서의 힙(heapq) 우선순위 큐로 관리한다.
+- 같은 날 같은 종류의 사건은 부품 배열을 담은 사건 하나로 묶어(event batching) 벡터 연산으로 처리한다.
+  예) 같은 날 도착하는 입고 수천 건 -> DELIVERY 사건 1개, 하루치 전 부품 소비 -> CONSUMPTION 사건 1개
+- 같은 날 안에서는 입고 -> 소비 -> 재발주 검토 순서로 처리한다.
+- backend='numba'(numba 설치 시 auto의 기본값)이면 같은 규칙을 부품 단위 스칼라 루프로 쓴
+  domain.kernels.supply_steps 컴파일 커널로 계산한다 (사건 큐 없이 부품별 입고 링 버퍼 사용).
+"""
+import heapq
+import itertools
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from common.tracing import span, traced
+from domain import kernels
+from domain.columnar import get_columns
+from domain.models import SimulationContext
+from domain.strategies import DelayImpactStrategy
+from domain.tables import part_labels, part_strings
+
+# 같은 날 사건 처리 순서
+DELIVERY, CONSUMPTION, REORDER = 0, 1, 2
+EVENT_NAMES = {DELIVERY: 'delivery', CONSUMPTION: 'consumption', REORDER: 'reorder'}
+
+
+class EventQueue:
+    """
+    (날짜, 종류) 순서의 사건 우선순위 큐
+    사건 하나는 부품 인덱스 배열과 수량 배열을 함께 담을 수 있다 (묶음 사건).
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[int, int, int, Optional[np.ndarray], Optional[np.ndarray]]] = []
+        self._seq = itertools.count()
+        self.pushed = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, day: int, kind: int, parts: Optional[np.ndarray] = None, quantities: Optional[np.ndarray] = None):
+        heapq.heappush(self._heap, (day, kind, next(self._seq), parts, quantities))
+        self.pushed += 1
+
+    def pop(self) -> Tuple[int, int, Optional[np.ndarray], Optional[np.ndarray]]:
+        day, kind, _, parts, quantities = heapq.heappop(self._heap)
+        return day, kind, parts, quantities
+
+    def push_grouped(self, days: np.ndarray, kind: int, parts: np.ndarray, quantities: np.ndarray, horizon: int):
+        """부품별 사건을 날짜별로 묶어 날짜당 사건 하나씩 넣는다 (horizon 이후 사건은 버림)"""
+        keep = days < horizon
+        days, parts, quantities = days[keep], parts[keep], quantities[keep]
+        if not len(days):
+            return
+        order = np.argsort(days, kind='stable')
+        days, parts, quantities = days[order], parts[order], quantities[order]
+        unique_days, starts = np.unique(days, return_index=True)
+        ends = np.append(starts[1:], len(days))
+        for day, start, end in zip(unique_days, starts, ends):
+            self.push(int(day), kind, parts[start:end], quantities[start:end])
+
+
+@dataclass
+class SupplyTrace:
+    """이산 사건 시뮬레이션 결과 (일별 궤적)"""
+    days: np.ndarray
+    inventory: np.ndarray        # 일말 전체 보유 재고 (days,)
+    shortage: np.ndarray         # 일별 미충족 수요량 (days,)
+    line_ids: List[str]
+    line_capacity: np.ndarray
+    line_output: np.ndarray      # 라인 × 일 생산량
+    stockout_days: np.ndarray    # 부품별 결품 발생 일수
+    final_inventory: np.ndarray  # 부품별 마지막 날 재고
+    orders: int                  # 발주 건수 (부품 단위)
+    shipments: int               # 입고 건수 (분할 선적 포함, 부품 단위)
+    events: int                  # 처리한 부품 단위 사건 수 (소비 + 발주 + 입고)
+    queue_events: int            # 큐에서 꺼낸 묶음 사건 수
+    backend: str = 'numpy'       # 계산에 쓴 커널 백엔드
+    part_ids: List[str] = field(default_factory=list)
+    tracked_parts: List[int] = field(default_factory=list)
+    tracked_inventory: Optional[np.ndarray] = None  # 일 × 추적 부품 재고
+
+    @property
+    def production_loss(self) -> int:
+        """기간 전체 라인 생산 손실 (일일 생산능력 대비)"""
+        return int(round(float(self.line_capacity.sum() * len(self.days) - self.line_output.sum())))
+
+    def to_records(self) -> List[Dict]:
+        """일별 레코드 (표/차트용)"""
+        total_output = self.line_output.sum(axis=0) if len(self.line_ids) else np.zeros(len(self.days))
+        return [
+            {
+                'day': int(day),
+                'inventory': float(self.inventory[i]),
+                'shortage': float(self.shortage[i]),
+                'line_output': float(total_output[i]),
+                **{f'output_{line}': float(self.line_output[j, i]) for j, line in enumerate(self.line_ids)},
+            }
+            for i, day in enumerate(self.days)
+        ]
+
+
+class SupplyEventSimulator:
+    """
+    재발주점(s, S) 정책 기반 이산 사건 공급 시뮬레이터
+    - 리드타임: 공급사 base_lead_time_days (공급사 정보가 없으면 default_lead_time_days)
+    - 재발주점 s = 일일사용량 × (리드타임 + safety_days), 목표 재고 S = s + 일일사용량 × order_cover_days
+      (보유 + 입고 예정) 재고가 s 이하이면 S까지 발주한다.
+    - 공급 지연: delay_days만큼 입고가 늦어진다 (delayed_suppliers를 주면 해당 공급사만).
+    - 분할 선적: 발주량의 fill_rate만 예정일에 입고되고 나머지는 backorder_lag_days 뒤에 입고된다.
+    - 라인 생산량: 라인 생산능력 × (그 라인에 투입되는 부품 중 가장 낮은 수요 충족률).
+      line_id가 없는 부품은 모든 라인에 투입되는 공용 부품으로 본다.
+    - policy: 부품별 재발주 정책 (domain.replenishment.ReorderPolicyPlan). 주면 위 s, S 대신 정책의
+      reorder_point / order_up_to를 쓰고, 주기 검토(RS) 정책은 cycle_days마다만 발주를 검토한다.
+    - backend: 'auto' / 'numpy' / 'numba' (domain.kernels.resolve_backend, 기본은 SCM_KERNEL_BACKEND 또는 auto)
+    """
+
+    def __init__(
+        self,
+        horizon_days: int = 180,
+        delay_days: int = 0,
+        delayed_suppliers: Optional[Sequence[str]] = None,
+        safety_days: float = DelayImpactStrategy.SAFETY_BUFFER_DAYS,
+        order_cover_days: float = 30,
+        fill_rate: float = 1.0,
+        backorder_lag_days: int = 7,
+        default_lead_time_days: int = 7,
+        track_parts: Sequence[int] = (),
+        policy=None,
+        backend: Optional[str] = None
+    ):
+        if horizon_days < 1:
+            raise ValueError("horizon_days는 1 이상이어야 합니다.")
+        if not 0 < fill_rate <= 1:
+            raise ValueError("fill_rate는 0보다 크고 1 이하여야 합니다.")
+        self.horizon_days = int(horizon_days)
+        self.delay_days = int(delay_days)
+        self.delayed_suppliers = None if delayed_suppliers is None else set(delayed_suppliers)
+        self.safety_days = safety_days
+        self.order_cover_days = order_cover_days
+        self.fill_rate = fill_rate
+        self.backorder_lag_days = int(backorder_lag_days)
+        self.default_lead_time_days = int(default_lead_time_days)
+        self.track_parts = list(track_parts)
+        self.policy = policy
+        self.backend = backend
+
+    @traced('event_sim.run')
+    def run(self, context: SimulationContext) -> SupplyTrace:
+        cols = get_columns(context)
+        n_parts, horizon = cols.n_parts, self.horizon_days
+
+        usage = cols.daily_usage_rate
+        on_hand = cols.current_inventory.astype(np.float64).copy()
+        on_order = np.zeros(n_parts)
+        lead_time = self._lead_times(context, cols)
+        reorder_point, order_up_to, review_period = self._policy_levels(usage, lead_time)
+        line_index, line_ids = self._part_lines(context)
+
+        line_capacity = cols.line_capacity
+        days = np.arange(horizon)
+        inventory_trace = np.zeros(horizon)
+        shortage_trace = np.zeros(horizon)
+        line_output = np.zeros((len(line_ids), horizon))
+        stockout_days = np.zeros(n_parts, dtype=np.int64)
+        tracked = np.zeros((horizon, len(self.track_parts)))
+        counts = {'orders': 0, 'shipments': 0, 'events': 0, 'queue_events': 0}
+
+        backend = kernels.resolve_backend(self.backend)
+        with span('event_sim.loop', parts=n_parts, days=horizon, backend=backend):
+            if backend == 'numba':
+                self._run_kernel(
+                    on_hand, on_order, usage, lead_time, reorder_point, order_up_to, review_period, line_index, line_capacity,
+                    inventory_trace, shortage_trace, line_output, stockout_days, tracked, counts
+                )
+            else:
+                queue = EventQueue()
+                queue.push(0, CONSUMPTION)
+                queue.push(0, REORDER)
+                while queue:
+                    day, kind, parts, quantities = queue.pop()
+                    counts['queue_events'] += 1
+
+                    if kind == DELIVERY:
+                        np.add.at(on_hand, parts, quantities)
+                        np.subtract.at(on_order, parts, quantities)
+                        counts['shipments'] += len(parts)
+                        counts['events'] += len(parts)
+
+                    elif kind == CONSUMPTION:
+                        consumed = np.minimum(on_hand, usage)
+                        unmet = usage - consumed
+                        on_hand -= consumed
+                        short = np.flatnonzero(unmet > 0)
+                        stockout_days[short] += 1
+
+                        inventory_trace[day] = on_hand.sum()
+                        shortage_trace[day] = unmet[short].sum()
+                        line_output[:, day] = line_capacity * self._line_fill(short, consumed, usage, line_index, len(line_ids))
+                        if self.track_parts:
+                            tracked[day] = on_hand[self.track_parts]
+                        counts['events'] += n_parts
+                        if day + 1 < horizon:
+                            queue.push(day + 1, CONSUMPTION)
+
+                    elif kind == REORDER:
+                        position = on_hand + on_order
+                        due = (position <= reorder_point) & (usage > 0)
+                        if review_period is not None:
+                            due &= (review_period == 0) | (day % np.maximum(review_period, 1) == 0)
+                        need = np.flatnonzero(due)
+                        if len(need):
+                            quantity = order_up_to[need] - position[need]
+                            on_order[need] += quantity
+                            arrival = day + lead_time[need].astype(np.int64)
+                            first = quantity * self.fill_rate
+                            queue.push_grouped(arrival, DELIVERY, need, first, horizon)
+                            if self.fill_rate < 1:
+                                queue.push_grouped(arrival + self.backorder_lag_days, DELIVERY, need, quantity - first, horizon)
+                            counts['orders'] += len(need)
+                            counts['events'] += len(need)
+                        if day + 1 < horizon:
+                            queue.push(day + 1, REORDER)
+
+        return SupplyTrace(
+            days=days,
+            inventory=inventory_trace,
+            shortage=shortage_trace,
+            line_ids=line_ids,
+            line_capacity=line_capacity,
+            line_output=line_output,
+            stockout_days=stockout_days,
+            final_inventory=on_hand,
+            part_ids=part_strings(context.parts, 'id') if self.track_parts else [],
+            tracked_parts=self.track_parts,
+            tracked_inventory=tracked if self.track_parts else None,
+            backend=backend,
+            **counts,
+        )
+
+    def _policy_levels(self, usage: np.ndarray, lead_time: np.ndarray):
+        """부품별 (재발주점 s, 목표 재고 S, 검토 주기 또는 None)"""
+        if self.policy is None:
+            reorder_point = usage * (lead_time + self.safety_days)
+            return reorder_point, reorder_point + usage * self.order_cover_days, None
+        if len(self.policy.reorder_point) != len(usage):
+            raise ValueError("재발주 정책의 부품 수가 컨텍스트와 다릅니다.")
+        review_period = None
+        if self.policy.kind == 'RS':
+            review_period = np.maximum(np.round(self.policy.cycle_days), 1).astype(np.int64)
+        return (
+            np.asarray(self.policy.reorder_point, dtype=np.float64),
+            np.asarray(self.policy.order_up_to, dtype=np.float64),
+            review_period,
+        )
+
+    def _run_kernel(
+        self, on_hand, on_order, usage, lead_time, reorder_point, order_up_to, review_period, line_index, line_capacity,
+        inventory_trace, shortage_trace, line_output, stockout_days, tracked, counts
+    ):
+        """컴파일 커널로 전 기간을 계산하고 큐 경로와 같은 궤적/사건 수를 채운다"""
+        horizon, n_lines = self.horizon_days, len(line_capacity)
+        lag = self.backorder_lag_days if self.fill_rate < 1 else 0
+        ring = int(lead_time.max()) + lag + 1 if len(lead_time) else 1
+        track_slot = np.full(len(on_hand), -1, dtype=np.int64)
+        unique_tracked, inverse = np.unique(np.asarray(self.track_parts, dtype=np.int64), return_inverse=True)
+        track_slot[unique_tracked] = np.arange(len(unique_tracked))
+        tracked_unique = np.zeros((horizon, len(unique_tracked)))
+        line_fill = np.ones((n_lines, horizon))
+        shared_fill = np.ones(horizon)
+        groups = np.zeros((horizon, ring, 2), dtype=np.bool_)
+        order_counts = np.zeros(2, dtype=np.int64)
+
+        if review_period is None:
+            review_period = np.zeros(len(on_hand), dtype=np.int64)
+
+        kernels.supply_steps(
+            on_hand, on_order, usage.astype(np.float64), lead_time, reorder_point, order_up_to, review_period,
+            line_index.astype(np.int64), horizon, float(self.fill_rate), lag, track_slot,
+            inventory_trace, shortage_trace, line_fill, shared_fill, stockout_days, tracked_unique, groups, order_counts
+        )
+        line_output[:] = line_capacity[:, None] * np.minimum(line_fill, shared_fill)
+        tracked[:] = tracked_unique[:, inverse]
+        counts['orders'], counts['shipments'] = int(order_counts[0]), int(order_counts[1])
+        counts['events'] = len(on_hand) * horizon + counts['orders'] + counts['shipments']
+        counts['queue_events'] = 2 * horizon + int(groups.sum())
+
+    def _lead_times(self, context: SimulationContext, cols) -> np.ndarray:
+        """부품별 실제 리드타임 (공급 지연 반영)"""
+        known = cols.supplier_index >= 0
+        lead_time = np.full(cols.n_parts, float(self.default_lead_time_days))
+        lead_time[known] = cols.supplier_lead_time[cols.supplier_index[known]]
+
+        if self.delay_days:
+            if self.delayed_suppliers is None:
+                delayed = np.ones(cols.n_parts, dtype=bool)
+            else:
+                flags = np.array([sid in self.delayed_suppliers for sid in cols.supplier_ids], dtype=bool)
+                delayed = known.copy()
+                delayed[known] = flags[cols.supplier_index[known]]
+            lead_time[delayed] += self.delay_days
+        return np.maximum(lead_time, 0.0)
+
+    def _part_lines(self, context: SimulationContext) -> Tuple[np.ndarray, List[str]]:
+        """부품별 라인 위치 (라인 정보가 없거나 모르는 라인이면 -1 = 공용 부품)"""
+        line_ids = [l.id for l in context.production_lines]
+        position = {lid: i for i, lid in enumerate(line_ids)}
+        codes, values = part_labels(context.parts, 'line_id')
+        lookup = np.array([position.get(v, -1) for v in values], dtype=np.int64)
+        return (lookup[codes] if len(codes) else np.zeros(0, dtype=np.int64)), line_ids
+
+    @staticmethod
+    def _line_fill(short: np.ndarray, consumed: np.ndarray, usage: np.ndarray, line_index: np.ndarray, n_lines: int) -> np.ndarray:
+        """라인별 수요 충족률 (결품 부품만 검사)"""
+        fill = np.ones(n_lines)
+        if not len(short) or not n_lines:
+            return fill
+        ratio = consumed[short] / usage[short]
+        lines = line_index[short]
+        dedicated = lines >= 0
+        np.minimum.at(fill, lines[dedicated], ratio[dedicated])
+        if not dedicated.all():
+            fill = np.minimum(fill, ratio[~dedicated].min())
+        return fill
@@ -1,15 +1,27 @@
-from typing import Dict, List
-import pandas as pd
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+import numpy as np
+from common.tracing import traced
+from domain.columnar import context_fingerprint, get_columns
+from domain.interfaces import IScenarioResultStore
 from domain.models import SimulationContext, SimulationResult
 from domain.strategies import PriceHikeStrategy, DelayImpactStrategy
+from domain.fusion import FusedEvaluator
 
 
 class ForecastService:
     """
     예측 및 트렌드 분석 서비스
     다양한 시나리오에 대한 예측 결과 제공
+    - 도메인 레이어는 pandas에 의존하지 않으므로 결과는 레코드(dict) 리스트로 반환한다.
+      표/차트용 DataFrame 변환은 presentation.frames에서 담당한다.
+    - result_store가 주어지면 결과를 저장하고, 같은 데이터/파라미터는 저장된 결과로 응답한다.
     """
+
+    def __init__(self, result_store: Optional[IScenarioResultStore] = None, scope: str = ""):
+        self.result_store = result_store
+        self.scope = scope
     
+    @traced('forecast.forecast_scenarios')
     def forecast_scenarios(
         self,
         context: SimulationContext,
@@ -20,11 +32,15 @@ class ForecastService:
         다양한 시나리오별 예측 결과 생성
         
         Returns:
-            Dict with keys:
+            Dict with keys (각 값은 레코드(dict) 리스트):
             - price_scenarios: 가격 상승별 영향
             - delay_scenarios: 지연별 영향
             - combined_scenarios: 복합 시나리오
         """
+        params = {'max_price_increase': float(max_price_increase), 'max_delay': int(max_delay)}
+        cached = self._lookup(context, 'forecast', params)
+        if cached is not None:
+            return cached
         
         # 1. 가격 상승 시나리오 (0% ~ max_price_increase%)
         price_scenarios = self._forecast_price_impact(context, max_price_increase)
@@ -35,17 +51,19 @@ class ForecastService:
         # 3. 복합 시나리오 (가격 상승 + 지연)
         combined_scenarios = self._forecast_combined_impact(context)
         
-        return {
+        forecasts = {
             'price_scenarios': price_scenarios,
             'delay_scenarios': delay_scenarios,
             'combined_scenarios': combined_scenarios
         }
+        self._store(context, 'forecast', params, forecasts)
+        return forecasts
     
     def _forecast_price_impact(
         self,
         context: SimulationContext,
         max_increase: float
-    ) -> pd.DataFrame:
+    ) -> List[Dict]:
         """가격 변화율별 영업이익 영향 예측 (상승 및 하락)"""
         scenarios = []
         
@@ -64,13 +82,13 @@ class ForecastService:
                 'risk_level': self._calculate_risk_level(profit_delta, 0)
             })
         
-        return pd.DataFrame(scenarios)
+        return scenarios
     
     def _forecast_delay_impact(
         self,
         context: SimulationContext,
         max_delay: int
-    ) -> pd.DataFrame:
+    ) -> List[Dict]:
         """공급 지연별 생산 손실 예측"""
         scenarios = []
         
@@ -89,7 +107,7 @@ class ForecastService:
                 'risk_level': self._calculate_risk_level(0, days)
             })
         
-        return pd.DataFrame(scenarios)
+        return scenarios
     
     def _forecast_combined_impact(
         self,
@@ -111,18 +129,16 @@ class ForecastService:
         ]
         
         for price_pct, delay_days, label in scenarios:
-            profit_delta = 0
-            production_loss = 0
-            
+            strategies = []
             if price_pct > 0:
-                price_strategy = PriceHikeStrategy(float(price_pct))
-                price_result = price_strategy.calculate(context)
-                profit_delta = price_result.profit_delta
-            
+                strategies.append(PriceHikeStrategy(float(price_pct)))
             if delay_days > 0:
-                delay_strategy = DelayImpactStrategy(delay_days)
-                delay_result = delay_strategy.calculate(context)
-                production_loss = delay_result.production_loss
+                strategies.append(DelayImpactStrategy(delay_days))
+            
+            # 가격/지연 전략을 단일 패스로 평가
+            result = FusedEvaluator(strategies).evaluate(context)
+            profit_delta = result.profit_delta
+            production_loss = result.production_loss
             
             combined.append({
                 'scenario': label,
@@ -158,6 +174,7 @@ class ForecastService:
         
         return total_loss
     
+    @traced('forecast.get_risk_trend')
     def get_risk_trend(
         self,
         context: SimulationContext,
@@ -172,8 +189,13 @@ class ForecastService:
             current_delay: 현재 지연 일수
             
         Returns:
-            향후 30일간의 리스크 트렌드
+            향후 30일간의 리스크 트렌드 (trend_data: 레코드(dict) 리스트)
         """
+        params = {'price_increase_pct': float(current_price_increase), 'delay_days': int(current_delay)}
+        cached = self._lookup(context, 'risk_trend', params)
+        if cached is not None:
+            return cached
+
         # 간단한 선형 예측 (실제로는 더 복잡한 모델 사용 가능)
         days = list(range(0, 31, 5))  # 0, 5, 10, 15, 20, 25, 30일
         
@@ -183,19 +205,16 @@ class ForecastService:
             future_price = current_price_increase + (day * 0.3)  # 일주일마다 0.5% 추가 상승
             future_delay = current_delay + (day // 7)  # 일주일마다 1일 추가 지연
             
-            # 예측 계산
-            profit_delta = 0
-            production_loss = 0
-            
+            # 예측 계산 (가격/지연 전략을 단일 패스로 평가)
+            strategies = []
             if future_price > 0:
-                price_strategy = PriceHikeStrategy(future_price)
-                price_result = price_strategy.calculate(context)
-                profit_delta = price_result.profit_delta
-            
+                strategies.append(PriceHikeStrategy(future_price))
             if future_delay > 0:
-                delay_strategy = DelayImpactStrategy(int(future_delay))
-                delay_result = delay_strategy.calculate(context)
-                production_loss = delay_result.production_loss
+                strategies.append(DelayImpactStrategy(int(future_delay)))
+            
+            result = FusedEvaluator(strategies).evaluate(context)
+            profit_delta = result.profit_delta
+            production_loss = result.production_loss
             
             trend_data.append({
                 'day': day,
@@ -206,7 +225,150 @@ class ForecastService:
                 'risk_level': self._calculate_risk_level(profit_delta, int(future_delay))
             })
         
-        return {
-            'trend_data': pd.DataFrame(trend_data),
+        trend = {
+            'trend_data': trend_data,
             'warning': '이 예측은 현재 추세가 계속된다는 가정하에 생성되었습니다.'
         }
+        self._store(context, 'risk_trend', params, trend)
+        return trend
+
+    @traced('forecast.forecast_grid')
+    def forecast_grid(
+        self,
+        context: SimulationContext,
+        max_price_increase: float = 30.0,
+        max_delay: int = 30,
+        price_step: float = 1.0,
+        delay_step: int = 1
+    ) -> Dict:
+        """
+        가격 변화율 × 지연 일수 격자의 총 영향 (히트맵용)
+        가격/지연 영향은 각각 총 구매액/라인 생산능력 합계에 선형이므로 부품 배열은 한 번만 읽고
+        격자는 두 축 벡터의 외적(broadcast)으로 만든다.
+
+        Returns:
+            Dict with keys:
+            - price_increase_pct / delay_days: 축 값 리스트
+            - profit_by_price / loss_by_delay: 축별 영향 리스트 (가격 -> 영업이익 변화, 지연 -> 생산 손실)
+            - total_impact: [지연][가격] 2차원 리스트
+        """
+        params = {
+            'max_price_increase': float(max_price_increase), 'max_delay': int(max_delay),
+            'price_step': float(price_step), 'delay_step': int(delay_step),
+        }
+        cached = self._lookup(context, 'forecast_grid', params)
+        if cached is not None:
+            return cached
+
+        prices, delays, profit_delta, production_loss = self.grid_axes(context, max_price_increase, max_delay, price_step, delay_step)
+        total_impact = self._calculate_total_impact(profit_delta[None, :], production_loss[:, None])
+
+        grid = {
+            'price_increase_pct': prices.tolist(),
+            'delay_days': delays.tolist(),
+            'profit_by_price': profit_delta.tolist(),
+            'loss_by_delay': production_loss.tolist(),
+            'total_impact': total_impact.tolist(),
+        }
+        self._store(context, 'forecast_grid', params, grid)
+        return grid
+
+    def grid_axes(
+        self,
+        context: SimulationContext,
+        max_price_increase: float = 30.0,
+        max_delay: int = 30,
+        price_step: float = 1.0,
+        delay_step: int = 1
+    ):
+        """가격/지연 격자의 축 값과 축별 영향 (prices, delays, profit_delta, production_loss; numpy 배열)"""
+        columns = get_columns(context)
+        prices = np.round(np.arange(-max_price_increase, max_price_increase + price_step / 2, price_step), 6)
+        delays = np.arange(0, max_delay + 1, delay_step)
+        total_spend = float(np.sum(columns.unit_price * columns.monthly_usage))
+        profit_delta = PriceHikeStrategy(prices).aggregate_terms({'monthly_spend': total_spend})['profit_delta']
+        production_loss = float(np.sum(columns.line_capacity)) * np.maximum(delays - DelayImpactStrategy.SAFETY_BUFFER_DAYS, 0)
+        return prices, delays, profit_delta, production_loss
+
+    def iter_grid_rows(
+        self,
+        context: SimulationContext,
+        max_price_increase: float = 30.0,
+        max_delay: int = 30,
+        price_step: float = 1.0,
+        delay_step: int = 1,
+        chunk_rows: int = 100_000
+    ) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        가격 × 지연 격자를 행 단위 레코드 묶음으로 차례로 생성 (내보내기용)
+        2차원 격자 전체를 만들지 않고 지연 축을 chunk_rows 행 안팎씩 잘라 계산한다.
+        """
+        prices, delays, profit_delta, production_loss = self.grid_axes(context, max_price_increase, max_delay, price_step, delay_step)
+        per_chunk = max(1, chunk_rows // max(len(prices), 1))
+        for start in range(0, len(delays), per_chunk):
+            block_delays, block_loss = delays[start:start + per_chunk], production_loss[start:start + per_chunk]
+            n = len(block_delays)
+            yield {
+                'price_increase_pct': np.tile(prices, n),
+                'delay_days': np.repeat(block_delays, len(prices)),
+                'profit_delta': np.tile(profit_delta, n),
+                'production_loss': np.repeat(block_loss, len(prices)),
+                'total_impact': self._calculate_total_impact(profit_delta[None, :], block_loss[:, None]).ravel(),
+            }
+
+    @traced('forecast.forecast_distribution')
+    def forecast_distribution(
+        self,
+        context: SimulationContext,
+        price_mean_pct: float = 0.0,
+        price_sd_pct: float = 5.0,
+        quantiles: Sequence[float] = (0.5, 0.95, 0.99),
+        rel_tol: float = 0.01,
+        max_paths: int = 2_000_000,
+        workers: int = 1,
+        seed: Optional[int] = 0
+    ) -> Dict:
+        """
+        확률적 예측: 공급사별 가격 변동과 지연을 표본 추출해 KPI 분위수(P50/P95/P99 등)를 추정한다.
+        KPI는 손실 부호(profit_loss, production_loss, total_loss; 클수록 나쁨)이므로 높은 분위수가 불리한 꼬리이다.
+        경로는 스트리밍 스케치로만 요약하며, 신뢰구간이 rel_tol 안에 들어오면 자동으로 멈춘다.
+
+        Returns:
+            Dict with keys:
+            - quantiles: 레코드 리스트 (kpi, quantile, value, lower, upper)
+            - paths / rounds / converged: 사용한 경로 수, 라운드 수, 수렴 여부
+        """
+        from domain.monte_carlo import KPIS, AdaptiveMonteCarlo, RiskSampler
+
+        params = {
+            'kpis': list(KPIS),
+            'price_mean_pct': float(price_mean_pct), 'price_sd_pct': float(price_sd_pct),
+            'quantiles': [float(q) for q in quantiles], 'rel_tol': float(rel_tol),
+            'max_paths': int(max_paths), 'seed': seed,
+        }
+        cached = self._lookup(context, 'distribution', params)
+        if cached is not None:
+            return cached
+
+        sampler = RiskSampler.from_context(context, price_mean_pct, price_sd_pct)
+        result = AdaptiveMonteCarlo(
+            quantiles=quantiles, rel_tol=rel_tol, max_paths=max_paths, workers=workers, seed=seed
+        ).run(sampler)
+
+        distribution = {
+            'quantiles': result.to_records(),
+            'paths': result.paths,
+            'rounds': result.rounds,
+            'converged': result.converged,
+        }
+        self._store(context, 'distribution', params, distribution)
+        return distribution
+
+    def _lookup(self, context: SimulationContext, kind: str, params: Dict[str, Any]) -> Optional[Dict]:
+        if self.result_store is None:
+            return None
+        return self.result_store.lookup(context_fingerprint(context), kind, params)
+
+    def _store(self, context: SimulationContext, kind: str, params: Dict[str, Any], result: Dict):
+        if self.result_store is not None:
+            self.result_store.append(context_fingerprint(context), kind, params, result, scope=self.scope)
@@ -0,0 +1,78 @@
+from typing import Any, Callable, Dict, List, Sequence
+
+import numpy as np
+
+from common.tracing import span
+from domain.columnar import ContextColumns, get_columns
+from domain.interfaces import IColumnarStrategy
+from domain.models import SimulationContext, SimulationResult
+
+# 전략이 선언할 수 있는 컬럼 이름 -> 컬럼 스냅샷에서 값을 꺼내는 함수
+COLUMN_GETTERS: Dict[str, Callable[[ContextColumns], Any]] = {
+    'unit_price': lambda c: c.unit_price,
+    'current_inventory': lambda c: c.current_inventory,
+    'daily_usage_rate': lambda c: c.daily_usage_rate,
+    'monthly_usage': lambda c: c.monthly_usage,
+    'supplier_index': lambda c: c.supplier_index,
+    'part_supplier_risk': lambda c: c.part_supplier_risk,
+    'supplier_risk': lambda c: c.supplier_risk,
+    'supplier_lead_time': lambda c: c.supplier_lead_time,
+    'part_currency_index': lambda c: c.gather_supplier_codes(c.supplier_currency_index),
+    'currencies': lambda c: c.currencies,
+    'part_country_index': lambda c: c.gather_supplier_codes(c.supplier_country_index),
+    'countries': lambda c: c.countries,
+    'line_capacity': lambda c: c.line_capacity,
+    'line_efficiency': lambda c: c.line_efficiency,
+}
+
+# 전략이 내보낼 수 있는 항 이름 (SimulationResult 필드)
+RESULT_TERMS = ('profit_delta', 'production_loss')
+
+
+class FusedEvaluator:
+    """
+    여러 컬럼형 전략을 단일 패스로 평가하는 합성 전략 실행기
+    1. 모든 전략이 선언한 컬럼의 합집합을 한 번만 읽는다.
+    2. 각 전략의 행 단위 항을 결과 필드별로 먼저 원소 단위로 더한다.
+    3. 필드별로 한 번만 합계(reduction)를 수행한다.
+    """
+
+    def __init__(self, strategies: Sequence[IColumnarStrategy]):
+        self.strategies = list(strategies)
+        self.columns = sorted({name for s in self.strategies for name in s.columns})
+        unknown = [name for name in self.columns if name not in COLUMN_GETTERS]
+        if unknown:
+            raise ValueError(f"알 수 없는 컬럼을 요청한 전략이 있습니다: {', '.join(unknown)}")
+
+    def evaluate(self, context: SimulationContext) -> SimulationResult:
+        with span('strategy.fused_evaluate', strategies=len(self.strategies)):
+            snapshot = get_columns(context)
+            columns = {name: COLUMN_GETTERS[name](snapshot) for name in self.columns}
+
+            totals = {term: 0.0 for term in RESULT_TERMS}
+            for term, values in self._combine_terms(columns).items():
+                totals[term] = float(sum(np.sum(v) for v in values))
+
+        return SimulationResult(
+            operating_profit=0,
+            production_output=0,
+            profit_delta=totals['profit_delta'],
+            production_loss=int(round(totals['production_loss']))
+        )
+
+    def _combine_terms(self, columns: Dict[str, Any]) -> Dict[str, List[Any]]:
+        """같은 필드의 항 중 모양이 같은 배열은 원소 단위로 합쳐 둔다"""
+        combined: Dict[str, List[Any]] = {}
+        for strategy in self.strategies:
+            for term, value in strategy.terms(columns).items():
+                if term not in RESULT_TERMS:
+                    raise ValueError(f"지원하지 않는 결과 항입니다: {term}")
+                bucket = combined.setdefault(term, [])
+                for i, existing in enumerate(bucket):
+                    if np.shape(existing) == np.shape(value):
+                        bucket[i] = existing + value
+                        break
+                else:
+                    bucket.append(value)
+
+        return combined
@@ -1,6 +1,8 @@
 from typing import List
 from dataclasses import dataclass
+from common.tracing import traced
 from domain.models import SimulationContext, SimulationResult
+from domain.replenishment import ReorderPolicySweep
 
 
 @dataclass
@@ -18,6 +20,10 @@ class InsightsService:
     시뮬레이션 결과를 분석하여 실용적인 비즈니스 조언 생성
     """
     
+    # 재고 확보 전략에서 제안하는 재발주 정책의 목표 fill rate
+    REORDER_TARGET_FILL_RATE = 0.98
+    
+    @traced('insights.generate_insights')
     def generate_insights(
         self,
         context: SimulationContext,
@@ -170,10 +176,12 @@ class InsightsService:
         if delay_days > 10:
             # 재고가 부족한 부품 찾기
             critical_parts = []
-            for part in context.parts:
+            critical_index = []
+            for i, part in enumerate(context.parts):
                 days_of_inventory = part.current_inventory / part.daily_usage_rate
                 if days_of_inventory < delay_days:
                     critical_parts.append(part.name)
+                    critical_index.append(i)
             
             if critical_parts:
                 insights.append(Insight(
@@ -187,13 +195,27 @@ class InsightsService:
                 insights.append(Insight(
                     type="recommendation",
                     title="💡 재고 확보 전략",
-                    message=f"최소 {delay_days + 5}일분의 안전 재고 확보를 권장합니다. "
-                            f"긴급 발주를 고려하세요.",
+                    message=self._reorder_advice(context, critical_index[:3], delay_days),
                     priority=2
                 ))
         
         return insights
     
+    def _reorder_advice(self, context: SimulationContext, part_index: List[int], delay_days: int) -> str:
+        """위험 부품의 (s, S) 정책 스윕 결과로 부품별 재발주점 / 목표 재고 제안 (지연은 공급사 리스크 확률로 발생)"""
+        plan = ReorderPolicySweep(
+            kind='sS', target_fill_rate=self.REORDER_TARGET_FILL_RATE, delay_scenarios=[(delay_days, 1.0)]
+        ).optimize(context, parts=part_index)
+        lines = [
+            f"- {plan.part_names[i]}: 재발주점 {plan.reorder_point[i]:,.0f}개, 목표 재고 {plan.order_up_to[i]:,.0f}개 "
+            f"(안전 {plan.safety_days[i]:.0f}일, 예상 fill rate {plan.fill_rate[i]:.1%})"
+            for i in range(len(plan.part_ids))
+        ]
+        return (
+            f"{delay_days}일 지연 리스크를 반영한 (s, S) 재발주 정책입니다:\n" + "\n".join(lines) +
+            "\n현재 재고가 재발주점 아래이면 긴급 발주를 고려하세요."
+        )
+    
     def _analyze_supplier_risk(self, context: SimulationContext, delay_days: int) -> List[Insight]:
         """공급사 리스크 분석"""
         insights = []
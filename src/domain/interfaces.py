@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Any, Dict, Mapping, Optional, Tuple
 from domain.models import SimulationContext, SimulationResult
 
 class ISimulationStrategy(ABC):
@@ -9,3 +10,69 @@ class ISimulationStrategy(ABC):
     @abstractmethod
     def calculate(self, context: SimulationContext) -> SimulationResult:
         pass
+
+class IColumnarStrategy(ISimulationStrategy):
+    """
+    컬럼 기반(융합 가능) 시뮬레이션 전략 인터페이스.
+    - columns: 전략이 읽는 컬럼 이름 (domain.fusion.COLUMN_GETTERS 참고)
+    - terms: 컬럼 배열을 받아 결과 필드별 항(행 단위 배열 또는 스칼라)을 반환
+    서비스는 여러 전략의 컬럼을 한 번만 읽고 항을 합산하여 단일 패스로 평가한다.
+    단독 호출(calculate) 시에도 같은 경로를 사용하므로 기존 계약은 그대로 유지된다.
+    """
+    columns: Tuple[str, ...] = ()
+
+    @abstractmethod
+    def terms(self, columns: Mapping[str, Any]) -> Mapping[str, Any]:
+        pass
+
+    def calculate(self, context: SimulationContext) -> SimulationResult:
+        from domain.fusion import FusedEvaluator
+        return FusedEvaluator([self]).evaluate(context)
+
+class IAggregateStrategy(ABC):
+    """
+    집계 큐브(domain.rollup.RollupCube) 기반 평가를 지원하는 전략의 선택 인터페이스.
+    계산식이 그룹 합계만으로 표현되는 전략은 이를 구현해 부품 전체를 다시 훑지 않고
+    공급사/라인/분류별 드릴다운 결과를 계산할 수 있다.
+    - aggregate_dims: 평가 가능한 집계 차원 (None이면 모든 차원)
+    - aggregate_terms: 그룹별 측정값 배열을 받아 결과 항 배열을 반환
+    """
+    aggregate_dims: Optional[Tuple[str, ...]] = None
+
+    @abstractmethod
+    def aggregate_terms(self, measures: Mapping[str, Any]) -> Mapping[str, Any]:
+        pass
+
+class IOverlayStrategy(ABC):
+    """
+    What-if 오버레이(domain.overlays) 평가를 지원하는 전략의 선택 인터페이스.
+    부품/공급사 개별 조정이 있을 때 원본 집계값(OverlayBase)에 조정 항목별 보정만 더해
+    결과 항을 계산하므로, 조정 하나의 비용은 카탈로그 크기가 아니라 조정 개수에 비례한다.
+    """
+    @abstractmethod
+    def overlay_terms(self, base: Any, overlay: Any) -> Mapping[str, Any]:
+        pass
+
+class IScenarioResultStore(ABC):
+    """
+    시나리오 결과 저장소 인터페이스 (append-only)
+    - context_hash: 데이터 내용 해시 (domain.columnar.context_fingerprint)
+    - kind: 결과 종류 ('simulation', 'forecast', 'risk_trend' 등)
+    - params: 시나리오 파라미터 (JSON 직렬화 가능한 dict)
+    - scope: 결과를 묶어 조회할 범위 라벨 (공장, 데이터 소스 등)
+    서비스는 같은 (context_hash, kind, params) 결과가 있으면 다시 계산하지 않고 재사용한다.
+    """
+    @abstractmethod
+    def lookup(self, context_hash: str, kind: str, params: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def append(
+        self,
+        context_hash: str,
+        kind: str,
+        params: Mapping[str, Any],
+        result: Mapping[str, Any],
+        scope: str = ""
+    ) -> None:
+        pass
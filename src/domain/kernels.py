@@ -0,0 +1,152 @@
+"""
+시간 단계(time-stepped) 시뮬레이션용 컴파일 커널 (선택: numba)
+결품/재발주처럼 값에 따라 갈라지는 일별 재고 계산과 경로별 최대 지연 계산을 부품(경로) 단위 스칼라 루프로 쓰고,
+numba가 설치되어 있으면 기계어로 컴파일해 쓴다. 없으면 호출하는 쪽의 기존 NumPy 경로를 그대로 쓴다.
+
+- 백엔드: 'numpy' / 'numba' / 'auto' (numba가 있으면 numba). 기본값은 환경 변수 SCM_KERNEL_BACKEND (없으면 auto)
+- 커널 함수는 numba 없이도 순수 Python으로 실행되므로(느림) 작은 입력으로 NumPy 경로와 결과를 비교할 수 있다.
+  컴파일된 함수의 원본은 .py_func로 꺼낸다.
+- 첫 호출 때 컴파일하며 결과는 __pycache__에 캐시한다 (cache=True).
+- numba 임포트(수백 ms)는 커널(supply_steps / line_loss)을 처음 꺼낼 때까지 미룬다.
+  설치 여부는 find_spec으로만 확인하므로 이 모듈을 임포트해도 콜드 스타트 경로에 numba가 올라오지 않는다.
+"""
+import os
+from importlib.util import find_spec
+from typing import Optional
+
+import numpy as np
+
+BACKENDS = ('numpy', 'numba')
+NUMBA_AVAILABLE = find_spec('numba') is not None
+
+
+def resolve_backend(backend: Optional[str] = None) -> str:
+    """요청한 백엔드를 실제 실행할 백엔드 이름으로 변환 ('auto'는 설치 여부에 따라 결정)"""
+    requested = (backend or os.environ.get('SCM_KERNEL_BACKEND') or 'auto').lower()
+    if requested == 'auto':
+        return 'numba' if NUMBA_AVAILABLE else 'numpy'
+    if requested not in BACKENDS:
+        raise ValueError(f"알 수 없는 커널 백엔드입니다: {requested} (auto, numpy, numba 중 하나)")
+    if requested == 'numba' and not NUMBA_AVAILABLE:
+        raise ValueError("numba가 설치되어 있지 않습니다. pip install numba 후 사용하거나 numpy 백엔드를 선택하세요.")
+    return requested
+
+
+def _compile(func):
+    """numba가 있으면 컴파일 함수, 없으면 원본 Python 함수"""
+    if not NUMBA_AVAILABLE:
+        return func
+    try:
+        import numba
+    except ImportError:  # numba가 없으면 NumPy 경로 사용
+        return func
+    return numba.njit(cache=True, nogil=True)(func)
+
+
+def _supply_steps(
+    on_hand, on_order, usage, lead_time, reorder_point, order_up_to, review_period, line_index,
+    horizon, fill_rate, backorder_lag, track_slot,
+    inventory, shortage, line_fill, shared_fill, stockout_days, tracked, groups, counts
+):
+    """
+    SupplyEventSimulator의 일별 입고 -> 소비 -> 재발주 검토를 부품마다 순서대로 계산 (배열은 제자리 갱신)
+    - 입고 예정량은 부품별 링 버퍼(1차 입고 / 분할 선적 잔량)에 두고, 리드타임 0인 입고는 재발주 직후 반영한다.
+    - review_period: 부품별 검토 주기 (0이면 매일 검토하는 연속 검토)
+    - line_fill / shared_fill: 라인별 / 공용 부품의 일별 최저 수요 충족률
+    - groups[발주일, 도착 오프셋, 1차/잔량]: 큐 경로에서 묶음 입고 사건이 되는 (발주일, 도착일) 조합
+    - counts: [발주 건수, 입고 건수]
+    """
+    n_parts = on_hand.shape[0]
+    ring = groups.shape[1]
+    first_due = np.zeros(ring)
+    back_due = np.zeros(ring)
+    for p in range(n_parts):
+        first_due[:] = 0.0
+        back_due[:] = 0.0
+        stock = on_hand[p]
+        pending = on_order[p]
+        use = usage[p]
+        lead = int(lead_time[p])
+        line = line_index[p]
+        slot_of_part = track_slot[p]
+        review = review_period[p]
+        for day in range(horizon):
+            slot = day % ring
+            # 같은 날 입고: 먼저 발주된 분할 선적 잔량이 먼저 큐에 들어가 있다
+            if back_due[slot] != 0.0:
+                stock += back_due[slot]
+                pending -= back_due[slot]
+                back_due[slot] = 0.0
+            if first_due[slot] != 0.0:
+                stock += first_due[slot]
+                pending -= first_due[slot]
+                first_due[slot] = 0.0
+
+            consumed = min(stock, use)
+            unmet = use - consumed
+            stock -= consumed
+            inventory[day] += stock
+            if unmet > 0:
+                stockout_days[p] += 1
+                shortage[day] += unmet
+                ratio = consumed / use
+                if line >= 0:
+                    line_fill[line, day] = min(line_fill[line, day], ratio)
+                else:
+                    shared_fill[day] = min(shared_fill[day], ratio)
+            if slot_of_part >= 0:
+                tracked[day, slot_of_part] = stock
+
+            position = stock + pending
+            if (review == 0 or day % review == 0) and position <= reorder_point[p] and use > 0:
+                quantity = order_up_to[p] - position
+                pending += quantity
+                counts[0] += 1
+                first = quantity * fill_rate
+                for kind in range(2 if fill_rate < 1 else 1):
+                    amount = first if kind == 0 else quantity - first
+                    offset = lead if kind == 0 else lead + backorder_lag
+                    if day + offset >= horizon:
+                        continue
+                    counts[1] += 1
+                    groups[day, offset, kind] = True
+                    if offset == 0:
+                        stock += amount
+                        pending -= amount
+                    elif kind == 0:
+                        first_due[(day + offset) % ring] += amount
+                    else:
+                        back_due[(day + offset) % ring] += amount
+        on_hand[p] = stock
+        on_order[p] = pending
+
+
+def _line_loss(delays, indptr, indices, line_capacity, safety_days, out):
+    """
+    경로별 라인 생산 손실 = Σ_l 생산능력 × max(0, 라인 투입 공급사 최대 지연 - 안전 재고 일수)
+    라인 l의 투입 공급사는 indices[indptr[l]:indptr[l + 1]] (CSR)
+    """
+    n_paths = delays.shape[0]
+    for l in range(line_capacity.shape[0]):
+        start, end = indptr[l], indptr[l + 1]
+        if start == end:
+            continue
+        capacity = line_capacity[l]
+        for i in range(n_paths):
+            worst = delays[i, indices[start]]
+            for k in range(start + 1, end):
+                if delays[i, indices[k]] > worst:
+                    worst = delays[i, indices[k]]
+            if worst > safety_days:
+                out[i] += capacity * (worst - safety_days)
+
+
+_KERNELS = {'supply_steps': _supply_steps, 'line_loss': _line_loss}
+
+
+def __getattr__(name):
+    """kernels.supply_steps / kernels.line_loss를 처음 꺼낼 때 컴파일해 모듈 속성으로 둔다"""
+    if name not in _KERNELS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    kernel = globals()[name] = _compile(_KERNELS[name])
+    return kernel
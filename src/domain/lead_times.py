@@ -0,0 +1,223 @@
+"""
+납품 이력 기반 공급사 리드타임 분포 / 지연 확률 추정
+납품 이력(발주일, 약속 납기일, 입고일)을 청크 단위로 받아 공급사별 일 단위 히스토그램과 합계만 누적하므로
+수백만 행 로그도 (공급사 수 × 최대 일수) 메모리로 훑는다. 누적은 청크마다 np.bincount 한 번으로 전체 공급사를 묶어 계산한다.
+
+- 리드타임 = 입고일 - 발주일
+- 지연 일수 = 입고일 - 약속 납기일 (약속 납기일이 없으면 리드타임 - 공급사 base_lead_time_days)
+  지연 일수가 tolerance_days보다 크면 지연 납품으로 본다.
+- 공급사별 결과: 납품 건수, 리드타임 평균 / 표준편차 / 분위수(히스토그램), 정상 납품 평균 리드타임,
+  지연 확률, 지연 시 평균 지연 일수
+- 지연 일수 분포: 전체 지연 납품을 DELAY_BIN_EDGES 구간으로 묶은 조건부 분포 (구간 평균 일수, 확률).
+  DEFAULT_DELAY_SCENARIOS와 같은 형식이며 공급사별 차이는 지연 확률로 반영한다.
+- attach_lead_time_fit으로 컨텍스트에 붙이면 컬럼 스냅샷(get_columns)은 납품 건수가 min_deliveries 이상인
+  공급사의 risk_score / base_lead_time_days 대신 추정한 지연 확률 / 정상 납품 리드타임을 쓰고,
+  안전재고 / 몬테카를로 / 재발주 정책은 지연 시나리오를 따로 주지 않으면 추정한 지연 일수 분포를 쓴다.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from domain.models import SimulationContext
+
+# 지연 일수 구간 경계 (일): (tolerance, 7], (7, 14], (14, 28], (28, ∞)
+DELAY_BIN_EDGES = (7, 14, 28)
+
+
+@dataclass(eq=False)
+class LeadTimeFit:
+    """공급사별 리드타임 분포 / 지연 확률 추정 결과"""
+    supplier_ids: List[str]
+    deliveries: np.ndarray            # 공급사별 유효 납품 건수
+    lead_time_histogram: np.ndarray   # (공급사, max_days + 1) 일 단위 리드타임 건수 (마지막 칸은 max_days 이상)
+    lead_time_mean: np.ndarray
+    lead_time_std: np.ndarray
+    nominal_lead_time: np.ndarray     # 정상(비지연) 납품의 평균 리드타임
+    delay_probability: np.ndarray
+    mean_delay_days: np.ndarray       # 지연 납품의 평균 지연 일수
+    delay_scenarios: Tuple[Tuple[float, float], ...]
+    rows: int
+    skipped_rows: int                 # 날짜 오류, 음수 리드타임, 공급사 목록에 없는 행
+    min_deliveries: int = 20
+
+    @property
+    def fitted(self) -> np.ndarray:
+        """컬럼 스냅샷에 추정값을 쓸 만큼 납품 건수가 있는 공급사"""
+        return self.deliveries >= self.min_deliveries
+
+    def lead_time_quantile(self, q: float) -> np.ndarray:
+        """공급사별 리드타임 분위수 (일, 납품 이력이 없으면 NaN)"""
+        cdf = np.cumsum(self.lead_time_histogram, axis=1)
+        days = (cdf >= q * self.deliveries[:, None]).argmax(axis=1).astype(np.float64)
+        return np.where(self.deliveries > 0, days, np.nan)
+
+    def overlay(self, supplier_ids: Sequence[str], risk: np.ndarray, lead_time: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """공급사 목록 순서의 (지연 확률, 리드타임)에 추정값을 덮어쓴 사본 (납품 건수가 부족한 공급사는 그대로)"""
+        position = {sid: i for i, sid in enumerate(self.supplier_ids)}
+        source = np.array([position.get(sid, -1) for sid in supplier_ids], dtype=np.int64)
+        target = np.flatnonzero(source >= 0)
+        source = source[target]
+        keep = self.fitted[source]
+        target, source = target[keep], source[keep]
+
+        risk, lead_time = risk.copy(), lead_time.copy()
+        risk[target] = self.delay_probability[source]
+        lead_time[target] = np.rint(self.nominal_lead_time[source])
+        return risk, lead_time
+
+    def to_records(self) -> List[Dict]:
+        """공급사별 추정 결과 레코드 (대시보드 표 / 다운로드용)"""
+        p50, p90 = self.lead_time_quantile(0.5), self.lead_time_quantile(0.9)
+        fitted = self.fitted
+        return [
+            {
+                'supplier_id': sid,
+                'deliveries': int(self.deliveries[i]),
+                'lead_time_mean': float(self.lead_time_mean[i]),
+                'lead_time_std': float(self.lead_time_std[i]),
+                'lead_time_p50': float(p50[i]),
+                'lead_time_p90': float(p90[i]),
+                'nominal_lead_time': float(self.nominal_lead_time[i]),
+                'delay_probability': float(self.delay_probability[i]),
+                'mean_delay_days': float(self.mean_delay_days[i]),
+                'fitted': bool(fitted[i]),
+            }
+            for i, sid in enumerate(self.supplier_ids)
+        ]
+
+
+class LeadTimeFitter:
+    """
+    납품 이력 청크를 누적하는 공급사별 리드타임 추정기
+
+    사용 예:
+        fitter = LeadTimeFitter(supplier_ids, base_lead_time_days)
+        for chunk in chunks:
+            fitter.update(supplier_index, lead_days, delay_days)
+        fit = fitter.result()
+    """
+
+    def __init__(
+        self,
+        supplier_ids: Sequence[str],
+        base_lead_time_days: Sequence[float],
+        tolerance_days: float = 0,
+        max_days: int = 365,
+        min_deliveries: int = 20
+    ):
+        if len(supplier_ids) != len(base_lead_time_days):
+            raise ValueError("공급사 목록과 기본 리드타임의 길이가 다릅니다.")
+        if max_days < 1:
+            raise ValueError("max_days는 1 이상이어야 합니다.")
+        self.supplier_ids = list(supplier_ids)
+        self.base_lead_time = np.asarray(base_lead_time_days, dtype=np.float64)
+        self.tolerance_days = float(tolerance_days)
+        self.max_days = int(max_days)
+        self.min_deliveries = int(min_deliveries)
+
+        n, width = len(self.supplier_ids), self.max_days + 1
+        self._histogram = np.zeros((n, width), dtype=np.int64)
+        self._lead_sum = np.zeros(n)
+        self._lead_sq_sum = np.zeros(n)
+        self._on_time = np.zeros(n, dtype=np.int64)
+        self._on_time_sum = np.zeros(n)
+        self._delayed = np.zeros(n, dtype=np.int64)
+        self._delay_sum = np.zeros(n)
+        self._delay_histogram = np.zeros(width, dtype=np.int64)  # 전체 지연 납품의 지연 일수
+        self.rows = 0
+        self.skipped_rows = 0
+
+    def update(self, supplier_index: np.ndarray, lead_days: np.ndarray, delay_days: Optional[np.ndarray] = None):
+        """
+        청크 하나 누적
+        - supplier_index: 행별 공급사 위치 (공급사 목록에 없으면 -1)
+        - lead_days: 리드타임(일, 날짜 오류는 NaN)
+        - delay_days: 약속 납기 대비 지연 일수 (None이거나 NaN인 행은 리드타임 - 기본 리드타임)
+        """
+        index = np.asarray(supplier_index, dtype=np.int64)
+        lead = np.asarray(lead_days, dtype=np.float64)
+        self.rows += len(index)
+
+        known = index >= 0
+        fallback = np.full(len(index), np.nan)
+        fallback[known] = lead[known] - self.base_lead_time[index[known]]
+        delay = fallback if delay_days is None else np.asarray(delay_days, dtype=np.float64)
+        delay = np.where(np.isnan(delay), fallback, delay)
+
+        valid = known & np.isfinite(lead) & (lead >= 0) & np.isfinite(delay)
+        self.skipped_rows += int(len(index) - valid.sum())
+        index, lead, delay = index[valid], lead[valid], delay[valid]
+        if not len(index):
+            return
+
+        n, width = len(self.supplier_ids), self.max_days + 1
+        day = np.minimum(np.rint(lead), self.max_days).astype(np.int64)
+        self._histogram += np.bincount(index * width + day, minlength=n * width).reshape(n, width)
+        self._lead_sum += np.bincount(index, weights=lead, minlength=n)
+        self._lead_sq_sum += np.bincount(index, weights=lead * lead, minlength=n)
+
+        late = delay > self.tolerance_days
+        self._on_time += np.bincount(index[~late], minlength=n)
+        self._on_time_sum += np.bincount(index[~late], weights=lead[~late], minlength=n)
+        self._delayed += np.bincount(index[late], minlength=n)
+        self._delay_sum += np.bincount(index[late], weights=delay[late], minlength=n)
+        late_day = np.clip(np.rint(delay[late]), 0, self.max_days).astype(np.int64)
+        self._delay_histogram += np.bincount(late_day, minlength=width)
+
+    def result(self) -> LeadTimeFit:
+        """누적한 통계로 공급사별 추정값 계산 (납품 이력이 없는 공급사의 리드타임 통계는 NaN, 확률은 0)"""
+        count = self._histogram.sum(axis=1)
+        safe = np.maximum(count, 1)
+        mean = self._lead_sum / safe
+        variance = np.maximum(self._lead_sq_sum / safe - mean * mean, 0.0)
+        observed = count > 0
+        nominal = np.where(
+            self._on_time > 0, self._on_time_sum / np.maximum(self._on_time, 1), self.base_lead_time
+        )
+        return LeadTimeFit(
+            supplier_ids=list(self.supplier_ids),
+            deliveries=count,
+            lead_time_histogram=self._histogram.copy(),
+            lead_time_mean=np.where(observed, mean, np.nan),
+            lead_time_std=np.where(observed, np.sqrt(variance), np.nan),
+            nominal_lead_time=nominal,
+            delay_probability=self._delayed / safe,
+            mean_delay_days=np.where(self._delayed > 0, self._delay_sum / np.maximum(self._delayed, 1), 0.0),
+            delay_scenarios=self._pooled_scenarios(),
+            rows=self.rows,
+            skipped_rows=self.skipped_rows,
+            min_deliveries=self.min_deliveries,
+        )
+
+    def _pooled_scenarios(self) -> Tuple[Tuple[float, float], ...]:
+        """전체 지연 납품의 지연 일수를 구간별 (평균 일수, 확률)로 요약 (지연 납품이 없으면 빈 튜플)"""
+        total = self._delay_histogram.sum()
+        if not total:
+            return ()
+        days = np.arange(len(self._delay_histogram), dtype=np.float64)
+        bins = np.searchsorted(DELAY_BIN_EDGES, days, side='left')
+        counts = np.bincount(bins, weights=self._delay_histogram, minlength=len(DELAY_BIN_EDGES) + 1)
+        day_sums = np.bincount(bins, weights=self._delay_histogram * days, minlength=len(DELAY_BIN_EDGES) + 1)
+        return tuple(
+            (round(float(day_sums[b] / counts[b]), 1), float(counts[b] / total))
+            for b in range(len(counts)) if counts[b] > 0
+        )
+
+
+def attach_lead_time_fit(context: SimulationContext, fit: Optional[LeadTimeFit]):
+    """컨텍스트에 추정 결과를 붙인다 (None이면 떼어 냄). 컬럼 스냅샷과 결과 캐시 키는 다음 조회 때 다시 만들어진다."""
+    if fit is None:
+        context.__dict__.pop('_lead_time_fit', None)
+    else:
+        context.__dict__['_lead_time_fit'] = fit
+
+
+def get_lead_time_fit(context: SimulationContext) -> Optional[LeadTimeFit]:
+    return context.__dict__.get('_lead_time_fit')
+
+
+def fitted_delay_scenarios(context: SimulationContext) -> Tuple[Tuple[float, float], ...]:
+    """컨텍스트에 붙은 추정 지연 일수 분포 (없으면 빈 튜플)"""
+    fit = get_lead_time_fit(context)
+    return fit.delay_scenarios if fit is not None else ()
@@ -7,15 +7,20 @@ class Supplier:
     name: str
     risk_score: int
     base_lead_time_days: int
+    currency: str = ""  # 결제 통화 (예: USD, JPY). 비어 있으면 환율 노출 없음
+    country: str = ""   # 공급 국가 (관세 적용 기준)
 
-@dataclass
+@dataclass(frozen=True)
 class Part:
+    """부품 (불변: 값을 바꾸려면 새 Part로 교체한다 - context.parts[i] = new)"""
     id: str
     name: str
     supplier_id: str
     unit_price: float
     current_inventory: int
     daily_usage_rate: int
+    category: str = ""  # 부품 분류 (드릴다운 집계용)
+    line_id: str = ""   # 사용 생산라인 ID (비어 있으면 전 라인 공용)
 
     @property
     def monthly_usage(self) -> int:
@@ -0,0 +1,286 @@
+"""
+적응형 몬테카를로 리스크 분포 추정
+- 경로(시나리오)를 배치 단위로 생성해 KPI별 KLL 스케치에만 흘려 보내므로
+  메모리는 경로 수와 무관하게 (배치 크기 + 스케치 크기)로 일정하다.
+- 배치마다 목표 분위수의 신뢰구간을 계산하고, 모든 구간이 요청한 허용 오차 안에 들어오면 멈춘다.
+- workers > 1이면 워커 프로세스별로 스케치를 만들고 라운드마다 병합한다.
+- 경로별 라인 최대 지연은 numba가 있으면 domain.kernels.line_loss 컴파일 커널로 계산한다 (RiskSampler.backend).
+- KPI는 모두 손실(클수록 나쁨)로 기록하므로 P95 / P99가 곧 불리한 꼬리이다.
+"""
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from common.tracing import span, traced
+from domain import kernels
+from domain.columnar import get_columns
+from domain.models import SimulationContext
+from domain.lead_times import fitted_delay_scenarios
+from domain.safety_stock import DEFAULT_DELAY_SCENARIOS
+from domain.sketches import KLLSketch
+from domain.strategies import DelayImpactStrategy
+from domain.tables import part_labels
+
+# 손실 부호: 영업이익 감소액($), 생산 손실(units), 총 손실($) = 영업이익 감소액 + 생산 손실 × PRODUCTION_UNIT_VALUE
+KPIS = ('profit_loss', 'production_loss', 'total_loss')
+
+# ForecastService._calculate_total_impact와 같은 환산 (생산 1 unit = 1000)
+PRODUCTION_UNIT_VALUE = 1000
+
+
+@dataclass
+class RiskSampler:
+    """
+    컨텍스트에서 뽑아 둔 작은 배열만으로 KPI 경로를 생성하는 샘플러 (워커 프로세스로 전달 가능)
+    - 가격: 공급사별 변동률 ε_i = 평균 + 표준편차 × (√ρ·Z + √(1-ρ)·Z_i) (ρ: 공통 시장 요인 상관)
+      영업이익 감소액 = Σ_i 공급사별 월간 구매액 × ε_i / 100  (가격이 내리면 음수)
+    - 지연: 공급사는 risk_score 확률로 지연되며 지연 일수는 delay_scenarios 분포를 따른다.
+      라인 생산 손실 = Σ_l 라인 생산능력 × max(0, 라인 투입 공급사 최대 지연 - 안전 재고 일수)
+    - backend: 라인 생산 손실 계산 커널 ('auto' / 'numpy' / 'numba', domain.kernels.resolve_backend)
+    """
+    spend: np.ndarray           # 공급사별 월간 구매액
+    risk: np.ndarray            # 공급사별 지연 확률
+    line_suppliers: np.ndarray  # 라인 × 공급사 투입 여부 (bool)
+    line_capacity: np.ndarray
+    delay_days: np.ndarray
+    delay_probs: np.ndarray
+    price_mean_pct: float = 0.0
+    price_sd_pct: float = 5.0
+    price_correlation: float = 0.5
+    safety_days: float = DelayImpactStrategy.SAFETY_BUFFER_DAYS
+    backend: Optional[str] = None
+
+    @classmethod
+    def from_context(
+        cls,
+        context: SimulationContext,
+        price_mean_pct: float = 0.0,
+        price_sd_pct: float = 5.0,
+        price_correlation: float = 0.5,
+        delay_scenarios: Optional[Sequence[Tuple[float, float]]] = None,
+        backend: Optional[str] = None
+    ) -> 'RiskSampler':
+        """delay_scenarios를 주지 않으면 컨텍스트의 추정 지연 분포(domain.lead_times), 그것도 없으면 DEFAULT_DELAY_SCENARIOS"""
+        cols = get_columns(context)
+        n_suppliers = len(cols.supplier_ids)
+        known = cols.supplier_index >= 0
+        spend = np.bincount(
+            cols.supplier_index[known],
+            weights=(cols.unit_price * cols.monthly_usage)[known],
+            minlength=n_suppliers
+        )
+
+        # 라인별 투입 공급사 (라인 정보가 없는 부품은 모든 라인에 투입)
+        line_ids = [l.id for l in context.production_lines]
+        position = {lid: i for i, lid in enumerate(line_ids)}
+        codes, values = part_labels(context.parts, 'line_id')
+        part_line = np.array([position.get(v, -1) for v in values], dtype=np.int64)[codes] if len(codes) else codes
+        line_suppliers = np.zeros((len(line_ids), n_suppliers), dtype=bool)
+        dedicated = known & (part_line >= 0)
+        line_suppliers[part_line[dedicated], cols.supplier_index[dedicated]] = True
+        line_suppliers[:, np.unique(cols.supplier_index[known & (part_line < 0)])] = True
+
+        scenarios = sorted(delay_scenarios or fitted_delay_scenarios(context) or DEFAULT_DELAY_SCENARIOS)
+        return cls(
+            spend=spend,
+            risk=np.clip(cols.supplier_risk, 0.0, 1.0),
+            line_suppliers=line_suppliers,
+            line_capacity=cols.line_capacity,
+            delay_days=np.array([d for d, _ in scenarios], dtype=np.float64),
+            delay_probs=np.array([p for _, p in scenarios], dtype=np.float64),
+            price_mean_pct=price_mean_pct,
+            price_sd_pct=price_sd_pct,
+            price_correlation=price_correlation,
+            backend=backend,
+        )
+
+    def sample(self, n: int, rng: np.random.Generator) -> Dict[str, np.ndarray]:
+        """n개 경로의 KPI 배열"""
+        n_suppliers = len(self.spend)
+        rho = min(max(self.price_correlation, 0.0), 1.0)
+        common = rng.standard_normal((n, 1))
+        own = rng.standard_normal((n, n_suppliers))
+        shocks = self.price_mean_pct + self.price_sd_pct * (math.sqrt(rho) * common + math.sqrt(1 - rho) * own)
+        profit_loss = (shocks @ self.spend) / 100
+
+        delayed = rng.random((n, n_suppliers)) < self.risk
+        cdf = np.cumsum(self.delay_probs) / self.delay_probs.sum()
+        level = np.minimum(np.searchsorted(cdf, rng.random((n, n_suppliers))), len(cdf) - 1)
+        delays = np.where(delayed, self.delay_days[level], 0.0)
+
+        production_loss = np.zeros(n)
+        if kernels.resolve_backend(self.backend) == 'numba':
+            # 라인별 공급사 열을 복사하지 않고 경로마다 최댓값만 훑는다
+            lines, suppliers = np.nonzero(self.line_suppliers)
+            indptr = np.searchsorted(lines, np.arange(len(self.line_capacity) + 1))
+            kernels.line_loss(delays, indptr, suppliers, self.line_capacity.astype(np.float64), float(self.safety_days), production_loss)
+        else:
+            for capacity, suppliers in zip(self.line_capacity, self.line_suppliers):
+                if suppliers.any():
+                    worst = delays[:, suppliers].max(axis=1)
+                    production_loss += capacity * np.maximum(worst - self.safety_days, 0.0)
+
+        return {
+            'profit_loss': profit_loss,
+            'production_loss': production_loss,
+            'total_loss': profit_loss + production_loss * PRODUCTION_UNIT_VALUE,
+        }
+
+
+@dataclass
+class MonteCarloResult:
+    """적응형 몬테카를로 결과 (KPI별 분위수와 신뢰구간)"""
+    paths: int
+    rounds: int
+    converged: bool
+    quantiles: Dict[str, Dict[float, float]]
+    intervals: Dict[str, Dict[float, Tuple[float, float]]]
+    backend: str = 'numpy'
+    sketches: Dict[str, KLLSketch] = field(repr=False, default_factory=dict)
+
+    def to_records(self) -> List[Dict]:
+        """KPI × 분위수 레코드 (표/차트/저장용)"""
+        return [
+            {
+                'kpi': kpi,
+                'quantile': q,
+                'value': value,
+                'lower': self.intervals[kpi][q][0],
+                'upper': self.intervals[kpi][q][1],
+            }
+            for kpi, values in self.quantiles.items()
+            for q, value in values.items()
+        ]
+
+
+def _sample_sketches(sampler: RiskSampler, n: int, batch_size: int, k: int, seed) -> Dict[str, KLLSketch]:
+    """n개 경로를 batch_size씩 생성해 KPI별 스케치로 요약 (워커 프로세스 진입점)"""
+    rng = np.random.default_rng(seed)
+    sketches = {kpi: KLLSketch(k, seed=int(rng.integers(2 ** 32))) for kpi in KPIS}
+    for start in range(0, n, batch_size):
+        for kpi, values in sampler.sample(min(batch_size, n - start), rng).items():
+            sketches[kpi].update(values)
+    return sketches
+
+
+class AdaptiveMonteCarlo:
+    """
+    목표 분위수의 신뢰구간이 허용 오차에 들어올 때까지 경로를 늘려 가는 몬테카를로 실행기
+    - 신뢰구간은 구간 분할(sectioning)로 구한다: 배치를 groups개 그룹 스케치에 번갈아 넣고,
+      그룹별 분위수 추정값의 표준오차 × t(groups-1)를 반폭으로 쓴다.
+      스케치 근사 오차도 그룹 간 편차에 반영되므로 스케치 해상도 때문에 구간이 과소 추정되지 않는다.
+    - 점추정값은 전체(병합) 스케치의 분위수이다.
+    - 허용 오차: max(rel_tol × 척도, abs_tol[kpi])  (구간 반폭 기준)
+      척도는 그 KPI의 목표 분위수 추정값 중 절댓값이 가장 큰 값이다 (0 근처 분위수에서 상대 오차가 폭주하지 않도록).
+    - 꼬리 분위수(P99)는 스케치 해상도의 영향을 크게 받으므로 k를 너무 작게 잡지 않는다 (기본 1000).
+    - 메모리: (groups + 1) × KPI 수 × 스케치 크기 + 배치 크기 (경로 수와 무관)
+    """
+
+    def __init__(
+        self,
+        quantiles: Sequence[float] = (0.5, 0.95, 0.99),
+        rel_tol: float = 0.01,
+        abs_tol: Optional[Dict[str, float]] = None,
+        confidence: float = 0.95,
+        batch_size: int = 4096,
+        min_paths: int = 10_000,
+        max_paths: int = 2_000_000,
+        k: int = 1000,
+        groups: int = 10,
+        workers: int = 1,
+        seed: Optional[int] = None
+    ):
+        if groups < 2:
+            raise ValueError("groups는 2 이상이어야 합니다.")
+        self.quantiles = tuple(quantiles)
+        self.rel_tol = rel_tol
+        self.abs_tol = abs_tol or {}
+        self.t = _student_t(NormalDist().inv_cdf(0.5 + confidence / 2), groups - 1)
+        self.groups = groups
+        self.batch_size = batch_size
+        self.min_paths = min_paths
+        self.max_paths = max_paths
+        self.k = k
+        self.workers = max(1, workers)
+        self.seed = seed
+
+    @traced('monte_carlo.run')
+    def run(self, sampler: RiskSampler) -> MonteCarloResult:
+        seeds = np.random.SeedSequence(self.seed)
+        sketches = {kpi: KLLSketch(self.k, seed=self.seed) for kpi in KPIS}
+        grouped = [{kpi: KLLSketch(self.k, seed=self.seed) for kpi in KPIS} for _ in range(self.groups)]
+        min_paths = max(self.min_paths, self.groups * self.batch_size)
+        batches = 0
+        rounds = 0
+        backend = kernels.resolve_backend(sampler.backend)
+
+        executor = ProcessPoolExecutor(self.workers) if self.workers > 1 else None
+        try:
+            while sketches[KPIS[0]].count < self.max_paths:
+                with span('monte_carlo.round', paths=self.batch_size * self.workers, backend=backend):
+                    children = seeds.spawn(self.workers)
+                    if executor is None:
+                        partials = [_sample_sketches(sampler, self.batch_size, self.batch_size, self.k, children[0])]
+                    else:
+                        partials = list(executor.map(
+                            _sample_sketches,
+                            [sampler] * self.workers, [self.batch_size] * self.workers,
+                            [self.batch_size] * self.workers, [self.k] * self.workers, children
+                        ))
+                    for partial in partials:
+                        group = grouped[batches % self.groups]
+                        for kpi, sketch in partial.items():
+                            group[kpi].merge(sketch)
+                            sketches[kpi].merge(sketch)
+                        batches += 1
+                rounds += 1
+
+                if sketches[KPIS[0]].count >= min_paths and self._summarize(sketches, grouped)[2]:
+                    break
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        quantiles, intervals, converged = self._summarize(sketches, grouped)
+        return MonteCarloResult(
+            paths=sketches[KPIS[0]].count,
+            rounds=rounds,
+            converged=converged,
+            quantiles=quantiles,
+            intervals=intervals,
+            backend=backend,
+            sketches=sketches,
+        )
+
+    def _summarize(self, sketches: Dict[str, KLLSketch], grouped: List[Dict[str, KLLSketch]]):
+        qs = np.array(self.quantiles)
+        quantiles, intervals = {}, {}
+        converged = True
+        for kpi, sketch in sketches.items():
+            estimates = sketch.quantiles(qs)
+            per_group = np.array([group[kpi].quantiles(qs) for group in grouped if group[kpi].count])
+            if len(per_group) < 2:
+                half_width = np.full(len(qs), np.inf)
+            else:
+                half_width = self.t * per_group.std(axis=0, ddof=1) / np.sqrt(len(per_group))
+
+            tolerance = max(self.rel_tol * float(np.max(np.abs(estimates))), self.abs_tol.get(kpi, 0.0))
+            converged &= bool(np.all(half_width <= tolerance))
+            quantiles[kpi] = {float(q): float(v) for q, v in zip(qs, estimates)}
+            intervals[kpi] = {
+                float(q): (float(v - h), float(v + h)) for q, v, h in zip(qs, estimates, half_width)
+            }
+        return quantiles, intervals, converged
+
+
+def _student_t(z: float, dof: int) -> float:
+    """정규 분위수 z에 대응하는 t 분포 분위수 (Cornish-Fisher 근사, dof ≥ 2에서 오차 1% 미만)"""
+    return (
+        z
+        + (z ** 3 + z) / (4 * dof)
+        + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * dof ** 2)
+    )
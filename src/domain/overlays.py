@@ -0,0 +1,221 @@
+"""
+What-if 오버레이 (부품/공급사 단위 개별 조정)
+공유되는 원본 컨텍스트는 그대로 두고, 개별 조정값만 작은 dict로 겹쳐 놓는다 (copy-on-write).
+
+- WhatIfOverlay: 불변 조정값 묶음. with_part / with_supplier는 조정 dict만 복사한 새 오버레이를 반환한다.
+- OverlayBase: 원본 컨텍스트에서 한 번만 계산해 두는 집계값 (총 구매액, 공급사별 구매액, 공급사 -> 라인 연결).
+  컨텍스트별로 캐시하므로 여러 오버레이가 같은 집계를 공유한다.
+- 전략(IOverlayStrategy)은 원본 집계값 + 조정 항목별 보정으로 평가하므로
+  조정 하나의 비용은 카탈로그 크기가 아니라 조정 개수에 비례한다.
+
+조정 규칙:
+- 단가 인상률(%): 부품 조정 > 공급사 조정 > 전역 인상률 순으로 대체한다.
+- 공급 지연(일): 공급사 조정이 그 공급사의 전역 지연을 대체한다.
+  라인 지연은 그 라인에 부품을 대는 공급사들의 지연 중 최댓값이다 (공용 부품은 모든 라인에 투입).
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from common.tracing import span, traced
+from domain.columnar import ContextColumns, get_columns
+from domain.models import SimulationContext, SimulationResult
+from domain.tables import part_labels, part_strings
+
+
+@dataclass(frozen=True)
+class WhatIfOverlay:
+    """부품/공급사 개별 조정값 (불변, 수정 시 새 오버레이 반환)"""
+    part_price_pct: Mapping[str, float] = field(default_factory=dict)
+    supplier_price_pct: Mapping[str, float] = field(default_factory=dict)
+    supplier_delay_days: Mapping[str, int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.part_price_pct) + len(self.supplier_price_pct) + len(self.supplier_delay_days)
+
+    def with_part(self, part_id: str, price_pct: Optional[float] = None) -> 'WhatIfOverlay':
+        """부품 단가 인상률 조정 (None이면 조정 해제)"""
+        return WhatIfOverlay(
+            part_price_pct=_updated(self.part_price_pct, part_id, price_pct, float),
+            supplier_price_pct=self.supplier_price_pct,
+            supplier_delay_days=self.supplier_delay_days,
+        )
+
+    def with_supplier(self, supplier_id: str, price_pct: Optional[float] = None, delay_days: Optional[int] = None) -> 'WhatIfOverlay':
+        """공급사 단가 인상률 / 지연 일수 조정 (None인 항목은 조정 해제)"""
+        return WhatIfOverlay(
+            part_price_pct=self.part_price_pct,
+            supplier_price_pct=_updated(self.supplier_price_pct, supplier_id, price_pct, float),
+            supplier_delay_days=_updated(self.supplier_delay_days, supplier_id, delay_days, int),
+        )
+
+    def to_params(self) -> Dict[str, Dict[str, Any]]:
+        """결과 저장소 키용 정렬된 dict"""
+        return {
+            'part_price_pct': dict(sorted(self.part_price_pct.items())),
+            'supplier_price_pct': dict(sorted(self.supplier_price_pct.items())),
+            'supplier_delay_days': dict(sorted(self.supplier_delay_days.items())),
+        }
+
+    @classmethod
+    def from_params(cls, params: Optional[Mapping[str, Mapping[str, Any]]]) -> 'WhatIfOverlay':
+        params = params or {}
+        return cls(
+            part_price_pct={k: float(v) for k, v in (params.get('part_price_pct') or {}).items()},
+            supplier_price_pct={k: float(v) for k, v in (params.get('supplier_price_pct') or {}).items()},
+            supplier_delay_days={k: int(v) for k, v in (params.get('supplier_delay_days') or {}).items()},
+        )
+
+
+def _updated(mapping: Mapping[str, Any], key: str, value: Any, cast) -> Dict[str, Any]:
+    """key만 바꾼 얕은 복사본 (value가 None이면 key 제거)"""
+    updated = dict(mapping)
+    if value is None:
+        updated.pop(key, None)
+    else:
+        updated[key] = cast(value)
+    return updated
+
+
+class OverlayBase:
+    """
+    원본 컨텍스트의 오버레이 평가용 집계값 (컨텍스트당 한 번, O(부품 수))
+    - part_spend / supplier_spend / total_spend: 월간 구매액
+    - 공급사 -> 라인 연결: 공용 부품(라인 없음)을 대는 공급사는 모든 라인에 연결된다.
+    """
+
+    def __init__(self, context: SimulationContext):
+        self.context = context
+        self.columns: ContextColumns = get_columns(context)
+        cols = self.columns
+        self.part_spend = cols.unit_price * cols.monthly_usage
+        self.total_spend = float(self.part_spend.sum())
+        known = cols.supplier_index >= 0
+        self.supplier_spend = np.bincount(cols.supplier_index[known], weights=self.part_spend[known], minlength=len(cols.supplier_ids))
+        self.supplier_position = {sid: i for i, sid in enumerate(cols.supplier_ids)}
+        self.line_capacity = cols.line_capacity
+        self._part_position: Optional[Dict[str, int]] = None
+        self._build_line_links(context, known)
+
+    def _build_line_links(self, context: SimulationContext, known: np.ndarray):
+        cols = self.columns
+        n_lines, n_suppliers = len(cols.line_capacity), len(cols.supplier_ids)
+        position = {l.id: i for i, l in enumerate(context.production_lines)}
+        codes, values = part_labels(context.parts, 'line_id')
+        lookup = np.array([position.get(v, -1) for v in values], dtype=np.int64)
+        part_line = lookup[codes] if len(codes) else np.zeros(0, dtype=np.int64)
+
+        # 공급사별 연결 라인 (CSR, 공급사 순 정렬): 공용 부품을 대는 공급사는 feeds_all로만 표시
+        self.feeds_all = np.zeros(n_suppliers, dtype=bool)
+        self.feeds_all[cols.supplier_index[known & (part_line < 0)]] = True
+        dedicated = known & (part_line >= 0)
+        pairs = np.unique(cols.supplier_index[dedicated] * n_lines + part_line[dedicated]) if n_lines else np.zeros(0, dtype=np.int64)
+        pair_supplier, pair_line = (pairs // n_lines, pairs % n_lines) if n_lines else (pairs, pairs)
+        specific = ~self.feeds_all[pair_supplier]
+        pair_supplier, pair_line = pair_supplier[specific], pair_line[specific]
+        self.line_ptr = np.searchsorted(pair_supplier, np.arange(n_suppliers + 1))
+        self.supplier_lines = pair_line
+
+        # 라인별 연결 공급사 수 (전역 지연이 남는지 판단) / 공급사 정보 없는 부품이 있는 라인
+        self.line_suppliers = np.bincount(pair_line, minlength=n_lines) + int(self.feeds_all.sum())
+        unknown = ~known
+        self.line_has_unknown = np.zeros(n_lines, dtype=bool)
+        if unknown.any():
+            if (part_line[unknown] < 0).any():
+                self.line_has_unknown[:] = True
+            self.line_has_unknown[part_line[unknown & (part_line >= 0)]] = True
+
+    def supplier(self, supplier_id: str) -> int:
+        if supplier_id not in self.supplier_position:
+            raise ValueError(f"알 수 없는 공급사입니다: {supplier_id}")
+        return self.supplier_position[supplier_id]
+
+    def part(self, part_id: str) -> int:
+        if self._part_position is None:
+            # 부품 조정이 처음 들어올 때 한 번만 만든다
+            self._part_position = {pid: i for i, pid in enumerate(part_strings(self.context.parts, 'id'))}
+        if part_id not in self._part_position:
+            raise ValueError(f"알 수 없는 부품입니다: {part_id}")
+        return self._part_position[part_id]
+
+    def lines_of(self, supplier: int) -> Optional[np.ndarray]:
+        """공급사가 부품을 대는 라인 위치 (None이면 모든 라인)"""
+        if self.feeds_all[supplier]:
+            return None
+        return self.supplier_lines[self.line_ptr[supplier]:self.line_ptr[supplier + 1]]
+
+
+@traced('overlay.base')
+def get_overlay_base(context: SimulationContext) -> OverlayBase:
+    """컨텍스트별 OverlayBase 캐시 (컬럼 스냅샷이 바뀌면 다시 만든다)"""
+    columns = get_columns(context)
+    cached = context.__dict__.get('_overlay_base_cache')
+    if cached is not None and cached[0] is columns:
+        return cached[1]
+    base = OverlayBase(context)
+    context.__dict__['_overlay_base_cache'] = (columns, base)
+    return base
+
+
+def check_overlay(context: SimulationContext, overlay: WhatIfOverlay):
+    """오버레이의 부품/공급사 ID가 컨텍스트에 있는지 확인 (없으면 ValueError)"""
+    base = get_overlay_base(context)
+    for supplier_id in set(overlay.supplier_price_pct) | set(overlay.supplier_delay_days):
+        base.supplier(supplier_id)
+    for part_id in overlay.part_price_pct:
+        base.part(part_id)
+
+
+def line_delays(base: OverlayBase, delay_days: int, overlay: WhatIfOverlay) -> np.ndarray:
+    """라인별 실효 지연 일수 (조정 공급사 수 × 연결 라인 수에 비례)"""
+    n_lines = len(base.line_capacity)
+    delays = np.zeros(n_lines)
+    overridden = np.zeros(n_lines, dtype=np.int64)
+    for supplier_id, days in overlay.supplier_delay_days.items():
+        lines = base.lines_of(base.supplier(supplier_id))
+        if lines is None:
+            np.maximum(delays, days, out=delays)
+            overridden += 1
+        else:
+            delays[lines] = np.maximum(delays[lines], days)
+            overridden[lines] += 1
+    # 조정되지 않은 공급사(또는 공급사 정보 없는 부품)가 남은 라인, 연결 부품이 없는 라인은 전역 지연 적용
+    keeps_global = (overridden < base.line_suppliers) | base.line_has_unknown | (base.line_suppliers == 0)
+    return np.where(keeps_global, np.maximum(delays, delay_days), delays)
+
+
+def price_corrections(base: OverlayBase, price_increase_pct: float, overlay: WhatIfOverlay) -> Tuple[float, float]:
+    """
+    전역 인상률 대비 조정분의 (구매액 × 인상률 차이) 합 (%)
+    Returns: (공급사 조정 보정, 부품 조정 보정)
+    """
+    supplier_pct = {base.supplier(sid): pct for sid, pct in overlay.supplier_price_pct.items()}
+    supplier_term = sum(base.supplier_spend[s] * (pct - price_increase_pct) for s, pct in supplier_pct.items())
+
+    part_term = 0.0
+    if overlay.part_price_pct:
+        supplier_index = base.columns.supplier_index
+        for part_id, pct in overlay.part_price_pct.items():
+            i = base.part(part_id)
+            inherited = supplier_pct.get(int(supplier_index[i]), price_increase_pct)
+            part_term += base.part_spend[i] * (pct - inherited)
+    return float(supplier_term), float(part_term)
+
+
+def evaluate_overlay(context: SimulationContext, strategies: Sequence[Any], overlay: WhatIfOverlay) -> SimulationResult:
+    """IOverlayStrategy 전략 목록을 원본 집계값 + 오버레이 보정으로 평가해 합산"""
+    base = get_overlay_base(context)
+    totals = {'profit_delta': 0.0, 'production_loss': 0.0}
+    with span('overlay.evaluate', strategies=len(strategies), overrides=len(overlay)):
+        for strategy in strategies:
+            for term, value in strategy.overlay_terms(base, overlay).items():
+                if term not in totals:
+                    raise ValueError(f"지원하지 않는 결과 항입니다: {term}")
+                totals[term] += float(np.sum(value))
+    return SimulationResult(
+        operating_profit=0,
+        production_output=0,
+        profit_delta=totals['profit_delta'],
+        production_loss=int(round(totals['production_loss']))
+    )
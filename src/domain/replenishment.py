@@ -0,0 +1,323 @@
+"""
+재발주 정책 평가와 파라미터 스윕
+부품별 (s, S) 연속 검토 또는 (R, S) 주기 검토 정책의 일평균 비용(발주 + 보유 + 결품)과 서비스 수준을
+공급사 리드타임(Supplier.base_lead_time_days)과 지연 리스크로 계산하고, 후보 정책 전체에서 부품별 최적 정책을 고른다.
+
+- 정책은 일수 단위로 정의해 모든 부품이 같은 후보를 쓴다 (부품 × 후보 행렬을 한 번에 계산).
+  (s, S): s = 일일사용량 × (리드타임 + 안전 일수), 발주량 Q = 일일사용량 × 주기 일수, S = s + Q
+  (R, S): 주기 일수(R)마다 검토, S = 일일사용량 × (R + 리드타임 + 안전 일수), 평균 발주량 Q = 일일사용량 × R
+- 리드타임: 공급사 risk_score 확률로 DEFAULT_DELAY_SCENARIOS 분포만큼 늘어난다 (안전재고/몬테카를로와 같은 가정).
+  컨텍스트에 납품 이력 추정 결과가 붙어 있으면 추정한 리드타임 / 지연 확률 / 지연 분포를 쓴다 (domain.lead_times).
+  일일 수요는 평균 daily_usage_rate, 변동계수 demand_cv의 정규 분포로 근사한다 (0이면 결정적 수요).
+- 주기당 기대 결품량 = Σ_j P(리드타임 j) × E[max(0, 보호 구간 수요 - 발주 시점 재고 위치)]
+  보호 구간: (s, S)는 리드타임, (R, S)는 R + 리드타임
+- 일평균 비용 = 발주 비용 / 주기 + 단가 × 연 보유율 / 365 × 평균 재고 + 결품 단가 × 기대 결품량 / 주기
+  평균 재고 ≈ Q / 2 + 주기 말 기대 순재고 (백오더 근사)
+- 서비스 수준: fill rate = 1 - 주기당 기대 결품량 / Q, cycle service level = P(주기 중 결품 없음)
+- 계산: 같은 리드타임의 부품은 일일사용량 1 기준 정책 항을 공유하므로 리드타임별로 한 번만 계산하고,
+  부품을 나눠(chunk) 행렬 곱으로 평가한다. 메모리는 (청크 부품 수 × 후보 수) 배열 몇 개로 일정하다.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from common.tracing import span, traced
+from domain.columnar import get_columns
+from domain.lead_times import fitted_delay_scenarios
+from domain.models import SimulationContext
+from domain.safety_stock import DEFAULT_DELAY_SCENARIOS
+from domain.strategies import DelayImpactStrategy
+from domain.tables import part_strings
+
+POLICY_KINDS = ('sS', 'RS')
+DEFAULT_SAFETY_DAYS = (0, 1, 2, 3, 5, 7, 10, 14, 21, 30)
+DEFAULT_CYCLE_DAYS = (3, 5, 7, 10, 14, 21, 30, 45, 60, 90)
+
+# 시뮬레이터 기본 (s, S) 정책 (SupplyEventSimulator의 safety_days / order_cover_days): 절감액 비교 기준
+BASELINE_POLICY = (DelayImpactStrategy.SAFETY_BUFFER_DAYS, 30)
+
+# ForecastService._calculate_total_impact와 같은 환산 (결품 1 unit = 1000)
+DEFAULT_SHORTAGE_COST = 1000.0
+
+_SQRT_2PI = np.sqrt(2 * np.pi)
+
+
+def _norm_pdf(z: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * z * z) / _SQRT_2PI
+
+
+def _norm_cdf(z: np.ndarray) -> np.ndarray:
+    """표준정규 누적분포 (Abramowitz-Stegun 26.2.17, 절대 오차 7.5e-8 미만)"""
+    t = 1.0 / (1.0 + 0.2316419 * np.abs(z))
+    poly = t * (0.319381530 + t * (-0.356563782 + t * (1.781477937 + t * (-1.821255978 + t * 1.330274429))))
+    upper = 1.0 - _norm_pdf(z) * poly
+    return np.where(z >= 0, upper, 1.0 - upper)
+
+
+@dataclass
+class ReorderPolicyPlan:
+    """부품별 선택 정책과 그 비용 / 서비스 수준"""
+    kind: str
+    part_ids: List[str]
+    part_names: List[str]
+    supplier_ids: List[str]
+    lead_time_days: np.ndarray
+    safety_days: np.ndarray
+    cycle_days: np.ndarray            # (s, S): 발주량 일수, (R, S): 검토 주기
+    reorder_point: np.ndarray         # (s, S)의 s, (R, S)는 검토 시점 발주 기준이 없으므로 S와 같음
+    order_up_to: np.ndarray
+    order_quantity: np.ndarray
+    daily_cost: np.ndarray
+    fill_rate: np.ndarray
+    cycle_service_level: np.ndarray
+    expected_shortage: np.ndarray     # 일평균 기대 결품량 (units)
+    baseline_daily_cost: np.ndarray   # BASELINE_POLICY의 일평균 비용
+    meets_target: np.ndarray          # 목표 fill rate 달성 여부 (목표가 없으면 모두 True)
+    candidates: int
+
+    @property
+    def total_daily_cost(self) -> float:
+        return float(self.daily_cost.sum())
+
+    @property
+    def total_baseline_cost(self) -> float:
+        return float(self.baseline_daily_cost.sum())
+
+    @property
+    def savings(self) -> np.ndarray:
+        return self.baseline_daily_cost - self.daily_cost
+
+    def to_records(self, limit: Optional[int] = None) -> List[Dict]:
+        """부품별 정책 레코드 (기준 정책 대비 절감액 내림차순)"""
+        savings = self.savings
+        order = np.argsort(-savings, kind='stable')[:limit]
+        return [
+            {
+                'part_id': self.part_ids[i],
+                'part_name': self.part_names[i],
+                'supplier_id': self.supplier_ids[i],
+                'policy': self.kind,
+                'lead_time_days': float(self.lead_time_days[i]),
+                'safety_days': float(self.safety_days[i]),
+                'cycle_days': float(self.cycle_days[i]),
+                'reorder_point': float(self.reorder_point[i]),
+                'order_up_to': float(self.order_up_to[i]),
+                'order_quantity': float(self.order_quantity[i]),
+                'daily_cost': float(self.daily_cost[i]),
+                'baseline_daily_cost': float(self.baseline_daily_cost[i]),
+                'fill_rate': float(self.fill_rate[i]),
+                'cycle_service_level': float(self.cycle_service_level[i]),
+                'meets_target': bool(self.meets_target[i]),
+            }
+            for i in order
+        ]
+
+
+class ReorderPolicySweep:
+    """
+    후보 정책(안전 일수 × 주기 일수) 전체를 부품별로 평가해 비용 최소 정책을 고르는 스윕
+    - target_fill_rate를 주면 그 fill rate를 만족하는 후보 중 비용 최소, 만족하는 후보가 없으면 fill rate 최대
+    - order_cost: 발주 1회 고정 비용, holding_rate: 연 보유 비용률(단가 대비), shortage_cost: 결품 1 unit 비용
+
+    사용 예:
+        plan = ReorderPolicySweep(kind='sS', target_fill_rate=0.98).optimize(context)
+        plan.to_records(limit=20)
+    """
+
+    def __init__(
+        self,
+        kind: str = 'sS',
+        safety_days: Sequence[float] = DEFAULT_SAFETY_DAYS,
+        cycle_days: Sequence[float] = DEFAULT_CYCLE_DAYS,
+        order_cost: float = 50.0,
+        holding_rate: float = 0.25,
+        shortage_cost: float = DEFAULT_SHORTAGE_COST,
+        demand_cv: float = 0.3,
+        target_fill_rate: Optional[float] = None,
+        delay_scenarios: Optional[Sequence[Tuple[float, float]]] = None,
+        default_lead_time_days: float = 7,
+        chunk_cells: int = 2_000_000
+    ):
+        if kind not in POLICY_KINDS:
+            raise ValueError(f"지원하지 않는 정책 종류입니다: {kind} ({', '.join(POLICY_KINDS)} 중 하나)")
+        if not len(safety_days) or not len(cycle_days) or min(cycle_days) <= 0 or min(safety_days) < 0:
+            raise ValueError("안전 일수는 0 이상, 주기 일수는 0보다 큰 후보가 하나 이상 있어야 합니다.")
+        if target_fill_rate is not None and not 0 < target_fill_rate <= 1:
+            raise ValueError("target_fill_rate는 0보다 크고 1 이하여야 합니다.")
+        self.kind = kind
+        grid_safety, grid_cycle = np.meshgrid(np.asarray(safety_days, float), np.asarray(cycle_days, float), indexing='ij')
+        self.safety_days = grid_safety.ravel()
+        self.cycle_days = grid_cycle.ravel()
+        self.order_cost = float(order_cost)
+        self.holding_rate = float(holding_rate)
+        self.shortage_cost = float(shortage_cost)
+        self.demand_cv = float(demand_cv)
+        self.target_fill_rate = target_fill_rate
+        self.delay_scenarios = delay_scenarios
+        self.default_lead_time_days = float(default_lead_time_days)
+        self.chunk_cells = chunk_cells
+
+    @property
+    def candidates(self) -> int:
+        return len(self.safety_days)
+
+    def part_inputs(self, context: SimulationContext) -> Dict[str, np.ndarray]:
+        """
+        부품별 일일사용량, 기본 리드타임, 단가, 리드타임 시나리오 가중치 (부품 × (무지연 + 지연 시나리오))와
+        시나리오별 지연 일수 (delay_scenarios가 없으면 컨텍스트의 추정 지연 분포, 그것도 없으면 DEFAULT_DELAY_SCENARIOS)
+        """
+        cols = get_columns(context)
+        known = cols.supplier_index >= 0
+        lead_time = np.full(cols.n_parts, self.default_lead_time_days)
+        lead_time[known] = cols.supplier_lead_time[cols.supplier_index[known]]
+        scenarios = sorted(self.delay_scenarios or fitted_delay_scenarios(context) or DEFAULT_DELAY_SCENARIOS)
+        probs = np.array([p for _, p in scenarios], dtype=np.float64)
+        probs = probs / probs.sum() if probs.sum() > 0 else probs
+        risk = np.clip(cols.part_supplier_risk, 0.0, 1.0)
+        weights = np.concatenate([(1 - risk)[:, None], risk[:, None] * probs[None, :]], axis=1)
+        return {
+            'usage': cols.daily_usage_rate.astype(np.float64),
+            'lead_time': np.maximum(lead_time, 0.0),
+            'unit_price': cols.unit_price.astype(np.float64),
+            'weights': weights,
+            'delay_days': np.array([0.0] + [d for d, _ in scenarios]),
+        }
+
+    def unit_terms(self, lead, safety, cycle, delay_days, kind: Optional[str] = None):
+        """
+        일일사용량 1 기준 정책 항 (브로드캐스트, 마지막 축은 리드타임 시나리오: delay_days = part_inputs의 시나리오 지연 일수)
+        반환: (재고 위치 일수, 보호 구간 일수, 기대 결품 일수, 무결품 확률)
+        정규 근사에서 z = (재고 위치 - 보호 구간 수요) / 표준편차는 일일사용량과 무관하므로
+        스윕은 이 항을 서로 다른 리드타임별로 한 번만 계산한다.
+        """
+        kind = kind or self.kind
+        lead, safety, cycle = np.asarray(lead, float), np.asarray(safety, float), np.asarray(cycle, float)
+        if kind == 'sS':
+            position = lead + safety            # 발주 시점 재고 위치 s
+            protect = lead[..., None] + delay_days
+        else:
+            position = cycle + lead + safety    # 검토 시점 재고 위치 S
+            protect = (cycle + lead)[..., None] + delay_days
+        gap = position[..., None] - protect
+        if self.demand_cv <= 0:
+            return position, protect, np.maximum(-gap, 0.0), (gap >= 0).astype(np.float64)
+
+        sigma = self.demand_cv * np.sqrt(protect)
+        safe_sigma = np.where(sigma > 0, sigma, 1.0)
+        z = gap / safe_sigma
+        cdf = _norm_cdf(z)
+        loss = np.where(sigma > 0, safe_sigma * (_norm_pdf(z) - z * (1 - cdf)), np.maximum(-gap, 0.0))
+        covered = np.where(sigma > 0, cdf, gap >= 0)
+        return position, protect, loss, covered
+
+    def evaluate(self, inputs: Dict[str, np.ndarray], safety_days, cycle_days, kind: Optional[str] = None) -> Dict[str, np.ndarray]:
+        """부품별 정책 평가 (safety_days / cycle_days는 스칼라 또는 부품 배열, kind를 주지 않으면 스윕의 정책 종류)"""
+        kind = kind or self.kind
+        lead = inputs['lead_time']
+        safety = np.broadcast_to(np.asarray(safety_days, float), lead.shape)
+        cycle = np.broadcast_to(np.asarray(cycle_days, float), lead.shape)
+        position, protect, loss, covered = self.unit_terms(lead, safety, cycle, inputs['delay_days'], kind)
+        weights = inputs['weights']
+        return self._metrics(
+            inputs['usage'], inputs['unit_price'], position, cycle, kind,
+            (weights * loss).sum(axis=-1), (weights * covered).sum(axis=-1), (weights * protect).sum(axis=-1)
+        )
+
+    def _metrics(self, usage, price, position_days, cycle, kind, loss_days, no_stockout, demand_days) -> Dict[str, np.ndarray]:
+        """시나리오 가중 합(일일사용량 1 기준)에서 비용 / 서비스 수준 계산 (브로드캐스트)"""
+        position, quantity = usage * position_days, usage * cycle
+        shortage = usage * loss_days
+        ordering = np.broadcast_to(usage > 0, shortage.shape)
+        average_stock = quantity / 2 + np.maximum(position - usage * demand_days + shortage, 0.0)
+        daily_cost = np.where(
+            ordering,
+            self.order_cost / cycle
+            + price * self.holding_rate / 365 * average_stock
+            + self.shortage_cost * shortage / cycle,
+            0.0
+        )
+        safe_quantity = np.where(quantity > 0, quantity, 1.0)
+        return {
+            'reorder_point': position,
+            'order_up_to': position + quantity if kind == 'sS' else position,
+            'order_quantity': quantity,
+            'daily_cost': daily_cost,
+            'fill_rate': np.where(ordering, np.clip(1 - shortage / safe_quantity, 0.0, 1.0), 1.0),
+            'cycle_service_level': np.where(ordering, no_stockout, 1.0),
+            'expected_shortage': np.where(ordering, shortage / cycle, 0.0),
+        }
+
+    def choose(self, metrics: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """(부품, 후보) 평가 결과에서 부품별 후보 위치와 목표 달성 여부"""
+        cost, fill = metrics['daily_cost'], metrics['fill_rate']
+        rows = np.arange(len(cost))
+        if self.target_fill_rate is None:
+            return cost.argmin(axis=1), np.ones(len(cost), dtype=bool)
+        feasible = fill >= self.target_fill_rate - 1e-12
+        best = np.where(feasible, cost, np.inf).argmin(axis=1)
+        met = feasible[rows, best]
+        # 목표를 만족하는 후보가 없으면 fill rate 최대 후보 (동률이면 비용 최소)
+        top = fill >= fill.max(axis=1, keepdims=True) - 1e-12
+        fallback = np.where(top, cost, np.inf).argmin(axis=1)
+        return np.where(met, best, fallback), met
+
+    @traced('replenishment.sweep')
+    def optimize(self, context: SimulationContext, parts: Optional[Sequence[int]] = None) -> ReorderPolicyPlan:
+        """
+        모든 부품(parts를 주면 그 인덱스의 부품만) × 후보 정책을 평가해 부품별 최적 정책 선택
+        같은 리드타임의 부품끼리 묶어 정책 항(후보 × 시나리오)을 한 번 계산하고,
+        부품별 시나리오 가중치와의 행렬 곱으로 (부품 × 후보) 결품량 / 무결품 확률을 만든다.
+        """
+        inputs = self.part_inputs(context)
+        index = None if parts is None else np.asarray(parts, dtype=np.int64)
+        if index is not None:
+            inputs = {name: values if name == 'delay_days' else values[index] for name, values in inputs.items()}
+        usage, price, weights = inputs['usage'], inputs['unit_price'], inputs['weights']
+        n_parts, n_candidates = len(usage), self.candidates
+        fields = ('reorder_point', 'order_up_to', 'order_quantity', 'daily_cost', 'fill_rate', 'cycle_service_level', 'expected_shortage')
+        chosen = {name: np.zeros(n_parts) for name in fields}
+        choice = np.zeros(n_parts, dtype=np.int64)
+        met = np.ones(n_parts, dtype=bool)
+
+        leads, lead_index = np.unique(inputs['lead_time'], return_inverse=True)
+        order = np.argsort(lead_index, kind='stable')
+        bounds = np.searchsorted(lead_index[order], np.arange(len(leads) + 1))
+        chunk = max(1, self.chunk_cells // max(n_candidates, 1))
+        with span('replenishment.evaluate', parts=n_parts, candidates=n_candidates, lead_times=len(leads), kind=self.kind):
+            for g, lead in enumerate(leads):
+                position, protect, loss, covered = self.unit_terms(
+                    np.full(n_candidates, lead), self.safety_days, self.cycle_days, inputs['delay_days']
+                )
+                group = order[bounds[g]:bounds[g + 1]]
+                for start in range(0, len(group), chunk):
+                    idx = group[start:start + chunk]
+                    w = weights[idx]
+                    metrics = self._metrics(
+                        usage[idx, None], price[idx, None], position[None, :], self.cycle_days[None, :], self.kind,
+                        w @ loss.T, w @ covered.T, w @ protect.T
+                    )
+                    best, ok = self.choose(metrics)
+                    rows = np.arange(len(idx))
+                    for name in fields:
+                        chosen[name][idx] = np.broadcast_to(metrics[name], (len(idx), n_candidates))[rows, best]
+                    choice[idx], met[idx] = best, ok
+
+        baseline = self.evaluate(inputs, *BASELINE_POLICY, kind='sS')
+        labels = {}
+        for attr in ('id', 'name', 'supplier_id'):
+            values = part_strings(context.parts, attr)
+            labels[attr] = values if index is None else [values[i] for i in index]
+        return ReorderPolicyPlan(
+            kind=self.kind,
+            part_ids=labels['id'],
+            part_names=labels['name'],
+            supplier_ids=labels['supplier_id'],
+            lead_time_days=inputs['lead_time'],
+            safety_days=self.safety_days[choice],
+            cycle_days=self.cycle_days[choice],
+            baseline_daily_cost=baseline['daily_cost'],
+            meets_target=met,
+            candidates=n_candidates,
+            **chosen,
+        )
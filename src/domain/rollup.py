@@ -0,0 +1,265 @@
+from dataclasses import dataclass
+from itertools import combinations
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from common.tracing import traced
+from domain.interfaces import IAggregateStrategy
+from domain.models import Part, SimulationContext, SimulationResult
+from domain.tables import part_labels, part_numeric
+
+DIMENSIONS = ('supplier', 'line', 'category')
+
+# 재고 커버리지(재고 / 일일사용량, 일) 구간
+COVERAGE_EDGES = (5, 10, 20, 30)
+COVERAGE_MEASURES = ('coverage_0_5', 'coverage_5_10', 'coverage_10_20', 'coverage_20_30', 'coverage_30_plus')
+
+MEASURES = ('part_count', 'monthly_spend', 'monthly_usage', 'inventory_value') + COVERAGE_MEASURES
+
+UNASSIGNED = "(미지정)"
+
+
+def _part_measures(unit_price: np.ndarray, inventory: np.ndarray, usage: np.ndarray) -> np.ndarray:
+    """부품별 측정값 행렬 (부품 수 × len(MEASURES))"""
+    n = len(unit_price)
+    coverage = np.divide(inventory, usage, out=np.full(n, np.inf), where=usage > 0)
+    bucket = np.searchsorted(np.array(COVERAGE_EDGES, dtype=np.float64), coverage, side='right')
+
+    values = np.zeros((n, len(MEASURES)))
+    values[:, 0] = 1.0
+    values[:, 1] = unit_price * usage * 30
+    values[:, 2] = usage * 30
+    values[:, 3] = unit_price * inventory
+    values[np.arange(n), 4 + bucket] = 1.0
+    return values
+
+
+@dataclass
+class CubeSlice:
+    """큐브 조회 결과 (그룹 라벨 + 측정값)"""
+    dims: Tuple[str, ...]
+    labels: List[Tuple[str, ...]]
+    values: np.ndarray
+    measures: Tuple[str, ...] = MEASURES
+
+    def column(self, measure: str) -> np.ndarray:
+        return self.values[:, self.measures.index(measure)]
+
+    def to_records(self) -> List[Dict]:
+        records = []
+        for label, row in zip(self.labels, self.values):
+            record = {dim: value or UNASSIGNED for dim, value in zip(self.dims, label)}
+            record.update({m: float(v) for m, v in zip(self.measures, row)})
+            records.append(record)
+        return records
+
+
+class _Level:
+    """특정 차원 조합으로 집계된 롤업 레벨 (행: 그룹, 열: 측정값)"""
+
+    def __init__(self, dims: Tuple[str, ...], codes: np.ndarray, values: np.ndarray):
+        self.dims = dims
+        self.codes = codes
+        self.values = values
+        self._index: Optional[Dict[Tuple[int, ...], int]] = None
+
+    def add(self, key: Tuple[int, ...], delta: np.ndarray):
+        # 조회 경로에는 필요 없으므로 첫 증분 갱신 시점에 인덱스를 만든다
+        if self._index is None:
+            self._index = {tuple(row): i for i, row in enumerate(self.codes.tolist())}
+        row = self._index.get(key)
+        if row is None:
+            row = len(self.codes)
+            self._index[key] = row
+            self.codes = np.vstack([self.codes, np.array(key, dtype=np.int64).reshape(1, -1)])
+            self.values = np.vstack([self.values, np.zeros((1, self.values.shape[1]))])
+        self.values[row] += delta
+
+
+class RollupCube:
+    """
+    공급사 × 생산라인 × 부품분류 계층 집계 큐브
+    - 생성 시 부품 단위 측정값(월 구매액, 월 사용량, 재고금액, 커버리지 구간별 부품 수)을
+      기본 셀로 한 번 집계하고, 모든 차원 조합(2^3 = 8개 레벨)의 롤업을 미리 계산한다.
+    - 드릴다운 조회는 미리 계산된 레벨에서 필터 마스크만 적용하므로 전체 부품을 다시 훑지 않는다.
+    - 데이터 변경 시 apply_changes()로 변경된 부품의 기여분만 빼고 더해 증분 갱신한다.
+    """
+
+    @traced('cube.build')
+    def __init__(self, context: SimulationContext):
+        self.labels: Dict[str, List[str]] = {dim: [] for dim in DIMENSIONS}
+        self._label_index: Dict[str, Dict[str, int]] = {dim: {} for dim in DIMENSIONS}
+        self.line_capacity: Dict[str, float] = {
+            line.id: float(line.capacity_per_day) for line in context.production_lines
+        }
+        for line_id in self.line_capacity:
+            self._code('line', line_id)
+
+        parts = context.parts
+        codes = np.column_stack([
+            self._codes('supplier', *part_labels(parts, 'supplier_id')),
+            self._codes('line', *part_labels(parts, 'line_id')),
+            self._codes('category', *part_labels(parts, 'category')),
+        ]) if len(parts) else np.zeros((0, len(DIMENSIONS)), dtype=np.int64)
+        values = _part_measures(
+            part_numeric(parts, 'unit_price'),
+            part_numeric(parts, 'current_inventory'),
+            part_numeric(parts, 'daily_usage_rate'),
+        )
+
+        # 1. 기본 셀(공급사, 라인, 분류)로 집계
+        base_codes, base_values = self._group(codes, values)
+
+        # 2. 기본 셀에서 모든 차원 조합의 롤업 레벨 계산
+        self.levels: Dict[Tuple[str, ...], _Level] = {}
+        for size in range(len(DIMENSIONS) + 1):
+            for dims in combinations(DIMENSIONS, size):
+                cols = [DIMENSIONS.index(d) for d in dims]
+                level_codes, level_values = self._group(base_codes[:, cols], base_values)
+                self.levels[dims] = _Level(dims, level_codes, level_values)
+
+        # 부품이 없는 라인도 라인 레벨에 표시되도록 0 행 추가
+        for line_id in self.line_capacity:
+            self.levels[('line',)].add((self._code('line', line_id),), np.zeros(len(MEASURES)))
+
+    # --- 조회 ---
+
+    def query(self, by: Sequence[str] = (), **filters: str) -> CubeSlice:
+        """
+        by 차원으로 그룹핑한 집계 조회. filters로 상위 차원을 고정해 드릴다운한다.
+        예) cube.query(by=('line',), supplier='S1') -> S1 부품의 라인별 집계
+        """
+        by = tuple(by)
+        unknown = [d for d in tuple(by) + tuple(filters) if d not in DIMENSIONS]
+        if unknown:
+            raise ValueError(f"지원하지 않는 집계 차원입니다: {', '.join(unknown)}")
+
+        level_dims = tuple(d for d in DIMENSIONS if d in by or d in filters)
+        level = self.levels[level_dims]
+        mask = np.ones(len(level.codes), dtype=bool)
+        for dim, label in filters.items():
+            code = self._label_index[dim].get('' if label == UNASSIGNED else label, -1)
+            mask &= level.codes[:, level_dims.index(dim)] == code
+
+        # 증분 갱신으로 비워진 그룹은 제외 (라인 레벨은 부품이 없는 라인도 표시)
+        if level_dims != ('line',):
+            mask &= level.values[:, 0] > 0
+
+        rows = np.flatnonzero(mask)
+        if by == level_dims:
+            codes, values = level.codes[rows], level.values[rows]
+        else:
+            cols = [level_dims.index(d) for d in by]
+            codes, values = self._group(level.codes[rows][:, cols], level.values[rows])
+
+        labels = [tuple(self.labels[d][c] for d, c in zip(by, row)) for row in codes.tolist()]
+        return CubeSlice(dims=by, labels=labels, values=values)
+
+    def total(self) -> Dict[str, float]:
+        values = self.levels[()].values
+        row = values[0] if len(values) else np.zeros(len(MEASURES))
+        return {m: float(v) for m, v in zip(MEASURES, row)}
+
+    def evaluate(self, strategies: Sequence, by: Sequence[str] = (), **filters: str) -> List[Dict]:
+        """
+        집계값으로 계산 가능한 전략(IAggregateStrategy)을 그룹별로 평가한다.
+        결과 레코드에는 그룹 라벨과 profit_delta / production_loss가 포함된다.
+        """
+        cube_slice = self.query(by, **filters)
+        measures = {m: cube_slice.column(m) for m in MEASURES}
+        # 라인 용량은 부품 측정값이 아니므로 라인 기준(또는 전체) 집계에서만 제공
+        if 'line' in by:
+            line_pos = tuple(by).index('line')
+            measures['line_capacity'] = np.array([self.line_capacity.get(l[line_pos], 0.0) for l in cube_slice.labels])
+        elif 'line' in filters:
+            measures['line_capacity'] = np.full(len(cube_slice.labels), self.line_capacity.get(filters['line'], 0.0))
+        else:
+            measures['line_capacity'] = np.full(len(cube_slice.labels), sum(self.line_capacity.values()))
+
+        totals = {term: np.zeros(len(cube_slice.labels)) for term in ('profit_delta', 'production_loss')}
+        for strategy in strategies:
+            if not isinstance(strategy, IAggregateStrategy):
+                raise ValueError(f"{type(strategy).__name__}은(는) 집계 기반 평가를 지원하지 않습니다.")
+            if strategy.aggregate_dims is not None and not set(by) | set(filters) <= set(strategy.aggregate_dims):
+                raise ValueError(f"{type(strategy).__name__}은(는) {tuple(by)} 기준 집계 평가를 지원하지 않습니다.")
+            for term, value in strategy.aggregate_terms(measures).items():
+                totals[term] = totals[term] + value
+
+        records = []
+        for i, label in enumerate(cube_slice.labels):
+            record = {dim: value or UNASSIGNED for dim, value in zip(cube_slice.dims, label)}
+            record['profit_delta'] = float(totals['profit_delta'][i])
+            record['production_loss'] = int(round(totals['production_loss'][i]))
+            records.append(record)
+        return records
+
+    def calculate(self, strategies: Sequence) -> SimulationResult:
+        """집계값만으로 전체 결과 계산"""
+        records = self.evaluate(strategies)
+        return SimulationResult(
+            operating_profit=0,
+            production_output=0,
+            profit_delta=records[0]['profit_delta'] if records else 0.0,
+            production_loss=records[0]['production_loss'] if records else 0
+        )
+
+    # --- 증분 갱신 ---
+
+    def apply_changes(self, removed: Sequence[Part] = (), added: Sequence[Part] = ()):
+        """
+        변경된 부품의 기여분만 반영한다 (수정 = 이전 값 제거 + 새 값 추가).
+        비용은 변경된 부품 수 × 레벨 수에 비례한다.
+        """
+        for parts, sign in ((removed, -1.0), (added, 1.0)):
+            if not parts:
+                continue
+            values = sign * _part_measures(
+                np.array([p.unit_price for p in parts], dtype=np.float64),
+                np.array([p.current_inventory for p in parts], dtype=np.float64),
+                np.array([p.daily_usage_rate for p in parts], dtype=np.float64),
+            )
+            for part, delta in zip(parts, values):
+                codes = {
+                    'supplier': self._code('supplier', part.supplier_id),
+                    'line': self._code('line', part.line_id),
+                    'category': self._code('category', part.category),
+                }
+                for dims, level in self.levels.items():
+                    level.add(tuple(codes[d] for d in dims), delta)
+
+    def update_part(self, old: Part, new: Part):
+        self.apply_changes(removed=[old], added=[new])
+
+    # --- 내부 유틸 ---
+
+    def _code(self, dim: str, label: str) -> int:
+        index = self._label_index[dim]
+        code = index.get(label)
+        if code is None:
+            code = index[label] = len(self.labels[dim])
+            self.labels[dim].append(label)
+        return code
+
+    def _codes(self, dim: str, part_codes: np.ndarray, values: List[str]) -> np.ndarray:
+        """부품 컬럼 코드(고유값 기준)를 큐브 라벨 코드로 변환"""
+        lookup = np.array([self._code(dim, value) for value in values], dtype=np.int64)
+        return lookup[part_codes]
+
+    @staticmethod
+    def _group(codes: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """코드 조합별로 측정값 합산"""
+        if codes.shape[1] == 0:
+            return np.zeros((1, 0), dtype=np.int64), values.sum(axis=0, keepdims=True)
+        if len(codes) == 0:
+            return codes.astype(np.int64), values
+        # 코드 조합을 단일 정수 키로 합쳐 1차원 unique로 그룹핑
+        shape = tuple(int(m) + 1 for m in codes.max(axis=0))
+        keys = np.ravel_multi_index(tuple(codes.T), shape)
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        unique = np.column_stack(np.unravel_index(unique_keys, shape))
+        grouped = np.column_stack([
+            np.bincount(inverse, weights=values[:, j], minlength=len(unique))
+            for j in range(values.shape[1])
+        ])
+        return unique.astype(np.int64), grouped
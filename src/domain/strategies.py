@@ -1,48 +1,127 @@
-from domain.interfaces import ISimulationStrategy
-from domain.models import SimulationContext, SimulationResult
+from typing import Any, Mapping, Sequence
+import numpy as np
+from domain.columnar import get_columns
+from domain.fusion import COLUMN_GETTERS
+from domain.interfaces import IAggregateStrategy, IColumnarStrategy, IOverlayStrategy
+from domain.models import SimulationContext
+from domain.overlays import line_delays, price_corrections
+
+class PriceHikeStrategy(IColumnarStrategy, IAggregateStrategy, IOverlayStrategy):
+    columns = ('unit_price', 'monthly_usage')
 
-class PriceHikeStrategy(ISimulationStrategy):
     def __init__(self, price_increase_pct: float):
         self.price_increase_pct = price_increase_pct
 
-    def calculate(self, context: SimulationContext) -> SimulationResult:
-        total_profit_delta = 0.0
-        MONTHS_DAYS = 30
-        
-        for part in context.parts:
-            base_cost = part.unit_price * part.monthly_usage
-            new_price = part.unit_price * (1 + self.price_increase_pct / 100)
-            new_cost = new_price * part.monthly_usage
-            cost_increase = new_cost - base_cost
-            total_profit_delta -= cost_increase
-
-        return SimulationResult(
-            operating_profit=0,
-            production_output=0,
-            profit_delta=total_profit_delta,
-            production_loss=0
-        )
-
-class DelayImpactStrategy(ISimulationStrategy):
+    def terms(self, columns: Mapping[str, Any]) -> Mapping[str, Any]:
+        base_cost = columns['unit_price'] * columns['monthly_usage']
+        new_price = columns['unit_price'] * (1 + self.price_increase_pct / 100)
+        new_cost = new_price * columns['monthly_usage']
+        cost_increase = new_cost - base_cost
+        return {'profit_delta': -cost_increase}
+
+    def aggregate_terms(self, measures: Mapping[str, Any]) -> Mapping[str, Any]:
+        # 구매액 합계에 비례하므로 어느 집계 단위에서도 계산 가능
+        return {'profit_delta': -measures['monthly_spend'] * self.price_increase_pct / 100}
+
+    def overlay_terms(self, base, overlay) -> Mapping[str, Any]:
+        # 전역 인상률 × 총 구매액 + 조정된 공급사/부품의 인상률 차이 × 해당 구매액
+        supplier_term, part_term = price_corrections(base, self.price_increase_pct, overlay)
+        return {'profit_delta': -(base.total_spend * self.price_increase_pct + supplier_term + part_term) / 100}
+
+class DelayImpactStrategy(IColumnarStrategy, IAggregateStrategy, IOverlayStrategy):
+    columns = ('line_capacity',)
+    aggregate_dims = ('line',)
+    SAFETY_BUFFER_DAYS = 5
+
     def __init__(self, delay_days: int):
         self.delay_days = delay_days
 
-    def calculate(self, context: SimulationContext) -> SimulationResult:
-        total_production_loss = 0
-        SAFETY_BUFFER_DAYS = 5
-        
+    def terms(self, columns: Mapping[str, Any]) -> Mapping[str, Any]:
         # 지연이 안전 재고 기간을 초과할 경우 손실 발생
-        if self.delay_days > SAFETY_BUFFER_DAYS:
-            lost_days = self.delay_days - SAFETY_BUFFER_DAYS
-            
-            for line in context.production_lines:
-                # 라인별 일일 생산량 * 손실 일수
-                line_loss = line.capacity_per_day * lost_days
-                total_production_loss += line_loss
-                
-        return SimulationResult(
-            operating_profit=0,
-            production_output=0,
-            profit_delta=0,
-            production_loss=total_production_loss
-        )
+        if self.delay_days <= self.SAFETY_BUFFER_DAYS:
+            return {'production_loss': 0}
+
+        lost_days = self.delay_days - self.SAFETY_BUFFER_DAYS
+        # 라인별 일일 생산량 * 손실 일수
+        return {'production_loss': columns['line_capacity'] * lost_days}
+
+    def aggregate_terms(self, measures: Mapping[str, Any]) -> Mapping[str, Any]:
+        return self.terms(measures)
+
+    def overlay_terms(self, base, overlay) -> Mapping[str, Any]:
+        if not overlay.supplier_delay_days:
+            return self.terms({'line_capacity': base.line_capacity})
+        # 공급사별 지연 조정: 라인마다 연결된 공급사의 최대 지연으로 손실 일수 계산
+        lost_days = np.maximum(line_delays(base, self.delay_days, overlay) - self.SAFETY_BUFFER_DAYS, 0)
+        return {'production_loss': base.line_capacity * lost_days}
+
+def _attribute_key(name: str) -> str:
+    """공급사 속성값 정규화 (저장소의 Currency / Country 변환과 동일)"""
+    return str(name).strip().upper()
+
+class SupplierAttributeShockStrategy(IColumnarStrategy):
+    """
+    공급사 속성(통화, 국가 등)별 단가 충격(%)을 부품에 적용하는 전략의 공통 구현
+    - 공급사 속성 코드를 부품 단위로 모은(gather) 뒤 충격 벡터를 인덱싱한다.
+    - sweep()은 속성별 월간 구매액을 한 번만 집계하고 행렬 곱으로
+      수천 개의 시나리오를 한 번에 평가한다.
+    - 충격 키는 저장소와 같이 앞뒤 공백을 지우고 대문자로 맞춰 비교한다 ('usd' == 'USD').
+    """
+    code_column = ''
+    names_column = ''
+
+    def __init__(self, shocks_pct: Mapping[str, float]):
+        self.shocks_pct = {_attribute_key(name): value for name, value in shocks_pct.items()}
+
+    @property
+    def columns(self):
+        return ('unit_price', 'monthly_usage', self.code_column, self.names_column)
+
+    def terms(self, columns: Mapping[str, Any]) -> Mapping[str, Any]:
+        names = columns[self.names_column]
+        # 마지막 칸은 속성 정보가 없는 부품(코드 -1)을 위한 0 충격
+        shock = np.zeros(len(names) + 1)
+        for i, name in enumerate(names):
+            shock[i] = self.shocks_pct.get(name, 0.0)
+
+        spend = columns['unit_price'] * columns['monthly_usage']
+        return {'profit_delta': -spend * shock[columns[self.code_column]] / 100}
+
+    @classmethod
+    def sweep(cls, context: SimulationContext, names: Sequence[str], shock_matrix_pct: np.ndarray) -> np.ndarray:
+        """
+        여러 충격 시나리오를 한 번에 평가한다.
+
+        Args:
+            names: shock_matrix_pct의 열에 대응하는 속성값 (예: ['USD', 'JPY'])
+            shock_matrix_pct: (시나리오 수 × len(names)) 충격 행렬 (%)
+
+        Returns:
+            시나리오별 영업이익 변화 (길이 = 시나리오 수)
+        """
+        strategy = cls({})
+        snapshot = get_columns(context)
+        columns = {name: COLUMN_GETTERS[name](snapshot) for name in strategy.columns}
+
+        known = columns[strategy.names_column]
+        spend = columns['unit_price'] * columns['monthly_usage']
+        codes = columns[strategy.code_column]
+        mask = codes >= 0
+        spend_by_code = np.bincount(codes[mask], weights=spend[mask], minlength=len(known))
+
+        position = {name: i for i, name in enumerate(known)}
+        keys = [_attribute_key(n) for n in names]
+        exposure = np.array([spend_by_code[position[k]] if k in position else 0.0 for k in keys])
+
+        shocks = np.atleast_2d(np.asarray(shock_matrix_pct, dtype=np.float64))
+        return -(shocks @ exposure) / 100
+
+class CurrencyShockStrategy(SupplierAttributeShockStrategy):
+    """공급사 결제 통화별 환율 변동(%)에 따른 원가 변화"""
+    code_column = 'part_currency_index'
+    names_column = 'currencies'
+
+class TariffStrategy(SupplierAttributeShockStrategy):
+    """공급 국가별 관세율(%)에 따른 원가 변화"""
+    code_column = 'part_country_index'
+    names_column = 'countries'
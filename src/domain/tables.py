@@ -0,0 +1,405 @@
+import sys
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from domain.models import Part
+
+# 정수 컬럼 후보 dtype (좁은 것부터)
+_INT_DTYPES = (np.int32, np.int64)
+
+_PART_STRING_FIELDS = ('id', 'name')
+_PART_CATEGORICAL_FIELDS = ('supplier_id', 'category', 'line_id')
+_PART_NUMERIC_FIELDS = ('unit_price', 'current_inventory', 'daily_usage_rate')
+
+
+class StringDictionary:
+    """
+    문자열 <-> 정수 코드 공유 사전
+    반복되는 ID 문자열(공급사 ID, 라인 ID, 분류)을 한 번만 보관하고 행에는 코드만 저장한다.
+    """
+
+    def __init__(self, values: Iterable[str] = ()):
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+        for value in values:
+            self.code(value)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def code(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def encode(self, values: Iterable[str]) -> np.ndarray:
+        codes = np.fromiter((self.code(v) for v in values), dtype=np.int64)
+        return codes.astype(narrow_int_dtype(len(self.values)), copy=False)
+
+    def decode(self, code: int) -> str:
+        return self.values[code]
+
+
+def narrow_int_dtype(max_abs: int) -> np.dtype:
+    for dtype in _INT_DTYPES:
+        if max_abs <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    raise ValueError(f"정수 범위를 벗어난 값이 있습니다: {max_abs}")
+
+
+def narrow_float(values: Iterable[float], column: str) -> np.ndarray:
+    """float32로 손실 없이 표현되면 float32, 아니면 float64 (NaN/무한대는 오류)"""
+    array = np.asarray(values, dtype=np.float64)
+    if not np.isfinite(array).all():
+        raise ValueError(f"'{column}' 컬럼에 숫자가 아니거나 무한대인 값이 있습니다.")
+    narrow = array.astype(np.float32)
+    if np.array_equal(narrow.astype(np.float64), array):
+        return narrow
+    return array
+
+
+def narrow_int(values: Iterable[float], column: str) -> np.ndarray:
+    """정수로 변환(소수점 이하 버림) 후 int32 범위면 int32, 아니면 int64 (범위 초과는 오류)"""
+    array = np.asarray(values, dtype=np.float64)
+    if not np.isfinite(array).all():
+        raise ValueError(f"'{column}' 컬럼에 숫자가 아니거나 무한대인 값이 있습니다.")
+    limit = np.iinfo(np.int64)
+    if len(array) and (array.min() < limit.min or array.max() > limit.max):
+        raise ValueError(f"'{column}' 컬럼에 정수 범위를 벗어난 값이 있습니다.")
+    array = np.trunc(array).astype(np.int64)
+    max_abs = int(np.abs(array).max()) if len(array) else 0
+    return array.astype(narrow_int_dtype(max_abs), copy=False)
+
+
+@dataclass
+class ColumnMemory:
+    """컬럼별 메모리 사용량 비교 (Part 객체 속성 대비 컬럼 저장)"""
+    column: str
+    rows: int
+    stored_dtype: str
+    object_bytes: int
+    stored_bytes: int
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.object_bytes - self.stored_bytes
+
+    @property
+    def saved_ratio(self) -> float:
+        return self.saved_bytes / self.object_bytes if self.object_bytes else 0.0
+
+
+def _object_bytes(values: Sequence) -> int:
+    """Python 객체로 보관할 때의 크기 추정 (값 객체 + 속성 포인터 8바이트)"""
+    return sum(sys.getsizeof(v) for v in values) + 8 * len(values)
+
+
+class PartTable:
+    """
+    부품 컬럼 저장소
+    - 반복되는 ID(공급사, 라인, 분류)는 StringDictionary 코드로, 숫자는 손실 없는 가장 좁은 dtype으로 저장한다.
+    - 부품 ID/이름은 대부분 고유하므로 문자열 리스트로 그대로 둔다.
+    - Part 객체는 PartSequence를 통해 접근할 때만 만든다.
+    """
+
+    def __init__(
+        self,
+        ids: List[str],
+        names: List[str],
+        supplier_ids: Iterable[str],
+        unit_price: Iterable[float],
+        current_inventory: Iterable[float],
+        daily_usage_rate: Iterable[float],
+        categories: Iterable[str],
+        line_ids: Iterable[str],
+        supplier_dictionary: Optional[StringDictionary] = None,
+        line_dictionary: Optional[StringDictionary] = None,
+        category_dictionary: Optional[StringDictionary] = None,
+    ):
+        dictionaries = {
+            'supplier_id': supplier_dictionary or StringDictionary(),
+            'category': category_dictionary or StringDictionary(),
+            'line_id': line_dictionary or StringDictionary(),
+        }
+        codes = {
+            'supplier_id': dictionaries['supplier_id'].encode(supplier_ids),
+            'category': dictionaries['category'].encode(categories),
+            'line_id': dictionaries['line_id'].encode(line_ids),
+        }
+        self._assign(ids, names, unit_price, current_inventory, daily_usage_rate, codes, dictionaries)
+
+    @classmethod
+    def from_codes(
+        cls,
+        ids: List[str],
+        names: List[str],
+        unit_price: Iterable[float],
+        current_inventory: Iterable[float],
+        daily_usage_rate: Iterable[float],
+        codes: Dict[str, np.ndarray],
+        dictionaries: Dict[str, StringDictionary],
+    ) -> 'PartTable':
+        """이미 사전 코드로 변환된 범주형 컬럼으로 테이블 생성 (PartTableBuilder용)"""
+        table = cls.__new__(cls)
+        table._assign(ids, names, unit_price, current_inventory, daily_usage_rate, codes, dictionaries)
+        return table
+
+    def _assign(self, ids, names, unit_price, current_inventory, daily_usage_rate, codes, dictionaries):
+        self.ids = list(ids)
+        self.names = list(names)
+        self.unit_price = narrow_float(unit_price, 'unit_price')
+        self.current_inventory = narrow_int(current_inventory, 'current_inventory')
+        self.daily_usage_rate = narrow_int(daily_usage_rate, 'daily_usage_rate')
+        self.dictionaries: Dict[str, StringDictionary] = dictionaries
+        self.codes: Dict[str, np.ndarray] = {
+            field: np.asarray(codes[field]).astype(narrow_int_dtype(len(dictionaries[field])), copy=False)
+            for field in _PART_CATEGORICAL_FIELDS
+        }
+
+        lengths = {len(self.ids), len(self.names), len(self.unit_price), len(self.current_inventory), len(self.daily_usage_rate)}
+        lengths.update(len(c) for c in self.codes.values())
+        if len(lengths) != 1:
+            raise ValueError("부품 컬럼의 길이가 서로 다릅니다.")
+        self.version = 0  # set_part마다 증가 (컬럼 스냅샷 캐시 무효화용)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    # --- 컬럼 접근 ---
+
+    def numeric(self, field: str) -> np.ndarray:
+        return getattr(self, field)
+
+    def labels(self, field: str) -> Tuple[np.ndarray, List[str]]:
+        """범주형 컬럼의 (코드 배열, 사전 값 목록)"""
+        return self.codes[field], self.dictionaries[field].values
+
+    def strings(self, field: str) -> List[str]:
+        if field == 'id':
+            return self.ids
+        if field == 'name':
+            return self.names
+        codes, values = self.labels(field)
+        return [values[c] for c in codes.tolist()]
+
+    def set_part(self, i: int, part: Part):
+        """
+        i번째 행을 part 값으로 바꾼다. 좁힌 dtype에 담기지 않는 값이면 그 컬럼을 넓힌다.
+        이미 꺼내 간 컬럼 배열 / 목록(컬럼 스냅샷, 계획 결과 등)은 바뀌지 않도록 바꾸는 컬럼만 복사한 뒤 쓴다
+        (행마다 O(n)이므로 대량 변경은 테이블을 새로 만든다).
+        """
+        numeric = {
+            'unit_price': narrow_float([part.unit_price], 'unit_price'),
+            'current_inventory': narrow_int([part.current_inventory], 'current_inventory'),
+            'daily_usage_rate': narrow_int([part.daily_usage_rate], 'daily_usage_rate'),
+        }
+        for field, value in numeric.items():
+            column = getattr(self, field)
+            column = column.astype(np.result_type(column.dtype, value.dtype))  # astype는 항상 복사
+            column[i] = value[0]
+            setattr(self, field, column)
+        for field in _PART_CATEGORICAL_FIELDS:
+            code = self.dictionaries[field].code(getattr(part, field))
+            column = self.codes[field].astype(np.result_type(self.codes[field].dtype, narrow_int_dtype(code)))
+            column[i] = code
+            self.codes[field] = column
+        self.ids = list(self.ids)
+        self.ids[i] = part.id
+        self.names = list(self.names)
+        self.names[i] = part.name
+        self.version += 1
+
+    def part(self, i: int) -> Part:
+        return Part(
+            id=self.ids[i],
+            name=self.names[i],
+            supplier_id=self.dictionaries['supplier_id'].values[self.codes['supplier_id'][i]],
+            unit_price=float(self.unit_price[i]),
+            current_inventory=int(self.current_inventory[i]),
+            daily_usage_rate=int(self.daily_usage_rate[i]),
+            category=self.dictionaries['category'].values[self.codes['category'][i]],
+            line_id=self.dictionaries['line_id'].values[self.codes['line_id'][i]],
+        )
+
+    def iter_parts(self) -> Iterator[Part]:
+        supplier_values = self.dictionaries['supplier_id'].values
+        category_values = self.dictionaries['category'].values
+        line_values = self.dictionaries['line_id'].values
+        for row in zip(
+            self.ids, self.names, self.codes['supplier_id'].tolist(), self.unit_price.tolist(),
+            self.current_inventory.tolist(), self.daily_usage_rate.tolist(),
+            self.codes['category'].tolist(), self.codes['line_id'].tolist(),
+        ):
+            yield Part(
+                id=row[0], name=row[1], supplier_id=supplier_values[row[2]], unit_price=row[3],
+                current_inventory=row[4], daily_usage_rate=row[5],
+                category=category_values[row[6]], line_id=line_values[row[7]],
+            )
+
+    # --- 메모리 리포트 ---
+
+    def memory_report(self) -> List[ColumnMemory]:
+        """컬럼별 저장 dtype과 Part 객체 속성 대비 절감량 (Python 객체 크기는 sys.getsizeof 기준 추정)"""
+        rows = len(self)
+        report = []
+        for field in _PART_STRING_FIELDS:
+            size = _object_bytes(self.strings(field))
+            report.append(ColumnMemory(field, rows, 'str', size, size))
+        for field in _PART_CATEGORICAL_FIELDS:
+            codes, values = self.labels(field)
+            # 행마다 같은 문자열 객체를 따로 보관했을 때의 크기
+            value_sizes = np.array([sys.getsizeof(v) for v in values], dtype=np.int64)
+            counts = np.bincount(codes, minlength=len(values)) if rows else np.zeros(len(values), dtype=np.int64)
+            object_bytes = int(counts @ value_sizes) + 8 * rows
+            stored = codes.nbytes + _object_bytes(values)
+            report.append(ColumnMemory(field, rows, f'category[{codes.dtype}]', object_bytes, stored))
+        for field in _PART_NUMERIC_FIELDS:
+            array = self.numeric(field)
+            scalar = 0.5 if array.dtype.kind == 'f' else 1
+            object_bytes = (sys.getsizeof(scalar) + 8) * rows
+            report.append(ColumnMemory(field, rows, str(array.dtype), object_bytes, array.nbytes))
+
+        # 행마다 Part 인스턴스와 속성 dict가 따로 잡히던 비용
+        sample = Part(id='', name='', supplier_id='', unit_price=0.0, current_inventory=0, daily_usage_rate=0)
+        per_row = sys.getsizeof(sample) + sys.getsizeof(sample.__dict__) + 8
+        report.append(ColumnMemory('(Part 객체)', rows, '-', per_row * rows, 0))
+        return report
+
+
+class PartTableBuilder:
+    """
+    배치 단위로 부품 행을 받아 PartTable을 만든다 (DB fetchmany 스트리밍용)
+    범주형 컬럼은 배치마다 바로 코드로 바꿔 문자열 목록을 끝까지 들고 있지 않는다.
+    """
+
+    def __init__(
+        self,
+        supplier_dictionary: Optional[StringDictionary] = None,
+        line_dictionary: Optional[StringDictionary] = None,
+        category_dictionary: Optional[StringDictionary] = None,
+    ):
+        self.dictionaries: Dict[str, StringDictionary] = {
+            'supplier_id': supplier_dictionary or StringDictionary(),
+            'category': category_dictionary or StringDictionary(),
+            'line_id': line_dictionary or StringDictionary(),
+        }
+        self.ids: List[str] = []
+        self.names: List[str] = []
+        self._numeric: Dict[str, List[np.ndarray]] = {field: [] for field in _PART_NUMERIC_FIELDS}
+        self._codes: Dict[str, List[np.ndarray]] = {field: [] for field in _PART_CATEGORICAL_FIELDS}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(
+        self,
+        ids: Sequence,
+        names: Sequence,
+        supplier_ids: Sequence,
+        unit_price: Sequence,
+        current_inventory: Sequence,
+        daily_usage_rate: Sequence,
+        categories: Sequence,
+        line_ids: Sequence,
+    ):
+        self.ids.extend(ids)
+        self.names.extend(names)
+        for field, values in (
+            ('unit_price', unit_price), ('current_inventory', current_inventory), ('daily_usage_rate', daily_usage_rate)
+        ):
+            self._numeric[field].append(np.asarray(values, dtype=np.float64))
+        for field, values in (('supplier_id', supplier_ids), ('category', categories), ('line_id', line_ids)):
+            self._codes[field].append(self.dictionaries[field].encode(values).astype(np.int64))
+
+    def build(self) -> PartTable:
+        def concat(chunks: List[np.ndarray], dtype) -> np.ndarray:
+            return np.concatenate(chunks) if chunks else np.zeros(0, dtype=dtype)
+
+        return PartTable.from_codes(
+            ids=self.ids,
+            names=self.names,
+            unit_price=concat(self._numeric['unit_price'], np.float64),
+            current_inventory=concat(self._numeric['current_inventory'], np.float64),
+            daily_usage_rate=concat(self._numeric['daily_usage_rate'], np.float64),
+            codes={field: concat(chunks, np.int64) for field, chunks in self._codes.items()},
+            dictionaries=self.dictionaries,
+        )
+
+
+class PartSequence(Sequence):
+    """
+    PartTable을 Part 리스트처럼 보이게 하는 지연 시퀀스
+    기존 코드(for part in context.parts 등)는 그대로 동작하고, Part 객체는 접근 시점에만 만든다.
+    컬럼 단위 계산은 part_numeric / part_labels / part_strings로 테이블을 직접 읽는다.
+    리스트처럼 context.parts[i] = new_part로 행을 바꿀 수 있다 (길이를 바꾸는 변경은 지원하지 않음).
+    Part는 frozen이므로 꺼낸 객체의 속성을 바꾸면 조용히 사라지지 않고 오류가 난다.
+    """
+
+    def __init__(self, table: PartTable):
+        self.table = table
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    @property
+    def version(self) -> int:
+        return self.table.version
+
+    def _position(self, index: int) -> int:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("part index out of range")
+        return index
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.table.part(i) for i in range(*index.indices(len(self)))]
+        return self.table.part(self._position(index))
+
+    def __setitem__(self, index, part: Part):
+        if isinstance(index, slice):
+            raise TypeError("PartSequence는 한 행씩만 바꿀 수 있습니다.")
+        self.table.set_part(self._position(index), part)
+
+    def __iter__(self) -> Iterator[Part]:
+        return self.table.iter_parts()
+
+    def __repr__(self) -> str:
+        return f"PartSequence({len(self)} parts)"
+
+
+# --- 부품 컬럼 접근 헬퍼 (Part 리스트 / PartSequence 공용) ---
+
+def part_table(parts: Sequence) -> Optional[PartTable]:
+    return parts.table if isinstance(parts, PartSequence) else None
+
+
+def part_numeric(parts: Sequence, field: str) -> np.ndarray:
+    """숫자 컬럼을 float64 배열로 반환 (계산 정밀도 유지)"""
+    table = part_table(parts)
+    if table is not None:
+        return table.numeric(field).astype(np.float64)
+    return np.fromiter((getattr(p, field) for p in parts), dtype=np.float64, count=len(parts))
+
+
+def part_labels(parts: Sequence, field: str) -> Tuple[np.ndarray, List[str]]:
+    """문자열 컬럼을 (코드 배열, 고유값 목록)으로 반환"""
+    table = part_table(parts)
+    if table is not None:
+        return table.labels(field)
+    dictionary = StringDictionary()
+    codes = dictionary.encode(getattr(p, field) for p in parts)
+    return codes, dictionary.values
+
+
+def part_strings(parts: Sequence, field: str) -> List[str]:
+    table = part_table(parts)
+    if table is not None:
+        return table.strings(field)
+    return [getattr(p, field) for p in parts]
@@ -1,6 +1,15 @@
+import logging
 from typing import List
 import pandas as pd
-from domain.models import Supplier, Part, ProductionLine, SimulationContext
+from common.tracing import span, traced
+from domain.columnar import get_columns
+from domain.lead_times import LeadTimeFit, LeadTimeFitter
+from domain.models import Supplier, ProductionLine, SimulationContext
+from domain.tables import PartSequence, PartTable, StringDictionary
+from infrastructure.schema import missing_columns_message, missing_required, resolve_columns
+from infrastructure.validation import ensure_valid, normalize_ids
+
+logger = logging.getLogger(__name__)
 
 def _generate_mock_data():
     """Mock 데이터 생성 (기존 generate_synthetic_data 대체)"""
@@ -10,7 +19,9 @@ def _generate_mock_data():
         'Supplier_ID': ['S1', 'S2', 'S3'],
         'Supplier_Name': ['Supplier A', 'Supplier B', 'Supplier C'],
         'Risk_Score': [0.3, 0.5, 0.2],
-        'Base_Lead_Time_Days': [7, 10, 5]
+        'Base_Lead_Time_Days': [7, 10, 5],
+        'Currency': ['KRW', 'USD', 'JPY'],
+        'Country': ['KR', 'CN', 'JP']
     }
     
     # Parts 데이터
@@ -20,7 +31,9 @@ def _generate_mock_data():
         'Supplier_ID': ['S1', 'S1', 'S2', 'S2', 'S3'],
         'Unit_Price': [100.0, 150.0, 200.0, 80.0, 120.0],
         'Current_Inventory': [500, 300, 200, 600, 400],
-        'Daily_Usage_Rate': [50, 30, 20, 40, 25]
+        'Daily_Usage_Rate': [50, 30, 20, 40, 25],
+        'Category': ['Metal', 'Metal', 'Electronics', 'Electronics', 'Plastic'],
+        'Line_ID': ['L1', 'L2', 'L1', 'L3', 'L2']
     }
     
     # Production 데이터
@@ -44,11 +57,22 @@ class SimulationRepository:
     - 현재는 내부 mock 데이터를 사용하거나 CSV 파일 업로드를 지원합니다.
     """
     
+    @traced('repository.load_context')
     def load_context(self) -> SimulationContext:
         """기본 mock 데이터로 컨텍스트 로드"""
         raw_data = _generate_mock_data()
         return self._build_context(raw_data)
     
+    @traced('repository.load_synthetic_context')
+    def load_synthetic_context(self, n_parts: int, seed: int = 0, **options) -> SimulationContext:
+        """
+        대규모 합성 데이터로 컨텍스트 로드 (부하/스케일 테스트, 데모용)
+        options: infrastructure.synthetic.SyntheticConfig 필드 (n_suppliers, n_lines 등)
+        """
+        from infrastructure.synthetic import generate_synthetic
+        return generate_synthetic(n_parts, seed, **options).to_context()
+
+    @traced('repository.load_context_from_uploads')
     def load_context_from_uploads(
         self, 
         parts_csv=None, 
@@ -68,147 +92,167 @@ class SimulationRepository:
         # 기본 mock 데이터 먼저 로드
         raw_data = _generate_mock_data()
         
-        # 업로드된 파일이 있으면 덮어쓰기
         # 업로드된 파일이 있으면 덮어쓰기
         try:
-            if parts_csv is not None:
-                print(f"DEBUG: parts_csv type: {type(parts_csv)}")
-                if hasattr(parts_csv, 'seek'):
-                    parts_csv.seek(0)
-                raw_data['parts'] = pd.read_csv(parts_csv)
-            if suppliers_csv is not None:
-                print(f"DEBUG: suppliers_csv type: {type(suppliers_csv)}")
-                if hasattr(suppliers_csv, 'seek'):
-                    suppliers_csv.seek(0)
-                raw_data['suppliers'] = pd.read_csv(suppliers_csv)
-            if production_csv is not None:
-                print(f"DEBUG: production_csv type: {type(production_csv)}")
-                if hasattr(production_csv, 'seek'):
-                    production_csv.seek(0)
-                raw_data['production'] = pd.read_csv(production_csv)
+            for key, csv_file in (('parts', parts_csv), ('suppliers', suppliers_csv), ('production', production_csv)):
+                if csv_file is None:
+                    continue
+                logger.debug("%s_csv type: %s", key, type(csv_file))
+                with span('repository.read_csv', table=key) as s:
+                    if hasattr(csv_file, 'seek'):
+                        csv_file.seek(0)
+                    raw_data[key] = pd.read_csv(csv_file)
+                    s.set(rows=len(raw_data[key]))
         except Exception as e:
-            print(f"ERROR in load_context_from_uploads: {e}")
-            # 에러 발생 시 로그를 남기거나 처리할 수 있음 (여기선 간단히 pass 또는 re-raise)
-            # print(f"Error reading CSV: {e}")
+            logger.error("load_context_from_uploads failed: %s", e)
             raise e
         
         return self._build_context(raw_data)
     
     
+    @traced('repository.fit_lead_times')
+    def fit_lead_times(self, deliveries_csv, context: SimulationContext, chunksize: int = 500_000, **options) -> LeadTimeFit:
+        """
+        납품 이력 CSV를 청크 단위로 읽어 컨텍스트 공급사별 리드타임 분포 / 지연 확률을 추정한다.
+        파일 전체를 메모리에 올리지 않으므로 수백만 행 로그도 (청크 크기 × 컬럼 수) 메모리로 처리한다.
+
+        - 컬럼은 별칭(infrastructure.schema 'deliveries')으로 인식하며 필요한 컬럼만 읽는다.
+          필수: Supplier_ID, Order_Date, Receipt_Date / 선택: Promised_Date
+        - 날짜 형식은 청크마다 첫 값으로 추정하며, 읽을 수 없는 날짜 / 입고일이 발주일보다 이른 행 /
+          공급사 목록에 없는 행은 건너뛰고 건수만 결과(skipped_rows)에 남긴다.
+        - 추정 결과는 domain.lead_times.attach_lead_time_fit으로 컨텍스트에 붙여 시나리오 계산에 쓴다.
+
+        Args:
+            deliveries_csv: 파일 경로 또는 업로드 파일 객체
+            context: 공급사 목록과 기본 리드타임(약속 납기일이 없는 행의 지연 기준)을 가진 컨텍스트
+            options: LeadTimeFitter 인자 (tolerance_days, max_days, min_deliveries)
+        """
+        supplier_ids = pd.Index(get_columns(context).supplier_ids)
+        fitter = LeadTimeFitter(
+            supplier_ids.tolist(), [s.base_lead_time_days for s in context.suppliers], **options
+        )
+
+        if hasattr(deliveries_csv, 'seek'):
+            deliveries_csv.seek(0)
+        reader = pd.read_csv(
+            deliveries_csv,
+            usecols=lambda col: bool(resolve_columns([col], 'deliveries')),
+            dtype=str,
+            chunksize=chunksize
+        )
+        with reader:
+            for number, chunk in enumerate(reader):
+                with span('repository.delivery_chunk', chunk=number, rows=len(chunk)):
+                    chunk = self._standardize_columns(chunk, 'deliveries')
+                    missing = missing_required(chunk.columns, 'deliveries')
+                    if missing:
+                        raise ValueError(missing_columns_message(missing, 'deliveries'))
+
+                    dates = {
+                        col: pd.to_datetime(chunk[col], errors='coerce')
+                        for col in ('Order_Date', 'Promised_Date', 'Receipt_Date') if col in chunk.columns
+                    }
+                    lead_days = (dates['Receipt_Date'] - dates['Order_Date']).dt.days.to_numpy(dtype=float, na_value=float('nan'))
+                    delay_days = None
+                    if 'Promised_Date' in dates:
+                        delay_days = (dates['Receipt_Date'] - dates['Promised_Date']).dt.days.to_numpy(dtype=float, na_value=float('nan'))
+                    index = supplier_ids.get_indexer(chunk['Supplier_ID'].str.strip())
+                    fitter.update(index, lead_days, delay_days)
+
+        fit = fitter.result()
+        if fit.skipped_rows:
+            logger.warning("납품 이력 %d행 중 %d행을 건너뛰었습니다 (날짜 오류 / 음수 리드타임 / 알 수 없는 공급사)", fit.rows, fit.skipped_rows)
+        return fit
+
+    @traced('repository.standardize_columns')
     def _standardize_columns(self, df: pd.DataFrame, target_type: str) -> pd.DataFrame:
         """
         데이터프레임의 컬럼명을 표준 스키마로 매핑한다.
         (한글, 영어, 다양한 별칭 지원)
         """
-        # 매핑 정의 (표준 컬럼명 -> [가능한 별칭들])
-        # 대소문자는 무시하고 비교함
-        mappings = {}
-        
-        if target_type == 'parts':
-            mappings = {
-                'Part_ID': ['id', 'part_id', 'item_id', 'code', '품목코드', '부품코드', '코드', '제품코드'],
-                'Part_Name': ['name', 'part_name', 'item_name', '품목명', '부품명', '이름', '품명'],
-                'Supplier_ID': ['supplier_id', 'vendor_id', 'partner_id', '공급사코드', '업체코드', '공급사'],
-                'Unit_Price': ['price', 'unit_price', 'cost', 'unit_cost', 'amount', '단가', '가격', '비용', '금액'],
-                'Current_Inventory': ['inventory', 'stock', 'qty', 'quantity', 'current_stock', '재고', '현재재고', '수량', '보유량'],
-                'Daily_Usage_Rate': ['usage', 'daily_usage', 'rate', 'demand', 'consumption', '일일사용량', '사용량', '소요량', '일일소요량']
-            }
-        elif target_type == 'suppliers':
-            mappings = {
-                'Supplier_ID': ['id', 'supplier_id', 'vendor_id', 'code', '공급사코드', '업체코드'],
-                'Supplier_Name': ['name', 'supplier_name', 'vendor_name', 'company', '공급사명', '업체명', '회사명'],
-                'Risk_Score': ['risk', 'risk_score', 'score', 'credit', '리스크', '위험도', '신용도', '점수'],
-                'Base_Lead_Time_Days': ['lead_time', 'leadtime', 'days', 'lt', 'time', '리드타임', '납기', '소요일']
-            }
-        elif target_type == 'production':
-            mappings = {
-                'Line_ID': ['id', 'line_id', 'line', 'code', '라인코드', '생산라인'],
-                'Line_Name': ['name', 'line_name', '라인명', '이름'],
-                'Capacity_Per_Day': ['capacity', 'capa', 'output', 'daily_capa', '생산능력', '일일생산량', 'capa'],
-                'Efficiency_Rate': ['efficiency', 'eff', 'rate', 'yield', '효율', '수율', '가동률']
-            }
-            
-        # 컬럼 변경
-        new_columns = {}
-        for col in df.columns:
-            col_lower = str(col).lower().replace(" ", "_").strip() # 소문자 및 공백 처리
-            
-            # 매핑 찾기
-            found = False
-            for std_col, aliases in mappings.items():
-                if col_lower == std_col.lower(): # 이미 표준 이름인 경우
-                    found = True
-                    break
-                if col_lower in aliases:
-                    new_columns[col] = std_col
-                    found = True
-                    break
+        # 별칭 규칙은 infrastructure.schema.COLUMN_ALIASES에서 DB 리포지토리와 공유
+        new_columns = {col: std_col for col, std_col in resolve_columns(df.columns, target_type).items() if col != std_col}
             
         if new_columns:
-            print(f"DEBUG: Renaming columns for {target_type}: {new_columns}")
+            logger.debug("Renaming columns for %s: %s", target_type, new_columns)
             return df.rename(columns=new_columns)
             
         return df
 
+    @traced('repository.build_context')
     def _build_context(self, raw_data: dict) -> SimulationContext:
         """DataFrame을 도메인 모델로 변환"""
         
         try:
+            # 0. 컬럼 표준화 + 필수 컬럼 검사 후 전체 행 검증 (오류가 있으면 모든 오류 행을 한 번에 보고)
+            frames = {}
+            for key in ('suppliers', 'parts', 'production'):
+                if key in raw_data and not raw_data[key].empty:
+                    df = normalize_ids(self._standardize_columns(raw_data[key], key), key)
+                    missing = missing_required(df.columns, key)
+                    if missing:
+                        raise ValueError(missing_columns_message(missing, key))
+                    frames[key] = df
+            ensure_valid(frames)
+
             # 1. Suppliers
             suppliers = []
-            if 'suppliers' in raw_data and not raw_data['suppliers'].empty:
-                # 컬럼 표준화 적용
-                df = self._standardize_columns(raw_data['suppliers'], 'suppliers')
-                
-                # 필수 컬럼 검사
-                required_cols = ['Supplier_ID', 'Supplier_Name', 'Risk_Score', 'Base_Lead_Time_Days']
-                missing = [col for col in required_cols if col not in df.columns]
-                if missing:
-                    raise ValueError(f"공급사 파일에 다음 필수 컬럼이 없습니다: {', '.join(missing)}")
+            if 'suppliers' in frames:
+                df = frames['suppliers']
+
+                # 선택 컬럼 (통화/국가): 없거나 비어 있으면 빈 문자열
+                for col in ['Currency', 'Country']:
+                    values = df[col] if col in df.columns else pd.Series('', index=df.index)
+                    df = df.assign(**{col: values.fillna('').astype(str).str.strip().str.upper()})
 
                 for _, row in df.iterrows():
                     suppliers.append(Supplier(
-                        id=row['Supplier_ID'],
+                        id=str(row['Supplier_ID']),
                         name=row['Supplier_Name'],
                         risk_score=row['Risk_Score'],
-                        base_lead_time_days=int(row['Base_Lead_Time_Days'])
+                        base_lead_time_days=int(row['Base_Lead_Time_Days']),
+                        currency=row['Currency'],
+                        country=row['Country']
                     ))
                 
             # 2. Parts
             parts = []
-            if 'parts' in raw_data and not raw_data['parts'].empty:
-                # 컬럼 표준화 적용
-                df = self._standardize_columns(raw_data['parts'], 'parts')
-                
-                required_cols = ['Part_ID', 'Part_Name', 'Supplier_ID', 'Unit_Price', 'Current_Inventory', 'Daily_Usage_Rate']
-                missing = [col for col in required_cols if col not in df.columns]
-                if missing:
-                    raise ValueError(f"부품 파일에 다음 필수 컬럼이 없습니다: {', '.join(missing)}")
+            if 'parts' in frames:
+                df = frames['parts']
 
-                for _, row in df.iterrows():
-                    parts.append(Part(
-                        id=row['Part_ID'],
-                        name=row['Part_Name'],
-                        supplier_id=row['Supplier_ID'],
-                        unit_price=float(row['Unit_Price']),
-                        current_inventory=int(row['Current_Inventory']),
-                        daily_usage_rate=int(row['Daily_Usage_Rate'])
-                    ))
+                # 선택 컬럼 (분류/사용 라인): 없거나 비어 있으면 빈 문자열
+                for col in ['Category', 'Line_ID']:
+                    values = df[col] if col in df.columns else pd.Series('', index=df.index)
+                    df = df.assign(**{col: values.fillna('').astype(str).str.strip()})
+
+                # 행 단위 Part 객체 대신 컬럼 테이블로 보관 (ID는 공유 사전 코드, 숫자는 좁은 dtype)
+                table = PartTable(
+                    ids=df['Part_ID'].astype(str).tolist(),
+                    names=df['Part_Name'].astype(str).tolist(),
+                    supplier_ids=df['Supplier_ID'].astype(str).tolist(),
+                    unit_price=df['Unit_Price'].astype(float).to_numpy(),
+                    current_inventory=df['Current_Inventory'].astype(float).to_numpy(),
+                    daily_usage_rate=df['Daily_Usage_Rate'].astype(float).to_numpy(),
+                    categories=df['Category'].tolist(),
+                    line_ids=df['Line_ID'].tolist(),
+                    supplier_dictionary=StringDictionary(s.id for s in suppliers)
+                )
+                parts = PartSequence(table)
+                if logger.isEnabledFor(logging.DEBUG):
+                    for column in table.memory_report():
+                        logger.debug(
+                            "parts.%s: %s, %d -> %d bytes", column.column, column.stored_dtype,
+                            column.object_bytes, column.stored_bytes
+                        )
                 
             # 3. Production Lines
             lines = []
-            if 'production' in raw_data and not raw_data['production'].empty:
-                # 컬럼 표준화 적용
-                df = self._standardize_columns(raw_data['production'], 'production')
-                
-                required_cols = ['Line_ID', 'Line_Name', 'Capacity_Per_Day', 'Efficiency_Rate']
-                missing = [col for col in required_cols if col not in df.columns]
-                if missing:
-                    raise ValueError(f"생산라인 파일에 다음 필수 컬럼이 없습니다: {', '.join(missing)}")
+            if 'production' in frames:
+                df = frames['production']
 
                 for _, row in df.iterrows():
                     lines.append(ProductionLine(
-                        id=row['Line_ID'],
+                        id=str(row['Line_ID']),
                         name=row['Line_Name'],
                         capacity_per_day=int(row['Capacity_Per_Day']),
                         efficiency_rate=float(row['Efficiency_Rate'])
@@ -0,0 +1,166 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Mapping, Optional
+
+from common.tracing import traced
+from domain.interfaces import IScenarioResultStore
+
+# 범위 조회용으로 별도 컬럼에 꺼내 두는 파라미터 / 결과 필드
+_PARAM_COLUMNS = ('price_increase_pct', 'delay_days')
+_RESULT_COLUMNS = ('profit_delta', 'production_loss')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scenario_results (
+    id INTEGER PRIMARY KEY,
+    created_at REAL NOT NULL,
+    context_hash TEXT NOT NULL,
+    scope TEXT NOT NULL DEFAULT '',
+    kind TEXT NOT NULL,
+    params_key TEXT NOT NULL,
+    price_increase_pct REAL,
+    delay_days INTEGER,
+    profit_delta REAL,
+    production_loss INTEGER,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_results_lookup ON scenario_results (context_hash, kind, params_key, created_at);
+CREATE INDEX IF NOT EXISTS ix_results_scope_delay ON scenario_results (scope, kind, delay_days, created_at);
+CREATE INDEX IF NOT EXISTS ix_results_scope_price ON scenario_results (scope, kind, price_increase_pct, created_at);
+CREATE INDEX IF NOT EXISTS ix_results_created ON scenario_results (created_at);
+"""
+
+
+def params_key(params: Mapping[str, Any]) -> str:
+    """파라미터의 정규화된 JSON (키 정렬) - 같은 시나리오는 같은 키"""
+    return json.dumps(params, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+
+
+class SqliteScenarioResultStore(IScenarioResultStore):
+    """
+    SQLite 기반 append-only 시나리오 결과 저장소
+    - 결과는 덮어쓰지 않고 계속 추가하며, 조회 시 같은 키의 가장 최근 결과를 사용한다.
+    - (context_hash, kind, params) 캐시 조회와 (scope, kind, 지연/가격 범위, 기간) 조회에 맞춘 인덱스를 둔다.
+    - 지연 일수, 가격 변화율, 결과 KPI는 별도 컬럼으로 저장해 JSON을 풀지 않고 범위 조회한다.
+    - 대시보드 백그라운드 스레드에서도 쓸 수 있도록 연결 하나를 잠금으로 보호한다.
+
+    사용 예:
+        store = SqliteScenarioResultStore("results.sqlite")
+        store.query(scope="plant-A", kind="simulation", min_delay=10)
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # --- IScenarioResultStore ---
+
+    @traced('result_store.lookup')
+    def lookup(self, context_hash: str, kind: str, params: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM scenario_results "
+                "WHERE context_hash = ? AND kind = ? AND params_key = ? "
+                "ORDER BY created_at DESC, id DESC LIMIT 1",
+                (context_hash, kind, params_key(params))
+            ).fetchone()
+        return json.loads(row[0])['result'] if row else None
+
+    @traced('result_store.append')
+    def append(
+        self,
+        context_hash: str,
+        kind: str,
+        params: Mapping[str, Any],
+        result: Mapping[str, Any],
+        scope: str = ""
+    ) -> None:
+        payload = json.dumps({'params': params, 'result': result}, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO scenario_results (created_at, context_hash, scope, kind, params_key, "
+                "price_increase_pct, delay_days, profit_delta, production_loss, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    time.time(), context_hash, scope, kind, params_key(params),
+                    *(params.get(c) for c in _PARAM_COLUMNS),
+                    *(result.get(c) for c in _RESULT_COLUMNS),
+                    payload,
+                )
+            )
+            self._conn.commit()
+
+    # --- 조회 ---
+
+    @traced('result_store.query')
+    def query(
+        self,
+        scope: Optional[str] = None,
+        kind: Optional[str] = None,
+        context_hash: Optional[str] = None,
+        min_delay: Optional[int] = None,
+        max_delay: Optional[int] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: Optional[int] = 1000,
+        include_payload: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        조건에 맞는 저장 결과 (최신순)
+        예) store.query(scope="plant-A", kind="simulation", min_delay=10)
+        since/until은 UNIX 타임스탬프(초)이다.
+        """
+        clauses, values = [], []
+        for column, op, value in (
+            ('scope', '=', scope),
+            ('kind', '=', kind),
+            ('context_hash', '=', context_hash),
+            ('delay_days', '>=', min_delay),
+            ('delay_days', '<=', max_delay),
+            ('price_increase_pct', '>=', min_price),
+            ('price_increase_pct', '<=', max_price),
+            ('created_at', '>=', since),
+            ('created_at', '<=', until),
+        ):
+            if value is not None:
+                clauses.append(f"{column} {op} ?")
+                values.append(value)
+
+        columns = ['id', 'created_at', 'context_hash', 'scope', 'kind', 'params_key', *_PARAM_COLUMNS, *_RESULT_COLUMNS]
+        if include_payload:
+            columns.append('payload')
+        sql = f"SELECT {', '.join(columns)} FROM scenario_results"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY created_at DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            values.append(int(limit))
+
+        with self._lock:
+            rows = self._conn.execute(sql, values).fetchall()
+
+        records = []
+        for row in rows:
+            record = dict(zip(columns, row))
+            record['params'] = json.loads(record.pop('params_key'))
+            if include_payload:
+                record['result'] = json.loads(record.pop('payload'))['result']
+            records.append(record)
+        return records
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM scenario_results").fetchone()[0]
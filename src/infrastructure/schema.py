@@ -0,0 +1,76 @@
+"""
+입력 데이터 표준 스키마와 컬럼 별칭
+CSV 업로드(SimulationRepository)와 DB 조회(SqlSimulationRepository)가 같은 규칙으로 컬럼을 인식한다.
+"""
+from typing import Dict, Iterable, List
+
+# 매핑 정의 (표준 컬럼명 -> [가능한 별칭들])
+# 대소문자는 무시하고 비교함
+COLUMN_ALIASES: Dict[str, Dict[str, List[str]]] = {
+    'parts': {
+        'Part_ID': ['id', 'part_id', 'item_id', 'code', '품목코드', '부품코드', '코드', '제품코드'],
+        'Part_Name': ['name', 'part_name', 'item_name', '품목명', '부품명', '이름', '품명'],
+        'Supplier_ID': ['supplier_id', 'vendor_id', 'partner_id', '공급사코드', '업체코드', '공급사'],
+        'Unit_Price': ['price', 'unit_price', 'cost', 'unit_cost', 'amount', '단가', '가격', '비용', '금액'],
+        'Current_Inventory': ['inventory', 'stock', 'qty', 'quantity', 'current_stock', '재고', '현재재고', '수량', '보유량'],
+        'Daily_Usage_Rate': ['usage', 'daily_usage', 'rate', 'demand', 'consumption', '일일사용량', '사용량', '소요량', '일일소요량'],
+        'Category': ['category', 'part_category', 'item_group', 'group', '분류', '카테고리', '품목군', '부품분류'],
+        'Line_ID': ['line_id', 'line', 'line_code', '라인', '라인코드', '생산라인', '사용라인']
+    },
+    'suppliers': {
+        'Supplier_ID': ['id', 'supplier_id', 'vendor_id', 'code', '공급사코드', '업체코드'],
+        'Supplier_Name': ['name', 'supplier_name', 'vendor_name', 'company', '공급사명', '업체명', '회사명'],
+        'Risk_Score': ['risk', 'risk_score', 'score', 'credit', '리스크', '위험도', '신용도', '점수'],
+        'Base_Lead_Time_Days': ['lead_time', 'leadtime', 'days', 'lt', 'time', '리드타임', '납기', '소요일'],
+        'Currency': ['currency', 'ccy', 'currency_code', '통화', '결제통화', '화폐'],
+        'Country': ['country', 'nation', 'origin', 'country_code', '국가', '원산지', '국가코드']
+    },
+    'production': {
+        'Line_ID': ['id', 'line_id', 'line', 'code', '라인코드', '생산라인'],
+        'Line_Name': ['name', 'line_name', '라인명', '이름'],
+        'Capacity_Per_Day': ['capacity', 'capa', 'output', 'daily_capa', '생산능력', '일일생산량', 'capa'],
+        'Efficiency_Rate': ['efficiency', 'eff', 'rate', 'yield', '효율', '수율', '가동률']
+    },
+    'deliveries': {
+        'Supplier_ID': ['supplier_id', 'supplier', 'vendor_id', 'vendor', 'partner_id', '공급사코드', '업체코드', '공급사'],
+        'Order_Date': ['order_date', 'po_date', 'ordered_at', 'order_dt', '발주일', '발주일자', '주문일', '주문일자'],
+        'Promised_Date': ['promised_date', 'due_date', 'requested_date', 'promise_date', 'eta', '납기일', '약속납기', '요청납기', '납기요청일'],
+        'Receipt_Date': ['receipt_date', 'received_date', 'delivery_date', 'gr_date', 'received_at', '입고일', '입고일자', '납품일', '납품일자'],
+    },
+}
+
+REQUIRED_COLUMNS: Dict[str, List[str]] = {
+    'parts': ['Part_ID', 'Part_Name', 'Supplier_ID', 'Unit_Price', 'Current_Inventory', 'Daily_Usage_Rate'],
+    'suppliers': ['Supplier_ID', 'Supplier_Name', 'Risk_Score', 'Base_Lead_Time_Days'],
+    'production': ['Line_ID', 'Line_Name', 'Capacity_Per_Day', 'Efficiency_Rate'],
+    'deliveries': ['Supplier_ID', 'Order_Date', 'Receipt_Date'],
+}
+
+TABLE_LABELS = {'parts': '부품', 'suppliers': '공급사', 'production': '생산라인', 'deliveries': '납품 이력'}
+
+
+def resolve_columns(columns: Iterable, target_type: str) -> Dict:
+    """
+    원본 컬럼명 -> 표준 컬럼명 매핑 (인식된 컬럼만 포함, 이미 표준 이름인 컬럼도 포함)
+    (한글, 영어, 다양한 별칭 지원)
+    """
+    mappings = COLUMN_ALIASES.get(target_type, {})
+    resolved = {}
+    for col in columns:
+        col_lower = str(col).lower().replace(" ", "_").strip() # 소문자 및 공백 처리
+
+        # 매핑 찾기
+        for std_col, aliases in mappings.items():
+            if col_lower == std_col.lower() or col_lower in aliases:
+                resolved[col] = std_col
+                break
+    return resolved
+
+
+def missing_required(standard_columns: Iterable[str], target_type: str) -> List[str]:
+    present = set(standard_columns)
+    return [col for col in REQUIRED_COLUMNS[target_type] if col not in present]
+
+
+def missing_columns_message(missing: List[str], target_type: str) -> str:
+    return f"{TABLE_LABELS[target_type]} 파일에 다음 필수 컬럼이 없습니다: {', '.join(missing)}"
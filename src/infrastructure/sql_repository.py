@@ -0,0 +1,284 @@
+import logging
+import sqlite3
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from common.tracing import span, traced
+from domain.models import ProductionLine, SimulationContext, Supplier
+from domain.rollup import COVERAGE_EDGES, DIMENSIONS, MEASURES, UNASSIGNED
+from domain.tables import PartSequence, PartTableBuilder, StringDictionary
+from infrastructure.schema import REQUIRED_COLUMNS, missing_columns_message, missing_required, resolve_columns
+
+logger = logging.getLogger(__name__)
+
+# 집계 차원 -> 부품 테이블 표준 컬럼
+_DIMENSION_COLUMNS = {'supplier': 'Supplier_ID', 'line': 'Line_ID', 'category': 'Category'}
+
+
+def _quote(identifier: str) -> str:
+    return '"' + str(identifier).replace('"', '""') + '"'
+
+
+def _text(value) -> str:
+    return '' if value is None else str(value).strip()
+
+
+class SqlSimulationRepository:
+    """
+    관계형 DB 기반 리포지토리 (SQLite 기본, DuckDB 선택)
+    - 테이블 컬럼은 CSV 업로드와 같은 별칭 규칙(infrastructure.schema)으로 인식한다.
+    - 공급사/라인/분류 필터는 WHERE 절로, 그룹 집계는 GROUP BY로 DB에서 처리한다 (pushdown).
+    - 부품은 fetchmany 배치로 읽어 컬럼 테이블(PartTable)에 바로 쌓는다.
+
+    사용 예:
+        repo = SqlSimulationRepository.connect("sqlite:///master.db")
+        context = repo.load_context(line_ids=["L1", "L2"])
+        summary = repo.aggregate(by=("supplier",), line_ids=["L1"])
+    """
+
+    DEFAULT_TABLES = {'parts': 'parts', 'suppliers': 'suppliers', 'production': 'production_lines'}
+
+    def __init__(self, connection, tables: Optional[Dict[str, str]] = None, batch_size: int = 50_000):
+        self.connection = connection
+        self.tables = {**self.DEFAULT_TABLES, **(tables or {})}
+        self.batch_size = batch_size
+        self._columns: Dict[str, Dict[str, str]] = {}
+
+    @classmethod
+    def connect(cls, url: str, **kwargs) -> 'SqlSimulationRepository':
+        """
+        URL로 연결 생성
+        - sqlite:///경로 (또는 sqlite:///:memory:)
+        - duckdb:///경로 (duckdb 패키지 필요)
+        """
+        scheme, _, path = url.partition(':///')
+        if scheme == 'sqlite':
+            return cls(sqlite3.connect(path or ':memory:'), **kwargs)
+        if scheme == 'duckdb':
+            try:
+                import duckdb
+            except ImportError as e:
+                raise ImportError("DuckDB 연결에는 duckdb 패키지가 필요합니다 (pip install duckdb).") from e
+            return cls(duckdb.connect(path or ':memory:'), **kwargs)
+        raise ValueError(f"지원하지 않는 DB URL입니다: {url}")
+
+    # --- 스키마 인식 ---
+
+    def columns(self, target_type: str) -> Dict[str, str]:
+        """표준 컬럼명 -> 실제 DB 컬럼명 (별칭 규칙으로 인식, 필수 컬럼 검사)"""
+        if target_type not in self._columns:
+            cursor = self.connection.cursor()
+            cursor.execute(f"SELECT * FROM {_quote(self.tables[target_type])} LIMIT 0")
+            actual = [d[0] for d in cursor.description]
+            cursor.close()
+
+            mapping: Dict[str, str] = {}
+            for col, std_col in resolve_columns(actual, target_type).items():
+                mapping.setdefault(std_col, col)
+            missing = missing_required(mapping, target_type)
+            if missing:
+                raise ValueError(missing_columns_message(missing, target_type))
+            logger.debug("Resolved columns for %s: %s", target_type, mapping)
+            self._columns[target_type] = mapping
+        return self._columns[target_type]
+
+    # --- 조회 ---
+
+    @traced('repository.sql.load_context')
+    def load_context(
+        self,
+        supplier_ids: Optional[Sequence[str]] = None,
+        line_ids: Optional[Sequence[str]] = None,
+        categories: Optional[Sequence[str]] = None,
+    ) -> SimulationContext:
+        """
+        필터 조건에 맞는 부품과 관련 공급사/생산라인만 로드한다.
+        line_ids를 주면 해당 라인(공장)의 부품과 라인만, supplier_ids를 주면 해당 공급사 부품만 읽는다.
+        """
+        part_where, part_params = self._part_filter(supplier_ids, line_ids, categories)
+        suppliers = self._load_suppliers(part_where, part_params)
+        parts = self._load_parts(part_where, part_params, suppliers)
+        lines = self._load_lines(line_ids)
+        return SimulationContext(parts=parts, suppliers=suppliers, production_lines=lines)
+
+    @traced('repository.sql.aggregate')
+    def aggregate(
+        self,
+        by: Sequence[str] = ('supplier',),
+        supplier_ids: Optional[Sequence[str]] = None,
+        line_ids: Optional[Sequence[str]] = None,
+        categories: Optional[Sequence[str]] = None,
+    ) -> List[Dict]:
+        """
+        부품을 메모리로 읽지 않고 DB에서 그룹 집계 (측정값은 RollupCube와 동일)
+        결과 레코드 형식은 CubeSlice.to_records()와 같다.
+        """
+        unknown = [d for d in by if d not in DIMENSIONS]
+        if unknown:
+            raise ValueError(f"지원하지 않는 집계 차원입니다: {', '.join(unknown)}")
+
+        keys = [f"COALESCE(CAST({self._part_expr(_DIMENSION_COLUMNS[d], optional=True)} AS VARCHAR), '')" for d in by]
+        price = f"CAST({self._part_expr('Unit_Price')} AS DOUBLE)"
+        inventory = f"CAST({self._part_expr('Current_Inventory')} AS DOUBLE)"
+        usage = f"CAST({self._part_expr('Daily_Usage_Rate')} AS DOUBLE)"
+
+        # 커버리지 구간: 재고 / 일일사용량 (사용량 0 이하는 마지막 구간), 나눗셈 대신 곱셈으로 비교
+        buckets = []
+        lower = None
+        for edge in COVERAGE_EDGES:
+            cond = f"{usage} > 0 AND {inventory} < {edge} * {usage}"
+            if lower is not None:
+                cond += f" AND {inventory} >= {lower} * {usage}"
+            buckets.append(cond)
+            lower = edge
+        buckets.append(f"{usage} <= 0 OR {inventory} >= {lower} * {usage}")
+
+        select = keys + [
+            "COUNT(*)",
+            f"SUM({price} * {usage} * 30)",
+            f"SUM({usage} * 30)",
+            f"SUM({price} * {inventory})",
+        ] + [f"SUM(CASE WHEN {cond} THEN 1 ELSE 0 END)" for cond in buckets]
+
+        where, params = self._part_filter(supplier_ids, line_ids, categories)
+        sql = f"SELECT {', '.join(select)} FROM {_quote(self.tables['parts'])} AS p{where}"
+        if keys:
+            positions = ', '.join(str(i + 1) for i in range(len(keys)))
+            sql += f" GROUP BY {positions} ORDER BY {positions}"
+
+        records = []
+        for row in self._fetch(sql, params):
+            record = {dim: _text(value) or UNASSIGNED for dim, value in zip(by, row)}
+            record.update({m: float(v or 0) for m, v in zip(MEASURES, row[len(keys):])})
+            records.append(record)
+        return records
+
+    # --- 내부 구현 ---
+
+    def _part_expr(self, std_col: str, optional: bool = False) -> str:
+        columns = self.columns('parts')
+        if std_col not in columns:
+            if optional:
+                return "''"
+            raise ValueError(missing_columns_message([std_col], 'parts'))
+        return f"p.{_quote(columns[std_col])}"
+
+    def _part_filter(self, supplier_ids, line_ids, categories) -> Tuple[str, list]:
+        clauses, params = [], []
+        for std_col, values in (('Supplier_ID', supplier_ids), ('Line_ID', line_ids), ('Category', categories)):
+            if values is None:
+                continue
+            values = [str(v) for v in values]
+            if not values:
+                clauses.append("1 = 0")
+                continue
+            if std_col not in self.columns('parts'):
+                raise ValueError(f"부품 테이블에 {std_col} 컬럼이 없어 필터를 적용할 수 없습니다.")
+            # 인덱스를 탈 수 있도록 컬럼에 CAST를 씌우지 않는다 (문자열 파라미터는 DB가 컬럼 타입으로 변환)
+            clauses.append(f"{self._part_expr(std_col)} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def _fetch(self, sql: str, params: list):
+        for rows in self._fetch_batches(sql, params):
+            yield from rows
+
+    def _fetch_batches(self, sql: str, params: list):
+        """fetchmany 배치로 결과를 순회 (전체 결과를 한 번에 메모리에 올리지 않음)"""
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(self.batch_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            cursor.close()
+
+    def _select(self, target_type: str, alias: str) -> Tuple[List[str], str]:
+        """필수 + 인식된 선택 컬럼의 SELECT 목록"""
+        columns = self.columns(target_type)
+        names = list(REQUIRED_COLUMNS[target_type])
+        names += [c for c in columns if c not in names]
+        return names, ', '.join(f"{alias}.{_quote(columns[c])}" for c in names)
+
+    def _load_suppliers(self, part_where: str, part_params: list) -> List[Supplier]:
+        names, select = self._select('suppliers', 's')
+        id_col = _quote(self.columns('suppliers')['Supplier_ID'])
+        sql = f"SELECT {select} FROM {_quote(self.tables['suppliers'])} AS s"
+        params: list = []
+        if part_where:
+            # 필터된 부품이 참조하는 공급사만 (서브쿼리로 DB에서 처리)
+            sql += (
+                f" WHERE s.{id_col} IN (SELECT DISTINCT {self._part_expr('Supplier_ID')}"
+                f" FROM {_quote(self.tables['parts'])} AS p{part_where})"
+            )
+            params = list(part_params)
+
+        suppliers = []
+        with span('repository.sql.fetch', table='suppliers') as s:
+            for row in self._fetch(sql, params):
+                values = dict(zip(names, row))
+                suppliers.append(Supplier(
+                    id=_text(values['Supplier_ID']),
+                    name=_text(values['Supplier_Name']),
+                    risk_score=values['Risk_Score'],
+                    base_lead_time_days=int(values['Base_Lead_Time_Days']),
+                    currency=_text(values.get('Currency')).upper(),
+                    country=_text(values.get('Country')).upper()
+                ))
+            s.set(rows=len(suppliers))
+        return suppliers
+
+    def _load_parts(self, where: str, params: list, suppliers: List[Supplier]) -> PartSequence:
+        names, select = self._select('parts', 'p')
+        position = {name: i for i, name in enumerate(names)}
+        builder = PartTableBuilder(supplier_dictionary=StringDictionary(s.id for s in suppliers))
+        sql = f"SELECT {select} FROM {_quote(self.tables['parts'])} AS p{where}"
+
+        def column(rows, name, convert=None):
+            i = position.get(name)
+            if i is None:
+                return [''] * len(rows)
+            if convert is None:
+                return [r[i] for r in rows]
+            return [convert(r[i]) for r in rows]
+
+        with span('repository.sql.fetch', table='parts') as s:
+            for rows in self._fetch_batches(sql, params):
+                builder.append(
+                    ids=column(rows, 'Part_ID', _text),
+                    names=column(rows, 'Part_Name', _text),
+                    supplier_ids=column(rows, 'Supplier_ID', _text),
+                    unit_price=column(rows, 'Unit_Price'),
+                    current_inventory=column(rows, 'Current_Inventory'),
+                    daily_usage_rate=column(rows, 'Daily_Usage_Rate'),
+                    categories=column(rows, 'Category', _text),
+                    line_ids=column(rows, 'Line_ID', _text),
+                )
+            s.set(rows=len(builder))
+        return PartSequence(builder.build())
+
+    def _load_lines(self, line_ids) -> List[ProductionLine]:
+        names, select = self._select('production', 'l')
+        sql = f"SELECT {select} FROM {_quote(self.tables['production'])} AS l"
+        params: list = []
+        if line_ids is not None:
+            line_ids = [str(v) for v in line_ids]
+            id_col = _quote(self.columns('production')['Line_ID'])
+            placeholders = ', '.join('?' * len(line_ids)) or "NULL"
+            sql += f" WHERE l.{id_col} IN ({placeholders})"
+            params = line_ids
+
+        lines = []
+        with span('repository.sql.fetch', table='production') as s:
+            for row in self._fetch(sql, params):
+                values = dict(zip(names, row))
+                lines.append(ProductionLine(
+                    id=_text(values['Line_ID']),
+                    name=_text(values['Line_Name']),
+                    capacity_per_day=int(values['Capacity_Per_Day']),
+                    efficiency_rate=float(values['Efficiency_Rate'])
+                ))
+            s.set(rows=len(lines))
+        return lines
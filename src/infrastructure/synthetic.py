@@ -0,0 +1,293 @@
+"""
+대규모 합성 데이터 생성기 (부하/스케일 테스트, 대시보드 데모용)
+시드 고정 + 벡터 연산으로 1천 ~ 1천만 부품 규모의 공급망 데이터를 몇 초 안에 만든다.
+
+분포 가정:
+- 단가: 로그정규 (소수 고가 부품이 구매액 대부분을 차지하는 heavy tail)
+- 일일 사용량: 파레토 (대부분 소량, 일부 대량 소비 부품)
+- 공급사 집중도: 순위 r의 공급사가 부품을 맡을 확률 ∝ 1 / r^supplier_zipf
+- 리스크: 베타(2, 5), 리드타임: 3일 + 감마 분포
+- 재고: 일일 사용량 × 보유 일수(감마 분포)
+
+    python src/infrastructure/synthetic.py --parts 1000000 --out data/synthetic --format csv
+    python src/infrastructure/synthetic.py --parts 10000000 --out data/synthetic.npz --format snapshot
+"""
+import argparse
+import sys
+import time
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# 스크립트로 직접 실행할 때도 src 레이어 모듈을 임포트할 수 있도록 경로 추가
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from common.tracing import traced
+from domain.models import ProductionLine, SimulationContext, Supplier
+from domain.tables import PartSequence, PartTable, StringDictionary
+
+CATEGORIES = ('Metal', 'Electronics', 'Plastic', 'Chemical', 'Rubber', 'Glass', 'Textile', 'Packaging')
+CATEGORY_WEIGHTS = (0.25, 0.22, 0.15, 0.1, 0.08, 0.07, 0.07, 0.06)
+
+# 공급 국가와 결제 통화
+COUNTRIES = ('KR', 'CN', 'JP', 'US', 'DE', 'VN', 'TW', 'MX')
+COUNTRY_WEIGHTS = (0.35, 0.25, 0.12, 0.1, 0.06, 0.05, 0.04, 0.03)
+COUNTRY_CURRENCY = {'KR': 'KRW', 'CN': 'CNY', 'JP': 'JPY', 'US': 'USD', 'DE': 'EUR', 'VN': 'USD', 'TW': 'USD', 'MX': 'USD'}
+
+
+@dataclass
+class SyntheticConfig:
+    """합성 데이터 규모와 분포 파라미터 (n_suppliers / n_lines가 None이면 부품 수에 맞춰 정함)"""
+    n_parts: int
+    n_suppliers: Optional[int] = None
+    n_lines: Optional[int] = None
+    seed: int = 0
+    price_log_mean: float = 4.0
+    price_log_sigma: float = 1.2
+    usage_pareto_shape: float = 1.6
+    max_daily_usage: int = 5000
+    supplier_zipf: float = 1.1
+    cover_days_shape: float = 2.0
+    cover_days_scale: float = 8.0
+    shared_part_ratio: float = 0.05
+
+    @property
+    def suppliers(self) -> int:
+        return self.n_suppliers or int(np.clip(self.n_parts // 50, 3, 50_000))
+
+    @property
+    def lines(self) -> int:
+        return self.n_lines or int(np.clip(self.n_parts // 20_000, 3, 200))
+
+
+@dataclass
+class SyntheticDataset:
+    """
+    생성된 합성 데이터 (numpy 컬럼)
+    범주형 컬럼은 코드 배열로 두고, 부품 ID는 위치로부터 만들 수 있으므로 보관하지 않는다.
+    """
+    part_supplier: np.ndarray    # 공급사 위치
+    part_line: np.ndarray        # 라인 위치 (-1: 전 라인 공용)
+    part_category: np.ndarray    # CATEGORIES 위치
+    unit_price: np.ndarray
+    current_inventory: np.ndarray
+    daily_usage_rate: np.ndarray
+    supplier_risk: np.ndarray
+    supplier_lead_time: np.ndarray
+    supplier_country: np.ndarray  # COUNTRIES 위치
+    line_capacity: np.ndarray
+    line_efficiency: np.ndarray
+
+    @property
+    def n_parts(self) -> int:
+        return len(self.unit_price)
+
+    def part_ids(self, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        width = len(str(max(self.n_parts - 1, 0)))
+        return list(map(f'P{{:0{width}d}}'.format, range(start, self.n_parts if stop is None else stop)))
+
+    def supplier_ids(self) -> List[str]:
+        width = len(str(max(len(self.supplier_risk) - 1, 0)))
+        return [f'S{i:0{width}d}' for i in range(len(self.supplier_risk))]
+
+    def line_ids(self) -> List[str]:
+        return [f'L{i + 1}' for i in range(len(self.line_capacity))]
+
+    @traced('synthetic.to_context')
+    def to_context(self) -> SimulationContext:
+        """도메인 컨텍스트 (부품은 PartTable, 부품명은 메모리 절약을 위해 ID와 같은 문자열을 공유)"""
+        supplier_ids = self.supplier_ids()
+        line_ids = self.line_ids()
+        suppliers = [
+            Supplier(
+                id=sid, name=f'Supplier {sid[1:]}', risk_score=float(risk), base_lead_time_days=int(lead_time),
+                currency=COUNTRY_CURRENCY[COUNTRIES[country]], country=COUNTRIES[country]
+            )
+            for sid, risk, lead_time, country in zip(supplier_ids, self.supplier_risk, self.supplier_lead_time, self.supplier_country)
+        ]
+        lines = [
+            ProductionLine(id=lid, name=f'Line {lid[1:]}', capacity_per_day=int(capacity), efficiency_rate=float(efficiency))
+            for lid, capacity, efficiency in zip(line_ids, self.line_capacity, self.line_efficiency)
+        ]
+
+        # 라인 코드: 사전 마지막 칸을 빈 문자열(공용 부품)로 둔다
+        line_codes = np.where(self.part_line >= 0, self.part_line, len(line_ids))
+        ids = self.part_ids()
+        table = PartTable.from_codes(
+            ids=ids,
+            names=ids,
+            unit_price=self.unit_price,
+            current_inventory=self.current_inventory,
+            daily_usage_rate=self.daily_usage_rate,
+            codes={'supplier_id': self.part_supplier, 'category': self.part_category, 'line_id': line_codes},
+            dictionaries={
+                'supplier_id': StringDictionary(supplier_ids),
+                'category': StringDictionary(CATEGORIES),
+                'line_id': StringDictionary(line_ids + ['']),
+            },
+        )
+        return SimulationContext(parts=PartSequence(table), suppliers=suppliers, production_lines=lines)
+
+    def to_frames(self, start: int = 0, stop: Optional[int] = None) -> Dict[str, 'pd.DataFrame']:
+        """표준 컬럼명의 DataFrame (parts는 [start, stop) 구간만; CSV/업로드 경로 테스트용)"""
+        import pandas as pd
+
+        stop = self.n_parts if stop is None else min(stop, self.n_parts)
+        ids = self.part_ids(start, stop)
+        line_names = np.array(self.line_ids() + [''], dtype=object)
+        supplier_ids = np.array(self.supplier_ids(), dtype=object)
+        part_slice = slice(start, stop)
+        countries = np.array(COUNTRIES, dtype=object)[self.supplier_country]
+        return {
+            'parts': pd.DataFrame({
+                'Part_ID': ids,
+                'Part_Name': ids,
+                'Supplier_ID': supplier_ids[self.part_supplier[part_slice]],
+                'Unit_Price': self.unit_price[part_slice],
+                'Current_Inventory': self.current_inventory[part_slice],
+                'Daily_Usage_Rate': self.daily_usage_rate[part_slice],
+                'Category': np.array(CATEGORIES, dtype=object)[self.part_category[part_slice]],
+                'Line_ID': line_names[self.part_line[part_slice]],
+            }),
+            'suppliers': pd.DataFrame({
+                'Supplier_ID': supplier_ids,
+                'Supplier_Name': [f'Supplier {sid[1:]}' for sid in supplier_ids],
+                'Risk_Score': self.supplier_risk,
+                'Base_Lead_Time_Days': self.supplier_lead_time,
+                'Currency': [COUNTRY_CURRENCY[c] for c in countries],
+                'Country': countries,
+            }),
+            'production': pd.DataFrame({
+                'Line_ID': self.line_ids(),
+                'Line_Name': [f'Line {lid[1:]}' for lid in self.line_ids()],
+                'Capacity_Per_Day': self.line_capacity,
+                'Efficiency_Rate': self.line_efficiency,
+            }),
+        }
+
+    @traced('synthetic.write_csvs')
+    def write_csvs(self, directory, chunk_rows: int = 1_000_000) -> Dict[str, Path]:
+        """parts.csv / suppliers.csv / production.csv를 쓴다 (부품은 chunk_rows씩 나눠 써서 메모리 일정)"""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        paths = {name: directory / f'{name}.csv' for name in ('parts', 'suppliers', 'production')}
+
+        frames = self.to_frames(0, 0)
+        for name in ('suppliers', 'production'):
+            frames[name].to_csv(paths[name], index=False)
+        try:
+            # pyarrow가 있으면 CSV 쓰기가 pandas보다 약 10배 빠르다 (선택 의존성)
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+        except ImportError:
+            pa = None
+
+        if pa is not None:
+            writer = None
+            try:
+                for start in range(0, max(self.n_parts, 1), chunk_rows):
+                    chunk = pa.Table.from_pandas(self.to_frames(start, start + chunk_rows)['parts'], preserve_index=False)
+                    if writer is None:
+                        writer = pa_csv.CSVWriter(str(paths['parts']), chunk.schema)
+                    writer.write_table(chunk)
+            finally:
+                if writer is not None:
+                    writer.close()
+            return paths
+
+        with open(paths['parts'], 'w', encoding='utf-8', newline='') as f:
+            for start in range(0, max(self.n_parts, 1), chunk_rows):
+                chunk = self.to_frames(start, start + chunk_rows)['parts']
+                chunk.to_csv(f, index=False, header=start == 0, float_format='%.2f')
+        return paths
+
+    @traced('synthetic.save_snapshot')
+    def save_snapshot(self, path) -> Path:
+        """numpy 컬럼 스냅샷(.npz)으로 저장 (CSV보다 훨씬 빠르게 다시 로드)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(path, **{f.name: getattr(self, f.name) for f in fields(self)})
+        return path if path.suffix == '.npz' else path.with_name(path.name + '.npz')
+
+    @classmethod
+    @traced('synthetic.load_snapshot')
+    def load_snapshot(cls, path) -> 'SyntheticDataset':
+        with np.load(path) as data:
+            return cls(**{f.name: data[f.name] for f in fields(cls)})
+
+
+@traced('synthetic.generate')
+def generate_synthetic(n_parts: int, seed: int = 0, **options) -> SyntheticDataset:
+    """
+    합성 데이터 생성
+    options: SyntheticConfig 필드 (n_suppliers, n_lines, price_log_sigma 등)
+    """
+    config = SyntheticConfig(n_parts=n_parts, seed=seed, **options)
+    if n_parts < 0:
+        raise ValueError("n_parts는 0 이상이어야 합니다.")
+    rng = np.random.default_rng(config.seed)
+    n_suppliers, n_lines = config.suppliers, config.lines
+
+    # 공급사 집중도 (Zipf)
+    supplier_weights = 1.0 / np.arange(1, n_suppliers + 1) ** config.supplier_zipf
+    part_supplier = _choice(rng, supplier_weights, n_parts, np.int32)
+
+    shared = rng.random(n_parts) < config.shared_part_ratio
+    part_line = np.where(shared, -1, rng.integers(0, n_lines, n_parts)).astype(np.int16 if n_lines < 2 ** 15 else np.int32)
+    part_category = _choice(rng, np.array(CATEGORY_WEIGHTS), n_parts, np.int8)
+
+    unit_price = np.round(rng.lognormal(config.price_log_mean, config.price_log_sigma, n_parts), 2).clip(0.01)
+    usage = np.minimum(np.floor(rng.pareto(config.usage_pareto_shape, n_parts) * 5) + 1, config.max_daily_usage).astype(np.int64)
+    cover_days = rng.gamma(config.cover_days_shape, config.cover_days_scale, n_parts)
+    inventory = np.floor(usage * cover_days).astype(np.int64)
+
+    return SyntheticDataset(
+        part_supplier=part_supplier,
+        part_line=part_line,
+        part_category=part_category,
+        unit_price=unit_price,
+        current_inventory=inventory,
+        daily_usage_rate=usage,
+        supplier_risk=np.round(rng.beta(2, 5, n_suppliers), 2),
+        supplier_lead_time=(3 + np.floor(rng.gamma(2.0, 4.0, n_suppliers))).clip(max=90).astype(np.int64),
+        supplier_country=_choice(rng, np.array(COUNTRY_WEIGHTS), n_suppliers, np.int8),
+        line_capacity=rng.integers(50, 500, n_lines) // 10 * 10,
+        line_efficiency=np.round(rng.uniform(0.8, 0.98, n_lines), 2),
+    )
+
+
+def _choice(rng: np.random.Generator, weights: np.ndarray, size: int, dtype) -> np.ndarray:
+    """가중치 비례 범주 표본 (누적분포 + searchsorted로 대용량에서도 빠르게)"""
+    cdf = np.cumsum(weights)
+    cdf /= cdf[-1]
+    return np.minimum(np.searchsorted(cdf, rng.random(size), side='right'), len(cdf) - 1).astype(dtype)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--parts', type=int, default=100_000)
+    parser.add_argument('--suppliers', type=int)
+    parser.add_argument('--lines', type=int)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', required=True, help='CSV 디렉터리 또는 스냅샷(.npz) 경로')
+    parser.add_argument('--format', choices=('csv', 'snapshot'), default='csv')
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    dataset = generate_synthetic(args.parts, args.seed, n_suppliers=args.suppliers, n_lines=args.lines)
+    generated = time.perf_counter()
+    if args.format == 'csv':
+        written = list(dataset.write_csvs(args.out).values())
+    else:
+        written = [dataset.save_snapshot(args.out)]
+    print(f"부품 {dataset.n_parts:,}개 생성 {generated - started:.2f}s, 저장 {time.perf_counter() - generated:.2f}s")
+    for path in written:
+        print(f"  {path}")
+
+
+if __name__ == '__main__':
+    main()
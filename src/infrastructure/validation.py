@@ -0,0 +1,209 @@
+"""
+입력 데이터 검증 (컬럼 단위 벡터 연산)
+표준 컬럼명으로 바꾼 DataFrame 전체를 한 번에 검사해 모든 오류 행을 한 표로 돌려준다.
+첫 오류에서 멈추지 않으므로 큰 파일도 한 번 업로드로 고칠 곳을 모두 확인할 수 있다.
+
+검사 항목:
+- 타입: 숫자 컬럼에 숫자가 아닌 값, 무한대(inf), 정수 컬럼의 소수
+- 필수값: 비어 있는 ID/이름/숫자
+- 범위: 음수 재고, 0 이하 일일사용량, 0~1 밖의 리스크/효율 등
+- 중복: 같은 테이블 안의 중복 ID
+- 참조 무결성: 부품의 Supplier_ID가 공급사 테이블에 있는지
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from common.tracing import span, traced
+from infrastructure.schema import TABLE_LABELS
+
+# 오류 표의 row는 CSV 파일 줄 번호 (헤더가 1행, 첫 데이터가 2행)
+ROW_OFFSET = 2
+ERROR_COLUMNS = ['table', 'row', 'column', 'value', 'rule', 'message']
+
+
+@dataclass(frozen=True)
+class ColumnRule:
+    """컬럼 하나의 검사 규칙 (kind: 'id' | 'text' | 'number' | 'integer')"""
+    column: str
+    kind: str = 'number'
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    exclusive_minimum: bool = False
+    unique: bool = False
+
+
+TABLE_RULES: Dict[str, List[ColumnRule]] = {
+    'parts': [
+        ColumnRule('Part_ID', 'id', unique=True),
+        ColumnRule('Part_Name', 'text'),
+        ColumnRule('Supplier_ID', 'id'),
+        ColumnRule('Unit_Price', minimum=0),
+        ColumnRule('Current_Inventory', minimum=0),
+        ColumnRule('Daily_Usage_Rate', minimum=0, exclusive_minimum=True),
+    ],
+    'suppliers': [
+        ColumnRule('Supplier_ID', 'id', unique=True),
+        ColumnRule('Supplier_Name', 'text'),
+        ColumnRule('Risk_Score', minimum=0, maximum=1),
+        ColumnRule('Base_Lead_Time_Days', 'integer', minimum=0),
+    ],
+    'production': [
+        ColumnRule('Line_ID', 'id', unique=True),
+        ColumnRule('Line_Name', 'text'),
+        ColumnRule('Capacity_Per_Day', 'integer', minimum=0),
+        ColumnRule('Efficiency_Rate', minimum=0, maximum=1, exclusive_minimum=True),
+    ],
+}
+
+# (테이블, 컬럼) -> (참조 테이블, 참조 컬럼)
+REFERENCES: Dict[Tuple[str, str], Tuple[str, str]] = {
+    ('parts', 'Supplier_ID'): ('suppliers', 'Supplier_ID'),
+}
+
+
+class DataValidationError(ValueError):
+    """검증 실패 (errors: 전체 오류 표, ERROR_COLUMNS 형식)"""
+
+    def __init__(self, errors: pd.DataFrame, preview: int = 5):
+        self.errors = errors
+        counts = errors['table'].value_counts()
+        summary = ', '.join(f"{TABLE_LABELS.get(t, t)} {counts[t]:,}건" for t in counts.index)
+        lines = [f"데이터 검증 실패: 오류 {len(errors):,}건 ({summary})"]
+        for e in errors.head(preview).itertuples(index=False):
+            lines.append(f"- {TABLE_LABELS.get(e.table, e.table)} {e.row}행 {e.column}: {e.message} (값: {e.value!r})")
+        if len(errors) > preview:
+            lines.append(f"... 외 {len(errors) - preview:,}건")
+        super().__init__('\n'.join(lines))
+
+
+def _keys(values: pd.Series) -> pd.Series:
+    """ID 비교용 문자열 (앞뒤 공백 제거)"""
+    return values.astype(str).str.strip()
+
+
+def normalize_ids(df: pd.DataFrame, table: str) -> pd.DataFrame:
+    """
+    ID 컬럼(kind='id')의 앞뒤 공백 제거 (결측은 그대로)
+    검증과 컨텍스트 생성이 같은 값을 보도록 컬럼 표준화 직후 한 번 적용한다
+    (' S1 '이 검증은 통과하고 공급사 연결은 끊기는 일이 없도록).
+    """
+    columns = [r.column for r in TABLE_RULES.get(table, ()) if r.kind == 'id' and r.column in df.columns]
+    if not columns:
+        return df
+    return df.assign(**{c: df[c].where(df[c].isna(), _keys(df[c])) for c in columns})
+
+
+def _blank(values: pd.Series, keys: Optional[pd.Series] = None) -> np.ndarray:
+    """비어 있는 값 (NaN 또는 공백 문자열; keys를 주면 문자열 변환을 다시 하지 않음)"""
+    missing = values.isna().to_numpy()
+    if values.dtype == object or pd.api.types.is_string_dtype(values.dtype):
+        keys = _keys(values) if keys is None else keys
+        missing = missing | (keys == '').to_numpy()
+    return missing
+
+
+def _issues(table: str, column: str, values: pd.Series, mask: np.ndarray, rule: str, message: str) -> Optional[pd.DataFrame]:
+    rows = np.flatnonzero(mask)
+    if not len(rows):
+        return None
+    return pd.DataFrame({
+        'table': table,
+        'row': rows + ROW_OFFSET,
+        'column': column,
+        'value': values.iloc[rows].fillna('').astype(str).to_numpy(),
+        'rule': rule,
+        'message': message,
+    })
+
+
+def _range_message(rule: ColumnRule) -> str:
+    if rule.minimum is not None and rule.maximum is not None:
+        lower = '초과' if rule.exclusive_minimum else '이상'
+        return f"{rule.minimum:g} {lower} {rule.maximum:g} 이하여야 합니다"
+    if rule.exclusive_minimum:
+        return f"{rule.minimum:g}보다 커야 합니다"
+    if rule.minimum is not None:
+        return f"{rule.minimum:g} 이상이어야 합니다"
+    return f"{rule.maximum:g} 이하여야 합니다"
+
+
+def _check_column(table: str, values: pd.Series, rule: ColumnRule) -> List[pd.DataFrame]:
+    found = []
+    keys = _keys(values) if rule.kind in ('id', 'text') else None
+    blank = _blank(values, keys)
+    found.append(_issues(table, rule.column, values, blank, 'required', "값이 비어 있습니다"))
+
+    if rule.kind in ('number', 'integer'):
+        numbers = pd.to_numeric(values, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        not_number = np.isnan(numbers) & ~blank
+        found.append(_issues(table, rule.column, values, not_number, 'type', "숫자가 아닙니다"))
+        found.append(_issues(table, rule.column, values, np.isinf(numbers), 'type', "유한한 숫자가 아닙니다"))
+
+        finite = np.isfinite(numbers)
+        if rule.kind == 'integer':
+            fractional = finite & (numbers != np.floor(np.where(finite, numbers, 0)))
+            found.append(_issues(table, rule.column, values, fractional, 'type', "정수가 아닙니다"))
+
+        out_of_range = np.zeros(len(numbers), dtype=bool)
+        with np.errstate(invalid='ignore'):
+            if rule.minimum is not None:
+                out_of_range |= (numbers <= rule.minimum) if rule.exclusive_minimum else (numbers < rule.minimum)
+            if rule.maximum is not None:
+                out_of_range |= numbers > rule.maximum
+        if rule.minimum is not None or rule.maximum is not None:
+            found.append(_issues(table, rule.column, values, out_of_range & finite, 'range', _range_message(rule)))
+
+    if rule.unique:
+        duplicated = keys.duplicated(keep=False).to_numpy() & ~blank
+        found.append(_issues(table, rule.column, values, duplicated, 'duplicate', "중복된 ID입니다"))
+    return [f for f in found if f is not None]
+
+
+@traced('validation.validate_table')
+def validate_table(df: pd.DataFrame, target_type: str) -> pd.DataFrame:
+    """표준 컬럼명 DataFrame 하나를 검사 (없는 컬럼은 건너뜀; 필수 컬럼 검사는 schema.missing_required)"""
+    found = []
+    for rule in TABLE_RULES[target_type]:
+        if rule.column in df.columns:
+            with span('validation.column', table=target_type, column=rule.column):
+                found.extend(_check_column(target_type, df[rule.column], rule))
+    return _concat(found)
+
+
+@traced('validation.validate_tables')
+def validate_tables(frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    여러 테이블과 테이블 간 참조 무결성을 한 번에 검사
+    Returns: 오류 표 (ERROR_COLUMNS, 테이블 -> 행 순서), 오류가 없으면 빈 DataFrame
+    """
+    found = [validate_table(df, table) for table, df in frames.items() if table in TABLE_RULES and df is not None]
+
+    for (table, column), (ref_table, ref_column) in REFERENCES.items():
+        df, ref = frames.get(table), frames.get(ref_table)
+        if df is None or ref is None or ref.empty or column not in df.columns or ref_column not in ref.columns:
+            continue
+        values = df[column]
+        keys = _keys(values)
+        known = keys.isin(_keys(ref[ref_column])).to_numpy()
+        message = f"{TABLE_LABELS[ref_table]} 목록에 없는 {ref_column}입니다"
+        found.append(_issues(table, column, values, ~known & ~_blank(values, keys), 'reference', message))
+
+    errors = _concat([f for f in found if f is not None and len(f)])
+    order = {table: i for i, table in enumerate(TABLE_RULES)}
+    return errors.sort_values(['table', 'row'], key=lambda s: s.map(order) if s.name == 'table' else s, kind='stable', ignore_index=True)
+
+
+def ensure_valid(frames: Dict[str, pd.DataFrame]):
+    """오류가 하나라도 있으면 전체 오류 표를 담은 DataValidationError"""
+    errors = validate_tables(frames)
+    if len(errors):
+        raise DataValidationError(errors)
+
+
+def _concat(found: List[pd.DataFrame]) -> pd.DataFrame:
+    if not found:
+        return pd.DataFrame({c: pd.Series(dtype='int64' if c == 'row' else object) for c in ERROR_COLUMNS})
+    return pd.concat(found, ignore_index=True)
@@ -0,0 +1,424 @@
+"""
+시뮬레이션 HTTP/JSON API 서버 (asyncio, 표준 라이브러리만 사용)
+MES/계획 시스템이 대시보드를 거치지 않고 What-if KPI를 조회할 수 있도록
+로드된 컨텍스트별로 시뮬레이션 / 예측 / 인사이트를 제공한다.
+
+- 동시에 들어온 /simulate 요청은 컨텍스트별로 짧은 시간 창(--batch-window-ms) 동안 모아
+  SimulationService.run_simulation_batch 한 번으로 벡터화 평가한다.
+- 예측/인사이트처럼 무거운 계산은 스레드 풀에서 실행하므로 이벤트 루프는 계속 요청을 받는다.
+
+    python src/presentation/api.py --sample --port 8765
+    python src/presentation/api.py --csv plant-A=examples/parts_example.csv,examples/suppliers_example.csv,examples/production_example.csv
+    python src/presentation/api.py --db plant-B=sqlite:///scm.sqlite --result-store results.sqlite
+
+엔드포인트:
+    GET  /health, /contexts, /stats
+    POST /simulate        {"context": "sample", "price_increase_pct": 10, "delay_days": 7,
+                           "currency_shocks": {"USD": 5}, "tariffs": {"CN": 10},
+                           "overlay": {"suppliers": {"S2": {"price_pct": 40}, "S3": {"delay_days": 12}}}}
+                          또는 {"context": "sample", "scenarios": [{...}, {...}]}
+    POST /forecast        {"context": "sample", "max_price_increase": 30, "max_delay": 30}
+    POST /forecast/trend  {"context": "sample", "price_increase_pct": 10, "delay_days": 7}
+    POST /insights        {"context": "sample", "price_increase_pct": 10, "delay_days": 7}
+"""
+import argparse
+import asyncio
+import json
+import logging
+import math
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+# 스크립트로 직접 실행할 때도 src 레이어 모듈을 임포트할 수 있도록 경로 추가
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from application.services import SimulationService
+from common.batching import MicroBatcher
+from domain.columnar import context_fingerprint
+from domain.overlays import WhatIfOverlay, check_overlay
+
+logger = logging.getLogger(__name__)
+
+MAX_BODY_BYTES = 1024 * 1024
+MAX_SCENARIOS = 10_000
+# 시나리오 입력 범위 (가격 / 환율 / 관세 / 오버레이 변동률 %, 지연 일수)
+MIN_PRICE_PCT, MAX_PRICE_PCT = -100.0, 1000.0
+MAX_DELAY_DAYS = 365
+# /forecast 가격 범위 상한 (시나리오 수가 범위에 비례하므로 요청 하나가 워커를 오래 붙잡지 않도록 제한)
+MAX_FORECAST_PRICE_PCT = 100.0
+
+_REASONS = {
+    200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+    413: 'Payload Too Large', 431: 'Request Header Fields Too Large', 500: 'Internal Server Error',
+}
+
+
+class ApiError(Exception):
+    """HTTP 상태 코드와 함께 클라이언트에 돌려줄 오류"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _number(body: Dict[str, Any], key: str, default: float, cast=float):
+    """유한한 숫자 (JSON의 NaN / Infinity는 400)"""
+    value = body.get(key, default)
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        raise ApiError(400, f"'{key}'는 유한한 숫자여야 합니다.")
+    return cast(value)
+
+
+def _bounded(body: Dict[str, Any], key: str, default: float, lower: float, upper: float, cast=float):
+    """lower 이상 upper 이하의 숫자 (범위를 벗어나면 400)"""
+    value = _number(body, key, default, cast)
+    if not lower <= value <= upper:
+        raise ApiError(400, f"'{key}'는 {lower:g} 이상 {upper:g} 이하여야 합니다.")
+    return value
+
+
+def _percent(body: Dict[str, Any], key: str) -> float:
+    return _bounded(body, key, 0.0, MIN_PRICE_PCT, MAX_PRICE_PCT)
+
+
+def _days(body: Dict[str, Any], key: str) -> int:
+    return _bounded(body, key, 0, 0, MAX_DELAY_DAYS, int)
+
+
+def _shocks(body: Dict[str, Any], key: str) -> Dict[str, float]:
+    value = body.get(key) or {}
+    if not isinstance(value, dict):
+        raise ApiError(400, f"'{key}'는 {{이름: 퍼센트}} 객체여야 합니다.")
+    return {str(name): _percent(value, name) for name in value}
+
+
+def _overlay(body: Dict[str, Any]) -> Optional[WhatIfOverlay]:
+    """{"suppliers": {"S2": {"price_pct": 40, "delay_days": 12}}, "parts": {"P1": {"price_pct": -5}}}"""
+    value = body.get('overlay')
+    if not value:
+        return None
+    if not isinstance(value, dict):
+        raise ApiError(400, "'overlay'는 {\"suppliers\": {...}, \"parts\": {...}} 객체여야 합니다.")
+    overlay = WhatIfOverlay()
+    for key in ('suppliers', 'parts'):
+        entries = value.get(key) or {}
+        if not isinstance(entries, dict) or not all(isinstance(v, dict) for v in entries.values()):
+            raise ApiError(400, f"'overlay.{key}'는 {{ID: {{조정값}}}} 객체여야 합니다.")
+        for entity_id, edit in entries.items():
+            price = _percent(edit, 'price_pct') if 'price_pct' in edit else None
+            if key == 'parts':
+                overlay = overlay.with_part(str(entity_id), price)
+            else:
+                delay = _days(edit, 'delay_days') if 'delay_days' in edit else None
+                overlay = overlay.with_supplier(str(entity_id), price, delay)
+    return overlay
+
+
+def parse_scenario(body: Dict[str, Any]) -> Dict[str, Any]:
+    """요청 본문을 run_simulation 인자로 검증/정규화한다"""
+    if not isinstance(body, dict):
+        raise ApiError(400, "시나리오는 JSON 객체여야 합니다.")
+    scenario = {
+        'price_increase_pct': _percent(body, 'price_increase_pct'),
+        'delay_days': _days(body, 'delay_days'),
+        'currency_shocks': _shocks(body, 'currency_shocks'),
+        'tariffs': _shocks(body, 'tariffs'),
+    }
+    overlay = _overlay(body)
+    if overlay:
+        scenario['overlay'] = overlay
+    return scenario
+
+
+def _json_default(value):
+    # numpy 스칼라/배열 등
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f"JSON으로 직렬화할 수 없는 값입니다: {type(value).__name__}")
+
+
+class SimulationApi:
+    """
+    라우팅과 요청 처리 (전송 계층과 분리되어 있어 소켓 없이도 테스트할 수 있다)
+    services: 컨텍스트 이름 -> SimulationService
+    """
+
+    def __init__(
+        self,
+        services: Dict[str, SimulationService],
+        batch_window_ms: float = 2.0,
+        max_batch: int = 512,
+        workers: int = 4
+    ):
+        if not services:
+            raise ValueError("로드된 컨텍스트가 없습니다.")
+        self.services = services
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='simulation-api')
+        self.batchers = {
+            name: MicroBatcher(service.run_simulation_batch, batch_window_ms, max_batch, self.executor)
+            for name, service in services.items()
+        }
+        self.routes = {
+            ('GET', '/health'): self._health,
+            ('GET', '/contexts'): self._contexts,
+            ('GET', '/stats'): self._stats,
+            ('POST', '/simulate'): self._simulate,
+            ('POST', '/forecast'): self._forecast,
+            ('POST', '/forecast/trend'): self._risk_trend,
+            ('POST', '/insights'): self._insights,
+        }
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+
+    async def handle(self, method: str, target: str, body: bytes = b'') -> Tuple[int, Any]:
+        """(상태 코드, JSON 직렬화 가능한 응답)"""
+        path = urlsplit(target).path.rstrip('/') or '/'
+        route = self.routes.get((method, path))
+        if route is None:
+            if any(p == path for _, p in self.routes):
+                return 405, {'error': f"{method} {path}는 지원하지 않습니다."}
+            return 404, {'error': f"알 수 없는 경로입니다: {path}"}
+
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError as e:
+            return 400, {'error': f"JSON 본문을 해석할 수 없습니다: {e}"}
+
+        try:
+            return 200, await route(payload)
+        except ApiError as e:
+            return e.status, {'error': str(e)}
+        except ValueError as e:
+            return 400, {'error': str(e)}
+        except Exception as e:
+            logger.exception("API 요청 처리 실패: %s %s", method, path)
+            return 500, {'error': f"{type(e).__name__}: {e}"}
+
+    def _resolve(self, body: Dict[str, Any]) -> str:
+        if not isinstance(body, dict):
+            raise ApiError(400, "요청 본문은 JSON 객체여야 합니다.")
+        name = body.get('context')
+        if name is None:
+            if len(self.services) > 1:
+                raise ApiError(400, f"'context'를 지정하세요: {', '.join(self.services)}")
+            return next(iter(self.services))
+        if name not in self.services:
+            raise ApiError(404, f"로드되지 않은 컨텍스트입니다: {name}")
+        return name
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    # --- 엔드포인트 ---
+
+    async def _health(self, body) -> Dict[str, Any]:
+        return {'status': 'ok', 'contexts': len(self.services)}
+
+    async def _contexts(self, body) -> List[Dict[str, Any]]:
+        return [
+            {
+                'name': name,
+                'scope': service.scope,
+                'parts': len(service.context.parts),
+                'suppliers': len(service.context.suppliers),
+                'production_lines': len(service.context.production_lines),
+                'fingerprint': context_fingerprint(service.context),
+            }
+            for name, service in self.services.items()
+        ]
+
+    async def _stats(self, body) -> Dict[str, Any]:
+        return {name: batcher.stats() for name, batcher in self.batchers.items()}
+
+    def _parse_for(self, name: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        # 오버레이 ID는 묶음에 넣기 전에 확인 (잘못된 요청 하나가 같은 묶음 전체를 실패시키지 않도록)
+        scenario = parse_scenario(body)
+        if 'overlay' in scenario:
+            check_overlay(self.services[name].context, scenario['overlay'])
+        return scenario
+
+    async def _simulate(self, body):
+        name = self._resolve(body)
+        batcher = self.batchers[name]
+        if 'scenarios' not in body:
+            return asdict(await batcher.submit(self._parse_for(name, body)))
+
+        scenarios = body['scenarios']
+        if not isinstance(scenarios, list):
+            raise ApiError(400, "'scenarios'는 시나리오 객체 배열이어야 합니다.")
+        if len(scenarios) > MAX_SCENARIOS:
+            raise ApiError(413, f"한 요청의 시나리오는 최대 {MAX_SCENARIOS}개입니다.")
+        parsed = [self._parse_for(name, s) for s in scenarios]
+        results = await asyncio.gather(*(batcher.submit(s) for s in parsed))
+        return [asdict(r) for r in results]
+
+    async def _forecast(self, body):
+        from domain.forecast_service import ForecastService
+
+        service = self.services[self._resolve(body)]
+        forecast = ForecastService(result_store=service.result_store, scope=service.scope)
+        return await self._run(
+            forecast.forecast_scenarios,
+            service.context,
+            _bounded(body, 'max_price_increase', 30.0, 0, MAX_FORECAST_PRICE_PCT),
+            _bounded(body, 'max_delay', 30, 0, MAX_DELAY_DAYS, int),
+        )
+
+    async def _risk_trend(self, body):
+        from domain.forecast_service import ForecastService
+
+        service = self.services[self._resolve(body)]
+        scenario = parse_scenario(body)
+        forecast = ForecastService(result_store=service.result_store, scope=service.scope)
+        return await self._run(
+            forecast.get_risk_trend, service.context, scenario['price_increase_pct'], scenario['delay_days']
+        )
+
+    async def _insights(self, body):
+        from domain.insights_service import InsightsService
+
+        name = self._resolve(body)
+        service = self.services[name]
+        scenario = parse_scenario(body)
+        result = await self.batchers[name].submit(scenario)
+        insights = await self._run(
+            InsightsService().generate_insights,
+            service.context, result, scenario['price_increase_pct'], scenario['delay_days']
+        )
+        return {'result': asdict(result), 'insights': [asdict(i) for i in insights]}
+
+    # --- HTTP/1.1 전송 계층 ---
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """keep-alive 연결에서 요청을 순서대로 처리한다"""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._respond(writer, 431, {'error': "요청 헤더가 너무 큽니다."}, False)
+                    break
+
+                try:
+                    request_line, *header_lines = head.decode('latin-1').rstrip('\r\n').split('\r\n')
+                    method, target, version = request_line.split(' ', 2)
+                    headers = {}
+                    for line in header_lines:
+                        key, _, value = line.partition(':')
+                        headers[key.strip().lower()] = value.strip()
+                    length = int(headers.get('content-length') or 0)
+                except ValueError:
+                    await self._respond(writer, 400, {'error': "잘못된 HTTP 요청입니다."}, False)
+                    break
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {'error': f"본문은 최대 {MAX_BODY_BYTES} bytes입니다."}, False)
+                    break
+
+                try:
+                    body = await reader.readexactly(length) if length else b''
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+
+                status, payload = await self.handle(method.upper(), target, body)
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection == 'keep-alive' if version == 'HTTP/1.0' else connection != 'close'
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int, payload: Any, keep_alive: bool):
+        body = json.dumps(payload, ensure_ascii=False, default=_json_default).encode('utf-8')
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode('latin-1') + body)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8765) -> asyncio.AbstractServer:
+        """서버를 시작한다 (port=0이면 빈 포트를 사용하며 실제 포트는 server.sockets에서 확인)"""
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+
+# --- 실행 ---
+
+def load_services(args: argparse.Namespace) -> Dict[str, SimulationService]:
+    """CLI 인자로 지정된 컨텍스트를 모두 로드한다"""
+    result_store = None
+    if args.result_store:
+        from infrastructure.result_store import SqliteScenarioResultStore
+        result_store = SqliteScenarioResultStore(args.result_store)
+
+    services: Dict[str, SimulationService] = {}
+    if args.sample or not (args.csv or args.db):
+        from infrastructure.repositories import SimulationRepository
+        services['sample'] = SimulationService(SimulationRepository().load_context(), result_store, 'sample')
+
+    for spec in args.csv:
+        from infrastructure.repositories import SimulationRepository
+        name, _, paths = spec.partition('=')
+        parts, suppliers, production = (paths.split(',') + ['', ''])[:3]
+        context = SimulationRepository().load_context_from_uploads(
+            parts_csv=parts or None, suppliers_csv=suppliers or None, production_csv=production or None
+        )
+        services[name] = SimulationService(context, result_store, name)
+
+    for spec in args.db:
+        from infrastructure.sql_repository import SqlSimulationRepository
+        name, _, url = spec.partition('=')
+        services[name] = SimulationService(SqlSimulationRepository.connect(url).load_context(), result_store, name)
+
+    return services
+
+
+async def serve(api: SimulationApi, host: str, port: int):
+    server = await api.start(host, port)
+    address = ', '.join(str(s.getsockname()) for s in server.sockets)
+    print(f"시뮬레이션 API 서버 시작: {address} (컨텍스트: {', '.join(api.services)})", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--sample', action='store_true', help='내장 샘플 데이터를 "sample" 컨텍스트로 로드')
+    parser.add_argument('--csv', action='append', default=[], metavar='NAME=PARTS[,SUPPLIERS[,PRODUCTION]]',
+                        help='CSV 파일로 컨텍스트 로드 (빈 항목은 샘플 데이터 사용, 반복 가능)')
+    parser.add_argument('--db', action='append', default=[], metavar='NAME=URL',
+                        help='sqlite:///... 또는 duckdb:///... 데이터베이스에서 컨텍스트 로드 (반복 가능)')
+    parser.add_argument('--result-store', help='예측 결과를 저장/재사용할 SQLite 파일 경로')
+    parser.add_argument('--batch-window-ms', type=float, default=2.0, help='요청 묶음 대기 시간 (0이면 묶지 않음)')
+    parser.add_argument('--max-batch', type=int, default=512)
+    parser.add_argument('--workers', type=int, default=4, help='계산 스레드 수')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    api = SimulationApi(load_services(args), args.batch_window_ms, args.max_batch, args.workers)
+    try:
+        asyncio.run(serve(api, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        api.close()
+
+
+if __name__ == '__main__':
+    main()
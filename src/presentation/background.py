@@ -0,0 +1,86 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+import streamlit as st
+
+# st.fragment가 없는 구버전 Streamlit에서는 일반 함수로 동작 (섹션 단위 부분 재실행 없음)
+_st_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+FRAGMENTS_SUPPORTED = _st_fragment is not None
+
+
+def fragment(func: Optional[Callable] = None, *, run_every: Optional[float] = None):
+    """st.fragment 호환 데코레이터 (@fragment, @fragment(run_every=0.5) 모두 지원)"""
+    def decorate(f: Callable) -> Callable:
+        if not FRAGMENTS_SUPPORTED:
+            return f
+        return _st_fragment(f, run_every=run_every) if run_every else _st_fragment(f)
+    return decorate(func) if func is not None else decorate
+
+
+class BackgroundTasks:
+    """
+    대시보드 무거운 섹션용 백그라운드 계산기
+    - 같은 키(입력값)의 작업은 한 번만 실행하고 결과를 최근 max_results개까지 보관한다.
+      실패한 작업은 보관하지 않으므로 다음 poll에서 다시 실행한다.
+    - 스레드를 만들 수 없는 환경(stlite/Pyodide 등)에서는 호출 시점에 동기 실행한다.
+    """
+
+    def __init__(self, max_workers: int = 2, max_results: int = 32):
+        self.max_results = max_results
+        self._futures: "OrderedDict[Hashable, Future]" = OrderedDict()
+        self._lock = threading.Lock()
+        try:
+            self._executor: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix='dashboard-bg'
+            )
+        except RuntimeError:
+            self._executor = None
+
+    def submit(self, key: Hashable, func: Callable, *args: Any, **kwargs: Any) -> Future:
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None:
+                self._futures.move_to_end(key)
+                return future
+
+            future = self._start(func, *args, **kwargs)
+            self._futures[key] = future
+            while len(self._futures) > self.max_results:
+                self._futures.popitem(last=False)
+            return future
+
+    def poll(self, key: Hashable, func: Callable, *args: Any, **kwargs: Any) -> Tuple[bool, Any]:
+        """작업을 (필요하면) 시작하고 (완료 여부, 결과)를 반환한다. 실패한 작업은 키를 지우고 예외를 다시 던진다."""
+        future = self.submit(key, func, *args, **kwargs)
+        if not future.done():
+            return False, None
+        if future.cancelled() or future.exception() is not None:
+            self._discard(key, future)
+        return True, future.result()
+
+    def _discard(self, key: Hashable, future: Future):
+        with self._lock:
+            # 그 사이 같은 키로 다시 제출된 작업은 지우지 않는다
+            if self._futures.get(key) is future:
+                del self._futures[key]
+
+    def done(self, key: Hashable) -> bool:
+        with self._lock:
+            future = self._futures.get(key)
+        return future is not None and future.done()
+
+    def _start(self, func: Callable, *args: Any, **kwargs: Any) -> Future:
+        if self._executor is not None:
+            try:
+                return self._executor.submit(func, *args, **kwargs)
+            except RuntimeError:
+                self._executor = None
+
+        future: Future = Future()
+        try:
+            future.set_result(func(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
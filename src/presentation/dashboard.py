@@ -1,7 +1,6 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
 
+import os
 import sys
 import importlib
 from pathlib import Path
@@ -11,13 +10,35 @@ src_path = Path(__file__).parent.parent
 sys.path.insert(0, str(src_path))
 
 # 모듈 강제 리로드 (캐싱 문제 해결용)
+# common.tracing / common.memprof는 프로세스 전역 트레이서와 리스너를 들고 있으므로 리로드하지 않는다
 modules_to_reload = [
     'domain.models',
+    'domain.lead_times',
+    'domain.interfaces',
+    'domain.tables',
+    'domain.columnar',
+    'domain.fusion',
+    'domain.overlays',
     'domain.strategies',
+    'domain.safety_stock',
+    'domain.kernels',
+    'domain.event_sim',
+    'domain.sketches',
+    'domain.monte_carlo',
+    'domain.rollup',
+    'domain.replenishment',
     'domain.insights_service',
     'domain.forecast_service',
+    'infrastructure.schema',
+    'infrastructure.validation',
     'infrastructure.repositories',
-    'application.services'
+    'infrastructure.synthetic',
+    'infrastructure.export',
+    'infrastructure.result_store',
+    'application.services',
+    'application.ingest',
+    'presentation.background',
+    'presentation.rendering'
 ]
 
 for module_name in modules_to_reload:
@@ -28,9 +49,15 @@ for module_name in modules_to_reload:
         except Exception as e:
             print(f"Failed to reload {module_name}: {e}")
 
-from infrastructure.repositories import SimulationRepository
-from application.services import SimulationService
+# pandas / plotly / 개별 서비스는 필요한 섹션에서 지연 임포트 (콜드 스타트 단축)
 from application.services import SimulationService
+from common.tracing import get_tracer, span
+from domain.columnar import context_fingerprint
+from domain.lead_times import attach_lead_time_fit
+from domain.overlays import WhatIfOverlay
+from presentation.background import FRAGMENTS_SUPPORTED, BackgroundTasks, fragment
+from presentation.frames import to_frame, trend_frame
+from presentation.rendering import DEFAULT_PAGE_SIZE, decimate_frame, heatmap_levels, page_frame
 
 # 페이지 설정
 st.set_page_config(
@@ -112,7 +139,8 @@ def load_templates():
     return {
         'parts': (templates_path / "parts_template.csv").read_text(),
         'suppliers': (templates_path / "suppliers_template.csv").read_text(),
-        'production': (templates_path / "production_template.csv").read_text()
+        'production': (templates_path / "production_template.csv").read_text(),
+        'deliveries': (templates_path / "deliveries_template.csv").read_text()
     }
 
 templates = load_templates()
@@ -121,13 +149,34 @@ templates = load_templates()
 if 'use_sample' not in st.session_state:
     st.session_state['use_sample'] = False
 
+# 성능 트레이스 (선택): 켜져 있으면 이번 rerun의 구간별 소요 시간을 수집
+# 세션(스크립트 실행 스레드) 단위로만 켜고 모으므로 동시 세션의 계측 여부 / 기록과 섞이지 않는다.
+# 백그라운드 작업 스레드(compute_in_background)의 스팬은 포함되지 않는다.
+tracer = get_tracer()
+trace_enabled = st.sidebar.toggle("⏱️ 성능 트레이스", value=False, help="이번 실행의 구간별 소요 시간을 하단에 표시합니다.")
+trace_records = tracer.begin_collect(trace_enabled)
+
+# 메모리 프로파일러 (opt-in): SCM_MEMPROF=1 환경 변수로 실행하면 단계별 메모리 리포트 표시
+# rerun마다 start / stop하면 st.rerun / st.stop / 예외로 stop이 건너뛰어져 스팬 리스너가 쌓이고
+# tracemalloc이 켜진 채 남으므로, 프로세스당 한 번만 시작하고 리포트는 프로세스 누적값으로 보여 준다.
+@st.cache_resource
+def get_memory_profiler():
+    if os.environ.get('SCM_MEMPROF', '') in ('', '0'):
+        return None
+    from common.memprof import MemoryProfiler
+    profiler = MemoryProfiler()
+    profiler.start()
+    return profiler
+
+memory_profiler = get_memory_profiler()
+
 # 사이드바 - CSV 업로드
 with st.sidebar.expander("📁 데이터 업로드", expanded=False):
     st.caption("자체 데이터로 시뮬레이션")
     
     # 템플릿 다운로드
     st.markdown("**📥 템플릿 다운로드**")
-    col1, col2, col3 = st.columns(3)
+    col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.download_button(
@@ -153,6 +202,14 @@ with st.sidebar.expander("📁 데이터 업로드", expanded=False):
             "text/csv",
             use_container_width=True
         )
+    with col4:
+        st.download_button(
+            "납품",
+            templates['deliveries'],
+            "deliveries_template.csv",
+            "text/csv",
+            use_container_width=True
+        )
     
     st.divider()
     
@@ -182,15 +239,104 @@ with st.sidebar.expander("📁 데이터 업로드", expanded=False):
             help="생산라인 정보 CSV 파일을 업로드하세요"
         )
 
-# 파일이 업로드되면 샘플 모드 해제
+        deliveries_file = st.file_uploader(
+            "납품 이력 (선택)",
+            type=['csv'],
+            key='deliveries_upload',
+            help="발주일/입고일(선택: 약속 납기일) 납품 로그로 공급사별 리드타임과 지연 확률을 추정합니다"
+        )
+
+# 사이드바 - 대규모 합성 데이터 (부하/스케일 데모)
+SYNTHETIC_SIZES = {"1천": 1_000, "1만": 10_000, "10만": 100_000, "100만": 1_000_000}
+
+with st.sidebar.expander("🧪 합성 데이터 (대규모 데모)", expanded=False):
+    st.caption("실제 규모와 비슷한 분포의 가상 데이터를 생성합니다.")
+    synthetic_size = st.selectbox("부품 수", list(SYNTHETIC_SIZES), index=2, key="synthetic_size")
+    synthetic_seed = st.number_input("시드", min_value=0, value=0, step=1, key="synthetic_seed")
+    if st.button("합성 데이터 생성", use_container_width=True):
+        st.session_state['synthetic'] = (SYNTHETIC_SIZES[synthetic_size], int(synthetic_seed))
+        st.session_state['use_sample'] = False
+
+# 파일이 업로드되면 샘플/합성 데이터 모드 해제
 if parts_file or suppliers_file or production_file:
     st.session_state['use_sample'] = False
+    st.session_state['synthetic'] = None
+elif st.session_state.get('use_sample', False):
+    st.session_state['synthetic'] = None
+
+# 시나리오 결과 저장소: 파일로 영구 보관해 서버를 재시작해도 결과를 다시 계산하지 않는다
+# (경로는 SCM_RESULT_STORE로 바꿀 수 있고, ':memory:'는 테스트용)
+RESULT_STORE_PATH = Path(__file__).parent.parent.parent / 'data' / 'scenario_results.sqlite'
+
+
+@st.cache_resource
+def get_result_store():
+    from infrastructure.result_store import SqliteScenarioResultStore
+
+    path = os.environ.get('SCM_RESULT_STORE', str(RESULT_STORE_PATH))
+    if path != ':memory:':
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+    return SqliteScenarioResultStore(path)
+
+result_store = get_result_store()
+
+# 감시 폴더 수집 (선택): SCM_WATCH_DIR가 있으면 백그라운드 스레드가 새 CSV를 읽고 사전 집계까지 만든 뒤
+# 모든 세션이 공유하는 컨텍스트를 한 번에 교체한다 (SCM_WATCH_INTERVAL: 폴링 간격 초)
+@st.cache_resource
+def get_folder_ingest():
+    watch_dir = os.environ.get('SCM_WATCH_DIR')
+    if not watch_dir:
+        return None
+    from application.ingest import FolderIngestService
+
+    interval = float(os.environ.get('SCM_WATCH_INTERVAL', '30'))
+    return FolderIngestService(watch_dir, result_store=result_store, poll_interval_s=interval).start()
+
+folder_ingest = get_folder_ingest()
+# 이번 실행 동안 쓸 스냅샷을 한 번만 읽는다 (실행 도중 교체되어도 섞이지 않음)
+watch_snapshot = folder_ingest.holder.current() if folder_ingest is not None else None
+
+
+@fragment(run_every=5)
+def watch_for_new_context(version):
+    """감시 폴더에서 새 컨텍스트가 교체되면 앱을 다시 실행"""
+    snapshot = folder_ingest.holder.current()
+    if snapshot is not None and snapshot.version != version:
+        st.rerun()
+
+
+if folder_ingest is not None:
+    with st.sidebar.expander("📂 감시 폴더", expanded=False):
+        st.caption(str(folder_ingest.directory))
+        if watch_snapshot is not None:
+            from datetime import datetime
+
+            loaded_at = datetime.fromtimestamp(watch_snapshot.loaded_at).strftime('%Y-%m-%d %H:%M:%S')
+            st.markdown(f"버전 **{watch_snapshot.version}** · {loaded_at} ({watch_snapshot.load_seconds:.1f}s)")
+            st.caption(", ".join(name for _, name, _, _ in watch_snapshot.signature))
+        else:
+            st.caption("아직 로드된 파일이 없습니다 (parts*.csv, suppliers*.csv, production*.csv).")
+        if folder_ingest.last_error:
+            st.error(f"최근 파일 로드 실패 (기존 데이터 유지): {folder_ingest.last_error}")
 
 # 데이터 로드 (DI: Dependency Injection 유사 패턴)
 # 데이터 로드 (DI: Dependency Injection 유사 패턴)
 # @st.cache_data 제거: 파일 업로드 스트림 이슈 방지 및 즉각적인 반응성 확보
 def get_simulation_service(_parts_file=None, _suppliers_file=None, _production_file=None):
+    # CSV 파싱에 pandas가 필요하므로 데이터를 실제로 로드할 때 임포트
+    from infrastructure.repositories import SimulationRepository
+
     repo = SimulationRepository()
+    # 저장 결과 조회 범위 라벨 (업로드 부품 파일명 또는 샘플)
+    synthetic = st.session_state.get('synthetic')
+    if _parts_file:
+        scope = _parts_file.name
+    elif _suppliers_file or _production_file:
+        scope = 'upload'
+    elif synthetic:
+        scope = f'synthetic-{synthetic[0]}-seed{synthetic[1]}'
+    else:
+        scope = 'sample'
     
     try:
         # 1. 업로드된 파일이 하나라도 있으면 업로드 로드 시도
@@ -200,18 +346,35 @@ def get_simulation_service(_parts_file=None, _suppliers_file=None, _production_f
                 suppliers_csv=_suppliers_file,
                 production_csv=_production_file
             )
-            return SimulationService(context)
+            return SimulationService(context, result_store=result_store, scope=scope)
             
         # 2. 샘플 데이터 사용 모드이면 Mock 데이터 로드
         elif st.session_state.get('use_sample', False):
             context = repo.load_context()
-            return SimulationService(context)
+            return SimulationService(context, result_store=result_store, scope=scope)
             
-        # 3. 그 외의 경우 (데이터 없음)
+        # 3. 합성 데이터 모드
+        elif synthetic:
+            with st.spinner(f"합성 데이터 {synthetic[0]:,}개 부품 생성 중..."):
+                context = repo.load_synthetic_context(*synthetic)
+            return SimulationService(context, result_store=result_store, scope=scope)
+
+        # 4. 그 외의 경우 (데이터 없음)
         else:
             return None
             
     except Exception as e:
+        errors = getattr(e, 'errors', None)  # infrastructure.validation.DataValidationError
+        if errors is not None:
+            st.error(f"❌ 업로드 데이터에서 오류 {len(errors):,}건이 발견되었습니다. 아래 표의 행을 수정한 뒤 다시 업로드해주세요.")
+            st.dataframe(errors.head(1000), use_container_width=True, hide_index=True)
+            st.download_button(
+                "📥 전체 오류 목록 (CSV)",
+                errors.to_csv(index=False).encode('utf-8-sig'),
+                "validation_errors.csv",
+                "text/csv"
+            )
+            return None
         st.error(f"❌ 데이터 처리 중 오류가 발생했습니다: {e}")
         # 디버깅 도움말
         with st.expander("🛠️ 상세 오류 정보"):
@@ -230,11 +393,39 @@ if parts_file or suppliers_file or production_file:
     
     st.sidebar.success(f"✅ 데이터 로드 완료: {', '.join(uploaded_files)}")
 
-service = get_simulation_service(parts_file, suppliers_file, production_file)
+# 같은 데이터 소스면 세션에 보관한 서비스를 재사용 (슬라이더 조작 시 CSV 재파싱 방지)
+if parts_file or suppliers_file or production_file:
+    data_source = tuple(getattr(f, 'file_id', None) or (f and f.name) for f in (parts_file, suppliers_file, production_file))
+elif st.session_state.get('use_sample', False):
+    data_source = 'sample'
+elif st.session_state.get('synthetic'):
+    data_source = ('synthetic',) + tuple(st.session_state['synthetic'])
+elif watch_snapshot is not None:
+    data_source = ('watch', watch_snapshot.version)
+else:
+    data_source = None
+
+watching = watch_snapshot is not None and data_source == ('watch', watch_snapshot.version)
+cached_service = st.session_state.get('simulation_service')
+if data_source is not None and cached_service is not None and cached_service[0] == data_source:
+    service = cached_service[1]
+elif watching:
+    # 감시 폴더 컨텍스트는 이미 백그라운드에서 로드/사전 집계가 끝난 서비스를 그대로 사용
+    service = watch_snapshot.service
+else:
+    service = get_simulation_service(parts_file, suppliers_file, production_file)
+    if service is not None:
+        st.session_state['simulation_service'] = (data_source, service)
+
+# 감시 폴더 데이터를 보고 있거나 기다리는 중이면 새 버전이 교체될 때 자동으로 다시 실행
+if folder_ingest is not None and (data_source is None or watching):
+    watch_for_new_context(watch_snapshot.version if watch_snapshot is not None else None)
 
 # --- Empty State 처리 ---
 if service is None:
     st.info("👈 왼쪽 사이드바에서 CSV 파일을 업로드하여 분석을 시작하세요.")
+    if folder_ingest is not None:
+        st.caption(f"📂 감시 폴더({folder_ingest.directory})에 새 파일이 들어오면 자동으로 표시됩니다.")
     
     col1, col2 = st.columns([1, 2])
     with col1:
@@ -257,6 +448,38 @@ if service is None:
 # 하지만 순수하게 하기 위해 서비스나 리포지토리에서 DF 변환 메서드를 제공하는 것이 좋음.
 context = service.context
 
+# 납품 이력 (선택): 공급사별 리드타임 분포 / 지연 확률을 추정해 컨텍스트에 붙인다 (같은 파일이면 세션에 보관한 결과 재사용)
+# 감시 폴더 컨텍스트는 모든 세션이 공유하므로 세션별 납품 이력을 붙이지 않는다.
+lead_time_fit = None
+if deliveries_file and watching:
+    st.sidebar.info("감시 폴더 데이터에는 업로드한 납품 이력을 적용하지 않습니다.")
+elif deliveries_file:
+    fit_source = (data_source, getattr(deliveries_file, 'file_id', None) or deliveries_file.name)
+    cached_fit = st.session_state.get('lead_time_fit')
+    if cached_fit is not None and cached_fit[0] == fit_source:
+        lead_time_fit = cached_fit[1]
+    else:
+        from infrastructure.repositories import SimulationRepository
+
+        try:
+            with st.spinner("납품 이력으로 리드타임 분포 추정 중..."):
+                lead_time_fit = SimulationRepository().fit_lead_times(deliveries_file, context)
+            st.session_state['lead_time_fit'] = (fit_source, lead_time_fit)
+        except Exception as e:
+            st.sidebar.error(f"❌ 납품 이력을 읽지 못했습니다 (기존 리스크 점수 사용): {e}")
+if not watching:
+    attach_lead_time_fit(context, lead_time_fit)
+
+if lead_time_fit is not None:
+    with st.sidebar.expander("⏱️ 리드타임 추정 결과", expanded=False):
+        st.caption(
+            f"납품 {lead_time_fit.rows - lead_time_fit.skipped_rows:,}건 사용 (건너뜀 {lead_time_fit.skipped_rows:,}건), "
+            f"추정값 적용 공급사 {int(lead_time_fit.fitted.sum()):,} / {len(lead_time_fit.supplier_ids):,}"
+        )
+        if lead_time_fit.delay_scenarios:
+            st.caption("지연 분포: " + ", ".join(f"{d:g}일 {p:.0%}" for d, p in lead_time_fit.delay_scenarios))
+        st.dataframe(to_frame(lead_time_fit.to_records()), use_container_width=True, hide_index=True)
+
 
 # 사이드바
 st.sidebar.header("🎛️ What-If 시나리오 시뮬레이션")
@@ -280,8 +503,62 @@ supplier_delay = st.sidebar.slider(
     step=1
 )
 
+# 통화/국가 정보가 있는 공급사가 있으면 환율·관세 시나리오 제공
+currencies = sorted({s.currency for s in context.suppliers if s.currency})
+countries = sorted({s.country for s in context.suppliers if s.country})
+currency_shocks = {}
+tariffs = {}
+
+if currencies or countries:
+    with st.sidebar.expander("💱 환율 · 관세 시나리오", expanded=False):
+        for currency in currencies:
+            currency_shocks[currency] = st.slider(
+                f"{currency} 환율 변동 (%)", -30.0, 30.0, 0.0, 1.0, key=f"fx_{currency}"
+            )
+        for country in countries:
+            tariffs[country] = st.slider(
+                f"{country} 관세율 (%)", 0.0, 50.0, 0.0, 1.0, key=f"tariff_{country}"
+            )
+
+# 공급사/부품 개별 조정 (전역 변화율/지연 위에 겹치는 what-if 오버레이)
+overlay = WhatIfOverlay()
+with st.sidebar.expander("🎯 공급사 · 부품 개별 조정", expanded=False):
+    supplier_names = {s.id: f"{s.id} ({s.name})" for s in context.suppliers}
+    edited_suppliers = st.multiselect(
+        "조정할 공급사", list(supplier_names), format_func=supplier_names.get, key="overlay_suppliers"
+    )
+    for supplier_id in edited_suppliers:
+        col_price, col_delay = st.columns(2)
+        price_pct = col_price.number_input(
+            f"{supplier_id} 단가 (%)", -50.0, 100.0, float(price_increase), 1.0, key=f"overlay_price_{supplier_id}"
+        )
+        delay = col_delay.number_input(
+            f"{supplier_id} 지연 (일)", 0, 60, int(supplier_delay), 1, key=f"overlay_delay_{supplier_id}"
+        )
+        overlay = overlay.with_supplier(supplier_id, price_pct=price_pct, delay_days=delay)
+
+    part_edits = st.text_area(
+        "부품별 단가 변화율 (한 줄에 '부품ID=%')", "", key="overlay_parts",
+        help="예: P1=15 (공급사 조정보다 우선 적용)"
+    )
+    for line in part_edits.splitlines():
+        part_id, _, pct = line.partition('=')
+        if not part_id.strip():
+            continue
+        try:
+            overlay = overlay.with_part(part_id.strip(), float(pct))
+        except ValueError:
+            st.warning(f"형식이 올바르지 않은 줄입니다: {line}")
+    if overlay:
+        st.caption(f"개별 조정 {len(overlay)}건 적용 중")
+
 # 시뮬레이션 실행 (어플리케이션 서비스 호출)
-result = service.run_simulation(price_increase, supplier_delay)
+try:
+    result = service.run_simulation(price_increase, supplier_delay, currency_shocks, tariffs, overlay=overlay)
+except ValueError as e:
+    # 없는 부품/공급사 ID 등 개별 조정 오류는 조정 없이 계산
+    st.sidebar.error(f"개별 조정 오류: {e}")
+    result = service.run_simulation(price_increase, supplier_delay, currency_shocks, tariffs)
 
 # --- KPI 출력 (기존 로직 유지하되 Service Result 사용) ---
 st.markdown("---")
@@ -319,175 +596,557 @@ if supplier_delay > 15 or result.profit_delta < -100000: # 임의의 임계값
 col3.markdown(f"**리스크 레벨 (Risk Level)**")
 col3.markdown(f"<h2 style='color: {risk_color};'>{risk_status}</h2>", unsafe_allow_html=True)
 
+# --- 지연 계산 섹션 공통 ---
+# 각 분석 섹션은 독립적으로 재실행되는 fragment이며, 토글이 켜진 섹션만 계산한다.
+# 무거운 계산은 백그라운드 스레드에서 수행하고 그동안 자리표시자를 보여준다.
+@st.cache_resource
+def get_background_tasks():
+    return BackgroundTasks()
+
+background = get_background_tasks()
+context_key = context_fingerprint(context)
+
+
+@fragment(run_every=0.5)
+def wait_for_background(key):
+    """백그라운드 작업이 끝나면 앱을 다시 실행해 결과를 표시"""
+    if background.done(key):
+        st.rerun()
+
+
+def compute_in_background(key, func, *args):
+    """결과가 준비되었으면 반환하고, 아니면 자리표시자를 표시한 뒤 None 반환"""
+    done, value = background.poll(key, func, *args)
+    if done:
+        return value
+    if not FRAGMENTS_SUPPORTED:
+        return background.submit(key, func, *args).result()
+
+    st.info("⏳ 계산 중입니다... 완료되면 자동으로 표시됩니다.")
+    wait_for_background(key)
+    return None
+
+
+def section_toggle(label, key, default=False):
+    return st.toggle(label, value=default, key=key)
+
+
+def paged_dataframe(df, key, page_size=DEFAULT_PAGE_SIZE, **kwargs):
+    """큰 표는 현재 페이지 행만 브라우저로 보낸다 (전체는 다운로드로 제공)"""
+    if len(df) <= page_size:
+        st.dataframe(df, use_container_width=True, **kwargs)
+        return
+    n_pages = -(-len(df) // page_size)
+    page = st.number_input(f"페이지 (총 {n_pages:,})", min_value=1, max_value=n_pages, value=1, step=1, key=f"{key}_page")
+    rows, _ = page_frame(df, page, page_size)
+    st.dataframe(rows, use_container_width=True, **kwargs)
+    start = (page - 1) * page_size
+    st.caption(f"{start + 1:,}–{start + len(rows):,}행 / 전체 {len(df):,}행")
+
+
 # --- AI 인사이트 섹션 ---
 st.markdown("---")
 st.subheader("🤖 AI 비즈니스 인사이트")
 
-# 인사이트 서비스 로드
-from domain.insights_service import InsightsService
+@fragment
+def insights_section(context, result, price_increase, supplier_delay):
+    if not section_toggle("인사이트 표시", "show_insights", default=True):
+        return
 
-insights_service = InsightsService()
-insights = insights_service.generate_insights(context, result, price_increase, supplier_delay)
+    # 인사이트 서비스 로드
+    from domain.insights_service import InsightsService
 
-if insights:
-    # 인사이트를 타입별로 그룹화
-    warnings = [i for i in insights if i.type == "warning"]
-    recommendations = [i for i in insights if i.type == "recommendation"]
-    infos = [i for i in insights if i.type == "info"]
-    
-    # Tabs로 구분하여 표시
-    tab1, tab2, tab3 = st.tabs(["⚠️ 경고", "💡 권장사항", "📊 정보"])
-    
-    with tab1:
-        if warnings:
-            for insight in warnings:
-                with st.expander(insight.title, expanded=True):
-                    st.markdown(insight.message)
-        else:
-            st.success("현재 심각한 경고 사항이 없습니다.")
-    
-    with tab2:
-        if recommendations:
-            for insight in recommendations:
-                with st.expander(insight.title, expanded=False):
-                    st.markdown(insight.message)
-        else:
-            st.info("현재 특별한 권장사항이 없습니다.")
-    
-    with tab3:
-        if infos:
-            for insight in infos:
-                with st.expander(insight.title, expanded=False):
-                    st.markdown(insight.message)
-        else:
-            st.info("추가 정보가 없습니다.")
-else:
-    st.success("✅ 현재 공급망 상태가 안정적입니다. 리스크 없음.")
+    insights_service = InsightsService()
+    insights = insights_service.generate_insights(context, result, price_increase, supplier_delay)
+
+    if insights:
+        # 인사이트를 타입별로 그룹화
+        warnings = [i for i in insights if i.type == "warning"]
+        recommendations = [i for i in insights if i.type == "recommendation"]
+        infos = [i for i in insights if i.type == "info"]
+        
+        # Tabs로 구분하여 표시
+        tab1, tab2, tab3 = st.tabs(["⚠️ 경고", "💡 권장사항", "📊 정보"])
+        
+        with tab1:
+            if warnings:
+                for insight in warnings:
+                    with st.expander(insight.title, expanded=True):
+                        st.markdown(insight.message)
+            else:
+                st.success("현재 심각한 경고 사항이 없습니다.")
+        
+        with tab2:
+            if recommendations:
+                for insight in recommendations:
+                    with st.expander(insight.title, expanded=False):
+                        st.markdown(insight.message)
+            else:
+                st.info("현재 특별한 권장사항이 없습니다.")
+        
+        with tab3:
+            if infos:
+                for insight in infos:
+                    with st.expander(insight.title, expanded=False):
+                        st.markdown(insight.message)
+            else:
+                st.info("추가 정보가 없습니다.")
+    else:
+        st.success("✅ 현재 공급망 상태가 안정적입니다. 리스크 없음.")
+
+insights_section(context, result, price_increase, supplier_delay)
+
+# --- 드릴다운 섹션 ---
+st.markdown("---")
+st.subheader("🔎 공급사 · 라인 · 분류별 드릴다운")
+
+@fragment
+def drill_down_section(service, price_increase, supplier_delay):
+    if not section_toggle("드릴다운 표시", "show_drill_down"):
+        return
+
+    dimension_labels = {'supplier': '공급사', 'line': '생산라인', 'category': '부품분류'}
+    drill_col1, drill_col2 = st.columns([1, 2])
+    with drill_col1:
+        drill_by = st.selectbox(
+            "집계 기준",
+            list(dimension_labels),
+            format_func=lambda d: dimension_labels[d]
+        )
+    with drill_col2:
+        filter_dims = [d for d in dimension_labels if d != drill_by]
+        drill_filters = {}
+        filter_cols = st.columns(len(filter_dims))
+        for filter_col, dim in zip(filter_cols, filter_dims):
+            options = ["전체"] + [r[dim] for r in service.cube.query(by=(dim,)).to_records()]
+            selected = filter_col.selectbox(f"{dimension_labels[dim]} 필터", options, key=f"drill_{dim}")
+            if selected != "전체":
+                drill_filters[dim] = selected
+
+    drill_df = to_frame(service.drill_down(price_increase, supplier_delay, [drill_by], **drill_filters))
+    paged_dataframe(drill_df, 'drill_table')
+
+drill_down_section(service, price_increase, supplier_delay)
+
+# --- 안전재고 예산 배분 섹션 ---
+st.markdown("---")
+st.subheader("🛡️ 안전재고 예산 배분 최적화")
+st.caption("공급사 리스크 기반 지연 시나리오에서 기대 결품량이 최소가 되도록 조달 예산을 부품별로 배분합니다.")
+
+@fragment
+def safety_stock_section(service):
+    if not section_toggle("배분 최적화 실행", "show_safety_stock"):
+        return
+
+    monthly_spend = service.cube.total()['monthly_spend']
+    safety_budget = st.number_input(
+        "추가 재고 조달 예산 ($)",
+        min_value=0.0,
+        value=float(round(monthly_spend * 0.1, -2)),
+        step=1000.0,
+        help="기본값은 월간 원자재 구매액의 10%입니다."
+    )
+
+    plan = compute_in_background(
+        ('safety_stock', context_key, safety_budget), service.optimize_safety_stock, safety_budget
+    )
+    if plan is None:
+        return
+    plan_df = to_frame(plan.to_records())
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("배분 금액", f"${plan.total_cost:,.0f}")
+    col2.metric("기대 결품량 (현재)", f"{plan.expected_shortage_before:,.0f} units")
+    col3.metric(
+        "기대 결품량 (배분 후)",
+        f"{plan.expected_shortage_after:,.0f} units",
+        delta=f"{plan.expected_shortage_after - plan.expected_shortage_before:,.0f}",
+        delta_color="inverse"
+    )
+
+    if plan_df.empty:
+        st.info("예산이 없거나 추가 재고로 줄일 수 있는 결품 리스크가 없습니다.")
+    else:
+        paged_dataframe(plan_df, 'safety_stock_table', page_size=50)
+        st.download_button(
+            "📥 배분표 다운로드 (CSV)",
+            plan_df.to_csv(index=False),
+            "safety_stock_allocation.csv",
+            "text/csv"
+        )
+
+safety_stock_section(service)
+
+# --- 재발주 정책 최적화 섹션 ---
+st.markdown("---")
+st.subheader("🔁 재발주 정책 최적화")
+st.caption("공급사 리드타임과 지연 리스크로 부품별 (s, S) / (R, S) 정책 후보를 평가해 비용이 가장 낮은 정책을 찾습니다.")
+
+@fragment
+def reorder_policy_section(service):
+    if not section_toggle("정책 스윕 실행", "show_reorder_policy"):
+        return
+
+    policy_col1, policy_col2 = st.columns(2)
+    with policy_col1:
+        policy_kind = st.radio(
+            "정책 종류",
+            ['sS', 'RS'],
+            format_func=lambda k: "(s, S) 연속 검토" if k == 'sS' else "(R, S) 주기 검토",
+            horizontal=True,
+            key="reorder_kind"
+        )
+    with policy_col2:
+        target_pct = st.slider(
+            "목표 fill rate (%)", 0, 100, 0, step=1, key="reorder_target",
+            help="0이면 목표 없이 비용(발주 + 보유 + 결품)이 최소인 정책을 고릅니다."
+        )
+    target_fill_rate = target_pct / 100 if target_pct > 0 else None
+
+    plan = compute_in_background(
+        ('reorder_policy', context_key, policy_kind, target_fill_rate),
+        service.optimize_reorder_policy, policy_kind, target_fill_rate
+    )
+    if plan is None:
+        return
+    plan_df = to_frame(plan.to_records())
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("일평균 비용 (현재 기준 정책)", f"${plan.total_baseline_cost:,.0f}")
+    col2.metric(
+        "일평균 비용 (최적 정책)",
+        f"${plan.total_daily_cost:,.0f}",
+        delta=f"{plan.total_daily_cost - plan.total_baseline_cost:,.0f}",
+        delta_color="inverse"
+    )
+    col3.metric("목표 달성 부품", f"{plan.meets_target.mean():.1%}")
+
+    paged_dataframe(plan_df, 'reorder_policy_table', page_size=50)
+    st.download_button(
+        "📥 정책표 다운로드 (CSV)",
+        plan_df.to_csv(index=False),
+        f"reorder_policy_{policy_kind}.csv",
+        "text/csv"
+    )
+
+reorder_policy_section(service)
 
 # --- 예측 및 트렌드 섹션 ---
 st.markdown("---")
 st.subheader("📈 예측 및 트렌드 분석")
 
-from domain.forecast_service import ForecastService
+@fragment
+def forecast_section(context, price_increase, supplier_delay):
+    # 선택한 보기만 계산 (탭은 숨겨진 탭까지 모두 실행되므로 라디오로 전환)
+    forecast_view = st.radio(
+        "예측 보기",
+        ["숨기기", "가격 상승 시나리오", "공급 지연 시나리오", "향후 30일 예측", "가격 × 지연 히트맵", "확률 분포"],
+        horizontal=True,
+        key="forecast_view",
+        label_visibility="collapsed"
+    )
+    if forecast_view == "숨기기":
+        return
 
-forecast_service = ForecastService()
+    # 차트를 그릴 때만 plotly와 예측 서비스 로드
+    import plotly.express as px
+    from domain.forecast_service import ForecastService
 
-# 예측 탭
-forecast_tab1, forecast_tab2, forecast_tab3 = st.tabs(
-    ["가격 상승 시나리오", "공급 지연 시나리오", "향후 30일 예측"]
-)
+    forecast_service = ForecastService(result_store=result_store, scope=service.scope)
 
-with forecast_tab1:
-    st.markdown("**원자재 가격 상승률에 따른 영업이익 영향 예측**")
-    forecasts = forecast_service.forecast_scenarios(context)
-    price_df = forecasts['price_scenarios']
+    if forecast_view in ("가격 상승 시나리오", "공급 지연 시나리오"):
+        # 시나리오 스윕은 슬라이더와 무관하므로 컨텍스트별로 한 번만 계산
+        forecasts = compute_in_background(('forecast', context_key), forecast_service.forecast_scenarios, context)
+        if forecasts is None:
+            return
+
+    if forecast_view == "가격 상승 시나리오":
+        st.markdown("**원자재 가격 상승률에 따른 영업이익 영향 예측**")
+        price_df = to_frame(forecasts['price_scenarios'])
     
-    fig_price = px.line(
-        price_df,
-        x='price_increase_pct',
-        y='profit_delta',
-        title='가격 상승률별 영업이익 변화 예측',
-        labels={
-            'price_increase_pct': '가격 상승률 (%)',
-            'profit_delta': '영업이익 변화 ($)'
-        },
-        markers=True,
-        template='plotly_dark'
-    )
+        with span('render.price_chart'):
+            fig_price = px.line(
+                decimate_frame(price_df, 'price_increase_pct', ['profit_delta']),
+                x='price_increase_pct',
+                y='profit_delta',
+                title='가격 상승률별 영업이익 변화 예측',
+                labels={
+                    'price_increase_pct': '가격 상승률 (%)',
+                    'profit_delta': '영업이익 변화 ($)'
+                },
+                markers=True,
+                template='plotly_dark'
+            )
     
-    # 테마별 색상 적용
-    line_col = '#00E5FF'
-    fig_price.update_traces(line_color=line_col, marker_color=line_col)
+            # 테마별 색상 적용
+            line_col = '#00E5FF'
+            fig_price.update_traces(line_color=line_col, marker_color=line_col)
     
-    fig_price.add_hline(y=0, line_dash="dash", line_color="gray", annotation_text="손익분기점")
-    fig_price.add_hline(y=-100000, line_dash="dash", line_color="red", annotation_text="위험 임계값")
-    st.plotly_chart(fig_price, use_container_width=True)
+            fig_price.add_hline(y=0, line_dash="dash", line_color="gray", annotation_text="손익분기점")
+            fig_price.add_hline(y=-100000, line_dash="dash", line_color="red", annotation_text="위험 임계값")
+            st.plotly_chart(fig_price, use_container_width=True)
     
-    # 데이터 테이블
-    with st.expander("📊 상세 데이터 보기"):
-        st.dataframe(price_df, use_container_width=True)
+        # 데이터 테이블
+        with st.expander("📊 상세 데이터 보기"):
+            paged_dataframe(price_df, 'price_table')
 
-with forecast_tab2:
-    st.markdown("**공급 지연 일수에 따른 생산 손실 예측**")
-    delay_df = forecasts['delay_scenarios']
+    elif forecast_view == "공급 지연 시나리오":
+        st.markdown("**공급 지연 일수에 따른 생산 손실 예측**")
+        delay_df = to_frame(forecasts['delay_scenarios'])
     
-    fig_delay = px.line(
-        delay_df,
-        x='delay_days',
-        y='production_loss',
-        title='지연 일수별 생산 손실 예측',
-        labels={
-            'delay_days': '지연 일수 (일)',
-            'production_loss': '생산 손실 (units)'
-        },
-        markers=True,
-        template='plotly_dark'
-    )
+        with span('render.delay_chart'):
+            fig_delay = px.line(
+                decimate_frame(delay_df, 'delay_days', ['production_loss']),
+                x='delay_days',
+                y='production_loss',
+                title='지연 일수별 생산 손실 예측',
+                labels={
+                    'delay_days': '지연 일수 (일)',
+                    'production_loss': '생산 손실 (units)'
+                },
+                markers=True,
+                template='plotly_dark'
+            )
     
-    # 테마별 색상 적용 (Delay는 빨간 계열 유지)
-    line_col = '#FF2B7D'
-    fig_delay.update_traces(line_color=line_col, marker_color=line_col)
+            # 테마별 색상 적용 (Delay는 빨간 계열 유지)
+            line_col = '#FF2B7D'
+            fig_delay.update_traces(line_color=line_col, marker_color=line_col)
     
-    fig_delay.add_hline(y=500, line_dash="dash", line_color="orange", annotation_text="주의 임계값")
-    fig_delay.add_hline(y=1000, line_dash="dash", line_color="red", annotation_text="위험 임계값")
-    st.plotly_chart(fig_delay, use_container_width=True)
+            fig_delay.add_hline(y=500, line_dash="dash", line_color="orange", annotation_text="주의 임계값")
+            fig_delay.add_hline(y=1000, line_dash="dash", line_color="red", annotation_text="위험 임계값")
+            st.plotly_chart(fig_delay, use_container_width=True)
     
-    # 데이터 테이블
-    with st.expander("📊 상세 데이터 보기"):
-        st.dataframe(delay_df, use_container_width=True)
+        # 데이터 테이블
+        with st.expander("📊 상세 데이터 보기"):
+            paged_dataframe(delay_df, 'delay_table')
 
-with forecast_tab3:
-    st.markdown("**현재 추세가 계속될 경우 향후 30일 예측**")
+    elif forecast_view == "향후 30일 예측":
+        st.markdown("**현재 추세가 계속될 경우 향후 30일 예측**")
     
-    if price_increase > 0 or supplier_delay > 0:
-        trend_data = forecast_service.get_risk_trend(context, price_increase, supplier_delay)
-        trend_df = trend_data['trend_data']
+        if price_increase > 0 or supplier_delay > 0:
+            trend_data = compute_in_background(
+                ('trend', context_key, price_increase, supplier_delay),
+                forecast_service.get_risk_trend, context, price_increase, supplier_delay
+            )
+            if trend_data is None:
+                return
+            trend_df = trend_frame(trend_data)
+            trend_chart_df = decimate_frame(trend_df, 'day', ['predicted_profit_delta', 'predicted_production_loss'])
         
-        # 이중 축 차트
-        fig_trend = px.line(
-            trend_df,
-            x='day',
-            y='predicted_profit_delta',
-            title='향후 30일 리스크 트렌드 예측',
-            labels={
-                'day': '일수 (Days)',
-                'predicted_profit_delta': '예상 영업이익 변화 ($)'
-            },
-            markers=True,
-            template='plotly_dark'
-        )
+            # 이중 축 차트
+            with span('render.trend_chart'):
+                fig_trend = px.line(
+                    trend_chart_df,
+                    x='day',
+                    y='predicted_profit_delta',
+                    title='향후 30일 리스크 트렌드 예측',
+                    labels={
+                        'day': '일수 (Days)',
+                        'predicted_profit_delta': '예상 영업이익 변화 ($)'
+                    },
+                    markers=True,
+                    template='plotly_dark'
+                )
         
-        # 테마별 색상 적용
-        line_col = '#00E5FF'
-        fig_trend.update_traces(line_color=line_col, name='예상 영업이익')
+                # 테마별 색상 적용
+                line_col = '#00E5FF'
+                fig_trend.update_traces(line_color=line_col, name='예상 영업이익')
         
-        # 생산 손실도 추가 (보조 축)
-        fig_trend.add_scatter(
-            x=trend_df['day'],
-            y=trend_df['predicted_production_loss'],
-            mode='lines+markers',
-            name='예상 생산 손실 (units)',
-            yaxis='y2'
-        )
+                # 생산 손실도 추가 (보조 축)
+                fig_trend.add_scatter(
+                    x=trend_chart_df['day'],
+                    y=trend_chart_df['predicted_production_loss'],
+                    mode='lines+markers',
+                    name='예상 생산 손실 (units)',
+                    yaxis='y2'
+                )
         
-        fig_trend.update_layout(
-            yaxis2=dict(
-                title='예상 생산 손실 (units)',
-                overlaying='y',
-                side='right'
-            )
-        )
+                fig_trend.update_layout(
+                    yaxis2=dict(
+                        title='예상 생산 손실 (units)',
+                        overlaying='y',
+                        side='right'
+                    )
+                )
         
-        st.plotly_chart(fig_trend, use_container_width=True)
+                st.plotly_chart(fig_trend, use_container_width=True)
         
-        # 경고 메시지
-        st.warning(trend_data['warning'])
+            # 경고 메시지
+            st.warning(trend_data['warning'])
         
-        # 상세 데이터
-        with st.expander("📊 상세 예측 데이터 보기"):
-            st.dataframe(trend_df, use_container_width=True)
+            # 상세 데이터
+            with st.expander("📊 상세 예측 데이터 보기"):
+                paged_dataframe(trend_df, 'trend_table')
+        else:
+            st.info("시뮬레이션 변수를 조절하면 향후 트렌드 예측이 표시됩니다.")
+
+    elif forecast_view == "가격 × 지연 히트맵":
+        st.markdown("**가격 변화율 × 지연 일수 조합별 총 영향 (영업이익 변화 + 생산 손실 환산)**")
+        resolution = st.select_slider("가격 축 간격 (%p)", options=[5.0, 1.0, 0.5, 0.1], value=1.0, key="grid_step")
+        grid = compute_in_background(
+            ('forecast_grid', context_key, resolution), forecast_service.forecast_grid, context, 30.0, 30, resolution, 1
+        )
+        if grid is None:
+            return
+
+        import plotly.graph_objects as go
+
+        # 거친 격자를 먼저 그리고 같은 자리에 점점 세밀한 격자로 교체 (긴 축 최대 300칸)
+        placeholder = st.empty()
+        with span('render.heatmap'):
+            for x, y, z in heatmap_levels(grid['price_increase_pct'], grid['delay_days'], grid['total_impact'], first_cells=32, max_cells=300):
+                fig_grid = go.Figure(go.Heatmap(
+                    x=x, y=y, z=z, colorscale='RdYlGn', colorbar=dict(title='총 영향 ($)'),
+                    hovertemplate='가격 %{x:.1f}%<br>지연 %{y:.0f}일<br>총 영향 $%{z:,.0f}<extra></extra>'
+                ))
+                fig_grid.update_layout(
+                    template='plotly_dark', xaxis_title='가격 변화율 (%)', yaxis_title='지연 일수 (일)',
+                    title=f'가격 × 지연 총 영향 ({len(x)} × {len(y)})'
+                )
+                placeholder.plotly_chart(fig_grid, use_container_width=True)
+        st.caption(f"격자 {len(grid['price_increase_pct']):,} × {len(grid['delay_days']):,} (화면에는 블록 평균으로 축소해 표시)")
+
+    elif forecast_view == "확률 분포":
+        st.markdown("**가격 변동(평균 = 현재 가격 변화율, 표준편차 5%p)과 공급사별 지연 확률을 반영한 KPI 분포**")
+        distribution = compute_in_background(
+            ('distribution', context_key, price_increase),
+            forecast_service.forecast_distribution, context, price_increase
+        )
+        if distribution is None:
+            return
+
+        labels = {'profit_loss': '영업이익 감소 ($)', 'production_loss': '생산 손실 (units)', 'total_loss': '총 손실 ($)'}
+        distribution_df = to_frame(distribution['quantiles'])
+        distribution_df['kpi'] = distribution_df['kpi'].map(labels)
+        distribution_df['quantile'] = distribution_df['quantile'].map(lambda q: f"P{q * 100:g}")
+        st.dataframe(distribution_df, use_container_width=True, hide_index=True)
+        status = "수렴" if distribution['converged'] else "최대 경로 수 도달"
+        st.caption(f"경로 {distribution['paths']:,}개 ({status}) · lower/upper는 95% 신뢰구간")
+
+forecast_section(context, price_increase, supplier_delay)
+
+
+# --- 대용량 결과 내보내기 섹션 ---
+st.markdown("---")
+st.subheader("📦 대용량 결과 내보내기")
+st.caption("전체 시나리오 스윕과 부품별 노출표를 청크 단위로 압축 파일에 써서 디스크에서 바로 내려받습니다.")
+
+# Streamlit 정적 폴더 (server.enableStaticServing): 파일을 세션 메모리에 올리지 않고 서버가 디스크에서 스트리밍
+EXPORT_DIR = Path(__file__).parent / 'static' / 'exports'
+STATIC_FILE_LIMIT = 200 * 1024 * 1024  # Streamlit 정적 파일 크기 상한
+
+
+def run_export(dataset, fmt, context, price_increase, supplier_delay, price_step, max_delay):
+    from domain.forecast_service import ForecastService
+    from infrastructure.export import cleanup_exports, export_path, part_exposure_chunks, split_export, write_chunks
+
+    cleanup_exports(EXPORT_DIR)  # 1시간 지난 파일만 (다른 세션이 내려받는 중인 최근 파일은 남김)
+    if dataset == 'sweep':
+        chunks = ForecastService().iter_grid_rows(context, 30.0, max_delay, price_step, 1)
     else:
-        st.info("시뮬레이션 변수를 조절하면 향후 트렌드 예측이 표시됩니다.")
+        chunks = part_exposure_chunks(context, price_increase, supplier_delay)
+    return split_export(write_chunks(chunks, export_path(EXPORT_DIR, dataset, fmt), fmt), STATIC_FILE_LIMIT)
+
+
+@fragment
+def export_section(context, price_increase, supplier_delay):
+    if not section_toggle("내보내기 파일 만들기", "show_export"):
+        return
+
+    from infrastructure.export import EXPORT_LABELS, available_formats
 
+    dataset_labels = {'sweep': '시나리오 스윕 (가격 × 지연)', 'exposure': '부품별 노출표 (현재 가격/지연)'}
+    col1, col2, col3, col4 = st.columns(4)
+    dataset = col1.selectbox("데이터", list(dataset_labels), format_func=lambda k: dataset_labels[k], key="export_dataset")
+    fmt = col2.selectbox("형식", available_formats(), format_func=lambda k: EXPORT_LABELS[k], key="export_format")
+    price_step = col3.select_slider("가격 간격 (%p)", options=[1.0, 0.1, 0.01], value=0.1, key="export_step", disabled=dataset != 'sweep')
+    max_delay = col4.number_input("최대 지연 (일)", min_value=1, max_value=365, value=90, step=1, key="export_delay", disabled=dataset != 'sweep')
+
+    request = (dataset, fmt, context_key, price_increase, supplier_delay, price_step, int(max_delay))
+    if st.button("📦 파일 생성", key="export_run"):
+        st.session_state['export_request'] = request
+    if st.session_state.get('export_request') != request:
+        return
+
+    export = compute_in_background(
+        ('export',) + request, run_export, dataset, fmt, context, price_increase, supplier_delay, price_step, int(max_delay)
+    )
+    if export is None:
+        return
+    if not all(path.exists() for path in export.files):
+        st.info("파일이 정리되었습니다. 다시 생성해 주세요.")
+        return
+
+    size = f"{export.bytes / 1024 / 1024:,.1f} MB"
+    if not st.get_option("server.enableStaticServing"):
+        # download_button은 파일 전체를 서버 메모리에 올리므로 대체 수단으로 쓰지 않는다
+        st.warning("정적 파일 서빙(server.enableStaticServing)이 꺼져 있어 내려받을 수 없습니다.")
+        return
+    for path in export.files:
+        part_size = f"{path.stat().st_size / 1024 / 1024:,.1f} MB"
+        st.markdown(f'<a href="app/static/exports/{path.name}" download="{path.name}">📥 {path.name} 다운로드 ({part_size})</a>', unsafe_allow_html=True)
+    if export.parts:
+        st.caption(f"{STATIC_FILE_LIMIT // 1024 // 1024} MB 단위 조각 {len(export.parts)}개 · 받은 뒤 `cat {export.name}.* > {export.name}`로 이어 붙이세요.")
+    st.caption(f"{export.rows:,}행 · {size} · {export.seconds:.1f}s (파일은 1시간 뒤 정리됩니다)")
+
+export_section(context, price_increase, supplier_delay)
+
+
+# --- 저장된 시나리오 결과 섹션 ---
+st.markdown("---")
+st.subheader("🗂️ 저장된 시나리오 결과")
+st.caption("이전에 실행한 시뮬레이션/예측 결과를 다시 계산하지 않고 조회합니다.")
+
+@fragment
+def saved_results_section(scope):
+    if not section_toggle("저장 결과 조회", "show_saved_results"):
+        return
+
+    kind_labels = {'simulation': 'KPI 시뮬레이션', 'risk_trend': '30일 트렌드', 'forecast': '시나리오 스윕'}
+    col1, col2, col3 = st.columns(3)
+    kind = col1.selectbox("결과 종류", list(kind_labels), format_func=lambda k: kind_labels[k])
+    min_delay = col2.number_input("최소 지연 일수", min_value=0, max_value=365, value=0, step=1)
+    limit = col3.number_input("최대 행 수", min_value=10, max_value=10000, value=200, step=10)
+
+    records = result_store.query(
+        scope=scope, kind=kind, min_delay=min_delay if kind != 'forecast' else None, limit=int(limit)
+    )
+    if not records:
+        st.info("조건에 맞는 저장 결과가 없습니다.")
+        return
+
+    from datetime import datetime
+
+    saved_df = to_frame(records)
+    saved_df['created_at'] = [datetime.fromtimestamp(r['created_at']).strftime('%Y-%m-%d %H:%M:%S') for r in records]
+    saved_df['params'] = saved_df['params'].map(lambda p: ', '.join(f"{k}={v}" for k, v in p.items()))
+    paged_dataframe(saved_df.drop(columns=['id', 'context_hash']), 'saved_table')
+    st.caption(f"전체 저장 결과: {result_store.count():,}건")
+
+saved_results_section(service.scope)
+
+# --- 성능 트레이스 패널 ---
+if trace_enabled:
+    st.markdown("---")
+    st.subheader("⏱️ 이번 실행의 구간별 소요 시간")
+    if trace_records:
+        trace_df = to_frame(tracer.summary(trace_records))
+        trace_df['name'] = trace_df['depth'].map(lambda d: "  " * d) + trace_df['name']
+        st.dataframe(trace_df.drop(columns='depth'), use_container_width=True)
+
+        import json
+        st.download_button(
+            "📥 Chrome Trace 다운로드 (JSON)",
+            json.dumps(tracer.to_chrome_trace(trace_records)),
+            "dashboard_trace.json",
+            "application/json"
+        )
+        st.caption("chrome://tracing 또는 https://ui.perfetto.dev 에서 열 수 있습니다.")
+    else:
+        st.info("수집된 스팬이 없습니다.")
 
+if memory_profiler is not None:
+    st.markdown("---")
+    st.subheader("🧠 단계별 메모리 프로파일 (프로세스 누적)")
+    st.dataframe(to_frame(memory_profiler.report()), use_container_width=True)
 
@@ -0,0 +1,23 @@
+"""
+도메인 결과(레코드 리스트) -> pandas DataFrame 어댑터
+- 도메인 레이어는 pandas 없이 레코드/배열만 반환하고, 표와 차트가 필요한 프레젠테이션 코드에서만 변환한다.
+- pandas는 첫 변환 시점에 임포트하므로 이 모듈을 불러오는 것만으로는 콜드 스타트 비용이 늘지 않는다.
+"""
+from typing import Dict, Iterable, Optional, Sequence
+
+
+def to_frame(records: Iterable[Dict], columns: Optional[Sequence[str]] = None):
+    """레코드(dict) 리스트를 DataFrame으로 변환 (빈 결과도 컬럼을 유지)"""
+    import pandas as pd
+
+    return pd.DataFrame(list(records), columns=columns)
+
+
+def forecast_frames(forecasts: Dict) -> Dict:
+    """ForecastService.forecast_scenarios 결과의 각 시나리오를 DataFrame으로 변환"""
+    return {key: to_frame(records) for key, records in forecasts.items()}
+
+
+def trend_frame(trend: Dict):
+    """ForecastService.get_risk_trend 결과의 trend_data를 DataFrame으로 변환"""
+    return to_frame(trend['trend_data'])
@@ -0,0 +1,110 @@
+"""
+차트/표 렌더링 데이터 축소
+브라우저로 보내는 Plotly JSON과 표 데이터의 크기가 데이터 크기에 비례해 커지지 않도록
+화면에 필요한 만큼만 보낸다.
+
+- lttb_indices / decimate_frame: Largest-Triangle-Three-Buckets로 선 그래프의 모양(극값, 꺾임)을
+  유지하면서 점 수를 max_points 이하로 줄인다.
+- heatmap_levels: 히트맵을 블록 평균으로 거칠게 먼저 보내고 점점 세밀하게 (coarse-to-fine) 보낸다.
+- page_frame: 큰 결과표는 현재 페이지 행만 잘라 보낸다.
+
+streamlit에 의존하지 않으므로 벤치마크와 테스트에서도 그대로 쓸 수 있다.
+"""
+from typing import Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_MAX_POINTS = 2000
+DEFAULT_PAGE_SIZE = 100
+
+
+def lttb_indices(x: Sequence[float], y: Sequence[float], threshold: int) -> np.ndarray:
+    """
+    LTTB로 남길 점의 위치 (오름차순, 첫 점과 마지막 점 포함)
+    점을 threshold - 2개 구간으로 나누고, 구간마다 직전에 고른 점과 다음 구간 평균점으로 만든
+    삼각형의 넓이가 가장 큰 점을 고른다. x는 정렬되어 있어야 한다.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    edges = np.append(edges, n)  # 마지막 구간의 '다음 구간'은 마지막 점
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = edges[i + 1], edges[i + 2]
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def decimate_frame(df, x: str, y_columns: Sequence[str], max_points: int = DEFAULT_MAX_POINTS):
+    """
+    y 컬럼별 LTTB 선택 점의 합집합으로 행을 줄인 DataFrame (행 수가 max_points 이하면 그대로)
+    여러 y를 한 차트에 그려도 각 선의 극값이 모두 남는다.
+    """
+    if len(df) <= max_points:
+        return df
+    ordered = df.sort_values(x, kind='stable') if not df[x].is_monotonic_increasing else df
+    per_column = max(3, max_points // max(len(y_columns), 1))
+    xs = ordered[x].to_numpy(dtype=np.float64)
+    keep = np.unique(np.concatenate([lttb_indices(xs, ordered[col].to_numpy(dtype=np.float64), per_column) for col in y_columns]))
+    return ordered.iloc[keep]
+
+
+def _block_mean(values: np.ndarray, factor: int, axis: int) -> np.ndarray:
+    """axis 방향으로 factor개씩 묶어 평균 (끝 블록은 남은 칸만 평균)"""
+    n = values.shape[axis]
+    if factor <= 1:
+        return values
+    starts = np.arange(0, n, factor)
+    sums = np.add.reduceat(np.nan_to_num(values), starts, axis=axis)
+    counts = np.add.reduceat((~np.isnan(values)).astype(np.float64), starts, axis=axis)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return sums / counts
+
+
+def heatmap_levels(
+    x: Sequence[float],
+    y: Sequence[float],
+    z: np.ndarray,
+    first_cells: int = 32,
+    max_cells: Optional[int] = None
+) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    거친 단계부터 (x, y, z)를 차례로 내보낸다 (블록 평균, 블록 크기를 절반씩 줄임)
+    - first_cells: 첫 단계의 긴 축 칸 수
+    - max_cells: 마지막 단계의 긴 축 칸 수 상한 (None이면 원본 해상도까지)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    z = np.asarray(z, dtype=np.float64)
+    longest = max(z.shape)
+    final = 1 if max_cells is None or longest <= max_cells else int(np.ceil(longest / max_cells))
+    factor = max(final, 1 << max(int(np.ceil(np.log2(max(longest / first_cells, 1)))), 0))
+    while True:
+        yield (
+            _block_mean(x, factor, 0),
+            _block_mean(y, factor, 0),
+            _block_mean(_block_mean(z, factor, 0), factor, 1),
+        )
+        if factor <= final:
+            return
+        factor = max(factor // 2, final)
+
+
+def page_frame(df, page: int, page_size: int = DEFAULT_PAGE_SIZE):
+    """(page번째 페이지 행, 전체 페이지 수); page는 1부터, 범위를 벗어나면 가장 가까운 페이지"""
+    n_pages = max(1, -(-len(df) // page_size))
+    page = min(max(int(page), 1), n_pages)
+    start = (page - 1) * page_size
+    return df.iloc[start:start + page_size], n_pages
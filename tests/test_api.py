@@ -0,0 +1,93 @@
+import asyncio
+import json
+
+import pytest
+from src.domain.models import Part, ProductionLine, SimulationContext, Supplier
+
+
+def _context():
+    suppliers = [
+        Supplier(id="S1", name="A", risk_score=0.3, base_lead_time_days=7, currency="USD", country="CN"),
+        Supplier(id="S2", name="B", risk_score=0.5, base_lead_time_days=10, currency="JPY", country="JP"),
+    ]
+    parts = [
+        Part(id="P1", name="Part1", supplier_id="S1", unit_price=100.0, current_inventory=10, daily_usage_rate=1),
+        Part(id="P2", name="Part2", supplier_id="S2", unit_price=50.0, current_inventory=10, daily_usage_rate=2),
+        Part(id="P3", name="Part3", supplier_id="S9", unit_price=70.0, current_inventory=5, daily_usage_rate=3),
+    ]
+    lines = [
+        ProductionLine(id="L1", name="Line1", capacity_per_day=100, efficiency_rate=1.0),
+        ProductionLine(id="L2", name="Line2", capacity_per_day=50, efficiency_rate=0.9),
+    ]
+    return SimulationContext(parts=parts, suppliers=suppliers, production_lines=lines)
+
+
+def test_run_simulation_batch_matches_single_runs():
+    from src.application.services import SimulationService
+
+    service = SimulationService(_context())
+    scenarios = [
+        {"price_increase_pct": 0.0, "delay_days": 0},
+        {"price_increase_pct": 12.5, "delay_days": 3},
+        {"price_increase_pct": -5.0, "delay_days": 9, "currency_shocks": {"USD": 10.0}},
+        {"price_increase_pct": 20.0, "delay_days": 15, "currency_shocks": {"JPY": -3.0, "EUR": 4.0}, "tariffs": {"CN": 25.0}},
+    ]
+
+    batch = service.run_simulation_batch(scenarios)
+    for scenario, result in zip(scenarios, batch):
+        single = service.run_simulation(**scenario)
+        assert result.profit_delta == pytest.approx(single.profit_delta)
+        assert result.production_loss == single.production_loss
+    assert service.run_simulation_batch([]) == []
+
+
+def test_api_coalesces_concurrent_requests_into_one_batch():
+    from src.application.services import SimulationService
+    from src.presentation.api import SimulationApi
+
+    api = SimulationApi({"plant-A": SimulationService(_context(), scope="plant-A")}, batch_window_ms=50)
+
+    async def scenario():
+        bodies = [json.dumps({"price_increase_pct": 10.0, "delay_days": d}).encode() for d in range(10)]
+        responses = await asyncio.gather(*(api.handle("POST", "/simulate", b) for b in bodies))
+
+        # 실제 소켓을 통한 keep-alive 요청
+        server = await api.start(port=0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"GET /contexts HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n")
+        raw = await reader.read()
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return responses, raw
+
+    responses, raw = asyncio.run(scenario())
+
+    assert [status for status, _ in responses] == [200] * 10
+    assert responses[9][1]["production_loss"] == 150 * 4
+    assert api.batchers["plant-A"].stats()["batches"] == 1
+    assert raw.startswith(b"HTTP/1.1 200 OK")
+    assert json.loads(raw.split(b"\r\n\r\n", 1)[1])[0]["name"] == "plant-A"
+
+    async def invalid_requests():
+        return [
+            await api.handle("POST", "/simulate", b'{"context": "nope"}'),
+            await api.handle("POST", "/simulate", b'{"delay_days": "ten"}'),
+            await api.handle("GET", "/simulate"),
+            await api.handle("POST", "/simulate", b'{bad'),
+            await api.handle("POST", "/forecast", b'{"max_price_increase": 1e9}'),
+            await api.handle("POST", "/forecast", b'{"max_delay": 366}'),
+            await api.handle("POST", "/forecast", b'{"max_price_increase": NaN}'),
+            await api.handle("POST", "/simulate", b'{"delay_days": Infinity}'),
+            await api.handle("POST", "/simulate", b'{"price_increase_pct": NaN}'),
+            await api.handle("POST", "/simulate", b'{"delay_days": 1e300}'),
+            await api.handle("POST", "/simulate", b'{"currency_shocks": {"USD": 1e9}}'),
+            await api.handle("POST", "/simulate", b'{"overlay": {"suppliers": {"S2": {"delay_days": -3}}}}'),
+        ]
+
+    errors = asyncio.run(invalid_requests())
+    api.close()
+    assert [status for status, _ in errors] == [404, 400, 405, 400, 400, 400, 400] + [400] * 5
+    assert "100" in errors[4][1]["error"]
+    assert "유한한" in errors[7][1]["error"] and "365" in errors[9][1]["error"]
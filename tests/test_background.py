@@ -0,0 +1,49 @@
+import pytest
+
+
+def _sync_tasks(monkeypatch, **options):
+    """스레드를 만들 수 없는 환경처럼 호출 시점에 동기 실행하는 BackgroundTasks"""
+    from src.presentation import background
+
+    def no_threads(*args, **kwargs):
+        raise RuntimeError("can't start new thread")
+
+    monkeypatch.setattr(background, 'ThreadPoolExecutor', no_threads)
+    return background.BackgroundTasks(**options)
+
+
+def test_poll_deduplicates_and_evicts_oldest(monkeypatch):
+    tasks = _sync_tasks(monkeypatch, max_results=2)
+    calls = []
+
+    def compute(x):
+        calls.append(x)
+        return x * 10
+
+    assert tasks.poll('a', compute, 1) == (True, 10)
+    assert tasks.poll('a', compute, 1) == (True, 10)  # 같은 키는 다시 실행하지 않는다
+    assert tasks.poll('b', compute, 2) == (True, 20)
+    assert tasks.poll('a', compute, 1) == (True, 10)  # 'a'가 가장 최근으로 이동
+    tasks.poll('c', compute, 3)  # 보관 한도 2 -> 가장 오래된 'b'를 버린다
+    assert calls == [1, 2, 3]
+    assert tasks.done('a') and tasks.done('c') and not tasks.done('b')
+
+    tasks.poll('b', compute, 2)
+    assert calls == [1, 2, 3, 2]
+
+
+def test_failed_task_is_dropped_and_retried(monkeypatch):
+    tasks = _sync_tasks(monkeypatch)
+    attempts = []
+
+    def flaky():
+        attempts.append(len(attempts))
+        if len(attempts) == 1:
+            raise ValueError("일시적 오류")
+        return 'ok'
+
+    with pytest.raises(ValueError):
+        tasks.poll('key', flaky)
+    assert not tasks.done('key')  # 실패한 결과는 캐시에 남지 않는다
+    assert tasks.poll('key', flaky) == (True, 'ok')
+    assert attempts == [0, 1]
@@ -0,0 +1,54 @@
+import numpy as np
+from src.domain.models import Part, ProductionLine, SimulationContext, Supplier
+
+
+def _context(inventory=0):
+    suppliers = [Supplier(id="S1", name="A", risk_score=0.3, base_lead_time_days=3)]
+    parts = [
+        Part(id="P1", name="Part1", supplier_id="S1", unit_price=10.0, current_inventory=inventory, daily_usage_rate=10, line_id="L1"),
+    ]
+    lines = [
+        ProductionLine(id="L1", name="Line1", capacity_per_day=100, efficiency_rate=1.0),
+        ProductionLine(id="L2", name="Line2", capacity_per_day=50, efficiency_rate=1.0),
+    ]
+    return SimulationContext(parts=parts, suppliers=suppliers, production_lines=lines)
+
+
+def test_event_queue_orders_by_day_then_kind_and_groups_deliveries():
+    from src.domain.event_sim import CONSUMPTION, DELIVERY, REORDER, EventQueue
+
+    queue = EventQueue()
+    queue.push(1, REORDER)
+    queue.push(1, CONSUMPTION)
+    queue.push_grouped(np.array([1, 0, 1, 9]), DELIVERY, np.array([0, 1, 2, 3]), np.array([5.0, 6.0, 7.0, 8.0]), horizon=5)
+
+    popped = [queue.pop() for _ in range(len(queue))]
+    assert [(day, kind) for day, kind, _, _ in popped] == [(0, DELIVERY), (1, DELIVERY), (1, CONSUMPTION), (1, REORDER)]
+    assert list(popped[1][2]) == [0, 2]
+    assert list(popped[1][3]) == [5.0, 7.0]
+
+
+def test_simulator_reorders_and_tracks_partial_shipments():
+    from src.domain.event_sim import SupplyEventSimulator
+
+    # 재고 0에서 시작: 0일차에 발주(S = 10 × 3 + 10 × 10 = 130), 3일차 입고
+    trace = SupplyEventSimulator(horizon_days=5, safety_days=0, order_cover_days=10, track_parts=[0]).run(_context())
+    assert list(trace.line_output[0]) == [0, 0, 0, 100, 100]
+    assert list(trace.line_output[1]) == [50] * 5  # 투입 부품이 없는 라인은 영향 없음
+    assert list(trace.inventory) == [0, 0, 0, 120, 110]
+    assert trace.production_loss == 300
+    assert list(trace.stockout_days) == [3]
+    assert (trace.orders, trace.shipments) == (1, 1)
+    assert list(trace.tracked_inventory[:, 0]) == [0, 0, 0, 120, 110]
+
+    # 분할 선적: 절반은 3일차, 나머지는 하루 뒤 입고
+    partial = SupplyEventSimulator(
+        horizon_days=5, safety_days=0, order_cover_days=10, fill_rate=0.5, backorder_lag_days=1
+    ).run(_context())
+    assert list(partial.inventory) == [0, 0, 0, 55, 110]
+    assert partial.shipments == 2
+
+    # 공급 지연은 입고를 늦춰 생산 손실을 늘린다
+    delayed = SupplyEventSimulator(horizon_days=5, delay_days=1, safety_days=0, order_cover_days=10).run(_context())
+    assert delayed.production_loss == 400
+    assert delayed.to_records()[4]["output_L1"] == 100.0
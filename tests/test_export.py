@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+
+
+def _context():
+    from src.domain.models import Part, ProductionLine, SimulationContext, Supplier
+
+    return SimulationContext(
+        parts=[
+            Part(id=f"P{i}", name=f"부품{i}", supplier_id="S1" if i % 2 else "S2", unit_price=10.0 + i,
+                 current_inventory=i * 10, daily_usage_rate=i % 4, category="A", line_id="L1" if i % 3 else "")
+            for i in range(25)
+        ],
+        suppliers=[Supplier(id="S1", name="a", risk_score=0.2, base_lead_time_days=10),
+                   Supplier(id="S2", name="b", risk_score=0.5, base_lead_time_days=20)],
+        production_lines=[ProductionLine(id="L1", name="L1", capacity_per_day=100, efficiency_rate=1.0)],
+    )
+
+
+def test_exposure_export_streams_chunks_to_gzip_csv_and_parquet(tmp_path):
+    from src.infrastructure.export import available_formats, export_path, part_exposure_chunks, write_chunks
+
+    context = _context()
+    for fmt in available_formats():
+        result = write_chunks(part_exposure_chunks(context, 10.0, 15, chunk_rows=10), export_path(tmp_path, 'exposure', fmt), fmt)
+        assert result.rows == 25 and result.bytes == result.path.stat().st_size
+        assert not list(tmp_path.glob('*.tmp'))  # 완료 후 임시 파일 없음
+
+        df = pd.read_csv(result.path) if fmt == 'csv' else pd.read_parquet(result.path)
+        assert list(df['part_id']) == [f"P{i}" for i in range(25)]
+        assert df.loc[3, 'monthly_spend'] == 13.0 * 3 * 30 and df.loc[3, 'profit_delta'] == -13.0 * 3 * 30 * 0.1
+        assert df.loc[4, 'coverage_days'] == np.inf and df.loc[4, 'uncovered_days'] == 0  # 사용량 0
+        assert df.loc[3, 'uncovered_days'] == 5 and df.loc[3, 'shortage_units'] == 15  # 커버리지 10일, 지연 15일
+        assert df.loc[5, 'uncovered_days'] == 0 and df.loc[5, 'shortage_units'] == 0  # 커버리지 50일
+        assert list(df['supplier_id'][:2]) == ["S2", "S1"] and list(df['supplier_risk'][:2]) == [0.5, 0.2]
+
+
+def test_sweep_rows_match_forecast_grid_and_old_exports_are_cleaned(tmp_path):
+    import os
+    import time
+
+    from src.domain.forecast_service import ForecastService
+    from src.infrastructure.export import cleanup_exports, export_path, write_chunks
+
+    context, service = _context(), ForecastService()
+    chunks = list(service.iter_grid_rows(context, 10.0, 12, 0.5, 1, chunk_rows=100))
+    assert len(chunks) > 1 and all(len(c['total_impact']) <= 100 for c in chunks)
+
+    grid = service.forecast_grid(context, 10.0, 12, 0.5, 1)
+    rows = pd.concat([pd.DataFrame(c) for c in chunks], ignore_index=True)
+    assert len(rows) == 41 * 13
+    expected = np.array(grid['total_impact'])[rows['delay_days'], (rows['price_increase_pct'] * 2 + 20).astype(int)]
+    assert np.allclose(rows['total_impact'], expected)
+
+    result = write_chunks(iter(chunks), export_path(tmp_path, 'sweep', 'csv'))
+    assert pd.read_csv(result.path).shape == (41 * 13, 5)
+
+    old = export_path(tmp_path, 'sweep', 'csv')
+    old.write_bytes(b'')
+    os.utime(old, (time.time() - 7200, time.time() - 7200))
+    old_part = tmp_path / f"{old.name}.001"
+    old_part.write_bytes(b'')
+    os.utime(old_part, (time.time() - 7200, time.time() - 7200))
+    (tmp_path / 'notes.txt').write_text('내보내기 파일 아님')
+    assert cleanup_exports(tmp_path, max_age_s=3600) == 2
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted([result.name, 'notes.txt'])
+    assert cleanup_exports(tmp_path, max_age_s=3600) == 0  # 최근 파일은 개수와 무관하게 남긴다
+
+
+def test_large_export_is_split_into_numbered_parts(tmp_path):
+    from src.infrastructure.export import export_path, part_exposure_chunks, split_export, write_chunks
+
+    result = write_chunks(part_exposure_chunks(_context(), chunk_rows=10), export_path(tmp_path, 'exposure', 'csv'))
+    original = result.path.read_bytes()
+    assert split_export(result, len(original)) == result and result.files == (result.path,)
+
+    split = split_export(result, 300)
+    assert not result.path.exists() and [p.name for p in split.files] == [f"{result.name}.{i:03d}" for i in range(1, len(split.parts) + 1)]
+    assert len(split.parts) == -(-len(original) // 300) and all(p.stat().st_size <= 300 for p in split.parts)
+    assert b''.join(p.read_bytes() for p in split.parts) == original
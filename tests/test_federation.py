@@ -0,0 +1,94 @@
+import numpy as np
+
+
+def _plant(suppliers, parts, capacity=100):
+    from src.domain.models import Part, ProductionLine, SimulationContext, Supplier
+
+    return SimulationContext(
+        parts=[Part(id=pid, name=pid, supplier_id=sid, unit_price=price, current_inventory=10, daily_usage_rate=usage)
+               for pid, sid, price, usage in parts],
+        suppliers=[Supplier(id=sid, name=f"{sid}-name", risk_score=risk, base_lead_time_days=7, currency="USD")
+                   for sid, risk in suppliers],
+        production_lines=[ProductionLine(id="L1", name="L1", capacity_per_day=capacity, efficiency_rate=1.0)],
+    )
+
+
+def _plants():
+    return {
+        'busan': _plant([("S1", 0.2), ("S2", 0.4)], [("P1", "S1", 10.0, 1), ("P2", "S2", 20.0, 2)]),
+        'ulsan': _plant([("S1", 0.5), ("S3", 0.1)], [("P1", "S1", 10.0, 3), ("P9", "S3", 5.0, 1)], capacity=50),
+        'gumi': _plant([("S2", 0.3)], [("Q1", "S2", 1.0, 10), ("Q2", "S2", 2.0, 10)]),
+    }
+
+
+def test_federation_sums_plant_kpis_and_dedupes_shared_suppliers():
+    from src.application.federation import Federation
+    from src.application.services import SimulationService
+
+    plants = _plants()
+    scenarios = [{'price_increase_pct': 10, 'delay_days': 8}, {'price_increase_pct': -5, 'delay_days': 0, 'currency_shocks': {'USD': 4}}]
+    with Federation(plants, workers=1) as group:
+        result = group.evaluate(scenarios)
+        exposure = group.supplier_exposure(price_increase_pct=10)
+
+    for i, s in enumerate(scenarios):
+        expected = [SimulationService(c).run_simulation(s['price_increase_pct'], s['delay_days'], s.get('currency_shocks')) for c in plants.values()]
+        assert np.isclose(result.totals()[i]['profit_delta'], sum(r.profit_delta for r in expected))
+        assert result.totals()[i]['production_loss'] == sum(r.production_loss for r in expected)
+    assert result.totals()[0]['worst_plant'] == 'busan'  # 월 구매액 1,500 (울산 1,050, 구미 900)
+    assert [r['plant'] for r in result.plant_records(1)] == ['busan', 'ulsan', 'gumi']
+
+    # S1은 부산/울산, S2는 부산/구미에 공통: 공급사당 한 행
+    by_id = {r['supplier_id']: r for r in exposure}
+    assert [r['supplier_id'] for r in exposure] == ['S2', 'S1', 'S3']
+    assert by_id['S1']['plants'] == 2 and by_id['S1']['part_count'] == 2
+    assert by_id['S1']['monthly_spend'] == 10.0 * 30 + 10.0 * 90 and by_id['S1']['risk_score'] == 0.5
+    assert by_id['S2']['monthly_spend'] == 1200.0 + 300.0 + 600.0 and by_id['S2']['supplier_name'] == "S2-name"
+    assert np.isclose(sum(r['spend_share'] for r in exposure), 1.0)
+    assert by_id['S3']['profit_delta'] == -150.0 * 0.1
+
+
+def test_worker_processes_load_plant_files_and_match_in_process(tmp_path):
+    import pandas as pd
+    import pytest
+
+    from src.application.federation import Federation, plants_from_directory
+
+    for name, context in _plants().items():
+        plant_dir = tmp_path / name
+        plant_dir.mkdir()
+        pd.DataFrame([vars(p) for p in context.parts]).to_csv(plant_dir / 'parts.csv', index=False)
+        pd.DataFrame([vars(s) for s in context.suppliers]).to_csv(plant_dir / 'suppliers.csv', index=False)
+        pd.DataFrame([vars(l) for l in context.production_lines]).to_csv(plant_dir / 'production.csv', index=False)
+    (tmp_path / 'empty').mkdir()
+
+    specs = plants_from_directory(tmp_path)
+    assert sorted(specs) == ['busan', 'gumi', 'ulsan']
+
+    scenarios = [{'price_increase_pct': p, 'delay_days': d} for p in (0, 15) for d in (3, 12)]
+    with Federation(_plants(), workers=1) as local, Federation(specs, workers=2) as remote:
+        assert remote.workers == 2 and remote.sizes == {'busan': 2, 'ulsan': 2, 'gumi': 2}
+        expected, actual = local.evaluate(scenarios), remote.evaluate(scenarios)
+        by_plant = dict(zip(actual.plants, actual.profit_delta))
+        assert all(np.allclose(by_plant[p], row) for p, row in zip(expected.plants, expected.profit_delta))
+        assert [t['production_loss'] for t in actual.totals()] == [t['production_loss'] for t in expected.totals()]
+        assert remote.supplier_exposure() == local.supplier_exposure()
+        assert all(rss is None or rss > 0 for rss in remote.worker_rss())
+        with pytest.raises(ValueError):
+            remote.evaluate([{'overlay': {'supplier_price_pct': {'S1': 5}}}])
+
+
+def test_worker_load_failure_names_plant_and_stops_workers(tmp_path):
+    import multiprocessing
+
+    import pytest
+
+    from src.application.federation import Federation, PlantSpec
+
+    missing = PlantSpec(*(str(tmp_path / f"{name}.csv") for name in ('parts', 'suppliers', 'production')))
+    plants = {'busan': _plants()['busan'], 'broken': missing}
+    with pytest.raises(ValueError, match="broken"):
+        Federation(plants, workers=2)
+    assert multiprocessing.active_children() == []
+    with pytest.raises(ValueError, match="broken"):
+        Federation(plants, workers=1)
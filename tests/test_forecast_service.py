@@ -0,0 +1,46 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.domain.models import Part, ProductionLine, SimulationContext
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+
+
+def _context():
+    parts = [
+        Part(id="P1", name="Part1", supplier_id="S1", unit_price=100.0, current_inventory=10, daily_usage_rate=1),
+        Part(id="P2", name="Part2", supplier_id="S1", unit_price=50.0, current_inventory=10, daily_usage_rate=2),
+    ]
+    lines = [ProductionLine(id="L1", name="Line1", capacity_per_day=100, efficiency_rate=1.0)]
+    return SimulationContext(parts=parts, suppliers=[], production_lines=lines)
+
+
+def test_forecast_returns_records():
+    from src.domain.forecast_service import ForecastService
+
+    service = ForecastService()
+    forecasts = service.forecast_scenarios(_context(), max_price_increase=10.0, max_delay=10)
+
+    assert [r['price_increase_pct'] for r in forecasts['price_scenarios']] == [-10, -5, 0, 5, 10]
+    assert forecasts['price_scenarios'][-1]['profit_delta'] == pytest.approx(-600.0)
+    assert [r['production_loss'] for r in forecasts['delay_scenarios']] == [0, 0, 500]
+
+    trend = service.get_risk_trend(_context(), 10.0, 8)
+    assert isinstance(trend['trend_data'], list)
+    assert trend['trend_data'][0]['predicted_production_loss'] == 300
+
+
+def test_domain_and_application_layers_do_not_import_pandas():
+    code = (
+        "import sys\n"
+        "import domain.forecast_service, domain.insights_service, application.services\n"
+        "heavy = [m for m in ('pandas', 'plotly', 'streamlit', 'numba') if m in sys.modules]\n"
+        "assert not heavy, heavy\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True, env={'PYTHONPATH': str(SRC_PATH)}
+    )
+    assert proc.returncode == 0, proc.stderr
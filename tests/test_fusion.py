@@ -0,0 +1,40 @@
+import pytest
+from src.domain.models import Part, ProductionLine, SimulationContext, SimulationResult
+
+
+def _context():
+    parts = [
+        Part(id="P1", name="Part1", supplier_id="S1", unit_price=100.0, current_inventory=10, daily_usage_rate=1),
+        Part(id="P2", name="Part2", supplier_id="S1", unit_price=50.0, current_inventory=10, daily_usage_rate=2),
+    ]
+    lines = [ProductionLine(id="L1", name="Line1", capacity_per_day=100, efficiency_rate=1.0)]
+    return SimulationContext(parts=parts, suppliers=[], production_lines=lines)
+
+
+def test_fused_evaluation_matches_individual_strategies():
+    from src.domain.strategies import PriceHikeStrategy, DelayImpactStrategy
+    from src.domain.fusion import FusedEvaluator
+
+    context = _context()
+    strategies = [PriceHikeStrategy(10.0), DelayImpactStrategy(8), PriceHikeStrategy(-5.0)]
+
+    fused = FusedEvaluator(strategies).evaluate(context)
+    separate = [s.calculate(context) for s in strategies]
+
+    assert fused.profit_delta == pytest.approx(sum(r.profit_delta for r in separate))
+    assert fused.production_loss == sum(r.production_loss for r in separate) == 300
+
+
+def test_service_runs_simple_plugin_alongside_fused_strategies():
+    from src.application.services import SimulationService
+    from src.domain.interfaces import ISimulationStrategy
+    from src.domain.strategies import PriceHikeStrategy
+
+    class FixedLossStrategy(ISimulationStrategy):
+        def calculate(self, context):
+            return SimulationResult(operating_profit=0, production_output=0, production_loss=7)
+
+    result = SimulationService(_context()).run_strategies([PriceHikeStrategy(20.0), FixedLossStrategy()])
+
+    assert result.profit_delta == pytest.approx(-1200.0)
+    assert result.production_loss == 7
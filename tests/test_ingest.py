@@ -0,0 +1,64 @@
+import os
+import time
+
+
+def _drop_tables(directory, tag, n_parts, age_s=60.0):
+    """ERP가 떨어뜨린 것처럼 parts_<tag>.csv 등을 감시 폴더에 쓰고 수정 시각을 age_s초 전으로 맞춘다"""
+    from src.infrastructure.synthetic import generate_synthetic
+
+    staged = generate_synthetic(n_parts, seed=1).write_csvs(directory / f'.staging-{tag}')
+    stamp = time.time() - age_s
+    for name, path in staged.items():
+        target = directory / f'{name}_{tag}.csv'
+        os.replace(path, target)
+        os.utime(target, (stamp, stamp))
+
+
+def test_poll_loads_newest_files_and_swaps_prewarmed_context(tmp_path):
+    from src.application.ingest import FolderIngestService
+
+    ingest = FolderIngestService(tmp_path, settle_s=1.0)
+    assert ingest.poll_once() is None and ingest.holder.current() is None  # 파일 없음
+
+    _drop_tables(tmp_path, '0800', 300, age_s=120)
+    first = ingest.poll_once()
+    assert first.version == 1 and len(first.service.context.parts) == 300
+    assert first.service._cube is not None and '_overlay_base_cache' in first.service.context.__dict__  # 사전 집계 완료
+    assert ingest.poll_once() is None  # 같은 파일 묶음은 다시 로드하지 않음
+
+    # 새 파일이 생기면 가장 최근 파일로 교체; 읽는 쪽이 들고 있던 스냅샷은 그대로
+    _drop_tables(tmp_path, '0900', 500, age_s=60)
+    second = ingest.poll_once()
+    assert second.version == 2 and ingest.holder.current() is second
+    assert len(second.service.context.parts) == 500 and len(first.service.context.parts) == 300
+    assert [name for _, name, _, _ in second.signature] == ['parts_0900.csv', 'production_0900.csv', 'suppliers_0900.csv']
+
+    # 아직 쓰는 중(방금 수정)인 파일은 안정화될 때까지 건너뜀
+    _drop_tables(tmp_path, '1000', 100, age_s=0)
+    assert ingest.poll_once() is None and ingest.holder.current() is second
+
+
+def test_failed_load_keeps_previous_context_and_background_thread_swaps(tmp_path):
+    from src.application.ingest import FolderIngestService
+
+    _drop_tables(tmp_path, 'a', 50)
+    ingest = FolderIngestService(tmp_path, settle_s=0.0, poll_interval_s=0.05)
+    good = ingest.poll_once()
+
+    # 검증 오류가 있는 새 파일: 기존 컨텍스트 유지, 오류 기록, 같은 파일은 재시도하지 않음
+    broken = tmp_path / 'parts_b.csv'
+    broken.write_text((tmp_path / 'parts_a.csv').read_text().replace('\n', '\n,,,\n', 1))
+    assert ingest.poll_once() is None and ingest.holder.current() is good
+    assert ingest.last_error and ingest.poll_once() is None
+
+    ingest.start()
+    try:
+        os.remove(broken)
+        _drop_tables(tmp_path, 'c', 80)
+        deadline = time.time() + 10
+        while ingest.holder.current().version < 2 and time.time() < deadline:
+            time.sleep(0.05)
+    finally:
+        ingest.stop(timeout=5)
+    assert not ingest.running and ingest.last_error is None
+    assert ingest.holder.current().version == 2 and len(ingest.holder.current().service.context.parts) == 80
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+
+def _use_python_kernels(monkeypatch, kernels):
+    """numba 설치 여부와 관계없이 커널 원본(Python)을 'numba' 백엔드로 실행"""
+    monkeypatch.setattr(kernels, 'NUMBA_AVAILABLE', True)
+    for name in ('supply_steps', 'line_loss'):
+        compiled = getattr(kernels, name)
+        monkeypatch.setattr(kernels, name, getattr(compiled, 'py_func', compiled))
+
+
+def test_supply_kernel_matches_event_queue_path(monkeypatch):
+    from src.domain import event_sim
+    from src.infrastructure.synthetic import generate_synthetic
+
+    context = generate_synthetic(300, seed=2, n_lines=4).to_context()
+    options = dict(horizon_days=60, delay_days=3, fill_rate=0.6, backorder_lag_days=2, track_parts=[5, 0, 5])
+    expected = event_sim.SupplyEventSimulator(backend='numpy', **options).run(context)
+    assert expected.backend == 'numpy' and expected.orders > 0
+
+    _use_python_kernels(monkeypatch, event_sim.kernels)
+    actual = event_sim.SupplyEventSimulator(backend='numba', **options).run(context)
+    assert actual.backend == 'numba'
+    for name in ('inventory', 'shortage', 'line_output', 'stockout_days', 'final_inventory', 'tracked_inventory'):
+        assert np.allclose(getattr(actual, name), getattr(expected, name)), name
+    counts = lambda t: (t.orders, t.shipments, t.events, t.queue_events, t.production_loss)
+    assert counts(actual) == counts(expected)
+
+
+def test_backend_selection_and_line_loss_kernel(monkeypatch):
+    from src.domain import monte_carlo
+    from src.infrastructure.synthetic import generate_synthetic
+
+    kernels = monte_carlo.kernels
+    monkeypatch.setenv('SCM_KERNEL_BACKEND', 'numpy')
+    assert kernels.resolve_backend() == 'numpy' and kernels.resolve_backend('auto') in kernels.BACKENDS
+    with pytest.raises(ValueError):
+        kernels.resolve_backend('cuda')
+    monkeypatch.setattr(kernels, 'NUMBA_AVAILABLE', False)
+    assert kernels.resolve_backend('auto') == 'numpy'
+    with pytest.raises(ValueError):
+        kernels.resolve_backend('numba')  # 설치되지 않은 백엔드를 명시하면 조용히 바꾸지 않는다
+
+    context = generate_synthetic(500, seed=3, n_lines=3).to_context()
+    sampler = monte_carlo.RiskSampler.from_context(context, backend='numpy')
+    expected = sampler.sample(300, np.random.default_rng(7))
+    _use_python_kernels(monkeypatch, kernels)
+    compiled = monte_carlo.RiskSampler.from_context(context, backend='numba')
+    actual = compiled.sample(300, np.random.default_rng(7))
+    assert expected['production_loss'].any()
+    for kpi in monte_carlo.KPIS:
+        assert np.array_equal(actual[kpi], expected[kpi]), kpi
+
+    result = monte_carlo.AdaptiveMonteCarlo(batch_size=200, min_paths=400, max_paths=400, groups=2, seed=0).run(compiled)
+    assert result.backend == 'numba' and result.paths == 400
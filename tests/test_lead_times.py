@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+
+def test_fitter_statistics_are_chunk_invariant():
+    from src.domain.lead_times import LeadTimeFitter
+
+    # S1: 기본 5일, 약속 납기 대비 0, 0, 3, 12일 지연 / S2: 약속 납기 없이 기본 10일 대비 판단
+    supplier = np.array([0, 0, 0, 0, 1, 1, 1, -1, 0])
+    lead = np.array([5, 5, 8, 17, 10, 9, 30, 4, np.nan])
+    delay = np.array([0, 0, 3, 12, np.nan, np.nan, np.nan, 0, 0])
+
+    whole = LeadTimeFitter(['S1', 'S2', 'S3'], [5, 10, 7], min_deliveries=3)
+    whole.update(supplier, lead, delay)
+    fit = whole.result()
+    assert (fit.rows, fit.skipped_rows) == (9, 2)  # 모르는 공급사 / 날짜 오류
+    assert fit.deliveries.tolist() == [4, 3, 0]
+    assert np.allclose(fit.delay_probability, [0.5, 1 / 3, 0])
+    assert np.allclose(fit.lead_time_mean[:2], [35 / 4, 49 / 3]) and np.isnan(fit.lead_time_mean[2])
+    assert np.allclose(fit.nominal_lead_time, [5, 9.5, 7])  # 이력이 없으면 기본 리드타임
+    assert np.allclose(fit.mean_delay_days, [7.5, 20, 0])
+    assert fit.lead_time_quantile(0.5)[:2].tolist() == [5, 10]
+    # 지연 3일 -> (0, 7], 12일 -> (7, 14], 20일 -> (14, 28]
+    assert fit.delay_scenarios == ((3.0, 1 / 3), (12.0, 1 / 3), (20.0, 1 / 3))
+
+    chunked = LeadTimeFitter(['S1', 'S2', 'S3'], [5, 10, 7], min_deliveries=3)
+    for part in np.array_split(np.arange(len(supplier)), 4):
+        chunked.update(supplier[part], lead[part], delay[part])
+    other = chunked.result()
+    assert np.array_equal(other.lead_time_histogram, fit.lead_time_histogram)
+    assert np.allclose(other.lead_time_std[:2], fit.lead_time_std[:2])
+    assert other.delay_scenarios == fit.delay_scenarios
+    assert [r['fitted'] for r in fit.to_records()] == [True, True, False]
+
+    with pytest.raises(ValueError):
+        LeadTimeFitter(['S1'], [5, 6])
+
+
+def test_repository_fit_attaches_to_context_and_scenario_engines(tmp_path):
+    from src.domain.columnar import context_fingerprint, get_columns
+    from src.domain.lead_times import attach_lead_time_fit
+    from src.domain.monte_carlo import RiskSampler
+    from src.domain.safety_stock import SafetyStockOptimizer
+    from src.infrastructure.repositories import SimulationRepository
+
+    repo = SimulationRepository()
+    context = repo.load_context()  # S1 (7일, 0.3), S2 (10일, 0.5), S3 (5일, 0.2)
+    rows = ["공급사코드,발주일,납기일,입고일,비고"]
+    rows += [f"S1,2024-01-{d:02d},2024-01-{d + 6:02d},2024-01-{d + 6:02d},ok" for d in range(1, 21)]
+    rows += [f"S1,2024-02-{d:02d},2024-02-{d + 6:02d},2024-02-{d + 16:02d},late" for d in range(1, 6)]
+    rows += ["S2,2024-03-01,,2024-03-25,", "S9,2024-03-01,,2024-03-02,", "S1,bad,,2024-03-02,"]
+    path = tmp_path / "deliveries.csv"
+    path.write_text("\n".join(rows), encoding="utf-8")
+
+    fit = repo.fit_lead_times(path, context, chunksize=7)
+    assert (fit.rows, fit.skipped_rows) == (28, 2)
+    assert fit.deliveries.tolist() == [25, 1, 0] and fit.fitted.tolist() == [True, False, False]
+    assert fit.delay_probability[0] == pytest.approx(0.2) and fit.nominal_lead_time[0] == 6
+
+    before = get_columns(context)
+    key = context_fingerprint(context)
+    base_shortage = SafetyStockOptimizer().expected_shortage(context)
+    attach_lead_time_fit(context, fit)
+    columns = get_columns(context)
+    assert columns is not before and context_fingerprint(context) != key
+    # 납품 건수가 충분한 S1만 추정값 사용
+    assert columns.supplier_risk.tolist() == [0.2, 0.5, 0.2] and columns.supplier_lead_time.tolist() == [6, 10, 5]
+    assert fit.delay_scenarios == ((10.7, 1.0),)  # S1 지연 10일 ×5, S2 기본 대비 14일 ×1 -> (7, 14] 구간 평균
+    sampler = RiskSampler.from_context(context)
+    assert sampler.delay_days.tolist() == [10.7]
+    assert not np.allclose(SafetyStockOptimizer().expected_shortage(context), base_shortage)
+
+    attach_lead_time_fit(context, None)
+    assert get_columns(context).supplier_risk.tolist() == [0.3, 0.5, 0.2]
+    assert context_fingerprint(context) == key
+
+    # 납품 건수가 부족해 컬럼은 그대로여도 지연 일수 분포가 바뀌므로 결과 캐시 키가 달라야 한다
+    sparse = repo.fit_lead_times(path, context, min_deliveries=100)
+    attach_lead_time_fit(context, sparse)
+    assert get_columns(context).supplier_risk.tolist() == [0.3, 0.5, 0.2]
+    assert context_fingerprint(context) != key
+    attach_lead_time_fit(context, None)
+
+    bad = tmp_path / "bad.csv"
+    bad.write_text("공급사코드,입고일\nS1,2024-01-01\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        repo.fit_lead_times(bad, context)
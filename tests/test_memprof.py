@@ -0,0 +1,44 @@
+import tracemalloc
+
+MB = 1024 * 1024
+
+
+def test_stage_peaks_include_nested_stages():
+    from src.common.memprof import MemoryProfiler
+    from src.common.tracing import Tracer
+
+    tracer = Tracer(enabled=False)
+    profiler = MemoryProfiler(stages=('load.*',), tracer=tracer)
+    with profiler:
+        with tracer.span('load.outer'):
+            with tracer.span('load.inner'):
+                buffer = bytearray(8 * MB)
+                del buffer
+            kept = bytearray(2 * MB)
+        with tracer.span('other.stage'):  # 단계 패턴에 맞지 않으면 기록하지 않는다
+            pass
+
+    stats = {r['stage']: r for r in profiler.report()}
+    assert set(stats) == {'load.outer', 'load.inner'}
+    assert stats['load.inner']['peak_mb'] >= 8 and stats['load.inner']['retained_mb'] < 1
+    # 바깥 단계 peak는 안쪽 단계 peak를 포함하고, 블록이 끝날 때 남은 2MB가 잔존량이다
+    assert stats['load.outer']['peak_mb'] >= 8 and 2 <= stats['load.outer']['retained_mb'] < 3
+    assert profiler.report()[0]['peak_mb'] >= profiler.report()[-1]['peak_mb']
+    assert len(kept) == 2 * MB
+
+
+def test_stop_removes_listener_and_restores_state():
+    from src.common.memprof import MemoryProfiler
+    from src.common.tracing import Tracer
+
+    was_tracing = tracemalloc.is_tracing()
+    tracer = Tracer(enabled=False)
+    profiler = MemoryProfiler(tracer=tracer)
+    profiler.start()
+    profiler.start()  # 다시 시작해도 리스너는 하나
+    assert tracer._listeners == [profiler] and tracer.enabled
+
+    profiler.stop()
+    assert tracer._listeners == [] and not tracer.enabled
+    assert tracemalloc.is_tracing() == was_tracing
+    profiler.stop()  # 두 번 멈춰도 안전
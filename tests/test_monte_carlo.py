@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from src.domain.models import Part, ProductionLine, SimulationContext, Supplier
+
+
+def test_kll_sketch_quantiles_and_merge():
+    from src.domain.sketches import KLLSketch
+
+    values = np.random.default_rng(0).lognormal(0.0, 1.0, 200_000)
+    left, right = KLLSketch(k=200, seed=1), KLLSketch(k=200, seed=2)
+    for chunk in np.array_split(values[:100_000], 50):
+        left.update(chunk)
+    right.update(values[100_000:])
+    merged = left.merge(right)
+
+    qs = [0.1, 0.5, 0.9, 0.99]
+    ranks = [np.mean(values <= v) for v in merged.quantiles(qs)]
+    assert ranks == pytest.approx(qs, abs=0.02)
+    assert merged.count == 200_000
+    assert merged.size < 2_000  # 표본 수와 무관하게 작은 크기 유지
+    assert merged.quantiles([0.0, 1.0]).tolist() == [values.min(), values.max()]
+    assert merged.rank(np.median(values)) == pytest.approx(0.5, abs=0.02)
+
+
+def test_adaptive_monte_carlo_stops_at_tolerance():
+    from src.domain.monte_carlo import AdaptiveMonteCarlo, RiskSampler
+
+    suppliers = [Supplier(id="S1", name="A", risk_score=1.0, base_lead_time_days=7)]
+    parts = [Part(id="P1", name="Part1", supplier_id="S1", unit_price=100.0, current_inventory=0, daily_usage_rate=1, line_id="L1")]
+    lines = [ProductionLine(id="L1", name="Line1", capacity_per_day=100, efficiency_rate=1.0)]
+    context = SimulationContext(parts=parts, suppliers=suppliers, production_lines=lines)
+
+    # 가격 변동 없음 + 항상 10일 지연 -> KPI가 결정적이므로 최소 경로 수에서 바로 수렴
+    sampler = RiskSampler.from_context(context, price_mean_pct=10.0, price_sd_pct=0.0, delay_scenarios=[(10, 1.0)])
+    result = AdaptiveMonteCarlo(batch_size=1000, min_paths=5000, groups=5, seed=0).run(sampler)
+    assert result.converged
+    assert result.paths == 5000
+    assert result.quantiles["profit_loss"][0.5] == pytest.approx(300.0)
+    assert result.quantiles["production_loss"][0.99] == pytest.approx(500.0)
+    assert result.quantiles["total_loss"][0.95] == pytest.approx(300.0 + 500.0 * 1000)
+    assert {r["kpi"] for r in result.to_records()} == {"profit_loss", "production_loss", "total_loss"}
+
+    # 허용 오차 0이면 수렴하지 못하고 max_paths에서 멈춘다
+    noisy = RiskSampler.from_context(context, price_sd_pct=5.0)
+    capped = AdaptiveMonteCarlo(rel_tol=0.0, batch_size=1000, min_paths=2000, max_paths=8000, groups=4, seed=0).run(noisy)
+    assert not capped.converged
+    assert capped.paths == 8000
+    low, high = capped.intervals["profit_loss"][0.5]
+    assert low < capped.quantiles["profit_loss"][0.5] < high
+
+    # 손실 부호이므로 높은 분위수가 불리한 꼬리: P99 손실 > P50 손실
+    for kpi in ("profit_loss", "total_loss"):
+        assert capped.quantiles[kpi][0.99] > capped.quantiles[kpi][0.5], kpi
@@ -0,0 +1,64 @@
+import numpy as np
+from src.domain.models import Part, ProductionLine, SimulationContext, Supplier
+
+
+def _context():
+    suppliers = [
+        Supplier(id="S1", name="A", risk_score=0.3, base_lead_time_days=3),
+        Supplier(id="S2", name="B", risk_score=0.5, base_lead_time_days=7),
+        Supplier(id="S3", name="C", risk_score=0.2, base_lead_time_days=5),
+    ]
+    parts = [
+        Part(id="P1", name="a", supplier_id="S1", unit_price=10.0, current_inventory=0, daily_usage_rate=10, line_id="L1"),
+        Part(id="P2", name="b", supplier_id="S2", unit_price=20.0, current_inventory=0, daily_usage_rate=5, line_id="L1"),
+        Part(id="P3", name="c", supplier_id="S2", unit_price=5.0, current_inventory=0, daily_usage_rate=4, line_id="L2"),
+        Part(id="P4", name="d", supplier_id="S3", unit_price=8.0, current_inventory=0, daily_usage_rate=2, line_id="L2"),
+    ]
+    lines = [
+        ProductionLine(id="L1", name="Line1", capacity_per_day=100, efficiency_rate=1.0),
+        ProductionLine(id="L2", name="Line2", capacity_per_day=50, efficiency_rate=1.0),
+        ProductionLine(id="L3", name="Line3", capacity_per_day=30, efficiency_rate=1.0),
+    ]
+    return SimulationContext(parts=parts, suppliers=suppliers, production_lines=lines)
+
+
+def test_price_overlay_matches_per_part_calculation_and_is_copy_on_write():
+    from src.application.services import SimulationService
+    from src.domain.overlays import WhatIfOverlay
+
+    base = WhatIfOverlay().with_supplier("S2", price_pct=40)
+    overlay = base.with_part("P3", price_pct=-5)
+    assert dict(base.part_price_pct) == {} and len(overlay) == 2  # 원래 오버레이는 그대로
+
+    result = SimulationService(_context()).run_simulation(10, 0, overlay=overlay)
+    spend = np.array([10 * 10, 20 * 5, 5 * 4, 8 * 2]) * 30.0
+    pct = np.array([10, 40, -5, 10])
+    assert np.isclose(result.profit_delta, -(spend * pct / 100).sum())
+
+    # 전역 변화율이 0이어도 조정만으로 평가, 조정 해제 시 기존 결과와 동일
+    assert np.isclose(SimulationService(_context()).run_simulation(0, 0, overlay=base).profit_delta, -(spend[1] + spend[2]) * 0.4)
+    cleared = overlay.with_supplier("S2").with_part("P3")
+    assert SimulationService(_context()).run_simulation(10, 0, overlay=cleared) == SimulationService(_context()).run_simulation(10, 0)
+
+
+def test_supplier_delay_overlay_hits_only_lines_it_feeds():
+    import pytest
+    from src.application.services import SimulationService
+    from src.domain.overlays import WhatIfOverlay
+
+    service = SimulationService(_context())
+    # S3만 12일 지연 -> S3가 부품을 대는 L2만 7일 손실
+    delayed = WhatIfOverlay().with_supplier("S3", delay_days=12)
+    assert service.run_simulation(0, 0, overlay=delayed).production_loss == 50 * 7
+
+    # 전역 8일 지연 + S2만 지연 없음: L1은 S1 때문에, L2는 S3 때문에 여전히 3일 손실, 부품 없는 L3도 전역 지연
+    relieved = WhatIfOverlay().with_supplier("S2", delay_days=0)
+    assert service.run_simulation(0, 8, overlay=relieved).production_loss == (100 + 50 + 30) * 3
+    only_s1 = relieved.with_supplier("S3", delay_days=0).with_supplier("S1", delay_days=0)
+    assert service.run_simulation(0, 8, overlay=only_s1).production_loss == 30 * 3
+
+    batch = service.run_simulation_batch([{'delay_days': 8, 'overlay': relieved.to_params()}, {'overlay': delayed}])
+    assert [r.production_loss for r in batch] == [(100 + 50 + 30) * 3, 50 * 7]
+
+    with pytest.raises(ValueError):
+        service.run_simulation(0, 0, overlay=WhatIfOverlay().with_supplier("S9", price_pct=5))
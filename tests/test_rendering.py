@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+
+
+def test_lttb_keeps_shape_and_decimate_frame_limits_points():
+    from src.presentation.rendering import decimate_frame, lttb_indices
+
+    x = np.arange(10_000)
+    y = np.sin(x / 500.0)
+    y[3_333] = 50.0  # 단일 스파이크
+    kept = lttb_indices(x, y, 200)
+    assert len(kept) == 200 and kept[0] == 0 and kept[-1] == len(x) - 1
+    assert np.all(np.diff(kept) > 0) and 3_333 in kept
+
+    df = pd.DataFrame({'day': x, 'a': y, 'b': -y})
+    small = decimate_frame(df, 'day', ['a', 'b'], max_points=300)
+    assert len(small) <= 300 and small['a'].max() == 50.0 and small['b'].min() == -50.0
+    assert len(decimate_frame(df.head(100), 'day', ['a'])) == 100  # 작은 표는 그대로
+
+
+def test_heatmap_levels_go_coarse_to_fine_and_tables_page():
+    from src.presentation.rendering import heatmap_levels, page_frame
+    from src.domain.forecast_service import ForecastService
+    from src.domain.models import Part, ProductionLine, SimulationContext
+
+    context = SimulationContext(
+        parts=[Part(id="P1", name="a", supplier_id="S1", unit_price=100.0, current_inventory=0, daily_usage_rate=1)],
+        suppliers=[],
+        production_lines=[ProductionLine(id="L1", name="L1", capacity_per_day=100, efficiency_rate=1.0)],
+    )
+    grid = ForecastService().forecast_grid(context, max_price_increase=10, max_delay=30, price_step=0.1)
+    z = np.array(grid['total_impact'])
+    assert z.shape == (31, 201)
+    assert z[10, 200] == -3000.0 * 10 / 100 - 100 * 5 * 1000  # 가격 +10%, 지연 10일
+
+    levels = list(heatmap_levels(grid['price_increase_pct'], grid['delay_days'], z, first_cells=16))
+    widths = [len(x) for x, _, _ in levels]
+    assert widths[0] <= 16 and widths == sorted(widths) and widths[-1] == 201
+    assert np.allclose(levels[-1][2], z)
+    assert np.isclose(levels[0][2].mean(), z.mean(), rtol=0.2)
+
+    rows, n_pages = page_frame(pd.DataFrame({'v': range(250)}), page=9, page_size=100)
+    assert n_pages == 3 and list(rows['v'])[:1] == [200] and len(rows) == 50
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+
+def _context():
+    from src.domain.models import Part, ProductionLine, SimulationContext, Supplier
+
+    suppliers = [Supplier(id="S1", name="A", risk_score=0.5, base_lead_time_days=4)]
+    parts = [
+        Part(id="P1", name="Part1", supplier_id="S1", unit_price=365.0, current_inventory=100, daily_usage_rate=10, line_id="L1"),
+        Part(id="P2", name="Part2", supplier_id="S9", unit_price=365.0, current_inventory=0, daily_usage_rate=0, line_id="L1"),
+    ]
+    lines = [ProductionLine(id="L1", name="Line1", capacity_per_day=100, efficiency_rate=1.0)]
+    return SimulationContext(parts=parts, suppliers=suppliers, production_lines=lines)
+
+
+def test_sweep_picks_hand_computed_policy():
+    from src.domain.replenishment import ReorderPolicySweep
+
+    # 사용량 10, 리드타임 4일, 50% 확률로 6일 지연, 일 보유비 = 365 × 0.25 / 365 = 0.25 / unit
+    sweep = ReorderPolicySweep(
+        safety_days=(0, 6), cycle_days=(10,), order_cost=50, shortage_cost=1000,
+        demand_cv=0, delay_scenarios=[(6, 1.0)]
+    )
+    inputs = sweep.part_inputs(_context())
+    no_buffer = sweep.evaluate(inputs, 0, 10)
+    # s = 40: 지연 시 6일 × 10 결품 (확률 0.5) -> 주기당 30 units, 평균 재고 Q/2 = 50
+    assert no_buffer['daily_cost'][0] == pytest.approx(50 / 10 + 0.25 * 50 + 1000 * 30 / 10)
+    assert no_buffer['fill_rate'][0] == pytest.approx(0.7)
+    assert no_buffer['cycle_service_level'][0] == pytest.approx(0.5)
+
+    plan = sweep.optimize(_context())
+    assert plan.safety_days[0] == 6 and plan.fill_rate[0] == 1.0
+    assert plan.reorder_point[0] == pytest.approx(100) and plan.order_up_to[0] == pytest.approx(200)
+    assert plan.daily_cost[0] == pytest.approx(5 + 0.25 * (50 + 30))
+    assert plan.daily_cost[1] == 0 and plan.fill_rate[1] == 1.0  # 사용하지 않는 부품은 발주하지 않는다
+    assert plan.to_records()[0]['part_id'] == 'P1'
+
+    with pytest.raises(ValueError):
+        ReorderPolicySweep(kind='Qr')
+
+
+def test_sweep_matches_brute_force_and_drives_event_sim(monkeypatch):
+    from src.domain import event_sim
+    from src.domain.replenishment import ReorderPolicySweep
+    from src.infrastructure.synthetic import generate_synthetic
+
+    context = generate_synthetic(400, seed=4, n_lines=3).to_context()
+    for kind, target in (('sS', None), ('RS', 0.95)):
+        sweep = ReorderPolicySweep(kind=kind, target_fill_rate=target, chunk_cells=3_000)
+        plan = sweep.optimize(context)
+        inputs = sweep.part_inputs(context)
+        brute = [sweep.evaluate(inputs, s, c) for s, c in zip(sweep.safety_days, sweep.cycle_days)]
+        costs = np.stack([m['daily_cost'] for m in brute], axis=1)
+        fills = np.stack([m['fill_rate'] for m in brute], axis=1)
+        feasible = fills >= (target or 0) - 1e-12
+        expected = np.where(feasible, costs, np.inf).min(axis=1)
+        assert np.allclose(plan.daily_cost[plan.meets_target], expected[plan.meets_target])
+        assert np.array_equal(plan.meets_target, feasible.any(axis=1))
+
+        subset = sweep.optimize(context, parts=[7, 3])
+        assert subset.part_ids == [plan.part_ids[7], plan.part_ids[3]]
+        assert np.allclose(subset.order_up_to, plan.order_up_to[[7, 3]])
+
+    # (R, S) 정책은 검토 주기마다만 발주하며, 컴파일 커널 경로와 큐 경로가 같은 결과를 낸다
+    options = dict(horizon_days=45, fill_rate=0.8, policy=plan)
+    expected = event_sim.SupplyEventSimulator(backend='numpy', **options).run(context)
+    review_days = np.ceil(45 / np.round(plan.cycle_days)).sum()  # 부품별 검토일마다 최대 1회 발주
+    assert 0 < expected.orders <= review_days
+    kernels = event_sim.kernels
+    compiled = kernels.supply_steps
+    monkeypatch.setattr(kernels, 'NUMBA_AVAILABLE', True)
+    monkeypatch.setattr(kernels, 'supply_steps', getattr(compiled, 'py_func', compiled))
+    actual = event_sim.SupplyEventSimulator(backend='numba', **options).run(context)
+    assert np.allclose(actual.inventory, expected.inventory) and actual.orders == expected.orders
+
+    with pytest.raises(ValueError):
+        event_sim.SupplyEventSimulator(policy=subset).run(context)
@@ -0,0 +1,50 @@
+import pytest
+from src.domain.models import Part, ProductionLine, SimulationContext
+
+
+def _context():
+    parts = [
+        Part(id="P1", name="Part1", supplier_id="S1", unit_price=100.0, current_inventory=10, daily_usage_rate=1),
+        Part(id="P2", name="Part2", supplier_id="S1", unit_price=50.0, current_inventory=10, daily_usage_rate=2),
+    ]
+    lines = [ProductionLine(id="L1", name="Line1", capacity_per_day=100, efficiency_rate=1.0)]
+    return SimulationContext(parts=parts, suppliers=[], production_lines=lines)
+
+
+def test_result_store_lookup_and_range_query():
+    from src.infrastructure.result_store import SqliteScenarioResultStore
+
+    store = SqliteScenarioResultStore()
+    for delay in (0, 5, 10, 15):
+        store.append("h1", "simulation", {"price_increase_pct": 10.0, "delay_days": delay}, {"production_loss": delay * 10}, scope="plant-A")
+    store.append("h2", "simulation", {"price_increase_pct": 10.0, "delay_days": 20}, {"production_loss": 1}, scope="plant-B")
+
+    assert store.lookup("h1", "simulation", {"delay_days": 10, "price_increase_pct": 10.0}) == {"production_loss": 100}
+    assert store.lookup("h1", "simulation", {"delay_days": 11, "price_increase_pct": 10.0}) is None
+
+    rows = store.query(scope="plant-A", kind="simulation", min_delay=10)
+    assert sorted(r["delay_days"] for r in rows) == [10, 15]
+    assert rows[0]["params"]["price_increase_pct"] == 10.0
+    assert store.query(min_price=20.0) == []
+    assert store.count() == 5
+
+
+def test_services_serve_repeated_requests_from_store():
+    from src.application.services import SimulationService
+    from src.domain.forecast_service import ForecastService
+    from src.infrastructure.result_store import SqliteScenarioResultStore
+
+    store = SqliteScenarioResultStore()
+    service = SimulationService(_context(), result_store=store, scope="plant-A")
+    first = service.run_simulation(10.0, 8)
+    second = service.run_simulation(10.0, 8)
+
+    assert second.profit_delta == pytest.approx(first.profit_delta)
+    assert second.production_loss == first.production_loss == 300
+    assert store.count() == 1
+
+    forecast = ForecastService(result_store=store, scope="plant-A")
+    expected = forecast.forecast_scenarios(service.context)
+    forecast._forecast_price_impact = None  # 캐시 적중 시 다시 계산하지 않음
+    assert forecast.forecast_scenarios(service.context) == expected
+    assert [r["kind"] for r in store.query(scope="plant-A")] == ["forecast", "simulation"]
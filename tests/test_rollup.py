@@ -0,0 +1,94 @@
+import pytest
+from src.domain.models import Part, Supplier, ProductionLine, SimulationContext
+
+
+def _context():
+    parts = [
+        Part(id="P1", name="Part1", supplier_id="S1", unit_price=10.0, current_inventory=20, daily_usage_rate=10, category="Metal", line_id="L1"),
+        Part(id="P2", name="Part2", supplier_id="S1", unit_price=20.0, current_inventory=400, daily_usage_rate=10, category="Chip", line_id="L2"),
+        Part(id="P3", name="Part3", supplier_id="S2", unit_price=30.0, current_inventory=70, daily_usage_rate=10, category="Metal", line_id="L1"),
+    ]
+    lines = [
+        ProductionLine(id="L1", name="Line1", capacity_per_day=100, efficiency_rate=1.0),
+        ProductionLine(id="L2", name="Line2", capacity_per_day=50, efficiency_rate=1.0),
+    ]
+    return SimulationContext(parts=parts, suppliers=[], production_lines=lines)
+
+
+def test_cube_drill_down_matches_raw_aggregation():
+    from src.domain.rollup import RollupCube
+
+    cube = RollupCube(_context())
+
+    by_supplier = {r['supplier']: r for r in cube.query(by=('supplier',)).to_records()}
+    assert by_supplier['S1']['monthly_spend'] == pytest.approx(10 * 300 + 20 * 300)
+    assert by_supplier['S2']['part_count'] == 1
+
+    s1_by_line = {r['line']: r['coverage_0_5'] + r['coverage_30_plus'] for r in cube.query(by=('line',), supplier='S1').to_records()}
+    assert s1_by_line == {'L1': 1.0, 'L2': 1.0}
+
+
+def test_cube_incremental_update_and_aggregate_strategies():
+    from src.application.services import SimulationService
+    from src.domain.columnar import get_columns, invalidate_columns
+    from src.domain.rollup import RollupCube
+    from src.domain.models import Part
+    from src.domain.strategies import PriceHikeStrategy, DelayImpactStrategy
+
+    context = _context()
+    cube = RollupCube(context)
+    before = SimulationService(context).run_simulation(10, 0).profit_delta
+
+    old = context.parts[0]
+    new = Part(id="P1", name="Part1", supplier_id="S3", unit_price=10.0, current_inventory=20, daily_usage_rate=20, category="Metal", line_id="L1")
+    cube.update_part(old, new)
+    context.parts[0] = new
+
+    incremental = {r['supplier']: r for r in cube.query(by=('supplier',)).to_records()}
+    rebuilt = {r['supplier']: r for r in RollupCube(context).query(by=('supplier',)).to_records()}
+    assert incremental == rebuilt
+    # 리스트 원소를 제자리에서 바꿔도 컬럼 스냅샷이 다시 만들어진다
+    after = SimulationService(context).run_simulation(10, 0).profit_delta
+    assert before == pytest.approx(-(10 * 300 + 20 * 300 + 30 * 300) * 0.1)
+    assert after == pytest.approx(-(10 * 600 + 20 * 300 + 30 * 300) * 0.1)
+    # 원소 속성을 제자리에서 바꾸면 명시적으로 무효화한다
+    context.production_lines[1].capacity_per_day = 80
+    assert get_columns(context).line_capacity.tolist() == [100, 50]
+    invalidate_columns(context)
+    assert get_columns(context).line_capacity.tolist() == [100, 80]
+
+    by_line = {r['line']: r for r in cube.evaluate([PriceHikeStrategy(10.0), DelayImpactStrategy(8)], by=('line',))}
+    assert by_line['L1']['profit_delta'] == pytest.approx(-(10 * 600 + 30 * 300) * 0.1)
+    assert by_line['L2']['production_loss'] == 150
+
+    with pytest.raises(ValueError):
+        cube.evaluate([DelayImpactStrategy(8)], by=('supplier',))
+
+
+def test_service_cube_follows_part_edits():
+    from dataclasses import replace
+    from src.application.services import SimulationService
+    from src.infrastructure.synthetic import generate_synthetic
+
+    table_context = generate_synthetic(300, seed=5, n_lines=3).to_context()
+    list_context = generate_synthetic(300, seed=5, n_lines=3).to_context()
+    list_context.parts = list(list_context.parts)
+
+    for context in (list_context, table_context):
+        service = SimulationService(context)
+
+        def totals():
+            drilled = sum(r['profit_delta'] for r in service.drill_down(10, 0, ['supplier']))
+            return drilled, service.run_simulation(10, 0).profit_delta
+
+        drilled, simulated = totals()
+        assert drilled == pytest.approx(simulated)
+        cube = service.cube
+
+        part = context.parts[0]
+        context.parts[0] = replace(part, unit_price=part.unit_price * 10, supplier_id=context.parts[5].supplier_id)
+        edited, simulated_after = totals()
+        assert simulated_after != pytest.approx(simulated)
+        assert edited == pytest.approx(simulated_after)
+        # 리스트 기반은 교체된 부품만 증분 반영, PartSequence는 다시 생성
+        assert (service.cube is cube) == (context is list_context)
@@ -0,0 +1,40 @@
+import pytest
+from src.domain.models import Part, Supplier, SimulationContext
+
+
+def _context():
+    suppliers = [
+        Supplier(id="S1", name="Safe", risk_score=0.1, base_lead_time_days=5),
+        Supplier(id="S2", name="Risky", risk_score=0.8, base_lead_time_days=10),
+    ]
+    parts = [
+        Part(id="P1", name="Part1", supplier_id="S1", unit_price=10.0, current_inventory=0, daily_usage_rate=10),
+        Part(id="P2", name="Part2", supplier_id="S2", unit_price=10.0, current_inventory=0, daily_usage_rate=10),
+    ]
+    return SimulationContext(parts=parts, suppliers=suppliers, production_lines=[])
+
+
+def test_optimizer_prefers_risky_supplier_within_budget():
+    from src.domain.safety_stock import SafetyStockOptimizer
+
+    # Arrange: 지연 10일(확률 1) 단일 시나리오, 예산은 100 units 분량
+    optimizer = SafetyStockOptimizer(delay_scenarios=[(10, 1.0)])
+
+    # Act
+    plan = optimizer.optimize(_context(), budget=1000.0)
+
+    # Assert: 같은 가격이면 리스크가 높은 공급사 부품에 먼저 배분
+    assert list(plan.additional_units) == [0, 100]
+    assert plan.total_cost == 1000.0
+    assert plan.expected_shortage_before == pytest.approx(0.1 * 100 + 0.8 * 100)
+    assert plan.expected_shortage_after == pytest.approx(0.1 * 100)
+
+
+def test_optimizer_allocation_records_only_allocated_parts():
+    from src.domain.safety_stock import SafetyStockOptimizer
+
+    plan = SafetyStockOptimizer(delay_scenarios=[(10, 1.0)]).optimize(_context(), budget=1500.0)
+    records = plan.to_records()
+
+    assert [r['part_id'] for r in records] == ["P2", "P1"]
+    assert records[1]['additional_units'] == 50
@@ -0,0 +1,63 @@
+import sqlite3
+
+import pytest
+
+
+def _connection():
+    con = sqlite3.connect(':memory:')
+    con.executescript('''
+        CREATE TABLE suppliers ("업체코드" TEXT, "업체명" TEXT, "위험도" REAL, "리드타임" INTEGER, "통화" TEXT);
+        CREATE TABLE parts ("부품코드" TEXT, "부품명" TEXT, "공급사" TEXT, "단가" REAL, "재고" INTEGER, "일일사용량" INTEGER, "분류" TEXT, "라인" TEXT);
+        CREATE TABLE production_lines (line_id TEXT, line_name TEXT, capacity INTEGER, efficiency REAL);
+    ''')
+    con.executemany("INSERT INTO suppliers VALUES (?, ?, ?, ?, ?)", [
+        ("S1", "A", 0.3, 7, "usd"), ("S2", "B", 0.5, 10, None), ("S3", "C", 0.1, 3, "JPY"),
+    ])
+    con.executemany("INSERT INTO parts VALUES (?, ?, ?, ?, ?, ?, ?, ?)", [
+        ("P1", "a", "S1", 100.0, 500, 50, "Metal", "L1"),
+        ("P2", "b", "S2", 200.0, 100, 20, None, "L2"),
+        ("P3", "c", "S1", 50.0, 10, 0, "Metal", "L2"),
+    ])
+    con.executemany("INSERT INTO production_lines VALUES (?, ?, ?, ?)", [
+        ("L1", "Line1", 100, 0.9), ("L2", "Line2", 150, 0.95),
+    ])
+    return con
+
+
+def test_sql_repository_discovers_alias_columns_and_pushes_down_filters():
+    from src.infrastructure.sql_repository import SqlSimulationRepository
+
+    repo = SqlSimulationRepository(_connection(), batch_size=2)
+
+    context = repo.load_context()
+    assert [p.id for p in context.parts] == ["P1", "P2", "P3"]
+    assert context.parts[1].category == ""
+    assert context.suppliers[0].currency == "USD"
+
+    subset = repo.load_context(line_ids=["L2"])
+    assert [p.id for p in subset.parts] == ["P2", "P3"]
+    assert sorted(s.id for s in subset.suppliers) == ["S1", "S2"]
+    assert [l.id for l in subset.production_lines] == ["L2"]
+
+    empty = repo.load_context(supplier_ids=[])
+    assert len(empty.parts) == 0 and empty.suppliers == []
+
+
+def _by_label(records, by):
+    return {tuple(r[d] for d in by): r for r in records}
+
+
+def test_sql_aggregate_matches_rollup_cube():
+    from src.domain.rollup import RollupCube
+    from src.infrastructure.sql_repository import SqlSimulationRepository
+
+    repo = SqlSimulationRepository(_connection())
+    cube = RollupCube(repo.load_context())
+
+    for by in [("supplier",), ("category", "line"), ()]:
+        assert _by_label(repo.aggregate(by=by), by) == _by_label(cube.query(by=by).to_records(), by)
+    filtered = repo.aggregate(by=("category",), line_ids=["L2"])
+    assert _by_label(filtered, ("category",)) == _by_label(cube.query(by=("category",), line="L2").to_records(), ("category",))
+
+    with pytest.raises(ValueError):
+        repo.aggregate(by=("plant",))
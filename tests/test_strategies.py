@@ -43,3 +43,40 @@ def test_delay_impact_strategy_calculation():
     # Assert
     # 손실 = (10 - 5) * 100 = 500
     assert result.production_loss == 500
+
+def _fx_context():
+    suppliers = [
+        Supplier(id="S1", name="US", risk_score=0.1, base_lead_time_days=5, currency="USD", country="US"),
+        Supplier(id="S2", name="JP", risk_score=0.1, base_lead_time_days=5, currency="JPY", country="JP"),
+        Supplier(id="S3", name="Local", risk_score=0.1, base_lead_time_days=5),
+    ]
+    parts = [
+        Part(id="P1", name="Part1", supplier_id="S1", unit_price=100.0, current_inventory=10, daily_usage_rate=1),
+        Part(id="P2", name="Part2", supplier_id="S2", unit_price=200.0, current_inventory=10, daily_usage_rate=1),
+        Part(id="P3", name="Part3", supplier_id="S3", unit_price=300.0, current_inventory=10, daily_usage_rate=1),
+    ]
+    return SimulationContext(parts=parts, suppliers=suppliers, production_lines=[])
+
+def test_currency_shock_strategy_applies_per_currency_shock():
+    from src.domain.strategies import CurrencyShockStrategy
+
+    # USD 10% 상승: P1 월 구매액 3,000 * 10% = 300 감소, 통화 정보 없는 P3는 영향 없음
+    result = CurrencyShockStrategy({"USD": 10.0, "KRW": 50.0}).calculate(_fx_context())
+
+    assert result.profit_delta == pytest.approx(-300.0)
+    # 저장소가 통화 코드를 대문자로 맞추므로 충격 키도 대소문자 / 공백과 무관하게 적용
+    assert CurrencyShockStrategy({" usd": 10.0}).calculate(_fx_context()).profit_delta == pytest.approx(-300.0)
+
+def test_tariff_strategy_sweep_matches_single_evaluation():
+    from src.domain.strategies import TariffStrategy
+    import numpy as np
+
+    context = _fx_context()
+    shocks = np.array([[0.0, 10.0], [25.0, 5.0]])
+
+    sweep = TariffStrategy.sweep(context, ["US", "JP"], shocks)
+    single = [TariffStrategy({"US": us, "JP": jp}).calculate(context).profit_delta for us, jp in shocks]
+
+    assert sweep == pytest.approx(single)
+    assert sweep[1] == pytest.approx(-(3000 * 0.25 + 6000 * 0.05))
+    assert TariffStrategy.sweep(context, ["us", "jp "], shocks) == pytest.approx(sweep)
@@ -0,0 +1,42 @@
+import numpy as np
+
+
+def test_generate_synthetic_is_seeded_and_builds_context():
+    from src.infrastructure.synthetic import generate_synthetic
+    from src.domain.columnar import get_columns
+
+    a = generate_synthetic(5000, seed=7)
+    b = generate_synthetic(5000, seed=7)
+    assert np.array_equal(a.unit_price, b.unit_price)
+    assert np.array_equal(a.part_supplier, b.part_supplier)
+    assert not np.array_equal(a.unit_price, generate_synthetic(5000, seed=8).unit_price)
+
+    # 공급사 집중도: 상위 공급사가 평균보다 훨씬 많은 부품을 맡는다
+    counts = np.bincount(a.part_supplier, minlength=len(a.supplier_risk))
+    assert counts[0] > 5 * counts.mean()
+    assert (a.daily_usage_rate >= 1).all() and (a.unit_price > 0).all()
+
+    context = a.to_context()
+    assert len(context.parts) == 5000
+    assert len(context.suppliers) == 100 and len(context.production_lines) == 3
+    part = context.parts[0]
+    assert part.id == 'P0000' and part.supplier_id == context.suppliers[a.part_supplier[0]].id
+    assert get_columns(context).daily_usage_rate.sum() == a.daily_usage_rate.sum()
+
+
+def test_synthetic_csv_and_snapshot_round_trip(tmp_path):
+    from src.infrastructure.repositories import SimulationRepository
+    from src.infrastructure.synthetic import SyntheticDataset, generate_synthetic
+
+    dataset = generate_synthetic(2500, seed=1)
+    paths = dataset.write_csvs(tmp_path / 'csv', chunk_rows=1000)
+    with open(paths['parts'], 'rb') as parts, open(paths['suppliers'], 'rb') as suppliers, open(paths['production'], 'rb') as production:
+        loaded = SimulationRepository().load_context_from_uploads(parts, suppliers, production)
+    expected = dataset.to_context()
+    assert len(loaded.parts) == 2500
+    assert loaded.parts[1234] == expected.parts[1234]
+    assert [s.id for s in loaded.suppliers] == [s.id for s in expected.suppliers]
+
+    restored = SyntheticDataset.load_snapshot(dataset.save_snapshot(tmp_path / 'snapshot.npz'))
+    assert np.array_equal(restored.current_inventory, dataset.current_inventory)
+    assert np.array_equal(restored.part_line, dataset.part_line)
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+from src.domain.models import Part
+
+
+def _parts():
+    return [
+        Part(id="P1", name="Part1", supplier_id="S1", unit_price=100.0, current_inventory=10, daily_usage_rate=1, category="Metal", line_id="L1"),
+        Part(id="P2", name="Part2", supplier_id="S2", unit_price=12.3, current_inventory=20, daily_usage_rate=2, line_id="L1"),
+        Part(id="P3", name="Part3", supplier_id="S1", unit_price=50.0, current_inventory=30, daily_usage_rate=3, category="Metal"),
+    ]
+
+
+def _table(parts, **kwargs):
+    from src.domain.tables import PartTable
+
+    return PartTable(
+        ids=[p.id for p in parts],
+        names=[p.name for p in parts],
+        supplier_ids=[p.supplier_id for p in parts],
+        unit_price=[p.unit_price for p in parts],
+        current_inventory=[p.current_inventory for p in parts],
+        daily_usage_rate=[p.daily_usage_rate for p in parts],
+        categories=[p.category for p in parts],
+        line_ids=[p.line_id for p in parts],
+        **kwargs
+    )
+
+
+def test_part_table_narrows_dtypes_and_round_trips_parts():
+    from src.domain.tables import PartSequence, StringDictionary, narrow_float, narrow_int
+
+    parts = _parts()
+    table = _table(parts, supplier_dictionary=StringDictionary(["S0", "S1", "S2"]))
+
+    # 12.3은 float32로 손실 없이 표현되지 않으므로 float64 유지
+    assert table.unit_price.dtype == np.float64
+    assert narrow_float([100.0, 0.5], 'x').dtype == np.float32
+    assert table.current_inventory.dtype == np.int32
+    assert narrow_int([2 ** 40], 'x').dtype == np.int64
+    assert table.codes['supplier_id'].tolist() == [1, 2, 1]
+
+    sequence = PartSequence(table)
+    assert len(sequence) == 3
+    assert [vars(p) for p in sequence] == [vars(p) for p in parts]
+    assert vars(sequence[-1]) == vars(parts[2])
+
+    report = {c.column: c for c in table.memory_report()}
+    assert report['current_inventory'].stored_bytes == 12
+    assert report['supplier_id'].stored_dtype == 'category[int32]'
+    assert report['current_inventory'].saved_bytes > 0
+    assert sum(c.saved_bytes for c in report.values()) > 0
+
+    with pytest.raises(ValueError):
+        narrow_int([float('nan')], 'current_inventory')
+    with pytest.raises(ValueError):
+        narrow_int([1e30], 'current_inventory')
+
+
+def test_columnar_context_matches_object_context():
+    from src.domain.models import ProductionLine, SimulationContext, Supplier
+    from src.domain.tables import PartSequence
+    from src.domain.strategies import PriceHikeStrategy
+    from src.domain.rollup import RollupCube
+    from src.domain.safety_stock import SafetyStockOptimizer
+
+    parts = _parts()
+    suppliers = [
+        Supplier(id="S1", name="A", risk_score=0.5, base_lead_time_days=5),
+        Supplier(id="S2", name="B", risk_score=0.2, base_lead_time_days=5),
+    ]
+    lines = [ProductionLine(id="L1", name="Line1", capacity_per_day=100, efficiency_rate=1.0)]
+    objects = SimulationContext(parts=parts, suppliers=suppliers, production_lines=lines)
+    columnar = SimulationContext(parts=PartSequence(_table(parts)), suppliers=suppliers, production_lines=lines)
+
+    strategy = PriceHikeStrategy(10.0)
+    assert strategy.calculate(columnar).profit_delta == pytest.approx(strategy.calculate(objects).profit_delta)
+    assert RollupCube(columnar).query(by=('supplier',)).to_records() == RollupCube(objects).query(by=('supplier',)).to_records()
+
+    optimizer = SafetyStockOptimizer()
+    assert optimizer.optimize(columnar, 500.0).to_records() == optimizer.optimize(objects, 500.0).to_records()
+
+
+def test_part_sequence_replaces_rows_and_parts_are_frozen():
+    import dataclasses
+    from src.domain.columnar import get_columns
+    from src.domain.models import ProductionLine, SimulationContext
+    from src.domain.tables import PartSequence
+
+    table = _table(_parts())
+    sequence = PartSequence(table)
+    context = SimulationContext(parts=sequence, suppliers=[], production_lines=[ProductionLine("L1", "Line1", 100, 1.0)])
+    before = get_columns(context)
+    inventory = table.current_inventory
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        sequence[0].unit_price = 1.0  # 꺼낸 Part를 고쳐도 반영되지 않으므로 조용히 넘기지 않는다
+
+    new = dataclasses.replace(sequence[1], supplier_id="S9", unit_price=0.1, current_inventory=2 ** 40)
+    sequence[-2] = new
+    assert vars(sequence[1]) == vars(new)
+    assert table.current_inventory.dtype == np.int64 and inventory.tolist() == [10, 20, 30]  # 넓혀서 복사, 원본은 그대로
+    columns = get_columns(context)
+    assert columns is not before and columns.unit_price[1] == 0.1
+    assert get_columns(context) is columns
+
+    with pytest.raises(TypeError):
+        sequence[0:1] = [new]
+    with pytest.raises(IndexError):
+        sequence[3] = new
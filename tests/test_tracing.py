@@ -0,0 +1,53 @@
+from src.common.tracing import Tracer
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer(enabled=False)
+
+    with tracer.span("service.run_simulation") as s:
+        s.set(rows=10)
+
+    assert tracer.records == []
+
+
+def test_collect_records_nested_spans_and_exports_chrome_trace():
+    tracer = Tracer(enabled=False)
+
+    with tracer.collect() as records:
+        with tracer.span("service.run_simulation"):
+            with tracer.span("strategy.fused_evaluate", strategies=2):
+                pass
+
+    assert [(r.name, r.depth) for r in records] == [("strategy.fused_evaluate", 1), ("service.run_simulation", 0)]
+    assert tracer.enabled is False
+
+    trace = tracer.to_chrome_trace(records)
+    assert {e['name'] for e in trace['traceEvents']} == {"service.run_simulation", "strategy.fused_evaluate"}
+    assert trace['traceEvents'][0]['args'] == {'strategies': 2}
+    assert [s['name'] for s in tracer.summary(records)][0] == "service.run_simulation"
+
+
+def test_session_collection_is_isolated_per_thread():
+    import threading
+    from src.common.tracing import Tracer
+
+    tracer = Tracer(enabled=False)
+    collected = {}
+    started = threading.Barrier(2)
+
+    def session(name, enabled):
+        records = tracer.begin_collect(enabled)
+        started.wait()  # 두 세션이 동시에 실행 중일 때 스팬을 만든다
+        with tracer.span(f"{name}.render"):
+            pass
+        collected[name] = records
+
+    threads = [threading.Thread(target=session, args=("a", True)), threading.Thread(target=session, args=("b", False))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert [r.name for r in collected["a"]] == ["a.render"]
+    assert collected["b"] is None
+    assert tracer.records == [] and not tracer.active  # 전역 트레이서와 이 스레드는 그대로 꺼져 있다
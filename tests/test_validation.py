@@ -0,0 +1,75 @@
+import io
+
+import pandas as pd
+import pytest
+
+
+def test_validate_tables_reports_every_bad_row_in_one_pass():
+    from src.infrastructure.validation import validate_tables
+
+    suppliers = pd.DataFrame({
+        'Supplier_ID': ['S1', 'S2', 'S2'],
+        'Supplier_Name': ['A', 'B', ' '],
+        'Risk_Score': [0.3, 1.5, 0.2],
+        'Base_Lead_Time_Days': [7, 3.5, 5],
+    })
+    parts = pd.DataFrame({
+        'Part_ID': ['P1', 'P2', 'P3', 'P4'],
+        'Part_Name': ['a', 'b', 'c', 'd'],
+        'Supplier_ID': ['S1', 'S9', 'S2', 'S1'],
+        'Unit_Price': ['10', 'abc', None, 'inf'],
+        'Current_Inventory': [5, -1, 0, 3],
+        'Daily_Usage_Rate': [1, 2, 0, 4],
+    })
+    errors = validate_tables({'suppliers': suppliers, 'parts': parts})
+
+    found = set(zip(errors['table'], errors['row'], errors['column'], errors['rule']))
+    assert found == {
+        ('suppliers', 3, 'Risk_Score', 'range'),
+        ('suppliers', 3, 'Base_Lead_Time_Days', 'type'),
+        ('suppliers', 3, 'Supplier_ID', 'duplicate'),
+        ('suppliers', 4, 'Supplier_ID', 'duplicate'),
+        ('suppliers', 4, 'Supplier_Name', 'required'),
+        ('parts', 3, 'Unit_Price', 'type'),
+        ('parts', 3, 'Current_Inventory', 'range'),
+        ('parts', 3, 'Supplier_ID', 'reference'),
+        ('parts', 4, 'Unit_Price', 'required'),
+        ('parts', 4, 'Daily_Usage_Rate', 'range'),
+        ('parts', 5, 'Unit_Price', 'type'),
+    }
+    # 테이블 -> 행 순서 (부품이 공급사보다 먼저)
+    assert list(errors['table'])[0] == 'parts' and list(errors['row'])[:3] == [3, 3, 3]
+    assert validate_tables({'suppliers': suppliers.iloc[:1], 'parts': parts.iloc[:1]}).empty
+
+
+def test_upload_with_bad_rows_raises_data_validation_error():
+    from src.infrastructure.repositories import SimulationRepository
+
+    csv = io.StringIO(
+        "부품코드,품명,공급사,단가,재고,사용량\n"
+        "P1,a,S1,10,5,1\n"
+        "P2,b,S1,x,5,1\n"
+        "P3,c,S7,10,5,0\n"
+    )
+    with pytest.raises(ValueError) as info:
+        SimulationRepository().load_context_from_uploads(parts_csv=csv)
+    assert type(info.value).__name__ == 'DataValidationError'
+    assert list(info.value.errors['row']) == [3, 4, 4]
+    assert '오류 3건' in str(info.value)
+
+
+def test_padded_ids_are_normalized_before_validation_and_loading():
+    from src.domain.columnar import get_columns
+    from src.infrastructure.repositories import SimulationRepository
+
+    parts = io.StringIO("Part_ID,Part_Name,Supplier_ID,Unit_Price,Current_Inventory,Daily_Usage_Rate,Line_ID\n P1 ,a, S1 ,10,5,1,L1 \n")
+    suppliers = io.StringIO("Supplier_ID,Supplier_Name,Risk_Score,Base_Lead_Time_Days\nS1 ,A,0.4,7\n")
+    production = io.StringIO("Line_ID,Line_Name,Capacity_Per_Day,Efficiency_Rate\n L1,Line,100,0.9\n")
+
+    context = SimulationRepository().load_context_from_uploads(parts, suppliers, production)
+    part = context.parts[0]
+    assert (part.id, part.supplier_id, part.line_id) == ("P1", "S1", "L1")
+    assert context.suppliers[0].id == "S1" and context.production_lines[0].id == "L1"
+    # 공급사 연결이 끊기지 않아 리스크가 그대로 반영된다
+    columns = get_columns(context)
+    assert columns.supplier_index.tolist() == [0] and columns.part_supplier_risk.tolist() == [0.4]